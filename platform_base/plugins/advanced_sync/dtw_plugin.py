@@ -17,6 +17,7 @@ except ImportError:
 
 from platform_base.core.protocols import PluginProtocol, PluginContext, PluginResult
 from platform_base.core.models import SyncResult, ResultMetadata, SeriesID
+from platform_base.processing.dtw import DTW_EXACT_MAX_CELLS, dtw_path, dtw_path_multiscale
 from platform_base.utils.errors import PluginError
 from platform_base.utils.logging import get_logger
 
@@ -26,6 +27,13 @@ logger = get_logger(__name__)
 PLUGIN_ID = "dtw_align"
 VERSION = "1.0.0"
 
+# distance_metric do plugin -> custo local do motor DTW
+_LOCAL_COST_METRICS = {
+    "euclidean": "sqeuclidean",
+    "manhattan": "manhattan",
+    "cosine": "cosine",
+}
+
 
 class DTWPlugin:
     """
@@ -83,6 +91,10 @@ class DTWPlugin:
                 - window_size: janela de busca DTW (opcional)
                 - distance_metric: métrica de distância (default: euclidean)
                 - step_pattern: padrão de passo (default: symmetric)
+                - band: restrição global, sakoe_chiba ou itakura (default: sakoe_chiba)
+                - mode: "exact", "multiscale" (FastDTW, memória linear) ou
+                  "auto" (multiscale quando a busca exata é grande; default)
+                - radius: raio de refinamento do modo multiscale (default: 10)
                 
         Returns:
             PluginResult com resultado da sincronização
@@ -98,6 +110,11 @@ class DTWPlugin:
             window_size = params.get("window_size")
             distance_metric = params.get("distance_metric", "euclidean")
             step_pattern = params.get("step_pattern", "symmetric")
+            band = params.get("band", "sakoe_chiba")
+            mode = params.get("mode", "auto")
+            radius = params.get("radius", 10)
+            if mode not in ("auto", "exact", "multiscale"):
+                raise PluginError("Unknown DTW mode", {"mode": mode})
             
             logger.info("dtw_sync_start", 
                        n_series=len(series_data),
@@ -122,7 +139,11 @@ class DTWPlugin:
                     ref_values, 
                     target_values,
                     window_size=window_size,
-                    distance_metric=distance_metric
+                    distance_metric=distance_metric,
+                    step_pattern=step_pattern,
+                    band=band,
+                    mode=mode,
+                    radius=radius
                 )
                 
                 warp_paths[series_id] = {
@@ -188,84 +209,44 @@ class DTWPlugin:
         x: np.ndarray, 
         y: np.ndarray,
         window_size: Optional[int] = None,
-        distance_metric: str = "euclidean"
+        distance_metric: str = "euclidean",
+        step_pattern: str = "symmetric",
+        band: str = "sakoe_chiba",
+        mode: str = "exact",
+        radius: int = 10
     ) -> tuple[np.ndarray, float]:
         """
-        Computa DTW entre duas séries
+        Computa DTW entre duas séries (motor compilado em processing.dtw)
+        
+        No modo multiscale o caminho é aproximado (FastDTW) e a restrição de
+        janela/banda não se aplica.
         
         Returns:
             (warp_path, total_distance)
         """
-        m, n = len(x), len(y)
-        
-        # Inicializa matriz de distâncias
-        if window_size is None:
-            window_size = max(m, n)  # Sem restrição de janela
-        
-        # Matriz de distâncias cumulativas
-        dtw_matrix = np.full((m + 1, n + 1), np.inf)
-        dtw_matrix[0, 0] = 0
-        
-        # Preenche matriz DTW com restrição de janela
-        for i in range(1, m + 1):
-            # Calcula limites da janela
-            j_start = max(1, i - window_size)
-            j_end = min(n + 1, i + window_size + 1)
-            
-            for j in range(j_start, j_end):
-                # Calcula distância local
-                if distance_metric == "euclidean":
-                    cost = (x[i-1] - y[j-1]) ** 2
-                elif distance_metric == "manhattan":
-                    cost = abs(x[i-1] - y[j-1])
-                elif distance_metric == "cosine":
-                    # Usa scipy se disponível
-                    if SCIPY_AVAILABLE:
-                        cost = scipy.spatial.distance.cosine([x[i-1]], [y[j-1]])
-                    else:
-                        cost = (x[i-1] - y[j-1]) ** 2  # fallback
-                else:
-                    cost = (x[i-1] - y[j-1]) ** 2  # fallback
-                
-                # Atualiza matriz com menor custo cumulativo
-                dtw_matrix[i, j] = cost + min(
-                    dtw_matrix[i-1, j],      # inserção
-                    dtw_matrix[i, j-1],      # deleção  
-                    dtw_matrix[i-1, j-1]     # matching
-                )
-        
-        # Backtracking para encontrar caminho ótimo
-        path = []
-        i, j = m, n
-        
-        while i > 0 or j > 0:
-            path.append((i-1, j-1))
-            
-            if i == 0:
-                j -= 1
-            elif j == 0:
-                i -= 1
-            else:
-                # Escolhe direção de menor custo
-                costs = [
-                    dtw_matrix[i-1, j-1],   # diagonal
-                    dtw_matrix[i-1, j],     # vertical
-                    dtw_matrix[i, j-1]      # horizontal
-                ]
-                min_idx = np.argmin(costs)
-                
-                if min_idx == 0:    # diagonal
-                    i -= 1
-                    j -= 1
-                elif min_idx == 1:  # vertical
-                    i -= 1
-                else:               # horizontal
-                    j -= 1
-        
-        path.reverse()
-        total_distance = dtw_matrix[m, n]
+        # "euclidean" aqui sempre foi a diferença ao quadrado; métricas
+        # desconhecidas caem no mesmo custo
+        metric = _LOCAL_COST_METRICS.get(distance_metric, "sqeuclidean")
+        if mode == "auto":
+            exact_cells = len(x) * (len(y) if window_size is None else 2 * window_size + 1)
+            mode = "multiscale" if exact_cells > DTW_EXACT_MAX_CELLS else "exact"
+        if mode == "multiscale":
+            alignment = dtw_path_multiscale(
+                x, y,
+                radius=radius,
+                metric=metric,
+                step_pattern=step_pattern,
+            )
+            return alignment.path, alignment.distance
         
-        return np.array(path), total_distance
+        alignment = dtw_path(
+            x, y,
+            window=window_size,
+            band=band,
+            metric=metric,
+            step_pattern=step_pattern,
+        )
+        return alignment.path, alignment.distance
     
     def _build_common_timeline(
         self,
@@ -24,9 +24,19 @@ from typing import Dict, List, Optional, Any, Tuple
 import numpy as np
 from dataclasses import dataclass
 
+from platform_base.caching.tiered import TieredCache
+from platform_base.core.memory_manager import get_memory_manager
+from platform_base.processing.dtw import (
+    DTW_BANDS,
+    DTW_METRICS,
+    DTW_STEP_PATTERNS,
+    dtw_distance,
+    dtw_distance_matrix,
+    dtw_path,
+)
+
 # Import scipy for DTW optimization
 try:
-    from scipy.spatial.distance import euclidean
     from scipy.optimize import minimize_scalar
     SCIPY_AVAILABLE = True
 except ImportError:
@@ -84,11 +94,12 @@ class DTWResult:
 class DTWConfig:
     """Configuration for DTW analysis"""
     window_size: Optional[int] = None  # Sakoe-Chiba band constraint
-    distance_metric: str = 'euclidean'  # euclidean, manhattan, cosine
+    distance_metric: str = 'euclidean'  # euclidean, sqeuclidean, manhattan, cosine
     normalize_distance: bool = True
     return_path: bool = True
     return_cost_matrix: bool = False
     step_pattern: str = 'symmetric'  # symmetric, asymmetric
+    band: str = 'sakoe_chiba'  # sakoe_chiba (uses window_size), itakura
     
 
 class DTWPlugin(PluginProtocol):
@@ -105,9 +116,14 @@ class DTWPlugin(PluginProtocol):
         self.total_execution_time = 0.0
         self.last_results: List[DTWResult] = []
         
-        # Cache for repeated computations
-        self._distance_cache = {}
-        self._max_cache_size = 100
+        # Cache for repeated computations, bounded by bytes (cost matrices
+        # can be large) and shrunk under memory pressure
+        self._max_cache_bytes = 64 * 1024 * 1024
+        self._distance_cache = TieredCache(
+            max_memory_bytes=self._max_cache_bytes,
+            memory_manager=get_memory_manager(),
+            name="dtw_distances",
+        )
     
     @property
     def name(self) -> str:
@@ -166,6 +182,7 @@ class DTWPlugin(PluginProtocol):
         # Validate inputs
         if len(series1) == 0 or len(series2) == 0:
             raise ValueError("Input series cannot be empty")
+        self._validate_config(config)
         
         # Convert to numpy arrays
         s1 = np.asarray(series1, dtype=np.float64)
@@ -179,13 +196,13 @@ class DTWPlugin(PluginProtocol):
         
         # Check cache
         cache_key = self._get_cache_key(s1, s2, config)
-        if cache_key in self._distance_cache:
-            cached_result = self._distance_cache[cache_key]
+        cached_result = self._distance_cache.get(cache_key)
+        if cached_result is not None:
             cached_result.execution_time = time.perf_counter() - start_time
             return cached_result
         
         # Compute DTW
-        if config.window_size is not None:
+        if config.window_size is not None or config.band == 'itakura':
             result = self._dtw_constrained(s1, s2, config)
         else:
             result = self._dtw_unconstrained(s1, s2, config)
@@ -210,166 +227,60 @@ class DTWPlugin(PluginProtocol):
     
     def _dtw_unconstrained(self, s1: np.ndarray, s2: np.ndarray, config: DTWConfig) -> DTWResult:
         """Compute unconstrained DTW"""
-        n, m = len(s1), len(s2)
-        
-        # Initialize cost matrix
-        cost_matrix = np.full((n + 1, m + 1), np.inf)
-        cost_matrix[0, 0] = 0
-        
-        # Fill cost matrix
-        for i in range(1, n + 1):
-            for j in range(1, m + 1):
-                # Compute distance between points
-                dist = self._point_distance(s1[i-1], s2[j-1], config.distance_metric)
-                
-                # DTW step patterns
-                if config.step_pattern == 'symmetric':
-                    cost_matrix[i, j] = dist + min(
-                        cost_matrix[i-1, j],     # insertion
-                        cost_matrix[i, j-1],     # deletion  
-                        cost_matrix[i-1, j-1]    # match
-                    )
-                elif config.step_pattern == 'asymmetric':
-                    cost_matrix[i, j] = dist + min(
-                        cost_matrix[i-1, j] + dist,      # insertion with penalty
-                        cost_matrix[i, j-1],             # deletion
-                        cost_matrix[i-1, j-1]            # match
-                    )
-        
-        # Extract final distance
-        distance = cost_matrix[n, m]
-        
-        # Normalize distance if requested
-        normalized_distance = None
-        if config.normalize_distance:
-            path_length = n + m  # Approximate path length
-            normalized_distance = distance / path_length
-        
-        # Extract warping path if requested
-        path = []
-        if config.return_path:
-            path = self._extract_path(cost_matrix)
-        
-        # Prepare cost matrix for return
-        return_cost_matrix = cost_matrix[1:, 1:] if config.return_cost_matrix else None
-        
-        return DTWResult(
-            distance=distance,
-            path=path,
-            cost_matrix=return_cost_matrix,
-            normalized_distance=normalized_distance,
-            metadata={
-                'series1_length': n,
-                'series2_length': m,
-                'step_pattern': config.step_pattern,
-                'distance_metric': config.distance_metric,
-                'constrained': False
-            }
-        )
+        return self._run_dtw(s1, s2, config, window=None)
     
     def _dtw_constrained(self, s1: np.ndarray, s2: np.ndarray, config: DTWConfig) -> DTWResult:
-        """Compute DTW with Sakoe-Chiba band constraint"""
+        """Compute DTW with Sakoe-Chiba band (or Itakura parallelogram) constraint"""
+        return self._run_dtw(s1, s2, config, window=config.window_size)
+    
+    def _run_dtw(self, s1: np.ndarray, s2: np.ndarray, config: DTWConfig,
+                 window: Optional[int]) -> DTWResult:
+        """Run the compiled DTW engine (band-limited, rolling rows without path)"""
         n, m = len(s1), len(s2)
-        window = config.window_size
-        
-        # Initialize cost matrix
-        cost_matrix = np.full((n + 1, m + 1), np.inf)
-        cost_matrix[0, 0] = 0
         
-        # Fill cost matrix with window constraint
-        for i in range(1, n + 1):
-            # Calculate window bounds
-            j_start = max(1, i - window)
-            j_end = min(m + 1, i + window + 1)
-            
-            for j in range(j_start, j_end):
-                # Compute distance between points
-                dist = self._point_distance(s1[i-1], s2[j-1], config.distance_metric)
-                
-                # DTW recurrence with constraint
-                cost_matrix[i, j] = dist + min(
-                    cost_matrix[i-1, j] if j > i - window else np.inf,
-                    cost_matrix[i, j-1] if j < i + window else np.inf,
-                    cost_matrix[i-1, j-1]
-                )
-        
-        # Extract results similar to unconstrained
-        distance = cost_matrix[n, m]
+        path = []
+        cost_matrix = None
+        if config.return_path or config.return_cost_matrix:
+            alignment = dtw_path(
+                s1, s2, window=window, band=config.band,
+                metric=config.distance_metric, step_pattern=config.step_pattern,
+                return_cost_matrix=config.return_cost_matrix,
+            )
+            distance = alignment.distance
+            cost_matrix = alignment.cost_matrix
+            if config.return_path:
+                path = [(int(i), int(j)) for i, j in alignment.path]
+        else:
+            distance = dtw_distance(
+                s1, s2, window=window, band=config.band,
+                metric=config.distance_metric, step_pattern=config.step_pattern,
+            )
         
+        # Normalize distance if requested
         normalized_distance = None
         if config.normalize_distance:
-            path_length = n + m
+            path_length = n + m  # Approximate path length
             normalized_distance = distance / path_length
         
-        path = []
-        if config.return_path:
-            path = self._extract_path(cost_matrix)
-        
-        return_cost_matrix = cost_matrix[1:, 1:] if config.return_cost_matrix else None
+        metadata = {
+            'series1_length': n,
+            'series2_length': m,
+            'step_pattern': config.step_pattern,
+            'distance_metric': config.distance_metric,
+            'constrained': window is not None or config.band == 'itakura',
+            'band': config.band,
+        }
+        if window is not None:
+            metadata['window_size'] = window
         
         return DTWResult(
             distance=distance,
             path=path,
-            cost_matrix=return_cost_matrix,
+            cost_matrix=cost_matrix,
             normalized_distance=normalized_distance,
-            metadata={
-                'series1_length': n,
-                'series2_length': m,
-                'step_pattern': config.step_pattern,
-                'distance_metric': config.distance_metric,
-                'constrained': True,
-                'window_size': window
-            }
+            metadata=metadata
         )
     
-    def _point_distance(self, p1: np.ndarray, p2: np.ndarray, metric: str) -> float:
-        """Compute distance between two points"""
-        if metric == 'euclidean':
-            if SCIPY_AVAILABLE:
-                return euclidean(p1, p2)
-            else:
-                return np.sqrt(np.sum((p1 - p2) ** 2))
-        elif metric == 'manhattan':
-            return np.sum(np.abs(p1 - p2))
-        elif metric == 'cosine':
-            norm1, norm2 = np.linalg.norm(p1), np.linalg.norm(p2)
-            if norm1 == 0 or norm2 == 0:
-                return 1.0
-            return 1.0 - np.dot(p1, p2) / (norm1 * norm2)
-        else:
-            raise ValueError(f"Unknown distance metric: {metric}")
-    
-    def _extract_path(self, cost_matrix: np.ndarray) -> List[Tuple[int, int]]:
-        """Extract optimal warping path from cost matrix"""
-        n, m = cost_matrix.shape
-        i, j = n - 1, m - 1
-        path = [(i-1, j-1)]  # Convert to 0-based indexing
-        
-        while i > 1 or j > 1:
-            if i == 1:
-                j -= 1
-            elif j == 1:
-                i -= 1
-            else:
-                # Find minimum of three predecessors
-                move_cost = [
-                    cost_matrix[i-1, j-1],  # diagonal
-                    cost_matrix[i-1, j],    # up
-                    cost_matrix[i, j-1]     # left
-                ]
-                move = np.argmin(move_cost)
-                
-                if move == 0:      # diagonal
-                    i, j = i-1, j-1
-                elif move == 1:    # up
-                    i = i-1
-                else:              # left
-                    j = j-1
-            
-            path.append((i-1, j-1))  # Convert to 0-based indexing
-        
-        return path[::-1]  # Reverse to start from beginning
-    
     def _get_cache_key(self, s1: np.ndarray, s2: np.ndarray, config: DTWConfig) -> str:
         """Generate cache key for DTW computation"""
         s1_hash = hash(s1.data.tobytes())
@@ -378,44 +289,75 @@ class DTWPlugin(PluginProtocol):
             config.window_size,
             config.distance_metric,
             config.normalize_distance,
-            config.step_pattern
+            config.step_pattern,
+            config.band,
+            config.return_path,
+            config.return_cost_matrix
         ))
         return f"{s1_hash}_{s2_hash}_{config_hash}"
     
     def _cache_result(self, key: str, result: DTWResult):
-        """Cache DTW result"""
-        if len(self._distance_cache) >= self._max_cache_size:
-            # Remove oldest entry
-            oldest_key = next(iter(self._distance_cache))
-            del self._distance_cache[oldest_key]
-        
-        self._distance_cache[key] = result
+        """Cache DTW result (LRU eviction by size in bytes)"""
+        self._distance_cache.set(key, result)
     
     def compute_dtw_batch(self, 
                          series_list: List[np.ndarray],
-                         config: Optional[DTWConfig] = None) -> np.ndarray:
+                         config: Optional[DTWConfig] = None,
+                         max_distance: Optional[float] = None,
+                         max_workers: Optional[int] = None) -> np.ndarray:
         """
         Compute pairwise DTW distances for a list of series
         
+        Pairs are evaluated in parallel by the compiled engine. With
+        ``max_distance`` (same units as the returned distances), pairs whose
+        LB_Kim/LB_Keogh lower bound exceeds it are skipped and the others are
+        abandoned as soon as they do; such pairs are reported as inf.
+        
         Args:
             series_list: List of time series
             config: DTW configuration
+            max_distance: Optional pruning threshold
+            max_workers: Threads evaluating pairs
             
         Returns:
             Distance matrix (n x n)
         """
-        n = len(series_list)
-        distance_matrix = np.zeros((n, n))
+        start_time = time.perf_counter()
         
-        for i in range(n):
-            for j in range(i + 1, n):
-                result = self.compute_dtw_distance(series_list[i], series_list[j], config)
-                distance = result.normalized_distance if result.normalized_distance is not None else result.distance
-                distance_matrix[i, j] = distance
-                distance_matrix[j, i] = distance  # Symmetric
+        if config is None:
+            config = DTWConfig()
+        self._validate_config(config)
+        if any(len(series) == 0 for series in series_list):
+            raise ValueError("Input series cannot be empty")
+        
+        distance_matrix = dtw_distance_matrix(
+            list(series_list),
+            window=config.window_size,
+            band=config.band,
+            metric=config.distance_metric,
+            step_pattern=config.step_pattern,
+            normalize=config.normalize_distance,
+            max_distance=max_distance,
+            max_workers=max_workers,
+        )
+        
+        n = len(series_list)
+        self.execution_count += n * (n - 1) // 2
+        self.total_execution_time += time.perf_counter() - start_time
         
         return distance_matrix
     
+    def _validate_config(self, config: DTWConfig) -> None:
+        """Reject unknown metric, step pattern or band"""
+        if config.distance_metric not in DTW_METRICS:
+            raise ValueError(f"Unknown distance metric: {config.distance_metric}")
+        if config.step_pattern not in DTW_STEP_PATTERNS:
+            raise ValueError(f"Unknown step pattern: {config.step_pattern}")
+        if config.band not in DTW_BANDS:
+            raise ValueError(f"Unknown band constraint: {config.band}")
+        if config.window_size is not None and config.window_size < 0:
+            raise ValueError(f"Window size must be >= 0: {config.window_size}")
+    
     def visualize_dtw_alignment(self, 
                               series1: np.ndarray,
                               series2: np.ndarray, 
@@ -488,6 +430,7 @@ class DTWPlugin(PluginProtocol):
             'total_execution_time': self.total_execution_time,
             'average_execution_time': avg_time,
             'cache_size': len(self._distance_cache),
+            'cache': self._distance_cache.get_stats(),
             'last_results_count': len(self.last_results),
             'scipy_available': SCIPY_AVAILABLE,
             'matplotlib_available': MATPLOTLIB_AVAILABLE
@@ -2,10 +2,12 @@
 
 from .disk import DiskCache, create_disk_cache_from_config
 from .memory import memory_cache
+from .tiered import TieredCache
 
 
 __all__ = [
     "DiskCache",
+    "TieredCache",
     "create_disk_cache_from_config",
     "memory_cache",
 ]
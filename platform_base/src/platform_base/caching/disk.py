@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import hashlib
 import pickle
+import shutil
+import sqlite3
+import threading
 import time
-from collections import OrderedDict
+import uuid
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from threading import RLock
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from joblib import Memory
 
 from platform_base.utils.errors import CacheError, handle_error
@@ -21,15 +26,75 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+# Arrays a partir deste tamanho viram blobs .npy (abertos via mmap no hit)
+ARRAY_BLOB_MIN_BYTES = 64 * 1024
+
+# Número de acessos acumulados antes de gravar o LRU no índice
+LRU_FLUSH_INTERVAL = 64
+
+# Diretórios de staging (.{key}.{tid}.tmp) mais novos que isto são de um set() em andamento
+STAGING_MAX_AGE_SECONDS = 3600.0
+
+_META_FILE = "meta.pkl"
+_INDEX_FILE = "index.sqlite"
+
+
+class _ArrayPickler(pickle.Pickler):
+    """Pickler que separa arrays numpy grandes em arquivos .npy."""
+
+    def __init__(self, file, directory: Path):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._directory = directory
+        self.n_blobs = 0
+
+    def persistent_id(self, obj: Any) -> Any:
+        if (
+            isinstance(obj, np.ndarray)
+            and type(obj) in (np.ndarray, np.memmap)
+            and not obj.dtype.hasobject
+            and obj.nbytes >= ARRAY_BLOB_MIN_BYTES
+        ):
+            name = f"a{self.n_blobs:04d}.npy"
+            np.save(self._directory / name, obj, allow_pickle=False)
+            self.n_blobs += 1
+            return ("npy", name)
+        return None
+
+
+class _ArrayUnpickler(pickle.Unpickler):
+    """Unpickler que abre os blobs .npy como memmap copy-on-write."""
+
+    def __init__(self, file, directory: Path):
+        super().__init__(file)
+        self._directory = directory
+
+    def persistent_load(self, pid: Any) -> Any:
+        kind, name = pid
+        if kind != "npy":
+            raise pickle.UnpicklingError(f"Unknown persistent id: {kind}")
+        return np.load(self._directory / name, mmap_mode="c", allow_pickle=False)
+
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.iterdir() if f.is_file())
+
+
 class DiskCache:
     """
-    Disk cache with joblib.Memory integration, TTL, and LRU cleanup.
+    Disk cache array-aware with joblib.Memory integration, TTL, and LRU cleanup.
 
     Features:
+    - Arrays numpy grandes gravados como ``.npy`` e devolvidos como memmap
+      copy-on-write no hit (custo de page faults, não de unpickling)
+    - Cada ``set`` grava num diretório versionado novo (``{key}.{versão}``):
+      blobs ainda mapeados por leitores nunca são sobrescritos. A versão
+      antiga é apagada em seguida quando possível; o que não puder ser
+      apagado (mmap aberto no Windows) fica para o ``cleanup``
+    - Demais objetos serializados num pickle pequeno por entrada
+    - Índice SQLite (tamanho e último acesso por entrada)
+    - LRU atualizado em lote e tamanho total mantido incrementalmente
     - Integração com joblib.Memory para caching de funções
     - TTL configurável via timestamp
-    - Limite de tamanho com LRU cleanup
-    - Persistência no path configurado
     - Métodos: get, set, clear, cleanup
     - Logging estruturado de operações
     """
@@ -59,11 +124,27 @@ class DiskCache:
         # TTL timestamp file
         self._stamp_file = self.location / ".ttl"
 
-        # LRU tracking file
-        self._lru_file = self.location / ".lru"
+        # Entries: one directory per key (meta.pkl + aNNNN.npy)
+        self._entries_dir = self.location / "entries"
+        self._entries_dir.mkdir(exist_ok=True)
+
+        self._lock = RLock()
+        self._index = sqlite3.connect(
+            self.location / _INDEX_FILE, check_same_thread=False, isolation_level=None,
+        )
+        self._index.execute("PRAGMA journal_mode=WAL")
+        self._index.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, size INTEGER NOT NULL, atime REAL NOT NULL, "
+            "version TEXT NOT NULL)"
+        )
+        self._index.execute("CREATE INDEX IF NOT EXISTS entries_atime ON entries(atime)")
 
-        # Initialize LRU order
-        self._lru_order: OrderedDict[str, float] = self._load_lru_order()
+        # Acessos ainda não gravados no índice e tamanho total em memória
+        self._pending_access: dict[str, float] = {}
+        self._total_size: int = self._index.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
 
         logger.info(
             "disk_cache_initialized",
@@ -72,39 +153,28 @@ class DiskCache:
             max_size_bytes=max_size_bytes,
         )
 
-    def _load_lru_order(self) -> OrderedDict[str, float]:
-        """Load LRU order from persistent file."""
-        try:
-            if self._lru_file.exists():
-                with open(self._lru_file, "rb") as f:
-                    return pickle.load(f)
-        except Exception as e:
-            logger.warning(
-                "lru_order_load_failed",
-                error=str(e),
-                lru_file=str(self._lru_file),
-            )
-        return OrderedDict()
-
-    def _save_lru_order(self) -> None:
-        """Save LRU order to persistent file."""
-        try:
-            with open(self._lru_file, "wb") as f:
-                pickle.dump(self._lru_order, f)
-        except Exception as e:
-            logger.warning(
-                "lru_order_save_failed",
-                error=str(e),
-                lru_file=str(self._lru_file),
-            )
-
     def _get_cache_key(self, key: str) -> str:
         """Generate cache key hash."""
         return hashlib.md5(key.encode()).hexdigest()
 
-    def _get_file_path(self, cache_key: str) -> Path:
-        """Get file path for cache key."""
-        return self.location / f"{cache_key}.cache"
+    def _get_entry_path(self, cache_key: str, version: str) -> Path:
+        """Get entry directory for a cache key version."""
+        return self._entries_dir / f"{cache_key}.{version}"
+
+    def _current_version(self, cache_key: str) -> str | None:
+        """Versão atual da entrada no índice (None se ausente)."""
+        with self._lock:
+            row = self._index.execute(
+                "SELECT version FROM entries WHERE key = ?", (cache_key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _discard_version(self, cache_key: str, version: str) -> None:
+        """Apaga um diretório substituído; se estiver em uso, o ``cleanup`` tenta de novo."""
+        path = self._get_entry_path(cache_key, version)
+        shutil.rmtree(path, ignore_errors=True)
+        if path.exists():
+            logger.debug("cache_version_deferred", cache_key=cache_key, version=version)
 
     def _expired(self) -> bool:
         """Check if entire cache is expired based on TTL."""
@@ -129,71 +199,74 @@ class DiskCache:
         except Exception as e:
             logger.warning("ttl_touch_failed", error=str(e))
 
+    def _flush_access(self) -> None:
+        """Grava no índice, em uma transação, os acessos acumulados."""
+        with self._lock:
+            if not self._pending_access:
+                return
+            pending = list(self._pending_access.items())
+            self._pending_access.clear()
+            with self._index:
+                self._index.executemany(
+                    "UPDATE entries SET atime = ? WHERE key = ?",
+                    [(atime, key) for key, atime in pending],
+                )
+
+    def _record_access(self, cache_key: str) -> None:
+        with self._lock:
+            self._pending_access[cache_key] = time.time()
+            if len(self._pending_access) >= LRU_FLUSH_INTERVAL:
+                self._flush_access()
+
+    def _remove_entry(self, cache_key: str) -> int:
+        """Remove entrada do disco e do índice. Retorna bytes liberados."""
+        with self._lock:
+            row = self._index.execute(
+                "SELECT size, version FROM entries WHERE key = ?", (cache_key,)
+            ).fetchone()
+            self._index.execute("DELETE FROM entries WHERE key = ?", (cache_key,))
+            self._pending_access.pop(cache_key, None)
+            size = row[0] if row else 0
+            self._total_size -= size
+        if row:
+            self._discard_version(cache_key, row[1])
+        return size
+
     def _get_cache_size(self) -> int:
-        """Get total cache size in bytes."""
-        total_size = 0
-        try:
-            for file_path in self.location.glob("*.cache"):
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
-        except Exception as e:
-            logger.warning("cache_size_calculation_failed", error=str(e))
-        return total_size
+        """Get total cache size in bytes (tracked incrementally)."""
+        return self._total_size
 
-    def _enforce_size_limit(self) -> None:
+    def _enforce_size_limit(self, protect: str | None = None) -> None:
         """Enforce cache size limit using LRU eviction."""
-        if self._max_size_bytes is None:
-            return
-
-        current_size = self._get_cache_size()
-        if current_size <= self._max_size_bytes:
+        if self._max_size_bytes is None or self._total_size <= self._max_size_bytes:
             return
 
         logger.info(
             "cache_size_limit_exceeded",
-            current_size=current_size,
+            current_size=self._total_size,
             max_size=self._max_size_bytes,
         )
 
-        # Sort by access time (oldest first)
-        sorted_items = sorted(self._lru_order.items(), key=lambda x: x[1])
-
-        # Get most recently added item to protect it
-        most_recent_key = sorted_items[-1][0] if sorted_items else None
-
-        for cache_key, _ in sorted_items:
-            # Skip the most recently added item
-            if cache_key == most_recent_key:
-                continue
-            file_path = self._get_file_path(cache_key)
-            if file_path.exists():
-                try:
-                    file_size = file_path.stat().st_size
-                    file_path.unlink()
-                    del self._lru_order[cache_key]
-                    current_size -= file_size
-
-                    logger.debug(
-                        "cache_file_evicted",
-                        cache_key=cache_key,
-                        file_size=file_size,
-                        remaining_size=current_size,
-                    )
-
-                    if current_size <= self._max_size_bytes:
-                        break
-                except Exception as e:
-                    logger.warning(
-                        "cache_eviction_failed",
-                        cache_key=cache_key,
-                        error=str(e),
-                    )
-
-        self._save_lru_order()
+        with self._lock:
+            self._flush_access()
+            candidates = self._index.execute(
+                "SELECT key FROM entries WHERE key != ? ORDER BY atime ASC", (protect or "",)
+            ).fetchall()
+
+            for (cache_key,) in candidates:
+                if self._total_size <= self._max_size_bytes:
+                    break
+                file_size = self._remove_entry(cache_key)
+                logger.debug(
+                    "cache_file_evicted",
+                    cache_key=cache_key,
+                    file_size=file_size,
+                    remaining_size=self._total_size,
+                )
 
         logger.info(
             "cache_size_enforcement_completed",
-            final_size=current_size,
+            final_size=self._total_size,
             max_size=self._max_size_bytes,
         )
 
@@ -201,6 +274,9 @@ class DiskCache:
         """
         Get value from cache.
 
+        Arrays numpy gravados como blobs voltam como ``np.memmap``
+        copy-on-write: podem ser alterados sem afetar o cache.
+
         Args:
             key: Cache key
 
@@ -213,20 +289,27 @@ class DiskCache:
             return None
 
         cache_key = self._get_cache_key(key)
-        file_path = self._get_file_path(cache_key)
 
         try:
-            if not file_path.exists():
+            # Um set() concorrente pode trocar a versão entre a consulta e a abertura
+            for _ in range(2):
+                version = self._current_version(cache_key)
+                if version is None:
+                    logger.debug("cache_miss", key=key, cache_key=cache_key)
+                    return None
+                entry = self._get_entry_path(cache_key, version)
+                try:
+                    with open(entry / _META_FILE, "rb") as f:
+                        value = _ArrayUnpickler(f, entry).load()
+                    break
+                except FileNotFoundError:
+                    continue
+            else:
                 logger.debug("cache_miss", key=key, cache_key=cache_key)
                 return None
 
-            with open(file_path, "rb") as f:
-                value = pickle.load(f)
-
-            # Update LRU order
-            self._lru_order[cache_key] = time.time()
-            self._lru_order.move_to_end(cache_key)
-            self._save_lru_order()
+            # Update LRU order (gravado em lote)
+            self._record_access(cache_key)
 
             logger.debug("cache_hit", key=key, cache_key=cache_key)
             return value
@@ -248,32 +331,50 @@ class DiskCache:
             value: Value to cache
         """
         cache_key = self._get_cache_key(key)
-        file_path = self._get_file_path(cache_key)
+        version = uuid.uuid4().hex
+        staging = self._entries_dir / f".{cache_key}.{threading.get_ident()}.tmp"
 
         try:
-            with open(file_path, "wb") as f:
-                pickle.dump(value, f)
-
-            # Update LRU order
-            self._lru_order[cache_key] = time.time()
-            self._lru_order.move_to_end(cache_key)
-            self._save_lru_order()
+            if staging.exists():
+                shutil.rmtree(staging)
+            staging.mkdir()
+            with open(staging / _META_FILE, "wb") as f:
+                pickler = _ArrayPickler(f, staging)
+                pickler.dump(value)
+            size = _dir_size(staging)
+
+            with self._lock:
+                # Diretório novo: leitores da versão anterior seguem com seus mmaps
+                staging.rename(self._get_entry_path(cache_key, version))
+                previous = self._index.execute(
+                    "SELECT size, version FROM entries WHERE key = ?", (cache_key,)
+                ).fetchone()
+                self._index.execute(
+                    "INSERT OR REPLACE INTO entries (key, size, atime, version) VALUES (?, ?, ?, ?)",
+                    (cache_key, size, time.time(), version),
+                )
+                self._pending_access.pop(cache_key, None)
+                self._total_size += size - (previous[0] if previous else 0)
+            if previous:
+                self._discard_version(cache_key, previous[1])
 
             # Update TTL
             if self._ttl_seconds is not None:
                 self._touch()
 
             # Enforce size limit
-            self._enforce_size_limit()
+            self._enforce_size_limit(protect=cache_key)
 
             logger.debug(
                 "cache_set",
                 key=key,
                 cache_key=cache_key,
-                file_size=file_path.stat().st_size,
+                file_size=size,
+                n_array_blobs=pickler.n_blobs,
             )
 
         except Exception as e:
+            shutil.rmtree(staging, ignore_errors=True)
             error = CacheError(
                 f"Failed to set cache value for key: {key}",
                 context={"key": key, "cache_key": cache_key, "error": str(e)},
@@ -286,20 +387,12 @@ class DiskCache:
             # Clear joblib cache
             self._memory.clear(warn=False)
 
-            # Clear manual cache files
-            for file_path in self.location.glob("*.cache"):
-                try:
-                    file_path.unlink()
-                except Exception as e:
-                    logger.warning(
-                        "cache_file_deletion_failed",
-                        file_path=str(file_path),
-                        error=str(e),
-                    )
-
-            # Clear LRU order
-            self._lru_order.clear()
-            self._save_lru_order()
+            with self._lock:
+                shutil.rmtree(self._entries_dir, ignore_errors=True)
+                self._entries_dir.mkdir(exist_ok=True)
+                self._index.execute("DELETE FROM entries")
+                self._pending_access.clear()
+                self._total_size = 0
 
             # Clear TTL stamp
             if self._stamp_file.exists():
@@ -330,42 +423,44 @@ class DiskCache:
                 self.clear()
                 return
 
-            # Clean up orphaned files (not in LRU order)
-            cache_files = {f.stem for f in self.location.glob("*.cache")}
-            lru_keys = set(self._lru_order.keys())
-            orphaned = cache_files - lru_keys
-
-            for orphaned_key in orphaned:
-                orphaned_file = self._get_file_path(orphaned_key)
-                try:
-                    orphaned_file.unlink()
-                    logger.debug("orphaned_cache_file_removed", cache_key=orphaned_key)
-                except Exception as e:
-                    logger.warning(
-                        "orphaned_file_removal_failed",
-                        cache_key=orphaned_key,
-                        error=str(e),
-                    )
-
-            # Remove LRU entries for non-existent files
-            missing_keys = lru_keys - cache_files
-            for missing_key in missing_keys:
-                del self._lru_order[missing_key]
-
-            if missing_keys:
-                self._save_lru_order()
-                logger.debug("lru_order_cleaned", removed_count=len(missing_keys))
+            with self._lock:
+                self._flush_access()
+
+                # Diretórios fora do índice: versões substituídas e staging abandonado
+                indexed = {
+                    self._get_entry_path(key, version).name: key
+                    for key, version in self._index.execute("SELECT key, version FROM entries")
+                }
+                now = time.time()
+                orphaned = []
+                for path in self._entries_dir.iterdir():
+                    if not path.is_dir() or path.name in indexed:
+                        continue
+                    # Staging de um set() em andamento (outra thread) é preservado
+                    if path.name.endswith(".tmp") and now - path.stat().st_mtime < STAGING_MAX_AGE_SECONDS:
+                        continue
+                    shutil.rmtree(path, ignore_errors=True)
+                    orphaned.append(path.name)
+                    logger.debug("orphaned_cache_file_removed", cache_key=path.name)
+
+                # Remove index entries for missing directories
+                missing_keys = [
+                    key for name, key in indexed.items() if not (self._entries_dir / name).is_dir()
+                ]
+                for missing_key in missing_keys:
+                    self._remove_entry(missing_key)
+
+                # Formato antigo (pickle por arquivo + .lru)
+                for legacy in [*self.location.glob("*.cache"), self.location / ".lru"]:
+                    legacy.unlink(missing_ok=True)
 
             # Enforce size limit
             self._enforce_size_limit()
 
-            cache_size = self._get_cache_size()
-            cache_count = len(list(self.location.glob("*.cache")))
-
             logger.info(
                 "cache_cleanup_completed",
-                cache_size=cache_size,
-                cache_count=cache_count,
+                cache_size=self._total_size,
+                cache_count=self._entry_count(),
                 orphaned_removed=len(orphaned),
                 missing_removed=len(missing_keys),
             )
@@ -377,6 +472,10 @@ class DiskCache:
             )
             handle_error(error)
 
+    def _entry_count(self) -> int:
+        with self._lock:
+            return self._index.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
     def cache_function(self, func: Callable) -> Callable:
         """
         Decorator for caching function results using joblib.Memory.
@@ -439,7 +538,7 @@ class DiskCache:
         """
         try:
             cache_size = self._get_cache_size()
-            cache_count = len(list(self.location.glob("*.cache")))
+            cache_count = self._entry_count()
 
             stats = {
                 "location": str(self.location),
@@ -447,7 +546,8 @@ class DiskCache:
                 "max_size_bytes": self._max_size_bytes,
                 "current_size_bytes": cache_size,
                 "entry_count": cache_count,
-                "lru_entries": len(self._lru_order),
+                "lru_entries": cache_count,
+                "pending_lru_updates": len(self._pending_access),
                 "expired": self._expired(),
             }
 
@@ -484,10 +584,16 @@ class DiskCache:
         """Context manager exit with cleanup."""
         self.cleanup()
 
+    def close(self) -> None:
+        """Grava acessos pendentes e fecha o índice."""
+        with self._lock:
+            self._flush_access()
+            self._index.close()
+
     def __del__(self):
         """Cleanup on object destruction."""
         try:
-            self._save_lru_order()
+            self.close()
         except Exception:
             pass  # Ignore errors during destruction
 
@@ -0,0 +1,387 @@
+"""
+Tiered Cache - cache em dois níveis (memória + disco) com contabilidade em bytes
+
+- L1: LRU em memória limitado por bytes (arrays contam ``ndarray.nbytes``)
+- L2: ``DiskCache`` opcional; escrita write-through, hits promovidos para L1
+
+Thread-safe (RLock no L1; o ``DiskCache`` tem lock próprio). Quando associado
+a um ``MemoryManager``, o L1 encolhe em ``MemoryLevel.HIGH`` e é esvaziado em
+``MemoryLevel.CRITICAL``; o L2 não é afetado.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import sys
+import uuid
+import weakref
+from collections import OrderedDict
+from threading import RLock
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from pydantic import BaseModel
+
+from platform_base.utils.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from platform_base.caching.disk import DiskCache
+    from platform_base.core.memory_manager import MemoryManager
+
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_MEMORY_BYTES = 256 * 1024 * 1024
+
+# Fração do L1 mantida quando a memória do sistema chega em HIGH
+HIGH_PRESSURE_KEEP_FRACTION = 0.5
+
+# Arrays graváveis maiores que isto não viram chave: hashear o buffer custa
+# mais que refazer a decimação que a chave protegeria
+FINGERPRINT_MAX_HASH_BYTES = 1024 * 1024
+
+# Tokens de identidade de arrays imutáveis: id -> (weakref, token). O prefixo
+# por processo impede colisão de chaves persistidas no L2 entre processos.
+_fingerprint_memo: dict[int, tuple[weakref.ref, bytes]] = {}
+_fingerprint_lock = RLock()
+_fingerprint_process = uuid.uuid4().bytes
+_fingerprint_counter = itertools.count()
+
+
+def sizeof(value: Any) -> int:
+    """
+    Estimativa do tamanho em bytes de ``value``.
+
+    Arrays numpy contam ``nbytes``; modelos pydantic, dicts, listas e objetos
+    com ``__dict__`` são percorridos recursivamente (cada objeto uma vez).
+    """
+    seen: set[int] = set()
+
+    def _size(obj: Any) -> int:
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+
+        if isinstance(obj, np.ndarray):
+            return int(obj.nbytes)
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None))):
+            return sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            return sys.getsizeof(obj) + sum(_size(k) + _size(v) for k, v in obj.items())
+        if isinstance(obj, (list, tuple, set, frozenset)):
+            return sys.getsizeof(obj) + sum(_size(item) for item in obj)
+        if isinstance(obj, BaseModel):
+            return sys.getsizeof(obj) + sum(_size(v) for v in obj.__dict__.values())
+        if hasattr(obj, "__dict__"):
+            return sys.getsizeof(obj) + _size(vars(obj))
+        return sys.getsizeof(obj)
+
+    return _size(value)
+
+
+def _is_immutable(arr: np.ndarray) -> bool:
+    """True se nem o array nem nenhum ndarray da cadeia ``base`` aceita escrita."""
+    while isinstance(arr, np.ndarray):
+        if arr.flags.writeable:
+            return False
+        arr = arr.base
+    return True
+
+
+def _content_digest(arr: np.ndarray) -> bytes:
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{arr.shape}:{arr.dtype.str}".encode())
+    if arr.dtype.hasobject:
+        hasher.update(arr.tobytes())
+    else:
+        hasher.update(np.ascontiguousarray(arr).reshape(-1).view(np.uint8))
+    return hasher.digest()
+
+
+def array_fingerprint(*arrays: np.ndarray) -> str | None:
+    """
+    Chave para caches de resultados derivados de arrays (ex.: decimação).
+
+    Arrays imutáveis (somente leitura em toda a cadeia ``base``, ex.: memmaps
+    ``mode="r"``) são identificados pelo objeto, em O(1): não podem mudar
+    enquanto vivem e o token nunca é reutilizado. Arrays graváveis pequenos
+    são identificados pelo conteúdo (forma, dtype e hash do buffer), então
+    alterações in-place mudam a chave. Acima de ``FINGERPRINT_MAX_HASH_BYTES``
+    graváveis retorna None: o chamador não deve usar cache.
+    """
+    pending = [np.asanyarray(arr) for arr in arrays]  # memmap continua o mesmo objeto
+    writable_bytes = sum(arr.nbytes for arr in pending if not _is_immutable(arr))
+    if writable_bytes > FINGERPRINT_MAX_HASH_BYTES:
+        return None
+
+    hasher = hashlib.blake2b(digest_size=16)
+    for arr in pending:
+        if not _is_immutable(arr):
+            hasher.update(_content_digest(arr))
+            continue
+        hasher.update(_identity_token(arr))
+    return hasher.hexdigest()
+
+
+def _identity_token(arr: np.ndarray) -> bytes:
+    key = id(arr)
+    with _fingerprint_lock:
+        memo = _fingerprint_memo.get(key)
+        if memo is not None and memo[0]() is arr:
+            return memo[1]
+        token = b"%s:%d:%s:%s" % (_fingerprint_process, next(_fingerprint_counter),
+                                  str(arr.shape).encode(), arr.dtype.str.encode())
+        ref = weakref.ref(arr, lambda _, key=key: _fingerprint_memo.pop(key, None))
+        _fingerprint_memo[key] = (ref, token)
+        return token
+
+
+def _remove_hooks(memory_manager: MemoryManager, hooks: list[tuple[Any, Any]]) -> None:
+    for level, hook in hooks:
+        memory_manager.remove_level_change_callback(level, hook)
+
+
+class TieredCache:
+    """
+    Cache thread-safe memória (L1) + disco (L2).
+
+    Features:
+    - L1 LRU limitado por bytes, não por número de itens
+    - L2 ``DiskCache`` opcional (write-through, promoção no hit)
+    - Contadores de hits por nível, misses e evicções
+    - Encolhimento automático sob pressão de memória (``MemoryManager``)
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        disk_cache: DiskCache | None = None,
+        memory_manager: MemoryManager | None = None,
+        name: str = "tiered",
+    ):
+        """
+        Args:
+            max_memory_bytes: Limite do L1 em bytes
+            disk_cache: Cache de disco usado como L2 (None = só memória)
+            memory_manager: Se informado, L1 reage às mudanças de nível de memória
+            name: Identificador usado nos logs e estatísticas
+        """
+        self.name = name
+        self._max_memory_bytes = int(max_memory_bytes)
+        self._disk = disk_cache
+        self._lock = RLock()
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._memory_bytes = 0
+
+        self._l1_hits = 0
+        self._l2_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._pressure_events = 0
+
+        self._memory_manager: MemoryManager | None = None
+        self._pressure_hooks: list[tuple[Any, Any]] = []
+        self._hooks_finalizer: weakref.finalize | None = None
+        if memory_manager is not None:
+            self.attach_memory_manager(memory_manager)
+
+    # ------------------------------------------------------------------
+    # Acesso
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Busca ``key`` no L1 e depois no L2; retorna ``default`` se ausente."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._l1_hits += 1
+                return entry[0]
+
+        if self._disk is not None:
+            value = self._disk.get(key)
+            if value is not None:
+                with self._lock:
+                    self._l2_hits += 1
+                    self._store(key, value)
+                return value
+
+        with self._lock:
+            self._misses += 1
+        return default
+
+    def set(self, key: str, value: Any, persist: bool = True) -> None:
+        """
+        Armazena ``value`` no L1 e, se ``persist``, também no L2.
+
+        Valores maiores que o limite do L1 ficam apenas no disco.
+        """
+        with self._lock:
+            self._store(key, value)
+
+        if persist and self._disk is not None:
+            self._disk.set(key, value)
+
+    def _store(self, key: str, value: Any) -> None:
+        size = sizeof(value)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= old[1]
+
+        if size > self._max_memory_bytes:
+            logger.debug("tiered_cache_value_too_large", cache=self.name, key=key, size_bytes=size)
+            return
+
+        self._entries[key] = (value, size)
+        self._memory_bytes += size
+        self._evict_to(self._max_memory_bytes)
+
+    def _evict_to(self, target_bytes: int) -> int:
+        evicted = 0
+        while self._entries and self._memory_bytes > target_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._memory_bytes -= size
+            evicted += 1
+        self._evictions += evicted
+        return evicted
+
+    def delete(self, key: str) -> bool:
+        """Remove ``key`` do L1 (o L2 expira pelas próprias regras)."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._memory_bytes -= entry[1]
+            return True
+
+    def discard_prefix(self, prefix: str) -> int:
+        """Remove do L1 todas as chaves iniciadas por ``prefix``."""
+        with self._lock:
+            keys = [k for k in self._entries if k.startswith(prefix)]
+            for key in keys:
+                self.delete(key)
+            return len(keys)
+
+    def clear(self, disk: bool = True) -> None:
+        """Esvazia o L1 e, se ``disk``, também o L2."""
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+        if disk and self._disk is not None:
+            self._disk.clear()
+
+    def shrink(self, fraction: float = HIGH_PRESSURE_KEEP_FRACTION) -> int:
+        """
+        Reduz o L1 para ``fraction`` do uso atual, descartando os itens menos
+        recentes. Retorna o número de itens removidos.
+        """
+        with self._lock:
+            target = int(self._memory_bytes * max(0.0, min(1.0, fraction)))
+            evicted = self._evict_to(target)
+        if evicted:
+            logger.info("tiered_cache_shrunk", cache=self.name, evicted=evicted,
+                        memory_bytes=self._memory_bytes)
+        return evicted
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes ocupados pelo L1."""
+        return self._memory_bytes
+
+    @property
+    def max_memory_bytes(self) -> int:
+        """Limite do L1 em bytes."""
+        return self._max_memory_bytes
+
+    @property
+    def disk_cache(self) -> DiskCache | None:
+        """Cache de disco usado como L2."""
+        return self._disk
+
+    # ------------------------------------------------------------------
+    # Pressão de memória
+    # ------------------------------------------------------------------
+
+    def attach_memory_manager(self, memory_manager: MemoryManager) -> None:
+        """
+        Registra callbacks de nível no ``MemoryManager``.
+
+        Os callbacks guardam referência fraca ao cache, então registrar não
+        impede a coleta de caches descartados; quando o cache é coletado os
+        callbacks são removidos do ``MemoryManager`` (``weakref.finalize``).
+        """
+        from platform_base.core.memory_manager import MemoryLevel
+
+        self.detach_memory_manager()
+        for level, method in (
+            (MemoryLevel.HIGH, self._on_high_memory),
+            (MemoryLevel.CRITICAL, self._on_critical_memory),
+        ):
+            ref = weakref.WeakMethod(method)
+
+            def hook(ref=ref):
+                bound = ref()
+                if bound is not None:
+                    bound()
+
+            memory_manager.add_level_change_callback(level, hook)
+            self._pressure_hooks.append((level, hook))
+        self._memory_manager = memory_manager
+        # Sem referência ao cache: roda na coleta ou no detach explícito
+        self._hooks_finalizer = weakref.finalize(
+            self, _remove_hooks, memory_manager, list(self._pressure_hooks),
+        )
+
+    def detach_memory_manager(self) -> None:
+        """Remove os callbacks registrados no ``MemoryManager``."""
+        if self._memory_manager is None:
+            return
+        self._hooks_finalizer()
+        self._hooks_finalizer = None
+        self._pressure_hooks.clear()
+        self._memory_manager = None
+
+    def _on_high_memory(self) -> None:
+        with self._lock:
+            self._pressure_events += 1
+        self.shrink(HIGH_PRESSURE_KEEP_FRACTION)
+
+    def _on_critical_memory(self) -> None:
+        with self._lock:
+            self._pressure_events += 1
+            evicted = self._evict_to(0)
+        logger.warning("tiered_cache_cleared_by_pressure", cache=self.name, evicted=evicted)
+
+    # ------------------------------------------------------------------
+    # Estatísticas
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> dict[str, Any]:
+        """Estatísticas dos dois níveis."""
+        with self._lock:
+            lookups = self._l1_hits + self._l2_hits + self._misses
+            stats = {
+                "name": self.name,
+                "memory_entries": len(self._entries),
+                "memory_bytes": self._memory_bytes,
+                "max_memory_bytes": self._max_memory_bytes,
+                "l1_hits": self._l1_hits,
+                "l2_hits": self._l2_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "pressure_events": self._pressure_events,
+                "hit_rate": (self._l1_hits + self._l2_hits) / lookups if lookups else 0.0,
+            }
+        if self._disk is not None:
+            stats["disk"] = self._disk.get_stats()
+        return stats
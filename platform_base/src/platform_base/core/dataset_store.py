@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import hashlib
+from pathlib import Path
 from threading import RLock
 from typing import TYPE_CHECKING
 
 import numpy as np
 
 from platform_base.caching.disk import create_disk_cache_from_config
+from platform_base.caching.tiered import DEFAULT_MAX_MEMORY_BYTES, TieredCache
+from platform_base.core.memory_manager import get_memory_manager
+from platform_base.core.shared_arrays import (
+    SHARED_MEMORY_MIN_BYTES,
+    get_shared_registry,
+    mapped_handle,
+)
 from platform_base.core.models import (
     Dataset,
     DatasetID,
@@ -15,6 +24,13 @@ from platform_base.core.models import (
     TimeWindow,
     ViewData,
 )
+from platform_base.io.columnar import (
+    delete_columnar,
+    is_columnar_dataset,
+    read_columnar,
+    write_columnar,
+)
+from platform_base.processing.pyramid import MinMaxPyramid, series_pyramid
 from platform_base.utils.errors import ValidationError
 from platform_base.utils.logging import get_logger
 
@@ -26,6 +42,13 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def _read_only(arr: np.ndarray) -> np.ndarray:
+    """View sem cópia que não permite escrita no array do dataset"""
+    view = arr.view()
+    view.flags.writeable = False
+    return view
+
+
 class DatasetSummary:
     """Resumo de dataset para UI"""
     def __init__(self, dataset_id: DatasetID, n_series: int, n_points: int):
@@ -43,12 +66,34 @@ class DatasetStore:
     - Cache multi-nível (memory + disk)
     - TTL configurável
     - Versionamento de datasets
-    - Operações de view com cache
+    - Views por busca binária (slices sem cópia) em eixos monotônicos;
+      índice ordenado + cache em dois níveis (``TieredCache``) nos demais
+    - Store colunar opcional com séries memory-mapped (``columnar_path``)
+    - Pirâmide min/max por série (``get_pyramid``) para plotagem em O(pixels)
+    - Arrays em memória compartilhada (``shared_memory`` / ``share_dataset``):
+      jobs em processos workers recebem handles em vez de cópias serializadas
     """
 
-    def __init__(self, cache_config: dict | None = None):
+    def __init__(
+        self,
+        cache_config: dict | None = None,
+        columnar_path: str | Path | None = None,
+        shared_memory: bool = False,
+    ):
         self._datasets: dict[DatasetID, Dataset] = {}
         self._lock = RLock()  # Thread safety
+        # dataset_id -> (t_seconds indexado, argsort, t ordenado); só eixos não-monotônicos
+        self._time_indexes: dict[DatasetID, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        # Séries alocadas em memória compartilhada ao entrar no store
+        self._shared_memory = shared_memory
+
+        # Store colunar: datasets ficam em disco e são servidos como np.memmap
+        if columnar_path is None and cache_config:
+            columnar_path = cache_config.get("columnar_path")
+        self._columnar_root = Path(columnar_path) if columnar_path else None
+        if self._columnar_root:
+            self._columnar_root.mkdir(parents=True, exist_ok=True)
+            logger.info("dataset_store_columnar_enabled", path=str(self._columnar_root))
 
         # Setup disk cache se configurado
         if cache_config:
@@ -59,11 +104,38 @@ class DatasetStore:
             self._disk_cache = None
             logger.info("dataset_store_cache_disabled")
 
+        # Views: L1 em memória limitado por bytes, L2 = disk cache (se houver)
+        memory_max_mb = (cache_config or {}).get("memory_max_mb")
+        self._view_cache = TieredCache(
+            max_memory_bytes=(int(memory_max_mb * 1024 * 1024) if memory_max_mb is not None
+                              else DEFAULT_MAX_MEMORY_BYTES),
+            disk_cache=self._disk_cache,
+            memory_manager=get_memory_manager(),
+            name="dataset_views",
+        )
+
     def add_dataset(self, dataset: Dataset) -> DatasetID:
-        """Adiciona dataset ao store thread-safe"""
+        """
+        Adiciona dataset ao store thread-safe.
+
+        Com store colunar configurado, o dataset é gravado em disco e a versão
+        residente passa a ser memory-mapped (os arrays em RAM são liberados).
+        """
         dataset_id = dataset.dataset_id
+        if self._columnar_root:
+            path = write_columnar(dataset, self._columnar_root)
+            dataset = read_columnar(path)
+            with self._lock:
+                self._datasets[dataset_id] = dataset
+            self._invalidate_views(dataset_id)
+            return dataset_id
+
+        if self._shared_memory:
+            self._share_arrays(dataset)
+
         with self._lock:
             self._datasets[dataset_id] = dataset
+        self._invalidate_views(dataset_id)
 
         # Cache dataset se cache disponível
         if self._disk_cache:
@@ -80,6 +152,15 @@ class DatasetStore:
             if dataset_id in self._datasets:
                 return self._datasets[dataset_id]
 
+            # Tenta store colunar (abre apenas o manifest, arrays via mmap)
+            if self._columnar_root:
+                path = self._columnar_root / dataset_id
+                if is_columnar_dataset(path):
+                    dataset = read_columnar(path)
+                    self._datasets[dataset_id] = dataset
+                    logger.debug("dataset_opened_from_columnar", dataset_id=dataset_id)
+                    return dataset
+
             # Tenta disk cache se disponível
             if self._disk_cache:
                 cache_key = f"dataset:{dataset_id}"
@@ -92,6 +173,44 @@ class DatasetStore:
 
             raise ValidationError("Dataset not found", {"dataset_id": dataset_id})
 
+    def open_columnar(self, path: str | Path) -> DatasetID:
+        """Registra dataset colunar existente sem copiar seus arrays para RAM"""
+        dataset = read_columnar(path)
+        with self._lock:
+            self._datasets[dataset.dataset_id] = dataset
+        logger.info("columnar_dataset_registered", dataset_id=dataset.dataset_id, path=str(path))
+        return dataset.dataset_id
+
+    def persist_dataset(self, dataset_id: DatasetID, root: str | Path | None = None) -> Path:
+        """
+        Grava dataset no formato colunar e troca a cópia residente pela versão mmap.
+
+        Args:
+            dataset_id: Dataset a persistir
+            root: Diretório raiz (padrão: ``columnar_path`` do store)
+
+        Returns:
+            Diretório do dataset colunar
+        """
+        target_root = Path(root) if root else self._columnar_root
+        if target_root is None:
+            raise ValidationError("Columnar store not configured", {"dataset_id": dataset_id})
+
+        with self._lock:
+            dataset = self.get_dataset(dataset_id)
+            path = write_columnar(dataset, target_root)
+            self._datasets[dataset_id] = read_columnar(path)
+        return path
+
+    def remove_dataset(self, dataset_id: DatasetID) -> bool:
+        """Remove dataset do store (e do store colunar, se houver)"""
+        with self._lock:
+            removed = self._datasets.pop(dataset_id, None) is not None
+            if self._columnar_root:
+                removed = delete_columnar(self._columnar_root / dataset_id) or removed
+        self._invalidate_views(dataset_id)
+        return removed
+
     def list_datasets(self) -> list[DatasetSummary]:
         """Lista datasets thread-safe"""
         with self._lock:
@@ -106,19 +225,75 @@ class DatasetStore:
             dataset = self._datasets.get(dataset_id, None)
             if not dataset:
                 raise ValidationError("Dataset not found", {"dataset_id": dataset_id})
+            if self._shared_memory:
+                series.values = self._shared(series.values)
             dataset.series[series.series_id] = series
             return series.series_id
 
+    def share_dataset(
+        self,
+        dataset_id: DatasetID,
+        series_ids: Iterable[SeriesID] | None = None,
+    ) -> Dataset:
+        """
+        Move os arrays grandes do dataset para memória compartilhada.
+
+        Os arrays (``t_seconds`` e as séries pedidas, ou todas) são
+        substituídos no próprio dataset, sem duplicar memória; chamadas
+        seguintes não copiam nada. Arrays memory-mapped (store colunar) ficam
+        como estão: os workers reabrem o arquivo.
+        """
+        with self._lock:
+            dataset = self.get_dataset(dataset_id)
+            if self._share_arrays(dataset, series_ids):
+                self._invalidate_views(dataset_id)
+            return dataset
+
+    def _share_arrays(self, dataset: Dataset, series_ids: Iterable[SeriesID] | None = None) -> bool:
+        """Aloca t_seconds e séries no registry compartilhado; True se algo mudou."""
+        changed = False
+        shared_t = self._shared(dataset.t_seconds)
+        if shared_t is not dataset.t_seconds:
+            dataset.t_seconds = shared_t
+            changed = True
+        selected = (dataset.series.values() if series_ids is None
+                    else [dataset.series[sid] for sid in series_ids if sid in dataset.series])
+        for series in selected:
+            shared_values = self._shared(series.values)
+            if shared_values is not series.values:
+                series.values = shared_values
+                changed = True
+        if changed:
+            logger.debug("dataset_shared", dataset_id=dataset.dataset_id,
+                         shared_mb=get_shared_registry().nbytes / 1024 / 1024)
+        return changed
+
+    @staticmethod
+    def _shared(values: np.ndarray) -> np.ndarray:
+        if (not isinstance(values, np.ndarray)
+                or values.nbytes < SHARED_MEMORY_MIN_BYTES
+                or mapped_handle(values) is not None):
+            return values
+        return get_shared_registry().put(values)
+
     def get_series(self, dataset_id: DatasetID, series_id: SeriesID) -> Series:
-        """Obtém série específica"""
+        """Obtém série específica (memmap quando servida pelo store colunar)"""
         with self._lock:
-            dataset = self._datasets.get(dataset_id, None)
-            if not dataset:
-                raise ValidationError("Dataset not found", {"dataset_id": dataset_id})
+            dataset = self.get_dataset(dataset_id)
             if series_id not in dataset.series:
                 raise ValidationError("Series not found", {"series_id": series_id})
             return dataset.series[series_id]
 
+    def get_pyramid(self, dataset_id: DatasetID, series_id: SeriesID) -> MinMaxPyramid:
+        """
+        Pirâmide min/max da série para plotagem por pixel.
+
+        Reaberta do disco (memmap) para datasets colunares; nos demais é
+        construída no primeiro acesso e fica anexada à série.
+        """
+        with self._lock:
+            return series_pyramid(self.get_series(dataset_id, series_id))
+
     def list_series(self, dataset_id: DatasetID) -> list[SeriesSummary]:
         """Lista séries de um dataset conforme especificação"""
         with self._lock:
@@ -144,69 +319,112 @@ class DatasetStore:
         time_window: TimeWindow,
     ) -> ViewData:
         """
-        Cria view com cache disk integrado conforme PRD seção 9.5
-
-        Views são operações custosas que se beneficiam de cache persistente.
+        Cria view de uma janela temporal conforme PRD seção 9.5
+
+        Com eixo temporal monotônico (``Dataset.is_monotonic``) a janela é
+        resolvida por busca binária e a view contém slices contíguos sem cópia
+        (memmap continua memmap) - O(log N), sem cache. Esses slices são
+        somente-leitura: escrever neles alteraria o dataset. Eixos não-monotônicos
+        usam um índice ordenado construído uma vez por dataset; essas views
+        são cópias e ficam no cache em dois níveis (L1 memória, L2 disco).
         """
         series_ids_list = list(series_ids)
 
-        # Cria chave de cache baseada nos parâmetros
-        cache_key = f"view:{dataset_id}:{hash(tuple(series_ids_list))}:{time_window.start}:{time_window.end}"
-
-        # Tenta cache primeiro
-        if self._disk_cache:
-            cached_view = self._disk_cache.get(cache_key)
-            if cached_view:
-                logger.debug("view_cache_hit",
-                           dataset_id=dataset_id,
-                           n_series=len(series_ids_list))
-                return cached_view
-
-        # Cache miss - calcula view
         with self._lock:
             dataset = self._datasets.get(dataset_id, None)
             if not dataset:
                 raise ValidationError("Dataset not found", {"dataset_id": dataset_id})
 
-            # Aplicar janela temporal
+        if dataset.is_monotonic:
             t_seconds = dataset.t_seconds
-            mask = (t_seconds >= time_window.start) & (t_seconds <= time_window.end)
-
-        if not np.any(mask):
+            lo = int(np.searchsorted(t_seconds, time_window.start, side="left"))
+            hi = int(np.searchsorted(t_seconds, time_window.end, side="right"))
+            if lo >= hi:
+                raise ValidationError("Time window has no data", {"dataset_id": dataset_id})
+
+            window = slice(lo, hi)
+            return ViewData(
+                dataset_id=dataset_id,
+                series={sid: _read_only(dataset.series[sid].values[window])
+                        for sid in series_ids_list},
+                t_seconds=_read_only(t_seconds[window]),
+                t_datetime=_read_only(dataset.t_datetime[window]),
+                window=time_window,
+            )
+
+        cache_key = self._view_cache_key(dataset_id, series_ids_list, time_window)
+        cached_view = self._view_cache.get(cache_key)
+        if cached_view is not None:
+            logger.debug("view_cache_hit",
+                       dataset_id=dataset_id,
+                       n_series=len(series_ids_list))
+            return cached_view
+
+        order, t_sorted = self._sorted_time_index(dataset)
+        lo = int(np.searchsorted(t_sorted, time_window.start, side="left"))
+        hi = int(np.searchsorted(t_sorted, time_window.end, side="right"))
+        if lo >= hi:
             raise ValidationError("Time window has no data", {"dataset_id": dataset_id})
 
-        t_seconds_view = dataset.t_seconds[mask]
-        t_datetime_view = dataset.t_datetime[mask]
-        series_view = {
-            series_id: dataset.series[series_id].values[mask] for series_id in series_ids_list
-        }
-
+        # Mantém a ordem original das amostras (mesma semântica de uma máscara)
+        indices = np.sort(order[lo:hi])
         view_data = ViewData(
             dataset_id=dataset_id,
-            series=series_view,
-            t_seconds=t_seconds_view,
-            t_datetime=t_datetime_view,
+            series={sid: dataset.series[sid].values[indices] for sid in series_ids_list},
+            t_seconds=dataset.t_seconds[indices],
+            t_datetime=dataset.t_datetime[indices],
             window=time_window,
         )
 
-        # Cache resultado se cache disponível
-        if self._disk_cache:
-            self._disk_cache.set(cache_key, view_data)
-            logger.debug("view_cached",
-                        dataset_id=dataset_id,
-                        n_series=len(series_ids_list),
-                        n_points=len(t_seconds_view))
+        self._view_cache.set(cache_key, view_data)
+        logger.debug("view_cached",
+                    dataset_id=dataset_id,
+                    n_series=len(series_ids_list),
+                    n_points=len(indices))
 
         return view_data
 
+    @staticmethod
+    def _view_cache_key(
+        dataset_id: DatasetID, series_ids: list[SeriesID], time_window: TimeWindow,
+    ) -> str:
+        """Chave estável entre processos (``hash()`` de str é aleatorizado)"""
+        digest = hashlib.sha1("\x1f".join(series_ids).encode()).hexdigest()
+        return f"view:{dataset_id}:{digest}:{time_window.start!r}:{time_window.end!r}"
+
+    def _sorted_time_index(self, dataset: Dataset) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Índice ordenado (argsort estável, t ordenado) para eixo não-monotônico.
+
+        Construído uma vez por dataset; NaN ficam no fim e nunca caem em janelas.
+        """
+        with self._lock:
+            index = self._time_indexes.get(dataset.dataset_id)
+            if index is None or index[0] is not dataset.t_seconds:
+                order = np.argsort(dataset.t_seconds, kind="stable")
+                index = (dataset.t_seconds, order, dataset.t_seconds[order])
+                self._time_indexes[dataset.dataset_id] = index
+                logger.debug("time_index_built", dataset_id=dataset.dataset_id,
+                             n_points=len(order))
+            return index[1], index[2]
+
+    def _invalidate_views(self, dataset_id: DatasetID) -> None:
+        with self._lock:
+            self._time_indexes.pop(dataset_id, None)
+        self._view_cache.discard_prefix(f"view:{dataset_id}:")
+
     def clear_cache(self) -> None:
-        """Limpa cache disk se disponível"""
-        if self._disk_cache:
-            self._disk_cache.clear()
-            logger.info("dataset_store_cache_cleared")
+        """Limpa cache de views (memória) e cache disk se disponível"""
+        self._view_cache.clear(disk=True)
+        with self._lock:
+            self._time_indexes.clear()
+        logger.info("dataset_store_cache_cleared")
 
     def get_cache_stats(self) -> dict:
         """Obtém estatísticas do cache"""
         if self._disk_cache:
-            return self._disk_cache.get_stats()
-        return {"cache_enabled": False}
+            stats = self._disk_cache.get_stats()
+        else:
+            stats = {"cache_enabled": False}
+        stats["view_cache"] = self._view_cache.get_stats()
+        return stats
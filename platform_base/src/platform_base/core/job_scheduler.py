@@ -0,0 +1,533 @@
+"""
+Job scheduler for CPU-bound processing operations
+
+All processing workers submit their numeric work (interpolation, calculus,
+synchronization, ...) to one scheduler instead of each running it on its own
+thread. The scheduler:
+
+- caps the number of concurrently running jobs at the number of cores;
+- keeps pending jobs in a priority queue, so interactive previews are started
+  before queued bulk jobs and one slot stays reserved for them;
+- runs large jobs on a process pool, handing input and result arrays over
+  through shared memory (see ``core.shared_arrays``) instead of pickling
+  them, and small jobs (or non-picklable callables) on a thread pool;
+- keeps interactive jobs on threads until the process pool is warm
+  (``warm_up``): a cold spawn worker costs seconds of interpreter start and
+  imports, far more than a preview;
+- tracks queue depth and per-job latency for the status bar.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from platform_base.core.shared_arrays import (
+    SHARED_MEMORY_MIN_BYTES,
+    MappedArrayHandle,
+    SharedArrayHandle,
+    attach_array,
+    get_shared_registry,
+    mapped_handle,
+    release_block,
+    share_array,
+)
+from platform_base.utils.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+logger = get_logger(__name__)
+
+# Latências guardadas para a média móvel exibida na UI
+LATENCY_HISTORY = 50
+
+# Importados na inicialização de cada worker (spawn começa do zero)
+WORKER_PRELOAD_MODULES = (
+    "platform_base.processing.calculus",
+    "platform_base.processing.interpolation",
+    "platform_base.processing.smoothing",
+    "platform_base.processing.synchronization",
+)
+
+
+class JobPriority(IntEnum):
+    """Job priority (lower runs first)"""
+    INTERACTIVE = 0  # previews the user is waiting on
+    NORMAL = 1       # derived series created from the UI
+    BULK = 2         # batch operations
+
+
+@dataclass
+class JobStats:
+    """Snapshot of scheduler load"""
+    queue_depth: int = 0
+    running: int = 0
+    completed: int = 0
+    failed: int = 0
+    last_latency_ms: float | None = None
+    mean_latency_ms: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "queue_depth": self.queue_depth,
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "last_latency_ms": self.last_latency_ms,
+            "mean_latency_ms": self.mean_latency_ms,
+        }
+
+
+@dataclass
+class Job:
+    """A submitted job and its timing"""
+    job_id: int
+    name: str
+    priority: JobPriority
+    func: Callable[..., Any]
+    args: tuple
+    kwargs: dict[str, Any]
+    future: Future = field(default_factory=Future)
+    use_process: bool = False
+    submitted_at: float = field(default_factory=time.perf_counter)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def wait_ms(self) -> float | None:
+        """Time spent queued"""
+        if self.started_at is None:
+            return None
+        return (self.started_at - self.submitted_at) * 1000
+
+    @property
+    def latency_ms(self) -> float | None:
+        """Submission to completion"""
+        if self.finished_at is None:
+            return None
+        return (self.finished_at - self.submitted_at) * 1000
+
+
+def _array_bytes(args: tuple, kwargs: dict[str, Any]) -> int:
+    total = 0
+    for value in (*args, *kwargs.values()):
+        if isinstance(value, (list, tuple)):
+            total += sum(item.nbytes for item in value if isinstance(item, np.ndarray))
+        elif isinstance(value, np.ndarray):
+            total += value.nbytes
+    return total
+
+
+def _is_picklable(func: Callable[..., Any]) -> bool:
+    try:
+        pickle.dumps(func)
+    except Exception:
+        return False
+    return True
+
+
+@dataclass(frozen=True)
+class _SharedResult:
+    """Result array written by a worker into a shared block"""
+    handle: SharedArrayHandle
+    # Resultado (pydantic) sem ``values``; None quando o resultado é o array
+    template: Any = None
+
+
+def _export_result(result: Any) -> Any:
+    """Worker side: move a large result array into a new shared block."""
+    values = result
+    if not isinstance(result, np.ndarray):
+        values = getattr(result, "values", None)
+        if not (isinstance(values, np.ndarray) and hasattr(result, "model_copy")):
+            return result
+
+    if values.nbytes < SHARED_MEMORY_MIN_BYTES:
+        # Views sobre memória compartilhada não sobrevivem ao close()
+        if isinstance(result, np.ndarray) and not result.flags.owndata:
+            return result.copy()
+        return result
+
+    block, handle = share_array(values)
+    release_block(block)
+    template = None if result is values else result.model_copy(update={"values": None})
+    return _SharedResult(handle, template)
+
+
+def _import_result(result: Any) -> Any:
+    """GUI side: adopt a shared result block into the registry."""
+    if not isinstance(result, _SharedResult):
+        return result
+    array = get_shared_registry().adopt(result.handle)
+    if result.template is None:
+        return array
+    return result.template.model_copy(update={"values": array})
+
+
+def _init_worker() -> None:
+    """Worker-process initializer: pay the processing imports up front."""
+    import importlib
+
+    for module in WORKER_PRELOAD_MODULES:
+        importlib.import_module(module)
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+def _run_shared(func: Callable[..., Any], args: tuple, kwargs: dict[str, Any]) -> Any:
+    """Worker-process entry point: attach shared inputs, call ``func``, export the result."""
+    blocks = []
+
+    def resolve(value):
+        if isinstance(value, SharedArrayHandle):
+            block, view = attach_array(value)
+            blocks.append(block)
+            return view
+        if isinstance(value, MappedArrayHandle):
+            return value.open()
+        if isinstance(value, (list, tuple)):
+            return type(value)(resolve(item) for item in value)
+        return value
+
+    try:
+        args = tuple(resolve(value) for value in args)
+        kwargs = {key: resolve(value) for key, value in kwargs.items()}
+        return _export_result(func(*args, **kwargs))
+    finally:
+        del args, kwargs
+        for block in blocks:
+            release_block(block)
+
+
+class JobScheduler:
+    """
+    Priority job queue over bounded process and thread pools.
+
+    ``submit`` returns a ``concurrent.futures.Future``; callers running on a
+    worker thread simply block on ``future.result()``.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        interactive_reserve: int = 1,
+        process_min_bytes: int = SHARED_MEMORY_MIN_BYTES,
+    ):
+        """
+        Args:
+            max_workers: Concurrent job cap (default: number of cores)
+            interactive_reserve: Slots bulk/normal jobs may not take
+                (ignored when the cap is 1)
+            process_min_bytes: Array payload from which jobs go to the
+                process pool; smaller jobs run on threads
+        """
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.interactive_reserve = min(interactive_reserve, self.max_workers - 1)
+        self.process_min_bytes = process_min_bytes
+
+        self._lock = threading.Lock()
+        self._pending: list[tuple[int, int, Job]] = []
+        self._running: dict[int, Job] = {}
+        self._ids = itertools.count(1)
+        self._latencies: list[float] = []
+        self._completed = 0
+        self._failed = 0
+        self._shutdown = False
+
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._process_pool_warm = False
+        self._warming = False
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        priority: JobPriority = JobPriority.NORMAL,
+        name: str | None = None,
+        **kwargs: Any,
+    ) -> Future:
+        """
+        Queue ``func(*args, **kwargs)``.
+
+        Large jobs with a module-level ``func`` run in a worker process
+        (INTERACTIVE ones only once the pool is warm, see ``warm_up``);
+        top-level ndarray arguments are passed through shared memory.
+        """
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Job scheduler has been shut down")
+
+            job = Job(
+                job_id=next(self._ids),
+                name=name or getattr(func, "__name__", "job"),
+                priority=JobPriority(priority),
+                func=func,
+                args=args,
+                kwargs=kwargs,
+            )
+            job.use_process = (_array_bytes(args, kwargs) >= self.process_min_bytes
+                               and _is_picklable(func))
+            heapq.heappush(self._pending, (job.priority, job.job_id, job))
+
+        logger.debug("job_submitted", job_id=job.job_id, name=job.name,
+                     priority=job.priority.name, process=job.use_process)
+        self._dispatch()
+        return job.future
+
+    def warm_up(self) -> None:
+        """
+        Start every process-pool worker in the background (non-blocking).
+
+        Until the workers are up, interactive jobs run on threads; call this
+        at application start so large previews can use processes later.
+        """
+        with self._lock:
+            if self._shutdown or self._process_pool_warm or self._warming:
+                return
+            self._warming = True
+        pool = self._get_process_pool()
+        started = time.perf_counter()
+        pending = [pool.submit(_worker_ready) for _ in range(self.max_workers)]
+        remaining = [len(pending)]
+
+        def on_ready(done: Future) -> None:
+            with self._lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+                self._warming = False
+                failed = any(f.cancelled() or f.exception() is not None for f in pending)
+                self._process_pool_warm = not failed and pool is self._process_pool
+            logger.info("job_workers_warm", workers=self.max_workers, failed=failed,
+                        elapsed_ms=round((time.perf_counter() - started) * 1000, 1))
+
+        for future in pending:
+            future.add_done_callback(on_ready)
+
+    @property
+    def process_pool_warm(self) -> bool:
+        """True once ``warm_up`` has started every worker process"""
+        with self._lock:
+            return self._process_pool_warm
+
+    def cancel_pending(self, priority: JobPriority | None = None) -> int:
+        """Cancel queued (not yet running) jobs, optionally of one priority."""
+        with self._lock:
+            keep, cancelled = [], []
+            for entry in self._pending:
+                if priority is None or entry[2].priority == priority:
+                    cancelled.append(entry[2])
+                else:
+                    keep.append(entry)
+            heapq.heapify(keep)
+            self._pending = keep
+
+        for job in cancelled:
+            job.future.cancel()
+        if cancelled:
+            logger.info("jobs_cancelled", count=len(cancelled))
+        return len(cancelled)
+
+    def stats(self) -> JobStats:
+        """Current queue depth, running jobs and latency figures"""
+        with self._lock:
+            latencies = list(self._latencies)
+            return JobStats(
+                queue_depth=len(self._pending),
+                running=len(self._running),
+                completed=self._completed,
+                failed=self._failed,
+                last_latency_ms=latencies[-1] if latencies else None,
+                mean_latency_ms=float(np.mean(latencies)) if latencies else None,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Cancel queued jobs and stop the pools."""
+        self.cancel_pending()
+        with self._lock:
+            self._shutdown = True
+            pools = [self._thread_pool, self._process_pool]
+            self._thread_pool = self._process_pool = None
+            self._process_pool_warm = False
+
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=True)
+        logger.info("job_scheduler_shutdown")
+
+    # ------------------------------------------------------------------
+    # Despacho
+    # ------------------------------------------------------------------
+
+    def _can_start(self, job: Job) -> bool:
+        limit = self.max_workers
+        if job.priority != JobPriority.INTERACTIVE:
+            limit -= self.interactive_reserve
+        return len(self._running) < limit
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while slots are free (highest priority first)."""
+        to_start = []
+        with self._lock:
+            while self._pending and not self._shutdown:
+                job = self._pending[0][2]
+                if not self._can_start(job):
+                    break
+                heapq.heappop(self._pending)
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                job.started_at = time.perf_counter()
+                self._running[job.job_id] = job
+                to_start.append(job)
+
+        for job in to_start:
+            self._start(job)
+
+    def _start(self, job: Job) -> None:
+        blocks = []
+        if job.use_process and job.priority == JobPriority.INTERACTIVE:
+            with self._lock:
+                job.use_process = self._process_pool_warm
+        try:
+            if job.use_process:
+                args, kwargs, blocks = self._share_arguments(job)
+                pool_future = self._get_process_pool().submit(_run_shared, job.func, args, kwargs)
+            else:
+                pool_future = self._get_thread_pool().submit(job.func, *job.args, **job.kwargs)
+        except Exception as e:
+            for block in blocks:
+                release_block(block, unlink=True)
+            self._finish(job, None, e)
+            return
+
+        def on_done(done: Future) -> None:
+            for block in blocks:
+                release_block(block, unlink=True)
+            if done.cancelled():
+                self._finish(job, None, RuntimeError("Job cancelled"))
+            else:
+                self._finish(job, done.result() if done.exception() is None else None,
+                             done.exception())
+
+        pool_future.add_done_callback(on_done)
+
+    def _share_arguments(self, job: Job) -> tuple[tuple, dict[str, Any], list]:
+        """
+        Replace array arguments by handles.
+
+        Registry arrays (e.g. ``DatasetStore`` series) and memory-mapped
+        arrays are passed by reference; other large arrays are copied into
+        temporary blocks released when the job finishes.
+        """
+        registry = get_shared_registry()
+        blocks = []
+
+        def share(value):
+            if isinstance(value, (list, tuple)):
+                return type(value)(share(item) for item in value)
+            if not isinstance(value, np.ndarray) or value.nbytes < SHARED_MEMORY_MIN_BYTES:
+                return value
+            handle = registry.handle_for(value) or mapped_handle(value)
+            if handle is None:
+                block, handle = share_array(value)
+                blocks.append(block)
+            return handle
+
+        try:
+            args = tuple(share(value) for value in job.args)
+            kwargs = {key: share(value) for key, value in job.kwargs.items()}
+        except Exception:
+            for block in blocks:
+                release_block(block, unlink=True)
+            raise
+        return args, kwargs, blocks
+
+    def _finish(self, job: Job, result: Any, error: BaseException | None) -> None:
+        if error is None:
+            try:
+                result = _import_result(result)
+            except Exception as e:
+                error = e
+
+        job.finished_at = time.perf_counter()
+        with self._lock:
+            self._running.pop(job.job_id, None)
+            self._latencies.append(job.latency_ms)
+            del self._latencies[:-LATENCY_HISTORY]
+            if error is None:
+                self._completed += 1
+            else:
+                self._failed += 1
+
+        if error is None:
+            job.future.set_result(result)
+        else:
+            job.future.set_exception(error)
+
+        logger.debug("job_finished", job_id=job.job_id, name=job.name,
+                     wait_ms=job.wait_ms, latency_ms=job.latency_ms,
+                     failed=error is not None)
+        self._dispatch()
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="job",
+                )
+            return self._thread_pool
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._process_pool is None:
+                # spawn: fork de um processo com threads Qt não é seguro
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            return self._process_pool
+
+
+# Global instance
+_job_scheduler: JobScheduler | None = None
+_job_scheduler_lock = threading.Lock()
+
+
+def get_job_scheduler() -> JobScheduler:
+    """Get global job scheduler instance (pools start lazily)."""
+    global _job_scheduler
+    with _job_scheduler_lock:
+        if _job_scheduler is None:
+            _job_scheduler = JobScheduler()
+        return _job_scheduler
+
+
+def shutdown_job_scheduler(wait: bool = True) -> None:
+    """Shut down the global scheduler, if it was created."""
+    global _job_scheduler
+    with _job_scheduler_lock:
+        scheduler, _job_scheduler = _job_scheduler, None
+    if scheduler is not None:
+        scheduler.shutdown(wait=wait)
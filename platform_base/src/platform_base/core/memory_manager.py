@@ -111,6 +111,8 @@ class MemoryManager:
         self._current_status: MemoryStatus | None = None
         self._last_level = MemoryLevel.NORMAL
         self._low_memory_mode = False
+        self._reservations: dict[str, float] = {}
+        self._reservations_lock = threading.Lock()
 
     def configure(self, config: MemoryConfig) -> None:
         """
@@ -295,16 +297,20 @@ class MemoryManager:
         estimated_mb = self.estimate_file_memory(file_path)
         status = self.get_status()
 
+        # Loads in flight (see reserve()) have not allocated their memory yet
+        reserved_mb = self.reserved_mb
+        available_mb = status.available_mb - reserved_mb
+
         # Check if we have enough available memory
-        if estimated_mb > status.available_mb:
+        if estimated_mb > available_mb:
             return (
                 False,
-                f"Not enough memory. Need ~{estimated_mb:.1f}MB, only {status.available_mb:.1f}MB available.",
+                f"Not enough memory. Need ~{estimated_mb:.1f}MB, only {max(available_mb, 0.0):.1f}MB available.",
             )
 
         # Check if loading would exceed hard limit
         hard_limit_mb = status.total_mb * (self._config.hard_limit_percent / 100)
-        projected_usage = status.process_mb + estimated_mb
+        projected_usage = status.process_mb + reserved_mb + estimated_mb
 
         if projected_usage > hard_limit_mb:
             return (
@@ -314,7 +320,7 @@ class MemoryManager:
             )
 
         # Generate warning if it would push us into high/critical
-        projected_percent = ((status.total_mb - status.available_mb + estimated_mb) / status.total_mb) * 100
+        projected_percent = ((status.total_mb - available_mb + estimated_mb) / status.total_mb) * 100
 
         if projected_percent >= self._config.high_threshold:
             level = "CRITICAL" if projected_percent >= self._config.critical_threshold else "HIGH"
@@ -326,6 +332,37 @@ class MemoryManager:
 
         return (True, None)
 
+    def reserve(self, key: str, file_path: str | Path) -> float:
+        """
+        Reserve the estimated memory of a file that is about to be loaded.
+
+        Concurrent loads share one budget: ``can_load_file`` subtracts all
+        active reservations from the available memory until ``release`` is
+        called for the key.
+
+        Args:
+            key: Reservation identifier (e.g. the file path)
+            file_path: File whose estimated memory is reserved
+
+        Returns:
+            Reserved memory in MB
+        """
+        estimated_mb = self.estimate_file_memory(file_path)
+        with self._reservations_lock:
+            self._reservations[key] = estimated_mb
+        return estimated_mb
+
+    def release(self, key: str) -> None:
+        """Release a reservation made with ``reserve``."""
+        with self._reservations_lock:
+            self._reservations.pop(key, None)
+
+    @property
+    def reserved_mb(self) -> float:
+        """Total memory reserved by loads in flight (MB)."""
+        with self._reservations_lock:
+            return sum(self._reservations.values())
+
     def force_gc(self) -> int:
         """
         Force garbage collection.
@@ -389,9 +426,19 @@ class MemoryManager:
         """
         self._level_change_callbacks[level].append(callback)
 
+    def remove_level_change_callback(
+        self,
+        level: MemoryLevel,
+        callback: Callable[[], None],
+    ) -> None:
+        """Remove level change callback."""
+        if callback in self._level_change_callbacks[level]:
+            self._level_change_callbacks[level].remove(callback)
+
     def _on_level_changed(self, new_level: MemoryLevel) -> None:
         """Handle level change."""
-        for callback in self._level_change_callbacks[new_level]:
+        # Cópia: callbacks podem se remover durante o disparo
+        for callback in list(self._level_change_callbacks[new_level]):
             try:
                 callback()
             except Exception:
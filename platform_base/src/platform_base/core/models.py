@@ -7,7 +7,7 @@ from typing import Any
 import numpy as np
 from numpy.typing import NDArray
 from pint import Unit
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 DatasetID = str
@@ -15,6 +15,26 @@ SeriesID = str
 ViewID = str
 SessionID = str
 
+# Bloco usado na verificação de monotonicidade (evita np.diff de N elementos)
+_MONOTONIC_CHECK_BLOCK = 1 << 20
+
+
+def is_non_decreasing(values: np.ndarray) -> bool:
+    """
+    True se ``values`` é não-decrescente e sem NaN.
+
+    Percorre o array em blocos para não alocar um temporário do tamanho do
+    eixo (importante para eixos memory-mapped com dezenas de milhões de pontos).
+    """
+    values = np.asarray(values)
+    n = len(values)
+    for start in range(0, n - 1, _MONOTONIC_CHECK_BLOCK):
+        stop = min(start + _MONOTONIC_CHECK_BLOCK + 1, n)
+        block = values[start:stop]
+        if not np.all(block[1:] >= block[:-1]):
+            return False
+    return n != 1 or not np.isnan(values[0])
+
 
 class SourceInfo(BaseModel):
     """Informação de origem do arquivo"""
@@ -57,6 +77,7 @@ class DatasetMetadata(BaseModel):
     validation_warnings: list[str] = Field(default_factory=list)
     validation_errors: list[str] = Field(default_factory=list)
     timezone: str = "UTC"
+    load_timings_ms: dict[str, float] = Field(default_factory=dict)  # duração por estágio do loader
 
 
 class SeriesMetadata(BaseModel):
@@ -78,6 +99,7 @@ class InterpolationInfo(BaseModel):
     is_interpolated_mask: NDArray[np.bool_] = Field(alias="is_interpolated")
     method_used: NDArray[np.str_]
     confidence: NDArray[np.float64] | None = None
+    uncertainty_std: NDArray[np.float64] | None = None
 
     @property
     def is_interpolated(self) -> NDArray[np.bool_]:
@@ -134,6 +156,9 @@ class Series(BaseModel):
     interpolation_info: InterpolationInfo | None = None
     metadata: SeriesMetadata
     lineage: Lineage | None = None
+    # Pirâmide min/max (processing.pyramid.MinMaxPyramid) para plotagem;
+    # construída sob demanda ou reaberta do store colunar.
+    pyramid: Any = Field(default=None, exclude=True, repr=False)
 
 
 class Dataset(BaseModel):
@@ -148,6 +173,27 @@ class Dataset(BaseModel):
     series: dict[SeriesID, Series]
     metadata: DatasetMetadata
     created_at: datetime
+    # Eixo temporal não-decrescente: janelas resolvidas por busca binária.
+    # None na construção = detectado a partir de t_seconds; trocar t_seconds
+    # (atribuição ou model_copy) recalcula a flag.
+    is_monotonic: bool | None = None
+
+    @model_validator(mode="after")
+    def _detect_monotonic(self) -> Dataset:
+        if self.is_monotonic is None:
+            self.is_monotonic = is_non_decreasing(self.t_seconds)
+        return self
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "t_seconds":
+            super().__setattr__("is_monotonic", is_non_decreasing(value))
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> Dataset:
+        # model_copy não roda validadores: sem isto a cópia herdaria a flag antiga
+        if update and "t_seconds" in update and "is_monotonic" not in update:
+            update = {**update, "is_monotonic": is_non_decreasing(update["t_seconds"])}
+        return super().model_copy(update=update, deep=deep)
 
 
 class TimeWindow(BaseModel):
@@ -0,0 +1,237 @@
+"""
+Shared-memory array handoff between the GUI process and worker processes
+
+Arrays are copied once into a ``multiprocessing.shared_memory`` block and
+referenced by a small picklable ``SharedArrayHandle`` (block name, shape and
+dtype). Worker processes attach to the block and get a read-only ndarray
+view instead of unpickling a copy of the data.
+
+``SharedArrayRegistry`` owns the blocks of the GUI process: ``DatasetStore``
+allocates series into it so that submitting a job passes the existing handle
+(no copy at all), and results written by workers into new blocks are adopted
+by it. Memory-mapped arrays (columnar store) travel as ``MappedArrayHandle``
+and are simply reopened by the worker.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from platform_base.utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# Arrays smaller than this are cheaper to pickle than to share
+SHARED_MEMORY_MIN_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class SharedArrayHandle:
+    """Picklable reference to an array stored in a shared-memory block"""
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+
+
+@dataclass(frozen=True)
+class MappedArrayHandle:
+    """Picklable reference to a read-only memory-mapped ``.npy`` array"""
+    filename: str
+    offset: int
+    shape: tuple[int, ...]
+    dtype: str
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+
+    def open(self) -> np.ndarray:
+        return np.memmap(self.filename, dtype=np.dtype(self.dtype), mode="r",
+                         offset=self.offset, shape=self.shape)
+
+
+def mapped_handle(values: np.ndarray) -> MappedArrayHandle | None:
+    """Handle for a whole, contiguous ``np.memmap`` array (None otherwise)."""
+    if not isinstance(values, np.memmap) or values.filename is None:
+        return None
+    if not values.flags.c_contiguous:
+        return None
+    # Slices de um memmap herdam offset/filename do pai; só o array inteiro
+    # (ou uma view idêntica) é reaberto com segurança
+    root = values
+    while isinstance(root.base, np.memmap):
+        root = root.base
+    if root.shape != values.shape or root.ctypes.data != values.ctypes.data:
+        return None
+    return MappedArrayHandle(values.filename, int(values.offset), tuple(values.shape),
+                             values.dtype.str)
+
+
+def share_array(values: np.ndarray) -> tuple[shared_memory.SharedMemory, SharedArrayHandle]:
+    """
+    Copy ``values`` into a new shared-memory block.
+
+    The caller owns the returned block and must ``close()`` and ``unlink()``
+    it once no process needs the data any more.
+    """
+    values = np.ascontiguousarray(values)
+    block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[...] = values
+    handle = SharedArrayHandle(block.name, tuple(values.shape), values.dtype.str)
+    logger.debug("shared_array_created", name=block.name, nbytes=values.nbytes)
+    return block, handle
+
+
+def attach_array(
+    handle: SharedArrayHandle,
+    writable: bool = False,
+) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+    """
+    Attach to a shared block and return a view of its array.
+
+    The view is read-only unless ``writable`` (e.g. an output block the
+    worker fills). The block must stay referenced while the view is in use;
+    ``close()`` it afterwards (never ``unlink()`` from the attaching side).
+    """
+    block = shared_memory.SharedMemory(name=handle.name)
+    view = np.ndarray(handle.shape, dtype=np.dtype(handle.dtype), buffer=block.buf)
+    view.flags.writeable = writable
+    return block, view
+
+
+def release_block(block: shared_memory.SharedMemory, unlink: bool = False) -> None:
+    """Close (and optionally unlink) a block, tolerating views still alive."""
+    try:
+        block.close()
+    except BufferError:
+        # Ainda existem views exportadas; o mapeamento é liberado no GC
+        logger.debug("shared_block_close_deferred", name=block.name)
+    if unlink:
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SharedArrayRegistry:
+    """
+    Shared-memory blocks owned by this process.
+
+    Every array handed out (``allocate``/``put``/``adopt``) is backed by its
+    own block; the block is unlinked when the array is garbage collected or
+    ``release``-d. ``handle_for`` maps such an array back to its handle so it
+    can be sent to a worker without copying.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[int, tuple[weakref.ref, SharedArrayHandle]] = {}
+        self._blocks: dict[str, shared_memory.SharedMemory] = {}
+
+    def allocate(self, shape: tuple[int, ...] | int, dtype=np.float64) -> np.ndarray:
+        """New writable shared array (uninitialized)"""
+        shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        block = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+        return self._track(block, SharedArrayHandle(block.name, shape, dtype.str))
+
+    def put(self, values: np.ndarray) -> np.ndarray:
+        """Shared copy of ``values`` (returned as is if already shared)"""
+        if self.handle_for(values) is not None:
+            return values
+        values = np.asarray(values)
+        array = self.allocate(values.shape, values.dtype)
+        array[...] = values
+        return array
+
+    def adopt(self, handle: SharedArrayHandle) -> np.ndarray:
+        """Take ownership of a block created by another process"""
+        block, _ = attach_array(handle)
+        return self._track(block, handle)
+
+    def handle_for(self, values: np.ndarray) -> SharedArrayHandle | None:
+        """Handle of a registry array (or an identical full view of one)"""
+        obj = values
+        with self._lock:
+            while isinstance(obj, np.ndarray):
+                entry = self._entries.get(id(obj))
+                if entry is not None and entry[0]() is obj:
+                    handle = entry[1]
+                    same_view = (values.shape == handle.shape
+                                 and values.dtype.str == handle.dtype
+                                 and values.flags.c_contiguous
+                                 and values.ctypes.data == obj.ctypes.data)
+                    return handle if same_view else None
+                obj = obj.base
+        return None
+
+    def release(self, values: np.ndarray) -> None:
+        """Unlink the block of a registry array now (views stay readable)"""
+        with self._lock:
+            entry = self._entries.pop(id(values), None)
+        if entry is not None:
+            self._free(entry[1].name)
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return sum(handle.nbytes for _, handle in self._entries.values())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def release_all(self) -> None:
+        with self._lock:
+            names = [handle.name for _, handle in self._entries.values()]
+            self._entries.clear()
+        for name in names:
+            self._free(name)
+
+    def _track(self, block: shared_memory.SharedMemory, handle: SharedArrayHandle) -> np.ndarray:
+        array = np.ndarray(handle.shape, dtype=np.dtype(handle.dtype), buffer=block.buf)
+        key = id(array)
+        with self._lock:
+            self._blocks[handle.name] = block
+            self._entries[key] = (weakref.ref(array), handle)
+        weakref.finalize(array, self._on_collected, key, handle.name)
+        logger.debug("shared_array_registered", name=handle.name, nbytes=handle.nbytes)
+        return array
+
+    def _on_collected(self, key: int, name: str) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1].name == name:
+                del self._entries[key]
+        self._free(name)
+
+    def _free(self, name: str) -> None:
+        with self._lock:
+            block = self._blocks.pop(name, None)
+        if block is not None:
+            release_block(block, unlink=True)
+
+
+# Global instance
+_registry: SharedArrayRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_shared_registry() -> SharedArrayRegistry:
+    """Get the process-wide shared array registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = SharedArrayRegistry()
+        return _registry
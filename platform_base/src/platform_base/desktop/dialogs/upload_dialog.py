@@ -8,6 +8,7 @@ Interface carregada de: desktop/ui_files/uploadDialog.ui
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -43,10 +44,52 @@ from platform_base.utils.logging import get_logger
 if TYPE_CHECKING:
     from platform_base.desktop.session_state import SessionState
     from platform_base.desktop.signal_hub import SignalHub
+    from platform_base.io.dataset_cache import DatasetCache
+    from platform_base.io.loader import LoadConfig
 
 
 logger = get_logger(__name__)
 
+# Cache persistente de datasets parseados (opt-in: ``use_dataset_cache``).
+# Fica em ``dataset_cache_path`` ou, por padrão, neste diretório do usuário,
+# limitado a ``dataset_cache_max_size_gb`` com evicção LRU.
+DEFAULT_DATASET_CACHE_DIR = Path.home() / ".platform_base" / "cache" / "datasets"
+DEFAULT_DATASET_CACHE_MAX_SIZE_GB = 2.0
+
+
+def _build_load_config(config: dict[str, Any]) -> LoadConfig:
+    """Build LoadConfig from the dialog configuration dict"""
+    from platform_base.io.loader import LoadConfig
+
+    return LoadConfig(
+        timestamp_column=config.get("timestamp_column"),
+        delimiter=config.get("delimiter", ","),
+        encoding=config.get("encoding", "utf-8"),
+        sheet_name=config.get("sheet_name", 0),  # Default to first sheet
+        hdf5_key=config.get("hdf5_key") or "/data",
+        chunk_size=config.get("chunk_size"),
+        engine=config.get("engine", "pandas"),
+        excel_engine=config.get("excel_engine", LoadConfig.model_fields["excel_engine"].default),
+        columns=config.get("columns"),
+    )
+
+
+def _build_dataset_cache(config: dict[str, Any]) -> DatasetCache | None:
+    """Parsed-dataset cache for the dialog configuration (None unless enabled)"""
+    if not config.get("use_dataset_cache", False):
+        return None
+    from platform_base.io.dataset_cache import DatasetCache
+
+    max_size_gb = config.get("dataset_cache_max_size_gb", DEFAULT_DATASET_CACHE_MAX_SIZE_GB)
+    try:
+        return DatasetCache(
+            config.get("dataset_cache_path") or DEFAULT_DATASET_CACHE_DIR,
+            max_size_bytes=int(max_size_gb * 1024 ** 3),
+        )
+    except OSError as e:
+        logger.warning("dataset_cache_unavailable", error=str(e))
+        return None
+
 
 class FileLoadWorker(BaseWorker):
     """Worker thread for loading files"""
@@ -66,23 +109,23 @@ class FileLoadWorker(BaseWorker):
             self.status_updated.emit("Loading file...")
 
             # Import loader (avoid import at module level)
-            from platform_base.io.loader import LoadConfig, load
+            from platform_base.io.loader import DataLoaderService
 
             # Create load config
-            load_config = LoadConfig(
-                timestamp_column=self.config.get("timestamp_column"),
-                delimiter=self.config.get("delimiter", ","),
-                encoding=self.config.get("encoding", "utf-8"),
-                sheet_name=self.config.get("sheet_name", 0),  # Default to first sheet
-                hdf5_key=self.config.get("hdf5_key") or "/data",
-                chunk_size=self.config.get("chunk_size"),
-            )
+            load_config = _build_load_config(self.config)
 
             self.progress.emit(25)
             self.status_updated.emit("Parsing data...")
 
-            # Load dataset
-            dataset = load(self.filepath, load_config)
+            # Load dataset (chunked CSV ingest reports progress per chunk)
+            def on_progress(percent: float, message: str) -> None:
+                self.progress.emit(25 + int(percent * 0.5))
+                self.status_updated.emit(message)
+
+            # Files already parsed with this config are opened from the cache
+            service = DataLoaderService(dataset_cache=_build_dataset_cache(self.config))
+            dataset = service.load_dataset(self.filepath, load_config,
+                                           progress_callback=on_progress)
 
             self.progress.emit(75)
             self.status_updated.emit("Validating data...")
@@ -97,6 +140,57 @@ class FileLoadWorker(BaseWorker):
             self.error.emit(str(e))
 
 
+class BatchFileLoadWorker(BaseWorker):
+    """
+    Worker thread for loading several files at once.
+
+    Files are parsed concurrently in a process pool by
+    ``DataLoaderService.load_many``, which also enforces the shared
+    MemoryManager budget; datasets are emitted as each file completes.
+    """
+
+    file_loaded = pyqtSignal(str, object)  # filepath, dataset
+    file_failed = pyqtSignal(str, str)  # filepath, error message
+
+    def __init__(self, filepaths: list[str], config: dict[str, Any],
+                 max_workers: int | None = None):
+        super().__init__()
+        self.filepaths = list(filepaths)
+        self.config = config
+        self.max_workers = max_workers
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Cancel the batch: files not yet started are skipped"""
+        super().cancel()
+        self._cancel_event.set()
+
+    def run(self):
+        """Load all files in the process pool"""
+        try:
+            from platform_base.io.loader import DataLoaderService
+
+            service = DataLoaderService(dataset_cache=_build_dataset_cache(self.config))
+            results = service.load_many(
+                self.filepaths,
+                _build_load_config(self.config),
+                max_workers=self.max_workers,
+                cancel_event=self._cancel_event,
+            )
+            for result in results:
+                if self.is_cancelled:
+                    break
+                if result.ok:
+                    self.file_loaded.emit(result.path, result.dataset)
+                else:
+                    self.file_failed.emit(result.path, result.error or "")
+
+        except Exception as e:
+            self.error.emit(str(e))
+        finally:
+            self.finished.emit()
+
+
 class PreviewWorker(BaseWorker):
     """Worker for generating file preview"""
 
@@ -219,7 +313,7 @@ class UploadDialog(QDialog, UiLoaderMixin):
 
         # Multi-file loading state
         self.pending_files: list[str] = []
-        self.loading_files: dict[str, FileLoadWorker] = {}
+        self.batch_worker: BatchFileLoadWorker | None = None
         self.loaded_datasets: list[str] = []  # Track loaded dataset IDs
         self.load_errors: list[str] = []
 
@@ -645,7 +739,6 @@ class UploadDialog(QDialog, UiLoaderMixin):
 
         # Reset state
         self.pending_files = list(self.selected_files)
-        self.loading_files = {}
         self.loaded_datasets = []
         self.load_errors = []
 
@@ -665,15 +758,13 @@ class UploadDialog(QDialog, UiLoaderMixin):
 
         logger.info("multi_file_load_started", file_count=len(self.pending_files))
 
-        # Start loading all files in parallel
-        for filepath in self.pending_files:
-            worker = FileLoadWorker(filepath, self.current_config)
-            worker.file_loaded.connect(self._on_multi_file_loaded)
-            worker.error.connect(lambda err, fp=filepath: self._on_multi_file_error(fp, err))
-            worker.finished.connect(lambda fp=filepath: self._on_multi_file_finished(fp))
-
-            self.loading_files[filepath] = worker
-            worker.start()
+        # Load all files in parallel (process pool, shared memory budget)
+        self.batch_worker = BatchFileLoadWorker(self.pending_files, self.current_config)
+        self.batch_worker.file_loaded.connect(self._on_multi_file_loaded)
+        self.batch_worker.file_failed.connect(self._on_multi_file_error)
+        self.batch_worker.error.connect(self._on_batch_error)
+        self.batch_worker.finished.connect(self._on_multi_file_finished)
+        self.batch_worker.start()
 
     @pyqtSlot(str, object)
     def _on_multi_file_loaded(self, filepath: str, dataset):
@@ -713,20 +804,24 @@ class UploadDialog(QDialog, UiLoaderMixin):
         completed = len(self.loaded_datasets) + len(self.load_errors)
         self.progress_bar.setValue(completed)
 
-    def _on_multi_file_finished(self, filepath: str):
-        """Handle worker finished for single file in multi-file operation"""
-        # Remove from loading dict
-        if filepath in self.loading_files:
-            worker = self.loading_files.pop(filepath)
+    def _on_batch_error(self, error_message: str):
+        """Handle failure of the batch itself (not of a single file)"""
+        self.load_errors.append(error_message)
+        logger.error("multi_file_batch_error", error=error_message)
+
+    def _on_multi_file_finished(self):
+        """Handle batch worker finished"""
+        worker = self.batch_worker
+        self.batch_worker = None
+        if worker is not None:
             # Ensure thread is properly stopped before cleanup
             if worker.isRunning():
-                worker.quit()
                 worker.wait(1000)
             worker.deleteLater()
+            if worker.is_cancelled:
+                return
 
-        # Check if all files are done
-        if not self.loading_files:
-            self._on_all_files_loaded()
+        self._on_all_files_loaded()
 
     def _on_all_files_loaded(self):
         """Handle completion of all file loading"""
@@ -876,11 +971,10 @@ class UploadDialog(QDialog, UiLoaderMixin):
             self.preview_worker.terminate()
             self.preview_worker.wait()
 
-        # Stop any running multi-file workers
-        for _filepath, worker in list(self.loading_files.items()):
-            if worker.isRunning():
-                worker.terminate()
-                worker.wait()
-        self.loading_files.clear()
+        # Stop the multi-file batch (pending files are skipped)
+        if self.batch_worker and self.batch_worker.isRunning():
+            self.batch_worker.cancel()
+            self.batch_worker.wait()
+        self.batch_worker = None
 
         event.accept()
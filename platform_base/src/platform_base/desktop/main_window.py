@@ -104,8 +104,20 @@ class MainWindow(QMainWindow, UiLoaderMixin):
         self._auto_save_timer.timeout.connect(self._auto_save_session)
         self._auto_save_timer.start(300000)  # Save every 5 minutes
 
+        # Workers de processo sobem em background depois que a janela aparece
+        QTimer.singleShot(0, self._warm_up_job_workers)
+
         logger.info("main_window_initialized")
 
+    def _warm_up_job_workers(self):
+        """Start the job scheduler's worker processes ahead of the first preview"""
+        from platform_base.core.job_scheduler import get_job_scheduler
+
+        try:
+            get_job_scheduler().warm_up()
+        except Exception as e:
+            logger.warning("job_workers_warm_up_failed", error=str(e))
+
     def _setup_ui_from_file(self):
         """Configura a UI carregada do arquivo .ui"""
         # Inserir painéis reais nos placeholders do .ui
@@ -305,10 +317,18 @@ class MainWindow(QMainWindow, UiLoaderMixin):
         self.memory_label = QLabel()
         status_bar.addPermanentWidget(self.memory_label)
         
+        # Job queue label (queue depth and latency of processing jobs)
+        self.jobs_label = QLabel()
+        status_bar.addPermanentWidget(self.jobs_label)
+        
         # Update memory usage periodically
         self.memory_timer = QTimer()
         self.memory_timer.timeout.connect(self._update_memory_usage)
         self.memory_timer.start(5000)
+        
+        self.jobs_timer = QTimer()
+        self.jobs_timer.timeout.connect(self._update_job_stats)
+        self.jobs_timer.start(1000)
 
     def _setup_window(self):
         """Configure main window properties"""
@@ -607,11 +627,19 @@ class MainWindow(QMainWindow, UiLoaderMixin):
         self.memory_label = QLabel()
         status_bar.addPermanentWidget(self.memory_label)
 
+        # Job queue label (queue depth and latency of processing jobs)
+        self.jobs_label = QLabel()
+        status_bar.addPermanentWidget(self.jobs_label)
+
         # Update memory usage periodically
         self.memory_timer = QTimer()
         self.memory_timer.timeout.connect(self._update_memory_usage)
         self.memory_timer.start(5000)  # Update every 5 seconds
 
+        self.jobs_timer = QTimer()
+        self.jobs_timer.timeout.connect(self._update_job_stats)
+        self.jobs_timer.start(1000)  # Update every second
+
         logger.debug("status_bar_created")
 
     def _setup_keyboard_shortcuts(self):
@@ -1152,6 +1180,20 @@ class MainWindow(QMainWindow, UiLoaderMixin):
             # psutil not available
             self.memory_label.setText("")
 
+    def _update_job_stats(self):
+        """Update job queue display (queued/running jobs and mean latency)"""
+        from platform_base.core.job_scheduler import get_job_scheduler
+
+        stats = get_job_scheduler().stats()
+        if stats.queue_depth == 0 and stats.running == 0 and stats.mean_latency_ms is None:
+            self.jobs_label.setText("")
+            return
+
+        text = f"Jobs: {stats.running} running, {stats.queue_depth} queued"
+        if stats.mean_latency_ms is not None:
+            text += f" | {stats.mean_latency_ms:.0f} ms avg"
+        self.jobs_label.setText(text)
+
     # New action handlers for enhanced keyboard shortcuts
 
     @pyqtSlot()
@@ -1718,6 +1760,10 @@ class MainWindow(QMainWindow, UiLoaderMixin):
 
         if reply == QMessageBox.StandardButton.Yes:
             self.save_session_on_exit()
+
+            from platform_base.core.job_scheduler import shutdown_job_scheduler
+            shutdown_job_scheduler(wait=False)
+
             event.accept()
         else:
             event.ignore()
@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING, Any
 import numpy as np
 from PyQt6.QtCore import QObject, QPointF, QRectF, pyqtSignal
 
+from platform_base.processing.window_stats import describe
 from platform_base.utils.logging import get_logger
 
 if TYPE_CHECKING:
@@ -290,14 +291,9 @@ class SelectionState:
         """Get statistics for selected values"""
         if self._dirty or self._value_stats is None:
             if self.selected_mask is not None and np.any(self.selected_mask):
-                selected_values = value_data[self.selected_mask]
-                self._value_stats = {
-                    "min": float(np.min(selected_values)),
-                    "max": float(np.max(selected_values)),
-                    "mean": float(np.mean(selected_values)),
-                    "std": float(np.std(selected_values)),
-                    "median": float(np.median(selected_values)),
-                }
+                self._value_stats = describe(
+                    value_data[self.selected_mask], ("min", "max", "mean", "std", "median"),
+                )
             else:
                 self._value_stats = {
                     "min": 0.0, "max": 0.0, "mean": 0.0, "std": 0.0, "median": 0.0,
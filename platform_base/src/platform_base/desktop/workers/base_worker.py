@@ -10,6 +10,7 @@ from typing import Any
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from platform_base.core.job_scheduler import JobPriority, get_job_scheduler
 from platform_base.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -29,6 +30,9 @@ class BaseWorker(QThread):
     error = pyqtSignal(str)  # error message
     finished = pyqtSignal()  # worker finished (success or error)
 
+    # Priority of the jobs this worker submits to the scheduler
+    job_priority = JobPriority.NORMAL
+
     def __init__(self, parent: QThread | None = None):
         super().__init__(parent)
 
@@ -95,6 +99,20 @@ class BaseWorker(QThread):
         logger.info("worker_completed", worker_id=self.worker_id)
         self.finished.emit()
 
+    def run_job(self, func, *args, **kwargs) -> Any:
+        """
+        Run a CPU-bound call on the shared job scheduler and wait for it.
+
+        The thread only waits; the work runs on the scheduler's pools, which
+        bound concurrency to the number of cores across all workers.
+        """
+        future = get_job_scheduler().submit(
+            func, *args, priority=self.job_priority,
+            name=f"{self.__class__.__name__}.{getattr(func, '__name__', 'job')}",
+            **kwargs,
+        )
+        return future.result()
+
     def safe_execute(self, func, *args, **kwargs) -> Any:
         """
         Safely execute a function with error handling.
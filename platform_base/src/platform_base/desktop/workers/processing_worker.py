@@ -35,8 +35,8 @@ class InterpolationWorker(BaseWorker):
         try:
             self.emit_progress(0, "Starting interpolation...")
 
-            # Get source data
-            dataset = self.dataset_store.get_dataset(self.dataset_id)
+            # Get source data (shared memory: the job process attaches, no copy)
+            dataset = self.dataset_store.share_dataset(self.dataset_id, [self.series_id])
             source_series = dataset.series[self.series_id]
 
             self.emit_progress(20, "Loading interpolation module...")
@@ -55,8 +55,8 @@ class InterpolationWorker(BaseWorker):
             self.emit_progress(40, f"Applying {self.method} interpolation...")
 
             # Perform interpolation
-            result = interpolate(source_series.values, dataset.t_seconds,
-                               interp_method, interp_params)
+            result = self.run_job(interpolate, source_series.values, dataset.t_seconds,
+                                  interp_method, interp_params)
 
             if self.is_cancelled:
                 return
@@ -124,8 +124,8 @@ class CalculusWorker(BaseWorker):
         try:
             self.emit_progress(0, f"Starting {self.operation}...")
 
-            # Get source data
-            dataset = self.dataset_store.get_dataset(self.dataset_id)
+            # Get source data (shared memory: the job process attaches, no copy)
+            dataset = self.dataset_store.share_dataset(self.dataset_id, [self.series_id])
             source_series = dataset.series[self.series_id]
 
             self.emit_progress(20, "Loading processing modules...")
@@ -155,7 +155,8 @@ class CalculusWorker(BaseWorker):
                     if len(parts) > 1 and parts[1] and parts[1][0].isdigit():
                         order = int(parts[1][0])
                         
-                result = calculate_derivative(
+                result = self.run_job(
+                    calculate_derivative,
                     source_series.values,
                     dataset.t_seconds,
                     order=order,
@@ -167,7 +168,8 @@ class CalculusWorker(BaseWorker):
                 unit_suffix = f"/s^{order}"
 
             elif self.operation in ["integral", "area", "area_under_curve"]:
-                result = calculate_integral(
+                result = self.run_job(
+                    calculate_integral,
                     source_series.values,
                     dataset.t_seconds,
                     method=self.parameters.get("integration_method", "trapz"),
@@ -185,7 +187,7 @@ class CalculusWorker(BaseWorker):
                     "kernel_size": self.parameters.get("kernel_size", 5),
                     "cutoff": self.parameters.get("cutoff", 0.1),
                 }
-                result_values = smooth(source_series.values, method, smooth_params)
+                result_values = self.run_job(smooth, source_series.values, method, smooth_params)
                 
                 # Create result object similar to derivative/integral
                 from dataclasses import dataclass
@@ -294,7 +296,7 @@ class SynchronizationWorker(BaseWorker):
             self.emit_progress(0, f"Starting synchronization with {self.method}...")
 
             # Get source data
-            dataset = self.dataset_store.get_dataset(self.dataset_id)
+            dataset = self.dataset_store.share_dataset(self.dataset_id, self.series_ids)
             source_series = [dataset.series[sid] for sid in self.series_ids]
 
             self.emit_progress(20, "Loading synchronization module...")
@@ -313,7 +315,8 @@ class SynchronizationWorker(BaseWorker):
             self.emit_progress(40, f"Synchronizing {len(self.series_ids)} series...")
 
             # Perform synchronization
-            sync_result = synchronize_series(
+            sync_result = self.run_job(
+                synchronize_series,
                 [s.values for s in source_series],
                 dataset.t_seconds,
                 sync_method,
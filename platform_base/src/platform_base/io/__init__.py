@@ -4,12 +4,17 @@ Platform Base IO Module
 
 Módulo de entrada/saída de dados:
 - Carregamento de arquivos (CSV, Excel, Parquet, HDF5)
+- Formato colunar nativo com séries memory-mapped
+- Cache persistente de datasets parseados
+- Leitor XLSX streaming (sem openpyxl)
 - Detecção automática de schema
 - Detecção automática de encoding
 - Validação de dados
 - Exportação
 """
 
+from platform_base.io.columnar import read_columnar, write_columnar
+from platform_base.io.dataset_cache import DatasetCache
 from platform_base.io.encoding_detector import (
     detect_bom,
     detect_encoding,
@@ -22,16 +27,20 @@ from platform_base.io.loader import (
     load,
     load_async,
 )
-from platform_base.io.schema_detector import SchemaRules, detect_schema
+from platform_base.io.schema_detector import SchemaRules, detect_arrow_schema, detect_schema
+from platform_base.io.xlsx_reader import XlsxSheetCache, read_xlsx, read_xlsx_sheets
 
 
 __all__ = [
+    # Cache
+    "DatasetCache",
     # Loader
     "FileFormat",
     "LoadConfig",
     "LoadStrategy",
     # Schema
     "SchemaRules",
+    "detect_arrow_schema",
     "detect_bom",
     # Encoding
     "detect_encoding",
@@ -39,4 +48,11 @@ __all__ = [
     "get_encoding_info",
     "load",
     "load_async",
+    # Columnar
+    "read_columnar",
+    "write_columnar",
+    # XLSX
+    "XlsxSheetCache",
+    "read_xlsx",
+    "read_xlsx_sheets",
 ]
@@ -0,0 +1,282 @@
+"""
+Columnar Dataset Store - formato nativo em disco com séries memory-mapped
+
+Layout de um dataset persistido::
+
+    <root>/<dataset_id>/
+        manifest.json          # metadata, unidades, lineage e mapa de arquivos
+        t_seconds.npy
+        t_datetime.npy
+        series_0000.npy        # valores (float64)
+        series_0000.interp.npy # máscara de interpolação (opcional)
+        series_0000.method.npy # método por ponto (opcional)
+        series_0000.conf.npy   # confiança por ponto (opcional)
+        series_0000.pyr_lo.npy # pirâmide min/max para plotagem
+        series_0000.pyr_hi.npy
+
+Cada coluna é um arquivo ``.npy`` independente, aberto com
+``np.load(..., mmap_mode=...)``. Abrir um dataset custa apenas a leitura do
+manifest; as páginas dos arrays são lidas do disco sob demanda.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from platform_base.core.models import (
+    Dataset,
+    DatasetMetadata,
+    InterpolationInfo,
+    Lineage,
+    Series,
+    SeriesMetadata,
+    SourceInfo,
+)
+from platform_base.processing.pyramid import MinMaxPyramid, series_pyramid
+from platform_base.processing.units import parse_unit
+from platform_base.utils.errors import DataLoadError
+from platform_base.utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+
+
+def _save_column(directory: Path, filename: str, array: np.ndarray) -> str:
+    """Grava uma coluna como .npy e retorna o nome do arquivo."""
+    np.save(directory / filename, np.ascontiguousarray(array), allow_pickle=False)
+    return filename
+
+
+def _compact_str_array(array: np.ndarray) -> np.ndarray:
+    """Reduz dtype unicode ao menor tamanho que preserva o conteúdo."""
+    if array.size == 0:
+        return array.astype("<U1")
+    width = max(int(np.char.str_len(array).max()), 1)
+    return array.astype(f"<U{width}")
+
+
+def _series_entry(directory: Path, index: int, series: Series) -> dict[str, Any]:
+    """Grava os arrays de uma série e retorna sua entrada no manifest."""
+    stem = f"series_{index:04d}"
+    values = np.asarray(series.values, dtype=np.float64)
+    files: dict[str, str] = {
+        "values": _save_column(directory, f"{stem}.npy", values),
+    }
+
+    # Pirâmide construída uma vez na escrita; leitores a reabrem via mmap
+    pyramid = series_pyramid(series).to_arrays()
+    files["pyramid_lo"] = _save_column(directory, f"{stem}.pyr_lo.npy", pyramid["lo"])
+    files["pyramid_hi"] = _save_column(directory, f"{stem}.pyr_hi.npy", pyramid["hi"])
+
+    info = series.interpolation_info
+    if info is not None:
+        files["is_interpolated"] = _save_column(
+            directory, f"{stem}.interp.npy", np.asarray(info.is_interpolated_mask, dtype=bool),
+        )
+        files["method_used"] = _save_column(
+            directory, f"{stem}.method.npy", _compact_str_array(np.asarray(info.method_used)),
+        )
+        if info.confidence is not None:
+            files["confidence"] = _save_column(
+                directory, f"{stem}.conf.npy", np.asarray(info.confidence, dtype=np.float64),
+            )
+
+    return {
+        "series_id": series.series_id,
+        "name": series.name,
+        "unit": str(series.unit),
+        "n_points": len(series.values),
+        "metadata": series.metadata.model_dump(),
+        "lineage": series.lineage.model_dump() if series.lineage else None,
+        "pyramid": {
+            "bucket_size": pyramid["bucket_size"],
+            "offsets": pyramid["offsets"].tolist(),
+        },
+        "files": files,
+    }
+
+
+def write_columnar(dataset: Dataset, root: str | Path, name: str | None = None) -> Path:
+    """
+    Persiste dataset no formato colunar em ``root/<name>`` (padrão: dataset_id).
+
+    A escrita é feita num diretório temporário e renomeada no final, de modo
+    que leitores nunca observam um dataset parcialmente gravado.
+
+    Args:
+        dataset: Dataset a persistir
+        root: Diretório raiz do store colunar
+        name: Nome do diretório do dataset (padrão: ``dataset.dataset_id``)
+
+    Returns:
+        Caminho do diretório do dataset
+    """
+    root_path = Path(root)
+    root_path.mkdir(parents=True, exist_ok=True)
+    name = name or dataset.dataset_id
+    target = root_path / name
+    staging = root_path / f".{name}.tmp"
+
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir()
+
+    try:
+        _save_column(staging, "t_seconds.npy", np.asarray(dataset.t_seconds, dtype=np.float64))
+        _save_column(
+            staging, "t_datetime.npy", np.asarray(dataset.t_datetime, dtype="datetime64[ns]"),
+        )
+        series_entries = [
+            _series_entry(staging, i, series) for i, series in enumerate(dataset.series.values())
+        ]
+
+        manifest = {
+            "format_version": FORMAT_VERSION,
+            "dataset_id": dataset.dataset_id,
+            "version": dataset.version,
+            "parent_id": dataset.parent_id,
+            "created_at": dataset.created_at.isoformat(),
+            "n_points": len(dataset.t_seconds),
+            "is_monotonic": dataset.is_monotonic,
+            "source": dataset.source.model_dump(),
+            "metadata": dataset.metadata.model_dump(),
+            "series": series_entries,
+        }
+        (staging / MANIFEST_NAME).write_text(
+            json.dumps(manifest, default=str, indent=2), encoding="utf-8",
+        )
+
+        if target.exists():
+            shutil.rmtree(target)
+        staging.rename(target)
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    logger.info(
+        "columnar_dataset_written",
+        dataset_id=dataset.dataset_id,
+        path=str(target),
+        n_series=len(series_entries),
+        n_points=len(dataset.t_seconds),
+    )
+    return target
+
+
+def is_columnar_dataset(path: str | Path) -> bool:
+    """Verifica se o diretório contém um dataset colunar."""
+    return (Path(path) / MANIFEST_NAME).is_file()
+
+
+def read_manifest(path: str | Path) -> dict[str, Any]:
+    """Lê e valida o manifest de um dataset colunar."""
+    manifest_path = Path(path) / MANIFEST_NAME
+    if not manifest_path.is_file():
+        raise DataLoadError("Columnar manifest not found", {"path": str(path)})
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    version = manifest.get("format_version")
+    if version != FORMAT_VERSION:
+        raise DataLoadError(
+            f"Unsupported columnar format version: {version}",
+            {"path": str(path), "format_version": version},
+        )
+    return manifest
+
+
+def _open_column(directory: Path, filename: str, mmap_mode: str | None) -> np.ndarray:
+    return np.load(directory / filename, mmap_mode=mmap_mode, allow_pickle=False)
+
+
+def read_columnar(path: str | Path, mmap_mode: str | None = "r") -> Dataset:
+    """
+    Abre dataset colunar com arrays memory-mapped (zero-copy).
+
+    Args:
+        path: Diretório do dataset (``root/<dataset_id>``)
+        mmap_mode: Modo passado a ``np.load``. ``"r"`` (padrão) produz views
+            somente leitura, ``"c"`` copy-on-write e ``None`` carrega tudo em RAM.
+
+    Returns:
+        Dataset cujos arrays são ``np.memmap`` sobre os arquivos da coluna
+    """
+    directory = Path(path)
+    manifest = read_manifest(directory)
+
+    series_dict: dict[str, Series] = {}
+    for entry in manifest["series"]:
+        files = entry["files"]
+        interpolation_info = None
+        if "is_interpolated" in files:
+            interpolation_info = InterpolationInfo(
+                is_interpolated=_open_column(directory, files["is_interpolated"], mmap_mode),
+                method_used=_open_column(directory, files["method_used"], mmap_mode),
+                confidence=(
+                    _open_column(directory, files["confidence"], mmap_mode)
+                    if "confidence" in files else None
+                ),
+            )
+
+        values = _open_column(directory, files["values"], mmap_mode)
+        pyramid = None
+        if "pyramid_lo" in files:
+            # Manifests antigos não têm pirâmide: construída sob demanda
+            pyramid = MinMaxPyramid.from_arrays(
+                values,
+                _open_column(directory, files["pyramid_lo"], mmap_mode),
+                _open_column(directory, files["pyramid_hi"], mmap_mode),
+                entry["pyramid"]["offsets"],
+                entry["pyramid"]["bucket_size"],
+            )
+
+        lineage = entry.get("lineage")
+        series_dict[entry["series_id"]] = Series(
+            series_id=entry["series_id"],
+            name=entry["name"],
+            unit=parse_unit(entry["unit"]),
+            values=values,
+            interpolation_info=interpolation_info,
+            metadata=SeriesMetadata(**entry["metadata"]),
+            lineage=Lineage(**lineage) if lineage else None,
+            pyramid=pyramid,
+        )
+
+    dataset = Dataset(
+        dataset_id=manifest["dataset_id"],
+        version=manifest["version"],
+        parent_id=manifest["parent_id"],
+        source=SourceInfo(**manifest["source"]),
+        t_seconds=_open_column(directory, "t_seconds.npy", mmap_mode),
+        t_datetime=_open_column(directory, "t_datetime.npy", mmap_mode),
+        series=series_dict,
+        metadata=DatasetMetadata(**manifest["metadata"]),
+        created_at=datetime.fromisoformat(manifest["created_at"]),
+        is_monotonic=manifest.get("is_monotonic"),
+    )
+
+    logger.debug(
+        "columnar_dataset_opened",
+        dataset_id=dataset.dataset_id,
+        path=str(directory),
+        n_series=len(series_dict),
+        mmap_mode=mmap_mode,
+    )
+    return dataset
+
+
+def delete_columnar(path: str | Path) -> bool:
+    """Remove dataset colunar do disco. Retorna True se algo foi removido."""
+    directory = Path(path)
+    if not is_columnar_dataset(directory):
+        return False
+    shutil.rmtree(directory)
+    return True
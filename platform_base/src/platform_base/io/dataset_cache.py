@@ -0,0 +1,275 @@
+"""
+Dataset Cache - cache persistente de datasets já parseados
+
+Reabrir um arquivo já carregado (mesmo conteúdo, mesma configuração) não
+passa de novo pelo parser: o ``Dataset`` completo fica gravado no formato
+colunar (``io/columnar.py``) e é aberto com arrays memory-mapped.
+
+Layout::
+
+    <location>/
+        entries/<key>/     # dataset colunar; key = sha256(checksum, hash da config)
+        files/<id>.json    # último (size, mtime_ns, checksum) visto para um caminho
+
+A chave é endereçada por conteúdo: o mesmo arquivo copiado para outro caminho
+reaproveita a entrada. Para não recalcular o SHA-256 a cada abertura, o
+checksum de um caminho é reutilizado enquanto tamanho e mtime não mudarem;
+se mudarem, o arquivo é re-hasheado antes de consultar o cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import RLock
+from typing import TYPE_CHECKING, Any
+
+from platform_base.io.columnar import MANIFEST_NAME, is_columnar_dataset, read_columnar, write_columnar
+from platform_base.utils.ids import new_id
+from platform_base.utils.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from platform_base.core.models import Dataset
+
+
+logger = get_logger(__name__)
+
+# Incrementar quando a saída do loader mudar de forma incompatível
+CACHE_VERSION = 1
+
+
+def file_checksum(path: str | Path, block_size: int = 1 << 20) -> str:
+    """SHA-256 do arquivo lido em blocos (memória constante)."""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def config_fingerprint(config: BaseModel) -> str:
+    """Hash estável da configuração de carregamento."""
+    payload = config.model_dump(mode="json", exclude={"custom_strategy"})
+    payload["_cache_version"] = CACHE_VERSION
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.iterdir() if f.is_file())
+
+
+class DatasetCache:
+    """
+    Cache persistente de ``Dataset`` parseados, endereçado por conteúdo.
+
+    Features:
+    - Chave = (checksum do arquivo, hash da ``LoadConfig``)
+    - Validação rápida por tamanho + mtime antes de re-hashear o arquivo
+    - Entradas no formato colunar, abertas via mmap copy-on-write
+    - Limite de tamanho com evicção LRU (mtime do manifest = último acesso)
+    """
+
+    def __init__(self, location: str | Path, max_size_bytes: int | None = None):
+        """
+        Args:
+            location: Diretório do cache
+            max_size_bytes: Tamanho máximo das entradas (None = sem limite)
+        """
+        self.location = Path(location)
+        self._entries = self.location / "entries"
+        self._files = self.location / "files"
+        self._entries.mkdir(parents=True, exist_ok=True)
+        self._files.mkdir(parents=True, exist_ok=True)
+        self._max_size_bytes = max_size_bytes
+        self._lock = RLock()
+        self._size_bytes: int | None = None  # calculado sob demanda, depois incremental
+
+        logger.info("dataset_cache_initialized", location=str(self.location),
+                    max_size_bytes=max_size_bytes)
+
+    # ------------------------------------------------------------------
+    # Checksum por caminho
+    # ------------------------------------------------------------------
+
+    def _file_record_path(self, path: Path) -> Path:
+        digest = hashlib.sha1(str(path.absolute()).encode()).hexdigest()
+        return self._files / f"{digest}.json"
+
+    def _record_checksum(self, path: Path, checksum: str, stat: os.stat_result) -> None:
+        record = {
+            "path": str(path.absolute()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "checksum": checksum,
+        }
+        self._file_record_path(path).write_text(json.dumps(record), encoding="utf-8")
+
+    def checksum(self, path: str | Path) -> str:
+        """
+        Checksum do arquivo, reaproveitando o último valor enquanto tamanho e
+        mtime não mudarem.
+        """
+        path_obj = Path(path)
+        stat = path_obj.stat()
+        record_path = self._file_record_path(path_obj)
+        try:
+            record = json.loads(record_path.read_text(encoding="utf-8"))
+            if record["size"] == stat.st_size and record["mtime_ns"] == stat.st_mtime_ns:
+                return record["checksum"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        checksum = file_checksum(path_obj)
+        self._record_checksum(path_obj, checksum, stat)
+        logger.debug("dataset_cache_file_rehashed", path=str(path_obj))
+        return checksum
+
+    # ------------------------------------------------------------------
+    # Entradas
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(checksum: str, config: BaseModel) -> str:
+        """Chave da entrada para (conteúdo, configuração)."""
+        return hashlib.sha256(f"{checksum}:{config_fingerprint(config)}".encode()).hexdigest()[:40]
+
+    def get(self, path: str | Path, config: BaseModel) -> Dataset | None:
+        """
+        Retorna o dataset parseado de ``path`` com ``config``, ou None.
+
+        O dataset devolvido recebe um novo ``dataset_id`` e aponta ``source``
+        para o caminho consultado; os arrays são mmap copy-on-write.
+        """
+        return self.lookup(path, config)[0]
+
+    def lookup(self, path: str | Path, config: BaseModel) -> tuple[Dataset | None, str | None]:
+        """
+        Como ``get``, mas devolve também o checksum usado na chave.
+
+        Num miss o chamador repassa o checksum ao ``load`` (``checksum=``)
+        para que o arquivo não seja hasheado de novo durante a carga.
+
+        Returns:
+            (dataset ou None, checksum ou None se o arquivo não existe)
+        """
+        path_obj = Path(path)
+        if not path_obj.exists():
+            return None, None
+
+        checksum = self.checksum(path_obj)
+        key = self.make_key(checksum, config)
+        entry = self._entries / key
+        if not is_columnar_dataset(entry):
+            logger.debug("dataset_cache_miss", path=str(path_obj), key=key)
+            return None, checksum
+
+        try:
+            cached = read_columnar(entry, mmap_mode="c")
+            os.utime(entry / MANIFEST_NAME)  # LRU: último acesso
+        except Exception as e:
+            logger.warning("dataset_cache_entry_unreadable", key=key, error=str(e))
+            self._remove_entry(entry)
+            return None, checksum
+
+        source = cached.source.model_copy(update={
+            "filepath": str(path_obj.absolute()),
+            "filename": path_obj.name,
+        })
+        dataset = cached.model_copy(update={
+            "dataset_id": new_id("dataset"),
+            "source": source,
+            "created_at": datetime.now(UTC),
+        })
+        logger.info("dataset_cache_hit", path=str(path_obj), key=key,
+                    n_series=len(dataset.series), n_points=len(dataset.t_seconds))
+        return dataset, checksum
+
+    def put(self, path: str | Path, config: BaseModel, dataset: Dataset) -> Path | None:
+        """
+        Grava dataset parseado de ``path``.
+
+        Usa ``dataset.source.checksum`` (calculado pelo loader) como conteúdo;
+        se o arquivo mudou de tamanho desde a carga, nada é gravado.
+        """
+        path_obj = Path(path)
+        stat = path_obj.stat()
+        if stat.st_size != dataset.source.size_bytes:
+            logger.warning("dataset_cache_source_changed", path=str(path_obj))
+            return None
+
+        checksum = dataset.source.checksum
+        key = self.make_key(checksum, config)
+        with self._lock:
+            self._record_checksum(path_obj, checksum, stat)
+            entry = self._entries / key
+            if is_columnar_dataset(entry):
+                return entry
+
+            entry = write_columnar(dataset, self._entries, name=key)
+            if self._size_bytes is not None:
+                self._size_bytes += _dir_size(entry)
+            self._enforce_size_limit(protect=key)
+
+        logger.debug("dataset_cache_set", path=str(path_obj), key=key)
+        return entry
+
+    def _remove_entry(self, entry: Path) -> None:
+        with self._lock:
+            if not entry.exists():
+                return
+            size = _dir_size(entry)
+            shutil.rmtree(entry, ignore_errors=True)
+            if self._size_bytes is not None:
+                self._size_bytes -= size
+
+    def _entry_dirs(self) -> list[Path]:
+        return [p for p in self._entries.iterdir() if p.is_dir() and not p.name.startswith(".")]
+
+    @property
+    def size_bytes(self) -> int:
+        """Tamanho total das entradas."""
+        with self._lock:
+            if self._size_bytes is None:
+                self._size_bytes = sum(_dir_size(p) for p in self._entry_dirs())
+            return self._size_bytes
+
+    def _enforce_size_limit(self, protect: str | None = None) -> None:
+        if self._max_size_bytes is None or self.size_bytes <= self._max_size_bytes:
+            return
+
+        entries = sorted(
+            (p for p in self._entry_dirs() if p.name != protect),
+            key=lambda p: (p / MANIFEST_NAME).stat().st_mtime if is_columnar_dataset(p) else 0.0,
+        )
+        for entry in entries:
+            if self.size_bytes <= self._max_size_bytes:
+                break
+            self._remove_entry(entry)
+            logger.debug("dataset_cache_evicted", key=entry.name)
+
+    def clear(self) -> None:
+        """Remove todas as entradas e registros de checksum."""
+        with self._lock:
+            shutil.rmtree(self._entries, ignore_errors=True)
+            shutil.rmtree(self._files, ignore_errors=True)
+            self._entries.mkdir(parents=True, exist_ok=True)
+            self._files.mkdir(parents=True, exist_ok=True)
+            self._size_bytes = 0
+        logger.info("dataset_cache_cleared", location=str(self.location))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Estatísticas do cache."""
+        return {
+            "location": str(self.location),
+            "entry_count": len(self._entry_dirs()),
+            "current_size_bytes": self.size_bytes,
+            "max_size_bytes": self._max_size_bytes,
+        }
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
 import hashlib
-from collections.abc import Callable
+import io
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
@@ -9,8 +16,13 @@ from typing import Any
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from platform_base.core.memory_manager import MemoryManager, get_memory_manager
 from platform_base.core.models import (
     Dataset,
     DatasetMetadata,
@@ -20,10 +32,17 @@ from platform_base.core.models import (
     SeriesMetadata,
     SourceInfo,
 )
+from platform_base.io.dataset_cache import DatasetCache, file_checksum
 from platform_base.io.encoding_detector import detect_encoding
-from platform_base.io.schema_detector import SchemaRules, detect_schema
+from platform_base.io.schema_detector import (
+    SchemaMap,
+    SchemaRules,
+    detect_arrow_schema,
+    detect_schema,
+)
 from platform_base.io.validator import validate_time, validate_values
-from platform_base.processing.timebase import to_seconds
+from platform_base.io.xlsx_reader import read_xlsx
+from platform_base.processing.timebase import detect_timestamp_format, parse_timestamps, to_seconds
 from platform_base.processing.units import infer_unit_from_name, parse_unit
 from platform_base.utils.errors import DataLoadError
 from platform_base.utils.ids import new_id
@@ -58,6 +77,65 @@ class FileFormat(Enum):
         return mapping[ext_lower]
 
 
+class _HashingReader(io.RawIOBase):
+    """
+    Leitor binário que atualiza um hash com cada byte entregue ao parser.
+
+    Permite calcular o checksum do arquivo na mesma passada da leitura, em vez
+    de reler o arquivo inteiro depois.
+    """
+
+    def __init__(self, raw: io.BufferedIOBase, hasher: Any):
+        super().__init__()
+        self._raw = raw
+        self._hasher = hasher
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        n = self._raw.readinto(buffer)
+        if n:
+            self._hasher.update(memoryview(buffer)[:n])
+        return n
+
+    def tell(self) -> int:
+        return self._raw.tell()
+
+    def finish(self, block_size: int = 1 << 20) -> None:
+        """Consome o restante do arquivo (ex.: leitura parcial com max_rows)."""
+        for block in iter(lambda: self._raw.read(block_size), b""):
+            self._hasher.update(block)
+
+
+@contextmanager
+def _hashed_open(path: Path, hasher: Any | None) -> Iterator[io.BufferedReader | Any]:
+    """Abre arquivo para leitura binária, alimentando ``hasher`` se fornecido."""
+    with open(path, "rb") as raw:
+        if hasher is None:
+            yield raw
+            return
+        reader = _HashingReader(raw, hasher)
+        yield io.BufferedReader(reader)
+        reader.finish()
+
+
+class _StageTimer:
+    """Cronômetro de estágios do pipeline de carga (ms por estágio)."""
+
+    def __init__(self):
+        self.timings: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.timings[name] = round(self.timings.get(name, 0.0) + elapsed, 3)
+
+
 class LoadStrategy(BaseModel):
     """Estratégia de carregamento por formato"""
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -66,8 +144,13 @@ class LoadStrategy(BaseModel):
     reader_params: dict[str, Any] = Field(default_factory=dict)
     preprocessing: Callable[[pd.DataFrame], pd.DataFrame] | None = None
 
-    def read_file(self, path: Path, config: LoadConfig) -> pd.DataFrame:
-        """Le arquivo usando estratégia específica"""
+    def read_file(self, path: Path, config: LoadConfig, hasher: Any | None = None) -> pd.DataFrame:
+        """
+        Le arquivo usando estratégia específica.
+
+        Para CSV, ``hasher`` (ex.: ``hashlib.sha256()``) é alimentado com os
+        bytes do arquivo durante a própria leitura.
+        """
         if self.format == FileFormat.CSV:
             # Auto-detect encoding se configurado
             encoding = config.encoding
@@ -81,22 +164,28 @@ class LoadStrategy(BaseModel):
                 "nrows": config.max_rows,
                 **self.reader_params,
             }
-            df = pd.read_csv(path, **params)
+            with _hashed_open(path, hasher) as handle:
+                df = pd.read_csv(handle, **params)
 
         elif self.format == FileFormat.EXCEL:
             # Ensure sheet_name defaults to 0 (first sheet) to avoid returning dict
             sheet = config.sheet_name if config.sheet_name is not None else 0
-            params = {
-                "sheet_name": sheet,
-                "nrows": config.max_rows,
-                **self.reader_params,
-            }
-            df = pd.read_excel(path, **params)
-
-            # Handle case where dict is returned (shouldn't happen with sheet_name set)
-            if isinstance(df, dict):
-                # Get first sheet
-                df = next(iter(df.values()))
+            # Leitor streaming só entende o formato OOXML (.xlsx)
+            streaming = config.excel_engine == "streaming" and path.suffix.lower() != ".xls"
+            if streaming and not self.reader_params:
+                df = read_xlsx(path, sheet, max_rows=config.max_rows)
+            else:
+                params = {
+                    "sheet_name": sheet,
+                    "nrows": config.max_rows,
+                    **self.reader_params,
+                }
+                df = pd.read_excel(path, **params)
+
+                # Handle case where dict is returned (shouldn't happen with sheet_name set)
+                if isinstance(df, dict):
+                    # Get first sheet
+                    df = next(iter(df.values()))
 
         elif self.format == FileFormat.PARQUET:
             df = pd.read_parquet(path, **self.reader_params)
@@ -118,46 +207,366 @@ class LoadStrategy(BaseModel):
 
         return df
 
+    def iter_chunks(self, path: Path, config: LoadConfig,
+                    position: list[int] | None = None,
+                    hasher: Any | None = None,
+                    usecols: Callable[[str], bool] | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Lê CSV em blocos de ``config.chunk_size`` linhas.
+
+        Args:
+            path: Arquivo CSV
+            config: Configuração (``chunk_size`` obrigatório)
+            position: Lista de um elemento atualizada com o offset de bytes
+                já consumido do arquivo, usada para reportar progresso
+            hasher: Hash alimentado com os bytes lidos (checksum em passada única)
+            usecols: Filtro de colunas repassado ao parser (None = todas)
+        """
+        if self.format != FileFormat.CSV:
+            raise DataLoadError("Chunked reading is only supported for CSV",
+                                {"format": self.format.value})
+        if not config.chunk_size:
+            raise DataLoadError("chunk_size must be set for chunked reading", {})
+
+        encoding = config.encoding
+        if encoding == "auto":
+            encoding = detect_encoding(path)
+            logger.info(f"auto_detected_encoding: {encoding}")
+
+        params = {
+            "delimiter": config.delimiter,
+            "encoding": encoding,
+            "nrows": config.max_rows,
+            "chunksize": config.chunk_size,
+            "usecols": usecols,
+            **self.reader_params,
+        }
+        with _hashed_open(path, hasher) as handle, pd.read_csv(handle, **params) as reader:
+            for chunk in reader:
+                if position is not None:
+                    position[0] = handle.tell()
+                yield self.preprocessing(chunk) if self.preprocessing else chunk
+
+    def read_arrow_schema(self, path: Path, config: LoadConfig) -> pa.Schema:
+        """Lê apenas o schema Arrow (cabeçalho/metadata) do arquivo"""
+        if self.format == FileFormat.PARQUET:
+            return pq.read_schema(path)
+        if self.format == FileFormat.CSV:
+            read_options, parse_options, convert_options = _arrow_csv_options(path, config)
+            with pacsv.open_csv(path, read_options=read_options, parse_options=parse_options,
+                                convert_options=convert_options) as reader:
+                return reader.schema
+        raise DataLoadError(f"Arrow engine does not support format: {self.format.value}",
+                            {"format": self.format.value})
+
+    def read_arrow(self, path: Path, config: LoadConfig, columns: list[str] | None = None,
+                   filters: list[tuple[str, str, Any]] | None = None,
+                   hasher: Any | None = None) -> pa.Table:
+        """
+        Lê arquivo como ``pyarrow.Table`` sem passar por pandas.
+
+        Args:
+            path: Arquivo CSV ou Parquet
+            config: Configuração de carregamento
+            columns: Projeção de colunas (None = todas)
+            filters: Filtros Parquet (predicate pushdown por row group)
+            hasher: Hash alimentado durante a leitura (apenas CSV)
+        """
+        if self.format == FileFormat.PARQUET:
+            table = pq.read_table(path, columns=columns, filters=filters, use_threads=True,
+                                  **self.reader_params)
+        elif self.format == FileFormat.CSV:
+            read_options, parse_options, convert_options = _arrow_csv_options(path, config)
+            if columns is not None:
+                convert_options.include_columns = columns
+            with _hashed_open(path, hasher) as handle:
+                table = pacsv.read_csv(handle, read_options=read_options,
+                                       parse_options=parse_options,
+                                       convert_options=convert_options)
+        else:
+            raise DataLoadError(f"Arrow engine does not support format: {self.format.value}",
+                                {"format": self.format.value})
+
+        if config.max_rows:
+            table = table.slice(0, config.max_rows)
+        return table
+
 
-def _parse_timestamps(data: pd.Series | pd.Index) -> pd.DatetimeIndex:
+def _parse_timestamps(data: pd.Series | pd.Index, fmt: str | None = None) -> pd.DatetimeIndex:
     """
-    Parse timestamps robustly, trying common formats to avoid pandas warnings.
+    Parse timestamps robustly, detecting the format once on a sample.
 
     Args:
         data: Series or Index containing timestamp data
+        fmt: Known ``strptime`` format (skips detection)
 
     Returns:
         DatetimeIndex with parsed timestamps
     """
-    # If already datetime, just convert
-    if pd.api.types.is_datetime64_any_dtype(data):
-        return pd.DatetimeIndex(data)
-
-    # Common datetime formats to try (most specific first)
-    formats = [
-        "%Y-%m-%d %H:%M:%S",      # 2025-08-10 00:00:00
-        "%Y-%m-%d %H:%M:%S.%f",   # 2025-08-10 00:00:00.123456
-        "%Y-%m-%dT%H:%M:%S",      # ISO format
-        "%Y-%m-%dT%H:%M:%S.%f",   # ISO with microseconds
-        "%Y-%m-%d",               # Date only
-        "%d/%m/%Y %H:%M:%S",      # Brazilian format
-        "%d/%m/%Y",               # Brazilian date only
-        "%m/%d/%Y %H:%M:%S",      # US format
-        "%m/%d/%Y",               # US date only
-    ]
-
-    # Try each format
-    for fmt in formats:
+    return parse_timestamps(data, fmt)
+
+
+class _ColumnBuffer:
+    """
+    Buffer numpy crescente para ingestão por chunks.
+
+    Pré-aloca pela estimativa de linhas e cresce 25% quando necessário; no
+    final é encolhido in-place (realloc) para o tamanho exato, evitando uma
+    cópia extra da coluna.
+    """
+
+    _GROWTH = 1.25
+
+    def __init__(self, dtype: np.dtype | str, capacity: int):
+        self._data = np.empty(max(capacity, 1), dtype=dtype)
+        self._size = 0
+
+    def append(self, values: np.ndarray) -> None:
+        n = len(values)
+        required = self._size + n
+        if required > len(self._data):
+            new_capacity = max(required, int(len(self._data) * self._GROWTH))
+            self._data.resize(new_capacity, refcheck=False)
+        self._data[self._size:required] = values
+        self._size = required
+
+    def finalize(self) -> np.ndarray:
+        """Retorna array contíguo com exatamente os elementos adicionados."""
+        self._data.resize(self._size, refcheck=False)
+        return self._data
+
+
+def _estimate_csv_rows(path: Path, sample_bytes: int = 1 << 16) -> int:
+    """Estima número de linhas de um CSV a partir de uma amostra do início."""
+    size = path.stat().st_size
+    with open(path, "rb") as f:
+        sample = f.read(sample_bytes)
+    newlines = sample.count(b"\n")
+    if newlines == 0 or size <= len(sample):
+        return max(newlines, 1)
+    return int(size / (len(sample) / newlines) * 1.05)
+
+
+def _report_progress(callback: Callable[[float, str], None] | None,
+                     percent: float, message: str) -> None:
+    if callback:
+        callback(percent, message)
+
+
+class _ColumnarFrame:
+    """Resultado de ingestão colunar (chunks ou Arrow): colunas finais em numpy"""
+
+    def __init__(self, schema: SchemaMap, timestamp_column: str,
+                 t_datetime: np.ndarray, columns: dict[str, np.ndarray]):
+        self.schema = schema
+        self.timestamp_column = timestamp_column
+        self.t_datetime = t_datetime
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.t_datetime)
+
+    def validation_frame(self) -> pd.DataFrame:
+        """DataFrame sem cópia sobre as colunas finais, para os validadores"""
+        data = {self.timestamp_column: self.t_datetime, **self.columns}
+        return pd.DataFrame(data, copy=False)
+
+
+# Linhas lidas para achar a coluna de tempo quando ``columns`` restringe a leitura
+_USECOLS_SAMPLE_ROWS = 1000
+
+
+def _chunk_usecols(path: Path, config: LoadConfig,
+                   strategy: LoadStrategy) -> Callable[[str], bool] | None:
+    """
+    Filtro de colunas para a leitura por chunks quando ``config.columns`` é dado.
+
+    Mantém a coluna de tempo (configurada ou detectada numa amostra do início
+    do arquivo) e as séries pedidas; nomes ausentes no arquivo são ignorados,
+    como nos demais caminhos.
+    """
+    if config.columns is None:
+        return None
+    timestamp_column = config.timestamp_column
+    if timestamp_column is None:
+        sample_config = config.model_copy(update={"chunk_size": _USECOLS_SAMPLE_ROWS})
+        chunks = strategy.iter_chunks(path, sample_config)
         try:
-            result = pd.to_datetime(data, format=fmt, errors="raise")
-            logger.debug("timestamp_format_detected", format=fmt)
-            return result
-        except (ValueError, TypeError):
-            continue
+            sample = next(chunks, None)
+        finally:
+            chunks.close()
+        if sample is None:
+            return None
+        timestamp_column = detect_schema(sample, config.schema_rules).timestamp_column
+    if timestamp_column == "__index__":
+        return None
+    keep = {timestamp_column, *config.columns}
+    return keep.__contains__
+
+
+def _ingest_csv_chunked(path: Path, config: LoadConfig, strategy: LoadStrategy,
+                        progress_callback: Callable[[float, str], None] | None = None,
+                        hasher: Any | None = None) -> _ColumnarFrame:
+    """
+    Pipeline de ingestão por chunks com memória de pico limitada.
+
+    chunk do pandas -> buffers por coluna (float64 / datetime64[ns]) -> arrays
+    finais contíguos. O schema e o formato de timestamp são detectados no
+    primeiro chunk; colunas que não são numéricas nele não viram séries.
+    Com ``config.columns`` o parser só lê a coluna de tempo e as séries pedidas.
+    """
+    if config.encoding == "auto":
+        config = config.model_copy(update={"encoding": detect_encoding(path)})
+    usecols = _chunk_usecols(path, config, strategy)
+    size = max(path.stat().st_size, 1)
+    capacity = _estimate_csv_rows(path)
+    if config.max_rows:
+        capacity = min(capacity, config.max_rows)
+
+    position = [0]
+    schema: SchemaMap | None = None
+    timestamp_column = ""
+    timestamp_format: str | None = None
+    t_buffer: _ColumnBuffer | None = None
+    buffers: dict[str, _ColumnBuffer] = {}
+
+    for chunk in strategy.iter_chunks(path, config, position=position, hasher=hasher,
+                                      usecols=usecols):
+        if schema is None:
+            _validate_dataframe(chunk, config.model_copy(update={"min_valid_points": 1}))
+            schema = detect_schema(chunk, config.schema_rules)
+            if config.columns is not None:
+                wanted = set(config.columns)
+                schema = schema.model_copy(update={
+                    "candidate_series": [c for c in schema.candidate_series if c.name in wanted],
+                })
+            timestamp_column = config.timestamp_column or schema.timestamp_column
+            t_buffer = _ColumnBuffer("datetime64[ns]", capacity)
+            buffers = {
+                c.name: _ColumnBuffer(np.float64, capacity) for c in schema.candidate_series
+            }
+            first_time = chunk.index if timestamp_column == "__index__" else chunk[timestamp_column]
+            timestamp_format = detect_timestamp_format(first_time)
+
+        raw_time = chunk.index if timestamp_column == "__index__" else chunk[timestamp_column]
+        t_buffer.append(_parse_timestamps(raw_time, timestamp_format).to_numpy(dtype="datetime64[ns]"))
+        for name, buffer in buffers.items():
+            buffer.append(pd.to_numeric(chunk[name], errors="coerce").to_numpy(dtype=np.float64))
+
+        _report_progress(
+            progress_callback,
+            min(position[0] / size, 1.0) * 80.0,
+            f"Reading file... ({len(chunk)} rows)",
+        )
+
+    if schema is None or t_buffer is None:
+        raise DataLoadError("File loaded as empty DataFrame", {})
+
+    # Strings dos chunks (pandas 3) vivem no pool do Arrow, que guarda as
+    # páginas liberadas; devolvê-las antes de montar o dataset baixa o pico.
+    del chunk, raw_time
+    pa.default_memory_pool().release_unused()
+
+    frame = _ColumnarFrame(
+        schema=schema,
+        timestamp_column=timestamp_column,
+        t_datetime=t_buffer.finalize(),
+        columns={name: buffer.finalize() for name, buffer in buffers.items()},
+    )
+    if len(frame) < config.min_valid_points:
+        raise DataLoadError(
+            f"Dataset has only {len(frame)} points, minimum required: {config.min_valid_points}",
+            {"n_points": len(frame), "min_required": config.min_valid_points},
+        )
+    logger.debug("csv_chunked_ingest_complete", n_rows=len(frame), n_columns=len(frame.columns))
+    return frame
+
+
+def _arrow_csv_options(path: Path, config: LoadConfig,
+                       ) -> tuple[pacsv.ReadOptions, pacsv.ParseOptions, pacsv.ConvertOptions]:
+    """Traduz LoadConfig para as opções do leitor CSV multithread do Arrow"""
+    encoding = config.encoding
+    if encoding == "auto":
+        encoding = detect_encoding(path)
+        logger.info(f"auto_detected_encoding: {encoding}")
+    return (
+        pacsv.ReadOptions(use_threads=True, encoding=encoding),
+        pacsv.ParseOptions(delimiter=config.delimiter),
+        pacsv.ConvertOptions(),
+    )
 
-    # Fallback: let pandas infer (will generate warning for mixed formats)
-    logger.debug("timestamp_format_fallback", message="Using pandas inference")
-    return pd.to_datetime(data, errors="coerce")
+
+def _arrow_to_datetime(column: pa.ChunkedArray) -> np.ndarray:
+    """Converte coluna Arrow de tempo para datetime64[ns]"""
+    if pa.types.is_timestamp(column.type) or pa.types.is_date(column.type):
+        return column.cast(pa.timestamp("ns")).to_numpy()
+    return _parse_timestamps(column.to_pandas()).to_numpy(dtype="datetime64[ns]")
+
+
+def _arrow_to_float(column: pa.ChunkedArray) -> np.ndarray:
+    """Converte coluna Arrow para float64 (nulls viram NaN)"""
+    if column.null_count:
+        column = pc.fill_null(column.cast(pa.float64()), np.nan)
+    else:
+        column = column.cast(pa.float64())
+    return column.to_numpy()
+
+
+def _ingest_arrow(path: Path, config: LoadConfig, strategy: LoadStrategy,
+                  hasher: Any | None = None) -> _ColumnarFrame:
+    """
+    Ingestão via PyArrow: CSV multithread ou Parquet com projeção de colunas
+    e pushdown de ``time_range`` nos row groups.
+
+    Colunas Arrow sem nulls e em um único chunk viram arrays numpy sem cópia
+    (somente leitura).
+    """
+    if config.encoding == "auto" and strategy.format == FileFormat.CSV:
+        config = config.model_copy(update={"encoding": detect_encoding(path)})
+    schema = detect_arrow_schema(strategy.read_arrow_schema(path, config), config.schema_rules)
+    timestamp_column = config.timestamp_column or schema.timestamp_column
+
+    if config.columns is not None:
+        wanted = set(config.columns)
+        schema = schema.model_copy(update={
+            "candidate_series": [c for c in schema.candidate_series if c.name in wanted],
+        })
+        projection = [timestamp_column] + [c.name for c in schema.candidate_series]
+    else:
+        projection = None
+
+    filters = None
+    pushed_down = False
+    if config.time_range is not None and strategy.format == FileFormat.PARQUET:
+        start, end = config.time_range
+        filters = [(timestamp_column, ">=", start), (timestamp_column, "<=", end)]
+        pushed_down = True
+
+    table = strategy.read_arrow(path, config, columns=projection, filters=filters, hasher=hasher)
+    if table.num_rows == 0:
+        raise DataLoadError("File loaded as empty DataFrame", {})
+    if not schema.candidate_series:
+        raise DataLoadError("No numeric columns found in dataset", {"columns": table.column_names})
+
+    t_datetime = _arrow_to_datetime(table.column(timestamp_column))
+    columns = {c.name: _arrow_to_float(table.column(c.name)) for c in schema.candidate_series}
+
+    if config.time_range is not None and not pushed_down:
+        start, end = (np.datetime64(t, "ns") for t in config.time_range)
+        mask = (t_datetime >= start) & (t_datetime <= end)
+        t_datetime = t_datetime[mask]
+        columns = {name: values[mask] for name, values in columns.items()}
+
+    frame = _ColumnarFrame(schema=schema, timestamp_column=timestamp_column,
+                           t_datetime=t_datetime, columns=columns)
+    if len(frame) < config.min_valid_points:
+        raise DataLoadError(
+            f"Dataset has only {len(frame)} points, minimum required: {config.min_valid_points}",
+            {"n_points": len(frame), "min_required": config.min_valid_points},
+        )
+    logger.debug("arrow_ingest_complete", n_rows=len(frame), n_columns=len(columns),
+                 projected=projection is not None, pushdown=pushed_down)
+    return frame
 
 
 class LoadConfig(BaseModel):
@@ -173,7 +582,11 @@ class LoadConfig(BaseModel):
 
     # Configurações de performance
     max_rows: int | None = None
-    chunk_size: int | None = None
+    chunk_size: int | None = None  # CSV: ingestão em blocos de N linhas
+    engine: str = "pandas"  # "pandas" | "arrow" (CSV multithread / Parquet)
+    columns: list[str] | None = None  # projeção: séries a carregar (None = todas)
+    time_range: tuple[datetime, datetime] | None = None  # engine "arrow": pushdown em Parquet
+    excel_engine: str = "streaming"  # "streaming" (leitor XML sem openpyxl) | "openpyxl"
 
     # Configurações de validação
     max_missing_ratio: float = 0.95
@@ -196,6 +609,20 @@ class LoadConfig(BaseModel):
             raise ValueError("max_missing_ratio deve estar entre 0 e 1")
         return v
 
+    @field_validator("engine")
+    @classmethod
+    def validate_engine(cls, v: str) -> str:
+        if v not in ("pandas", "arrow"):
+            raise ValueError("engine deve ser 'pandas' ou 'arrow'")
+        return v
+
+    @field_validator("excel_engine")
+    @classmethod
+    def validate_excel_engine(cls, v: str) -> str:
+        if v not in ("openpyxl", "streaming"):
+            raise ValueError("excel_engine deve ser 'openpyxl' ou 'streaming'")
+        return v
+
     @field_validator("min_valid_points")
     @classmethod
     def validate_min_points(cls, v: int) -> int:
@@ -209,11 +636,10 @@ def _get_default_strategy(fmt: FileFormat) -> LoadStrategy:
     return LoadStrategy(format=fmt)
 
 
-def _create_source_info(path: Path, fmt: FileFormat) -> SourceInfo:
+def _create_source_info(path: Path, fmt: FileFormat, checksum: str | None = None) -> SourceInfo:
     """Cria SourceInfo com checksum conforme especificação"""
-    # Calcula checksum SHA256
-    with open(path, "rb") as f:
-        file_hash = hashlib.sha256(f.read()).hexdigest()
+    # SHA256 calculado durante a leitura, ou em blocos se não disponível
+    file_hash = checksum or file_checksum(path)
 
     return SourceInfo(
         filepath=str(path.absolute()),
@@ -243,8 +669,26 @@ def _validate_dataframe(df: pd.DataFrame, config: LoadConfig) -> None:
     logger.debug("dataframe_validated", shape=df.shape, numeric_cols=len(numeric_cols))
 
 
-def load(path: str, config: dict | LoadConfig | None = None) -> Dataset:
-    """Carrega dataset de arquivo conforme especificação seção 6"""
+def load(path: str, config: dict | LoadConfig | None = None,
+         progress_callback: Callable[[float, str], None] | None = None,
+         checksum: str | None = None) -> Dataset:
+    """
+    Carrega dataset de arquivo conforme especificação seção 6.
+
+    CSV com ``config.chunk_size`` definido é ingerido por chunks, com
+    memória de pico limitada e progresso reportado em ``progress_callback``
+    (percentual 0-100, mensagem). Com ``config.engine == "arrow"``, CSV e
+    Parquet são lidos via PyArrow, respeitando ``columns`` e ``time_range``.
+
+    Em CSV o checksum SHA-256 é calculado na mesma passada da leitura, e os
+    timestamps são convertidos uma única vez (validação e série temporal usam
+    o mesmo resultado). ``checksum``, se já conhecido (ex.: calculado pelo
+    ``DatasetCache`` na consulta), é usado como está e o arquivo não é
+    hasheado de novo. A duração de cada estágio fica em
+    ``dataset.metadata.load_timings_ms``.
+    """
+    timer = _StageTimer()
+    total_start = time.perf_counter()
     cfg = config if isinstance(config, LoadConfig) else LoadConfig(**(config or {}))
     path_obj = Path(path)
 
@@ -258,42 +702,78 @@ def load(path: str, config: dict | LoadConfig | None = None) -> Dataset:
         raise DataLoadError(f"Unsupported file format: {path_obj.suffix}", {"path": path})
 
     strategy = cfg.custom_strategy or _get_default_strategy(fmt)
+    use_arrow = cfg.engine == "arrow" and fmt in (FileFormat.CSV, FileFormat.PARQUET)
+    chunked = not use_arrow and fmt == FileFormat.CSV and bool(cfg.chunk_size)
 
-    logger.info("loading_file", path=str(path_obj), format=fmt.value, size_mb=path_obj.stat().st_size / 1024 / 1024)
+    logger.info("loading_file", path=str(path_obj), format=fmt.value,
+                size_mb=path_obj.stat().st_size / 1024 / 1024,
+                engine="arrow" if use_arrow else "pandas", chunked=chunked)
 
+    # CSV é lido sequencialmente: o hash acompanha a leitura
+    hasher = hashlib.sha256() if fmt == FileFormat.CSV and checksum is None else None
+    frame: _ColumnarFrame | None = None
     try:
-        df = strategy.read_file(path_obj, cfg)
-        _validate_dataframe(df, cfg)
+        with timer.stage("read"):
+            if use_arrow:
+                _report_progress(progress_callback, 10.0, "Reading file (arrow)...")
+                frame = _ingest_arrow(path_obj, cfg, strategy, hasher=hasher)
+            elif chunked:
+                frame = _ingest_csv_chunked(path_obj, cfg, strategy, progress_callback,
+                                            hasher=hasher)
+            else:
+                df = strategy.read_file(path_obj, cfg, hasher=hasher)
+                _validate_dataframe(df, cfg)
     except Exception as e:
         logger.exception("file_load_failed", path=str(path_obj), error=str(e))
         raise DataLoadError(f"Failed to load file: {e}", {"path": path, "original_error": str(e)})
 
-    schema = detect_schema(df, cfg.schema_rules)
-    timestamp_column = cfg.timestamp_column or schema.timestamp_column
-
-    time_report = validate_time(df, timestamp_column)
-    candidate_names = [c.name for c in schema.candidate_series]
-    values_report = validate_values(df, candidate_names, max_missing_ratio=cfg.max_missing_ratio)
-
-    if timestamp_column == "__index__":
-        timestamps = _parse_timestamps(df.index)
-    else:
-        timestamps = _parse_timestamps(df[timestamp_column])
-
-    t_datetime = timestamps.to_numpy()
-    t_seconds = to_seconds(t_datetime)
-
+    with timer.stage("schema"):
+        if frame is not None:
+            df = frame.validation_frame()
+            schema = frame.schema
+            timestamp_column = frame.timestamp_column
+        else:
+            schema = detect_schema(df, cfg.schema_rules)
+            timestamp_column = cfg.timestamp_column or schema.timestamp_column
+            if cfg.columns is not None:
+                wanted = set(cfg.columns)
+                schema = schema.model_copy(update={
+                    "candidate_series": [c for c in schema.candidate_series if c.name in wanted],
+                })
+
+    with timer.stage("timestamps"):
+        if frame is not None:
+            timestamps = pd.DatetimeIndex(frame.t_datetime, copy=False)
+        else:
+            raw_time = df.index if timestamp_column == "__index__" else df[timestamp_column]
+            timestamps = _parse_timestamps(raw_time)
+        t_datetime = timestamps.to_numpy()
+        t_seconds = to_seconds(t_datetime)
+
+    _report_progress(progress_callback, 85.0, "Validating data...")
+    with timer.stage("validate"):
+        time_report = validate_time(df, timestamp_column, timestamps=timestamps)
+        candidate_names = [c.name for c in schema.candidate_series]
+        values_report = validate_values(df, candidate_names, max_missing_ratio=cfg.max_missing_ratio)
+
+    _report_progress(progress_callback, 90.0, "Building series...")
+    series_start = time.perf_counter()
     series_dict: dict[str, Series] = {}
     for candidate in schema.candidate_series:
-        values = pd.to_numeric(df[candidate.name], errors="coerce").to_numpy(dtype=float)
+        if frame is not None:
+            values = frame.columns[candidate.name]
+        else:
+            values = pd.to_numeric(df[candidate.name], errors="coerce").to_numpy(dtype=float)
         unit_str = cfg.unit_overrides.get(candidate.name)
         if unit_str is None:
             unit_str = infer_unit_from_name(candidate.name)
         unit = parse_unit(unit_str)
-        method_used = np.where(np.isnan(values), "missing", "original")
+        # Preenche direto em <U32 (evita array temporário de strings por série)
+        method_used = np.full(len(values), "original", dtype="<U32")
+        method_used[np.isnan(values)] = "missing"
         interpolation_info = InterpolationInfo(
             is_interpolated=np.zeros(len(values), dtype=bool),
-            method_used=method_used.astype("<U32"),
+            method_used=method_used,
         )
         metadata = SeriesMetadata(
             original_name=candidate.name,
@@ -320,19 +800,27 @@ def load(path: str, config: dict | LoadConfig | None = None) -> Dataset:
             metadata=metadata,
             lineage=lineage,
         )
+    timer.timings["series"] = round((time.perf_counter() - series_start) * 1000, 3)
+
+    with timer.stage("checksum"):
+        source = _create_source_info(
+            path_obj, fmt, checksum=hasher.hexdigest() if hasher is not None else checksum,
+        )
+    timer.timings["total"] = round((time.perf_counter() - total_start) * 1000, 3)
 
     metadata = DatasetMetadata(
         schema_confidence=schema.confidence,
         validation_warnings=[w.message for w in time_report.warnings + values_report.warnings],
         validation_errors=[e.message for e in time_report.errors + values_report.errors],
         timezone=cfg.timezone,
+        load_timings_ms=timer.timings,
     )
 
     dataset = Dataset(
         dataset_id=new_id("dataset"),
         version=1,
         parent_id=None,
-        source=_create_source_info(path_obj, fmt),
+        source=source,
         t_seconds=t_seconds,
         t_datetime=t_datetime,
         series=series_dict,
@@ -348,6 +836,7 @@ def load(path: str, config: dict | LoadConfig | None = None) -> Dataset:
         file_format=fmt.value,
         file_size_mb=path_obj.stat().st_size / 1024 / 1024,
         schema_confidence=schema.confidence,
+        load_timings_ms=timer.timings,
     )
     return dataset
 
@@ -360,9 +849,9 @@ def load_async(path: str, config: dict | LoadConfig | None = None,
 
     try:
         if progress_callback:
-            progress_callback(20.0, "Reading file...")
+            progress_callback(5.0, "Reading file...")
 
-        dataset = load(path, config)
+        dataset = load(path, config, progress_callback=progress_callback)
 
         if progress_callback:
             progress_callback(100.0, "Load complete")
@@ -415,6 +904,24 @@ def get_file_info(path: str) -> dict[str, Any]:
         }
 
 
+def _load_in_worker(path: str, config: LoadConfig, checksum: str | None = None) -> Dataset:
+    """Ponto de entrada dos processos do pool de carregamento."""
+    return load(path, config, checksum=checksum)
+
+
+class BatchLoadResult(BaseModel):
+    """Resultado de um arquivo em ``DataLoaderService.load_many``"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    path: str
+    dataset: Dataset | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.dataset is not None
+
+
 class DataLoaderService:
     """
     Serviço de carregamento de dados com gerenciamento de cache e validação.
@@ -423,14 +930,17 @@ class DataLoaderService:
     com suporte a múltiplos formatos e validação automática.
     """
     
-    def __init__(self, default_config: LoadConfig | None = None):
+    def __init__(self, default_config: LoadConfig | None = None,
+                 dataset_cache: DatasetCache | None = None):
         """
         Inicializa o serviço.
         
         Args:
             default_config: Configuração padrão para carregamentos
+            dataset_cache: Cache persistente de datasets parseados (opcional)
         """
         self._default_config = default_config or LoadConfig()
+        self._dataset_cache = dataset_cache
         self._cache: dict[str, pd.DataFrame] = {}
         self._loaded_files: list[str] = []
         
@@ -483,20 +993,168 @@ class DataLoaderService:
     def load_dataset(
         self,
         path: str | Path,
-        config: LoadConfig | None = None
+        config: LoadConfig | None = None,
+        use_cache: bool = True,
+        progress_callback: Callable[[float, str], None] | None = None,
     ) -> Dataset:
         """
         Carrega arquivo como Dataset completo.
+
+        Com ``dataset_cache`` configurado, um arquivo já parseado com a mesma
+        configuração é aberto do cache sem passar pelo parser.
         
         Args:
             path: Caminho do arquivo
             config: Configuração de carregamento
+            use_cache: Se deve usar o cache de datasets
+            progress_callback: Callback de progresso repassado a ``load``
             
         Returns:
             Dataset com séries de dados
         """
         load_config = config or self._default_config
-        return load(path, load_config)
+        cached, checksum = self._cached_dataset(path, load_config) if use_cache else (None, None)
+        if cached is not None:
+            _report_progress(progress_callback, 100.0, "Loaded from cache")
+            return cached
+
+        # Checksum da consulta ao cache: o load não hasheia o arquivo de novo
+        dataset = load(str(path), load_config, progress_callback=progress_callback,
+                       checksum=checksum)
+        if use_cache:
+            self._store_dataset(path, load_config, dataset)
+        return dataset
+
+    def _cache_enabled(self, config: LoadConfig) -> bool:
+        # Estratégias customizadas não têm representação estável na chave
+        return self._dataset_cache is not None and config.custom_strategy is None
+
+    def _cached_dataset(self, path: str | Path, config: LoadConfig) -> tuple[Dataset | None, str | None]:
+        """(dataset do cache ou None, checksum calculado na consulta ou None)."""
+        if not self._cache_enabled(config):
+            return None, None
+        try:
+            return self._dataset_cache.lookup(path, config)
+        except Exception as e:
+            logger.warning("dataset_cache_lookup_failed", path=str(path), error=str(e))
+            return None, None
+
+    def _store_dataset(self, path: str | Path, config: LoadConfig, dataset: Dataset) -> None:
+        if not self._cache_enabled(config):
+            return
+        try:
+            self._dataset_cache.put(path, config, dataset)
+        except Exception as e:
+            logger.warning("dataset_cache_store_failed", path=str(path), error=str(e))
+
+    def load_many(
+        self,
+        paths: Iterable[str | Path],
+        config: LoadConfig | None = None,
+        max_workers: int | None = None,
+        cancel_event: threading.Event | None = None,
+        memory_manager: MemoryManager | None = None,
+        executor: Executor | None = None,
+    ) -> Iterator[BatchLoadResult]:
+        """
+        Carrega vários arquivos em paralelo num pool de processos.
+
+        Os resultados são entregues à medida que cada arquivo termina (não na
+        ordem de entrada). Um arquivo só é submetido quando
+        ``MemoryManager.can_load_file`` aprova, considerando a memória já
+        reservada pelos carregamentos em andamento; se nem sozinho ele cabe,
+        o resultado traz o erro. Falhas de um arquivo não interrompem os demais.
+        Arquivos presentes no ``dataset_cache`` são entregues sem ir ao pool.
+
+        O pool próprio usa ``spawn`` (como o ``JobScheduler``): fork de um
+        processo com threads Qt não é seguro. Cancelar (``cancel_event``) ou
+        fechar o gerador antes do fim descarta os arquivos não iniciados e
+        retorna sem esperar; carregamentos já em execução não são
+        interrompidos, apenas terminam em segundo plano e são ignorados.
+
+        Args:
+            paths: Arquivos a carregar
+            config: Configuração de carregamento (padrão do serviço se None)
+            max_workers: Número de processos (padrão ``os.cpu_count()``)
+            cancel_event: Quando sinalizado, arquivos ainda não iniciados são
+                descartados e a iteração termina
+            memory_manager: Orçamento de memória compartilhado (global se None)
+            executor: Executor já existente (o chamador é dono do ciclo de vida)
+
+        Yields:
+            BatchLoadResult por arquivo concluído
+        """
+        load_config = config or self._default_config
+        manager = memory_manager or get_memory_manager()
+        pending = [str(Path(p)) for p in paths]
+        pending.reverse()  # pop() do fim preserva a ordem de submissão
+        owns_executor = executor is None
+        limit = max_workers or os.cpu_count() or 1
+        pool = executor or ProcessPoolExecutor(
+            max_workers=limit, mp_context=multiprocessing.get_context("spawn"),
+        )
+        # Futuro -> (caminho, reserva); reservas com id próprio, pois o mesmo
+        # arquivo pode aparecer duas vezes no lote
+        in_flight: dict[Future, tuple[str, str]] = {}
+        cancelled = False
+
+        logger.info("batch_load_started", n_files=len(pending), max_workers=limit)
+        try:
+            while pending or in_flight:
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled = True
+                    break
+
+                while pending and len(in_flight) < limit:
+                    path = pending[-1]
+                    cached, checksum = self._cached_dataset(path, load_config)
+                    if cached is not None:
+                        pending.pop()
+                        self._loaded_files.append(str(Path(path).absolute()))
+                        yield BatchLoadResult(path=path, dataset=cached)
+                        continue
+                    can_load, message = manager.can_load_file(path)
+                    if not can_load:
+                        if in_flight:
+                            break  # aguarda liberar memória
+                        pending.pop()
+                        logger.warning("batch_load_memory_rejected", path=path, reason=message)
+                        yield BatchLoadResult(path=path, error=message or "Not enough memory")
+                        continue
+                    pending.pop()
+                    reservation = new_id("load")
+                    manager.reserve(reservation, path)
+                    future = pool.submit(_load_in_worker, path, load_config, checksum)
+                    in_flight[future] = (path, reservation)
+
+                if not in_flight:
+                    continue
+
+                done, _ = wait(in_flight, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, reservation = in_flight.pop(future)
+                    manager.release(reservation)
+                    try:
+                        dataset = future.result()
+                    except Exception as e:
+                        logger.warning("batch_load_file_failed", path=path, error=str(e))
+                        yield BatchLoadResult(path=path, error=str(e))
+                    else:
+                        self._store_dataset(path, load_config, dataset)
+                        self._loaded_files.append(str(Path(path).absolute()))
+                        yield BatchLoadResult(path=path, dataset=dataset)
+        except GeneratorExit:
+            # Consumidor fechou o gerador (ex.: closeEvent): mesmo que cancelar
+            cancelled = True
+            raise
+        finally:
+            for future, (_, reservation) in in_flight.items():
+                future.cancel()
+                manager.release(reservation)
+            if owns_executor:
+                pool.shutdown(wait=not cancelled, cancel_futures=True)
+            logger.info("batch_load_finished", cancelled=cancelled,
+                        n_skipped=len(pending) + len(in_flight))
     
     def clear_cache(self) -> None:
         """Limpa o cache de dados."""
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -73,3 +75,33 @@ def detect_schema(df: pd.DataFrame, rules: SchemaRules) -> SchemaMap:
         candidate_series=candidates,
         confidence=confidence,
     )
+
+
+def detect_arrow_schema(schema: pa.Schema, rules: SchemaRules) -> SchemaMap:
+    """Detect schema from a pyarrow schema, mirroring ``detect_schema``."""
+    names = list(schema.names)
+    datetime_cols = [
+        f.name for f in schema if pa.types.is_timestamp(f.type) or pa.types.is_date(f.type)
+    ]
+    if datetime_cols:
+        timestamp_col = datetime_cols[0]
+        confidence = 0.95
+    else:
+        timestamp_col = _match_timestamp_column(names, rules)
+        confidence = 0.9 if timestamp_col else 0.5
+
+    if timestamp_col is None:
+        timestamp_col = names[0]
+
+    candidates = [
+        SeriesCandidate(name=f.name, dtype=np.dtype(f.type.to_pandas_dtype()).name)
+        for f in schema
+        if f.name != timestamp_col
+        and (pa.types.is_integer(f.type) or pa.types.is_floating(f.type))
+    ]
+
+    return SchemaMap(
+        timestamp_column=timestamp_col,
+        candidate_series=candidates,
+        confidence=confidence,
+    )
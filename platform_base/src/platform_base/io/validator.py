@@ -28,7 +28,7 @@ import numpy as np
 import pandas as pd
 from pydantic import BaseModel, ConfigDict, Field
 
-from platform_base.processing.timebase import to_seconds
+from platform_base.processing.timebase import parse_timestamps, to_seconds
 from platform_base.utils.logging import get_logger
 
 
@@ -45,33 +45,7 @@ def _parse_timestamps_for_validation(data: pd.Series | pd.Index) -> pd.DatetimeI
     Returns:
         DatetimeIndex with parsed timestamps
     """
-    # If already datetime, just convert
-    if pd.api.types.is_datetime64_any_dtype(data):
-        return pd.DatetimeIndex(data)
-
-    # Common datetime formats to try
-    formats = [
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d %H:%M:%S.%f",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%d",
-        "%d/%m/%Y %H:%M:%S",
-        "%d/%m/%Y",
-        "%m/%d/%Y %H:%M:%S",
-        "%m/%d/%Y",
-    ]
-
-    for fmt in formats:
-        try:
-            parsed = pd.to_datetime(data, format=fmt, errors="raise")
-            return pd.DatetimeIndex(parsed)
-        except (ValueError, TypeError):
-            continue
-
-    # Fallback - try auto detection
-    parsed = pd.to_datetime(data, errors="coerce")
-    return pd.DatetimeIndex(parsed)
+    return parse_timestamps(data)
 
 
 class ValidationWarning(BaseModel):
@@ -195,11 +169,18 @@ def detect_gaps(t_seconds: np.ndarray, gap_multiplier: float = 5.0) -> GapReport
     return GapReport(count=len(gaps), gaps=gaps)
 
 
-def validate_time(df: pd.DataFrame, timestamp_column: str) -> ValidationReport:
+def validate_time(
+    df: pd.DataFrame,
+    timestamp_column: str,
+    timestamps: pd.DatetimeIndex | None = None,
+) -> ValidationReport:
+    """Valida coluna de tempo; ``timestamps`` já convertidos evitam um novo parse."""
     warnings: list[ValidationWarning] = []
     errors: list[ValidationError] = []
 
-    if timestamp_column == "__index__":
+    if timestamps is not None:
+        timestamps = pd.DatetimeIndex(timestamps)
+    elif timestamp_column == "__index__":
         timestamps = _parse_timestamps_for_validation(df.index)
     else:
         timestamps = _parse_timestamps_for_validation(df[timestamp_column])
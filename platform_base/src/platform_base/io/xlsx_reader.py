@@ -0,0 +1,422 @@
+"""
+XLSX Reader - leitura streaming de planilhas sem openpyxl
+
+Lê o XML da worksheet direto do zip com ``iterparse`` (expat, estilo SAX),
+sem materializar objetos de célula: cada valor vai para um buffer tipado da
+sua coluna (float64 para números/datas, strings esparsas à parte). Células de
+data (pelo ``numFmt`` do estilo) viram ``datetime64`` na unidade que o pandas
+usa para datas do openpyxl. Cada linha é posicionada pelo atributo ``r``:
+linhas omitidas no XML viram linhas NaN, como no ``pd.read_excel``.
+
+Também oferece:
+- ``read_xlsx_sheets``: decodifica várias sheets em paralelo (processos)
+- ``XlsxSheetCache``: cada sheet é decodificada uma vez e gravada em Arrow IPC
+  (colunar, aberta via mmap); aberturas seguintes não leem o XML
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import re
+import zipfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from xml.etree.ElementTree import iterparse
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from platform_base.utils.errors import DataLoadError
+from platform_base.utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# numFmtId embutidos que representam data/hora
+_BUILTIN_DATE_FORMATS = frozenset({14, 15, 16, 17, 18, 19, 20, 21, 22, 45, 46, 47})
+_DATE_TOKENS = re.compile(r"[dmyhs]", re.IGNORECASE)
+_FORMAT_LITERALS = re.compile(r'"[^"]*"|\[[^\]]*\]|\\.')
+
+# Textos tratados como ausentes (mesmo conjunto padrão do pandas)
+_NA_STRINGS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+
+_EPOCH_1900 = np.datetime64("1899-12-30", "us")
+_EPOCH_1904 = np.datetime64("1904-01-01", "us")
+_MS_PER_DAY = 86_400_000
+
+
+@lru_cache(maxsize=1)
+def _datetime_dtype() -> np.dtype:
+    """dtype que o pandas escolhe para datas vindas do openpyxl (ns ou us, conforme a versão)."""
+    return pd.to_datetime([datetime(2000, 1, 1)]).dtype
+
+
+def _column_index(ref: str) -> int:
+    """'AB12' -> 27 (base 0)."""
+    index = 0
+    for ch in ref:
+        if "A" <= ch <= "Z":
+            index = index * 26 + (ord(ch) - 64)
+        else:
+            break
+    return index - 1
+
+
+def _is_date_format(code: str) -> bool:
+    return bool(_DATE_TOKENS.search(_FORMAT_LITERALS.sub("", code)))
+
+
+class _Workbook:
+    """Metadados do workbook: sheets, shared strings e estilos de data."""
+
+    def __init__(self, archive: zipfile.ZipFile):
+        self.archive = archive
+        names = set(archive.namelist())
+
+        workbook = archive.read("xl/workbook.xml")
+        rels = archive.read("xl/_rels/workbook.xml.rels")
+        targets = {}
+        for _, elem in iterparse(io.BytesIO(rels)):
+            if elem.tag == f"{_PKG_REL_NS}Relationship":
+                target = elem.get("Target", "")
+                targets[elem.get("Id")] = (
+                    target.lstrip("/") if target.startswith("/")
+                    else str(PurePosixPath("xl") / target)
+                )
+
+        self.sheets: dict[str, str] = {}
+        self.date1904 = False
+        for _, elem in iterparse(io.BytesIO(workbook)):
+            if elem.tag == f"{_NS}sheet":
+                self.sheets[elem.get("name")] = targets[elem.get(f"{_REL_NS}id")]
+            elif elem.tag == f"{_NS}workbookPr":
+                self.date1904 = elem.get("date1904") in ("1", "true")
+
+        self.shared_strings = (
+            self._read_shared_strings() if "xl/sharedStrings.xml" in names else []
+        )
+        self.date_styles = self._read_date_styles() if "xl/styles.xml" in names else frozenset()
+
+    def _read_shared_strings(self) -> list[str]:
+        strings: list[str] = []
+        with self.archive.open("xl/sharedStrings.xml") as f:
+            for _, elem in iterparse(f):
+                if elem.tag == f"{_NS}si":
+                    strings.append("".join(t.text or "" for t in elem.iter(f"{_NS}t")))
+                    elem.clear()
+        return strings
+
+    def _read_date_styles(self) -> frozenset[int]:
+        custom: dict[int, str] = {}
+        xf_formats: list[int] = []
+        in_cell_xfs = False
+        with self.archive.open("xl/styles.xml") as f:
+            for event, elem in iterparse(f, events=("start", "end")):
+                if elem.tag == f"{_NS}cellXfs":
+                    in_cell_xfs = event == "start"
+                elif event == "end" and elem.tag == f"{_NS}numFmt":
+                    custom[int(elem.get("numFmtId"))] = elem.get("formatCode", "")
+                elif event == "end" and in_cell_xfs and elem.tag == f"{_NS}xf":
+                    xf_formats.append(int(elem.get("numFmtId", 0)))
+        return frozenset(
+            i for i, fmt_id in enumerate(xf_formats)
+            if fmt_id in _BUILTIN_DATE_FORMATS
+            or (fmt_id in custom and _is_date_format(custom[fmt_id]))
+        )
+
+    def resolve_sheet(self, sheet: str | int) -> tuple[str, str]:
+        names = list(self.sheets)
+        if isinstance(sheet, int):
+            if not 0 <= sheet < len(names):
+                raise DataLoadError(f"Worksheet index {sheet} is invalid", {"n_sheets": len(names)})
+            sheet = names[sheet]
+        if sheet not in self.sheets:
+            raise DataLoadError(f"Worksheet named '{sheet}' not found", {"sheets": names})
+        return sheet, self.sheets[sheet]
+
+
+class _ColumnBuffer:
+    """Buffer tipado de uma coluna: float64 contíguo + strings/booleanos esparsos."""
+
+    __slots__ = ("bools", "dates", "numbers", "strings", "values")
+
+    def __init__(self):
+        self.values = array("d")
+        self.strings: dict[int, str] = {}
+        self.bools: dict[int, bool] = {}
+        self.dates = 0
+        self.numbers = 0
+
+    def pad(self, n_rows: int) -> None:
+        missing = n_rows - len(self.values)
+        if missing > 0:
+            self.values.extend([np.nan] * missing)
+
+    def finalize(self, n_rows: int, epoch: np.datetime64) -> np.ndarray:
+        self.pad(n_rows)
+        values = np.frombuffer(self.values, dtype=np.float64)[:n_rows]
+        if not self.strings:
+            if self.bools and len(self.bools) == self.numbers == n_rows:
+                return values.astype(bool)
+            if self.dates and self.dates == self.numbers:
+                dtype = _datetime_dtype()
+                valid = ~np.isnan(values)
+                out = np.full(n_rows, np.datetime64("NaT"), dtype=dtype)
+                # Excel guarda datas com precisão de milissegundo
+                millis = np.round(values[valid] * _MS_PER_DAY).astype(np.int64)
+                out[valid] = (epoch + millis.astype("timedelta64[ms]")).astype(dtype)
+                return out
+            if (self.numbers == n_rows and n_rows
+                    and np.all(np.mod(values, 1) == 0) and np.abs(values).max() < 2**53):
+                return values.astype(np.int64)
+            return values.copy()
+
+        out = values.astype(object)
+        out[np.isnan(values)] = None
+        for cells in (self.strings, self.bools):
+            for row, value in cells.items():
+                if row < n_rows:
+                    out[row] = value
+        return out
+
+
+def _header_names(cells: dict[int, object], n_columns: int) -> list[str]:
+    names: list[str] = []
+    seen: dict[str, int] = {}
+    for i in range(n_columns):
+        value = cells.get(i)
+        if value is None or value == "":
+            name = f"Unnamed: {i}"
+        elif isinstance(value, float) and value.is_integer():
+            name = str(int(value))
+        else:
+            name = str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def xlsx_sheet_names(path: str | Path) -> list[str]:
+    """Nomes das sheets na ordem do workbook."""
+    with zipfile.ZipFile(path) as archive:
+        return list(_Workbook(archive).sheets)
+
+
+def read_xlsx(path: str | Path, sheet: str | int = 0, max_rows: int | None = None) -> pd.DataFrame:
+    """
+    Lê uma sheet de XLSX em modo streaming.
+
+    A primeira linha da planilha é o cabeçalho. Colunas só numéricas viram
+    float64 (int64 se todas inteiras), colunas só booleanas viram bool,
+    colunas com formato de data viram ``datetime64`` e colunas com texto
+    viram object. Linhas ausentes no XML viram linhas NaN.
+
+    Args:
+        path: Arquivo .xlsx
+        sheet: Nome ou índice da sheet
+        max_rows: Número máximo de linhas de dados
+
+    Returns:
+        DataFrame equivalente ao de ``pd.read_excel`` para dados tabulares
+    """
+    try:
+        archive = zipfile.ZipFile(path)
+    except (zipfile.BadZipFile, OSError) as e:
+        raise DataLoadError(f"Invalid XLSX file: {e}", {"path": str(path)}) from e
+
+    with archive:
+        workbook = _Workbook(archive)
+        sheet_name, member = workbook.resolve_sheet(sheet)
+        shared = workbook.shared_strings
+        date_styles = workbook.date_styles
+        epoch = _EPOCH_1904 if workbook.date1904 else _EPOCH_1900
+
+        header: dict[int, object] | None = None
+        columns: dict[int, _ColumnBuffer] = {}
+        n_rows = 0
+        sheet_row = 0  # número (base 1) da última linha lida
+        row_tag, cell_tag, value_tag = f"{_NS}row", f"{_NS}c", f"{_NS}v"
+        inline_tag, text_tag = f"{_NS}is", f"{_NS}t"
+        sheet_data = None
+
+        with archive.open(member) as f:
+            for event, row in iterparse(f, events=("start", "end")):
+                if event == "start":
+                    if row.tag == f"{_NS}sheetData":
+                        sheet_data = row
+                    continue
+                if row.tag != row_tag:
+                    continue
+
+                # Linhas vazias podem ser omitidas do XML: posiciona pelo atributo r
+                ref_row = row.get("r")
+                sheet_row = int(ref_row) if ref_row else sheet_row + 1
+                cells: dict[int, tuple[object, bool]] = {}
+                next_col = 0
+                for cell in row.iter(cell_tag):
+                    ref = cell.get("r")
+                    col = _column_index(ref) if ref else next_col
+                    next_col = col + 1
+                    kind = cell.get("t", "n")
+                    if kind == "inlineStr":
+                        inline = cell.find(inline_tag)
+                        text = "".join(t.text or "" for t in inline.iter(text_tag)) if inline is not None else ""
+                        cells[col] = (text, False)
+                        continue
+                    v = cell.find(value_tag)
+                    if v is None or v.text is None:
+                        continue
+                    if kind == "s":
+                        cells[col] = (shared[int(v.text)], False)
+                    elif kind in ("str", "d"):
+                        cells[col] = (v.text, False)
+                    elif kind == "e":
+                        continue
+                    elif kind == "b":
+                        cells[col] = (v.text in ("1", "true"), False)
+                    else:
+                        style = cell.get("s")
+                        is_date = style is not None and int(style) in date_styles
+                        cells[col] = (float(v.text), is_date)
+                # Descarta a linha já lida (memória constante)
+                sheet_data.remove(row)
+
+                if header is None:
+                    header = {}
+                    if sheet_row == 1:
+                        header = {c: value for c, (value, _) in cells.items()}
+                        continue
+
+                data_row = sheet_row - 2
+                if max_rows is not None and data_row >= max_rows:
+                    break
+                for col, (value, is_date) in cells.items():
+                    if value.__class__ is str and value in _NA_STRINGS:
+                        continue
+                    buffer = columns.get(col)
+                    if buffer is None:
+                        buffer = columns[col] = _ColumnBuffer()
+                    buffer.pad(data_row)
+                    if value.__class__ is bool:
+                        # Misturado com números vale 1/0 (como no read_excel)
+                        buffer.values.append(float(value))
+                        buffer.numbers += 1
+                        buffer.bools[data_row] = value
+                    elif isinstance(value, float):
+                        buffer.values.append(value)
+                        buffer.numbers += 1
+                        buffer.dates += is_date
+                    else:
+                        buffer.values.append(np.nan)
+                        buffer.strings[data_row] = value
+                if cells:
+                    # Linhas finais vazias não contam (read_excel as descarta)
+                    n_rows = data_row + 1
+
+    if header is None:
+        return pd.DataFrame()
+
+    n_columns = max([*header, *columns], default=-1) + 1
+    names = _header_names(header, n_columns)
+    data = {}
+    for i, name in enumerate(names):
+        buffer = columns.get(i)
+        data[name] = (
+            buffer.finalize(n_rows, epoch) if buffer is not None
+            else np.full(n_rows, np.nan)
+        )
+
+    logger.debug("xlsx_streaming_read", path=str(path), sheet=sheet_name,
+                 n_rows=n_rows, n_columns=n_columns)
+    return pd.DataFrame(data, copy=False)
+
+
+def _read_sheet_task(path: str, sheet: str, max_rows: int | None) -> pd.DataFrame:
+    return read_xlsx(path, sheet, max_rows)
+
+
+def read_xlsx_sheets(
+    path: str | Path,
+    sheets: list[str] | None = None,
+    max_rows: int | None = None,
+    max_workers: int | None = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Decodifica várias sheets, em paralelo entre processos.
+
+    Args:
+        path: Arquivo .xlsx
+        sheets: Sheets a ler (None = todas)
+        max_rows: Número máximo de linhas por sheet
+        max_workers: Processos (1 = sequencial)
+
+    Returns:
+        Dicionário nome da sheet -> DataFrame, na ordem pedida
+    """
+    names = sheets if sheets is not None else xlsx_sheet_names(path)
+    if max_workers == 1 or len(names) <= 1:
+        return {name: read_xlsx(path, name, max_rows) for name in names}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {name: pool.submit(_read_sheet_task, str(path), name, max_rows) for name in names}
+        return {name: future.result() for name, future in futures.items()}
+
+
+class XlsxSheetCache:
+    """
+    Cache de conversão: cada sheet é decodificada uma vez e gravada em Arrow
+    IPC (Feather v2, sem compressão) para ser reaberta via mmap.
+
+    A chave é (caminho absoluto, tamanho, mtime_ns, sheet); alterar o workbook
+    invalida as entradas dele.
+    """
+
+    def __init__(self, location: str | Path):
+        self.location = Path(location)
+        self.location.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, path: Path, sheet: str | int) -> Path:
+        stat = path.stat()
+        raw = f"{path.absolute()}|{stat.st_size}|{stat.st_mtime_ns}|{sheet}"
+        return self.location / f"{hashlib.sha1(raw.encode()).hexdigest()}.arrow"
+
+    def read(self, path: str | Path, sheet: str | int = 0, max_rows: int | None = None) -> pd.DataFrame:
+        """Lê a sheet do cache, decodificando o XLSX apenas na primeira vez."""
+        path_obj = Path(path)
+        entry = self._entry_path(path_obj, sheet)
+        if entry.exists():
+            table = feather.read_table(entry, memory_map=True)
+            if max_rows is not None:
+                table = table.slice(0, max_rows)
+            logger.debug("xlsx_sheet_cache_hit", path=str(path_obj), sheet=sheet)
+            return table.to_pandas()
+
+        df = read_xlsx(path_obj, sheet)
+        staging = entry.with_suffix(".tmp")
+        feather.write_feather(pa.Table.from_pandas(df, preserve_index=False), staging,
+                              compression="uncompressed")
+        staging.replace(entry)
+        logger.debug("xlsx_sheet_cache_stored", path=str(path_obj), sheet=sheet)
+        return df.head(max_rows) if max_rows is not None else df
+
+    def clear(self) -> None:
+        """Remove todas as sheets convertidas."""
+        for entry in self.location.glob("*.arrow"):
+            entry.unlink(missing_ok=True)
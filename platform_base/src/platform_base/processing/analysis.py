@@ -3,7 +3,8 @@ Signal Analysis Module - FFT, Correlation, and Outlier Detection
 
 Provides comprehensive signal analysis capabilities for time series data:
 - Fast Fourier Transform (FFT) analysis
-- Cross-correlation and auto-correlation
+- Cross-correlation and auto-correlation (direct or FFT, chosen by size)
+- Pairwise lag matrix for delay estimation across many channels
 - Outlier detection using multiple methods
 """
 
@@ -13,18 +14,28 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import numpy as np
+from scipy import fft as sp_fft
 from scipy import signal, stats
 
+from platform_base.processing.parallel import DEFAULT_MAX_WORKERS
 from platform_base.utils.errors import ValidationError
 from platform_base.utils.logging import get_logger
 
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from numpy.typing import NDArray
 
 
 logger = get_logger(__name__)
 
+# Custo relativo de um passo n·log2(n) de FFT frente a uma multiplicação-soma
+# do produto direto; calibra a escolha automática direct/fft
+CORRELATION_FFT_COST = 10.0
+
+CORRELATION_METHODS = ("auto", "direct", "fft")
+
 
 @dataclass
 class FFTResult:
@@ -47,6 +58,15 @@ class CorrelationResult:
     confidence_interval: tuple[float, float]  # 95% confidence interval
 
 
+@dataclass
+class LagMatrixResult:
+    """Result of pairwise lag estimation"""
+    names: list[str]                      # Series order of the matrices
+    lags: NDArray[np.int64]               # lags[i, j] > 0: series i lags series j (samples)
+    peak_correlation: NDArray[np.float64]  # Normalized correlation at the peak
+    max_lag: int                          # Largest lag searched (samples)
+
+
 @dataclass
 class OutlierResult:
     """Result of outlier detection"""
@@ -109,17 +129,11 @@ def compute_fft(
 
         clean_values = clean_values * window_func
 
-    # Compute FFT
-    fft_values = np.fft.fft(clean_values)
+    # Compute FFT (real input: only the non-negative half is transformed)
     n = len(clean_values)
-
-    # Compute frequencies
-    frequencies = np.fft.fftfreq(n, d=1/sampling_rate)
-
-    # Take only positive frequencies
-    positive_freq_idx = frequencies >= 0
-    frequencies = frequencies[positive_freq_idx]
-    fft_values = fft_values[positive_freq_idx]
+    n_positive = (n + 1) // 2  # mesmos bins de fftfreq >= 0 (sem Nyquist)
+    fft_values = sp_fft.rfft(clean_values)[:n_positive]
+    frequencies = sp_fft.rfftfreq(n, d=1/sampling_rate)[:n_positive]
 
     # Compute magnitude, phase, and power
     magnitude = np.abs(fft_values)
@@ -148,22 +162,82 @@ def compute_fft(
     )
 
 
+def _lag_range(n1: int, n2: int, max_lag: int | None) -> tuple[int, int]:
+    """Lags k of c[k] = sum_n a[n + k] * v[n] with any overlap, limited to |k| <= max_lag."""
+    lag_lo, lag_hi = -(n2 - 1), n1 - 1
+    if max_lag is not None:
+        lag_lo, lag_hi = max(lag_lo, -max_lag), min(lag_hi, max_lag)
+    return lag_lo, lag_hi
+
+
+def _correlation_fft_size(n1: int, n2: int, lag_lo: int, lag_hi: int) -> int:
+    """Smallest fast FFT length whose circular wrap-around misses lags lo..hi."""
+    needed = max(n1 - lag_lo, n2 + lag_hi)
+    return sp_fft.next_fast_len(min(needed, n1 + n2 - 1), real=True)
+
+
+def _choose_correlation_method(n1: int, n2: int, lag_lo: int, lag_hi: int) -> str:
+    """'direct' when O(N·n_lags) beats the O(L·log L) FFT estimate."""
+    direct_cost = (lag_hi - lag_lo + 1) * min(n1, n2)
+    nfft = _correlation_fft_size(n1, n2, lag_lo, lag_hi)
+    fft_cost = CORRELATION_FFT_COST * nfft * np.log2(max(nfft, 2))
+    return "direct" if direct_cost <= fft_cost else "fft"
+
+
+def _correlate_direct(
+    a: NDArray[np.float64],
+    v: NDArray[np.float64],
+    lag_lo: int,
+    lag_hi: int,
+) -> NDArray[np.float64]:
+    """Cross-correlation for lags lo..hi, one dot product per lag."""
+    n1, n2 = len(a), len(v)
+    correlation = np.empty(lag_hi - lag_lo + 1)
+    for idx, k in enumerate(range(lag_lo, lag_hi + 1)):
+        if k >= 0:
+            length = min(n1 - k, n2)
+            correlation[idx] = np.dot(a[k:k + length], v[:length])
+        else:
+            length = min(n1, n2 + k)
+            correlation[idx] = np.dot(a[:length], v[-k:-k + length])
+    return correlation
+
+
+def _correlate_fft(
+    a: NDArray[np.float64],
+    v: NDArray[np.float64],
+    lag_lo: int,
+    lag_hi: int,
+) -> NDArray[np.float64]:
+    """Cross-correlation for lags lo..hi via real FFTs."""
+    nfft = _correlation_fft_size(len(a), len(v), lag_lo, lag_hi)
+    spectrum = sp_fft.rfft(a, nfft) * np.conj(sp_fft.rfft(v, nfft))
+    circular = sp_fft.irfft(spectrum, nfft)
+    # Lags negativos ficam no fim do buffer circular
+    return circular[np.arange(lag_lo, lag_hi + 1) % nfft]
+
+
 def compute_correlation(
     signal1: NDArray[np.float64],
     signal2: NDArray[np.float64] | None = None,
     mode: str = "auto",
     max_lag: int | None = None,
     normalize: bool = True,
+    method: str = "auto",
 ) -> CorrelationResult:
     """
     Compute correlation between signals.
     
+    Only the lags within ``max_lag`` are computed: directly (one dot product
+    per lag) for small lag windows, or with real FFTs sized for that window.
+    
     Args:
         signal1: First signal
         signal2: Second signal (if None, computes autocorrelation)
         mode: 'auto' for autocorrelation, 'cross' for cross-correlation
         max_lag: Maximum lag to compute (None = full range)
         normalize: Whether to normalize correlation to [-1, 1]
+        method: 'direct', 'fft' or 'auto' (cheaper of the two by size)
         
     Returns:
         CorrelationResult with correlation analysis
@@ -174,6 +248,12 @@ def compute_correlation(
     if len(signal1) < 2:
         raise ValidationError("Correlation requires at least 2 data points")
 
+    if method not in CORRELATION_METHODS:
+        raise ValidationError(f"Unknown correlation method: {method}")
+
+    if max_lag is not None and max_lag < 0:
+        raise ValidationError(f"max_lag must be non-negative, got {max_lag}")
+
     # Remove NaN values
     clean_signal1 = signal1[~np.isnan(signal1)]
 
@@ -182,8 +262,7 @@ def compute_correlation(
 
     # Auto-correlation if signal2 not provided
     if signal2 is None or mode == "auto":
-        correlation = np.correlate(clean_signal1, clean_signal1, mode='full')
-        lags = np.arange(-len(clean_signal1) + 1, len(clean_signal1))
+        clean_signal2 = clean_signal1
     else:
         # Cross-correlation
         clean_signal2 = signal2[~np.isnan(signal2)]
@@ -191,8 +270,15 @@ def compute_correlation(
         if len(clean_signal2) < 2:
             raise ValidationError("Not enough valid data points in signal2")
 
-        correlation = np.correlate(clean_signal1, clean_signal2, mode='full')
-        lags = np.arange(-len(clean_signal1) + 1, len(clean_signal1))
+    lag_lo, lag_hi = _lag_range(len(clean_signal1), len(clean_signal2), max_lag)
+    if method == "auto":
+        method = _choose_correlation_method(len(clean_signal1), len(clean_signal2), lag_lo, lag_hi)
+
+    if method == "fft":
+        correlation = _correlate_fft(clean_signal1, clean_signal2, lag_lo, lag_hi)
+    else:
+        correlation = _correlate_direct(clean_signal1, clean_signal2, lag_lo, lag_hi)
+    lags = np.arange(lag_lo, lag_hi + 1)
 
     # Normalize if requested
     if normalize:
@@ -200,12 +286,6 @@ def compute_correlation(
         if signal2 is not None and mode != "auto":
             correlation = correlation / np.std(clean_signal2)
 
-    # Limit to max_lag if specified
-    if max_lag is not None:
-        lag_mask = np.abs(lags) <= max_lag
-        correlation = correlation[lag_mask]
-        lags = lags[lag_mask]
-
     # Find peak correlation
     peak_idx = np.argmax(np.abs(correlation))
     peak_correlation = correlation[peak_idx]
@@ -219,6 +299,7 @@ def compute_correlation(
     logger.info(
         "correlation_computed",
         mode=mode,
+        method=method,
         peak_correlation=peak_correlation,
         peak_lag=peak_lag,
         n_points=len(signal1),
@@ -233,6 +314,85 @@ def compute_correlation(
     )
 
 
+def compute_lag_matrix(
+    series: Mapping[str, NDArray[np.float64]],
+    max_lag: int | None = None,
+    max_workers: int | None = None,
+) -> LagMatrixResult:
+    """
+    Estimate the lag between every pair of equally sampled series.
+    
+    Each series is standardized (NaN contributes zero) and transformed once;
+    every pair then costs a single inverse real FFT of length
+    ~N + max_lag. The peak of |correlation| within ``max_lag`` gives the
+    lag, with the same sign convention as ``compute_correlation``.
+    
+    Args:
+        series: Mapping name -> values, all of the same length
+        max_lag: Maximum lag searched (None = full range)
+        max_workers: FFT worker threads (default ``DEFAULT_MAX_WORKERS``)
+        
+    Returns:
+        LagMatrixResult with antisymmetric lags and symmetric peak correlation
+        
+    Raises:
+        ValidationError: If lengths differ or there are fewer than 2 points
+    """
+    names = list(series)
+    arrays = [np.asarray(series[name], dtype=np.float64) for name in names]
+    lengths = {len(values) for values in arrays}
+    if len(lengths) > 1:
+        raise ValidationError(f"All series must have the same length, got {sorted(lengths)}")
+
+    n = lengths.pop() if lengths else 0
+    if n < 2:
+        raise ValidationError("Lag estimation requires at least 2 data points")
+
+    if max_lag is not None and max_lag < 0:
+        raise ValidationError(f"max_lag must be non-negative, got {max_lag}")
+
+    lag_lo, lag_hi = _lag_range(n, n, max_lag)
+    nfft = _correlation_fft_size(n, n, lag_lo, lag_hi)
+    workers = max_workers or DEFAULT_MAX_WORKERS
+    lag_index = np.arange(lag_lo, lag_hi + 1) % nfft
+
+    # Um espectro por série, reutilizado em todos os pares
+    spectra = []
+    for values in arrays:
+        mean = np.nanmean(values)
+        std = np.nanstd(values)
+        scale = std * np.sqrt(np.count_nonzero(~np.isnan(values)))
+        z = np.nan_to_num((values - mean) / scale) if scale > 0 else np.zeros(n)
+        spectra.append(sp_fft.rfft(z, nfft, workers=workers))
+
+    n_series = len(names)
+    lags = np.zeros((n_series, n_series), dtype=np.int64)
+    peak_correlation = np.eye(n_series)
+    for i in range(n_series):
+        for j in range(i + 1, n_series):
+            circular = sp_fft.irfft(spectra[i] * np.conj(spectra[j]), nfft, workers=workers)
+            correlation = circular[lag_index]
+            peak = int(np.argmax(np.abs(correlation)))
+            lags[i, j] = lag_lo + peak
+            lags[j, i] = -lags[i, j]
+            peak_correlation[i, j] = peak_correlation[j, i] = correlation[peak]
+
+    logger.info(
+        "lag_matrix_computed",
+        n_series=n_series,
+        n_points=n,
+        max_lag=lag_hi,
+        nfft=nfft,
+    )
+
+    return LagMatrixResult(
+        names=names,
+        lags=lags,
+        peak_correlation=peak_correlation,
+        max_lag=lag_hi,
+    )
+
+
 def detect_outliers(
     values: NDArray[np.float64],
     method: str = "zscore",
@@ -14,6 +14,11 @@ try:
 except ImportError:
     from scipy.integrate import cumtrapz
 
+try:
+    from scipy.integrate import trapezoid
+except ImportError:
+    from scipy.integrate import trapz as trapezoid
+
 try:
     from scipy.integrate import simpson
 except ImportError:
@@ -26,7 +31,8 @@ except ImportError:
     NUMBA_AVAILABLE = False
 
 from platform_base.core.models import CalcResult, QualityMetrics, ResultMetadata
-from platform_base.processing.smoothing import SmoothingConfig, smooth
+from platform_base.processing.parallel import as_row_block, map_row_chunks
+from platform_base.processing.smoothing import SmoothingConfig, smooth, smooth_batch
 from platform_base.profiling.decorators import performance_critical, profile
 from platform_base.utils.errors import CalculusError
 from platform_base.utils.logging import get_logger
@@ -91,6 +97,32 @@ def _create_numba_calculus_functions():
 _finite_diff_numba, _trapz_numba, _area_between_numba = _create_numba_calculus_functions()
 
 
+def _create_numba_batch_functions():
+    """Create numba kernels for batched (n_series, n_points) blocks."""
+    if not NUMBA_AVAILABLE:
+        return None
+
+    # nogil: chunks de linhas rodam em paralelo nas threads de map_row_chunks
+    @numba.jit(nopython=True, cache=True, nogil=True)
+    def _finite_diff_rows_numba(block: np.ndarray, t: np.ndarray) -> np.ndarray:
+        """Finite difference derivative of each row (same stencil as _finite_diff_numba)."""
+        n_rows, n = block.shape
+        deriv = np.empty((n_rows, n))
+
+        for r in range(n_rows):
+            deriv[r, 0] = (block[r, 1] - block[r, 0]) / (t[1] - t[0])
+            for i in range(1, n - 1):
+                deriv[r, i] = (block[r, i + 1] - block[r, i - 1]) / (t[i + 1] - t[i - 1])
+            deriv[r, n - 1] = (block[r, n - 1] - block[r, n - 2]) / (t[n - 1] - t[n - 2])
+
+        return deriv
+
+    return _finite_diff_rows_numba
+
+
+_finite_diff_rows_numba = _create_numba_batch_functions()
+
+
 def _build_metadata(method: str, params: dict, duration_ms: float = 0.0) -> ResultMetadata:
     """Constrói metadata conforme especificação seção 5.6"""
     return ResultMetadata(
@@ -256,6 +288,178 @@ def integral(
     )
 
 
+def derivative_batch(
+    values: np.ndarray,
+    t: np.ndarray,
+    order: int,
+    method: Literal["finite_diff", "savitzky_golay", "spline_derivative"] = "finite_diff",
+    params: dict | None = None,
+    smoothing: SmoothingConfig | None = None,
+    max_workers: int | None = None,
+) -> CalcResult:
+    """
+    Calcula derivadas de várias séries que compartilham o eixo ``t``.
+
+    ``values`` é um bloco ``(n_series, n_points)``; o resultado tem a mesma
+    forma e cada linha é igual a ``derivative(values[i], t, ...)``. A validação
+    e o projeto do filtro são feitos uma única vez e as linhas são processadas
+    em paralelo.
+    """
+    start_time = time.perf_counter()
+
+    if params is None:
+        params = {}
+
+    if order < 1 or order > 3:
+        raise CalculusError("Order must be between 1 and 3", {"order": order})
+
+    t = np.asarray(t, dtype=float)
+    block = as_row_block(values, len(t), error=CalculusError)
+    n_series, n_points = block.shape
+
+    if n_points < 2:
+        raise CalculusError("Insufficient points for derivative calculation", {"n_points": n_points})
+
+    # Aplica suavização se especificado
+    if smoothing is not None:
+        block = smooth_batch(block, smoothing.method, smoothing.params, max_workers)
+        logger.debug("derivative_batch_smoothing_applied", method=smoothing.method)
+
+    if method == "finite_diff":
+        if (NUMBA_AVAILABLE and _finite_diff_rows_numba is not None and
+            n_points > 10000 and order == 1):
+            logger.debug("using_numba_finite_diff_rows", n_series=n_series, n_points=n_points)
+            deriv = map_row_chunks(lambda rows: _finite_diff_rows_numba(rows, t), block, max_workers)
+        else:
+            def _gradient_rows(rows: np.ndarray) -> np.ndarray:
+                for _ in range(order):
+                    rows = np.gradient(rows, t, axis=-1)
+                return rows
+
+            deriv = map_row_chunks(_gradient_rows, block, max_workers)
+    elif method == "savitzky_golay":
+        window_length = params.get("window_length", 7)
+        polyorder = params.get("polyorder", 3)
+        delta = params.get("delta", float(np.median(np.diff(t))))
+        deriv = map_row_chunks(
+            lambda rows: savgol_filter(
+                rows,
+                window_length=window_length,
+                polyorder=polyorder,
+                deriv=order,
+                delta=delta,
+                axis=-1,
+            ),
+            block,
+            max_workers,
+        )
+    elif method == "spline_derivative":
+        def _spline_rows(rows: np.ndarray) -> np.ndarray:
+            return np.vstack([
+                UnivariateSpline(t, row, s=params.get("s")).derivative(n=order)(t)
+                for row in rows
+            ])
+
+        deriv = map_row_chunks(_spline_rows, block, max_workers)
+    else:
+        raise CalculusError("Derivative method not available", {"method": method})
+
+    n_valid = np.sum(np.isfinite(deriv))
+    n_nan = deriv.size - n_valid
+
+    duration_ms = (time.perf_counter() - start_time) * 1000
+
+    quality_metrics = QualityMetrics(
+        n_valid=n_valid,
+        n_interpolated=0,
+        n_nan=n_nan,
+    )
+
+    logger.info("derivative_batch_computed",
+               order=order,
+               method=method,
+               n_series=n_series,
+               n_points=n_points,
+               duration_ms=duration_ms)
+
+    return CalcResult(
+        values=deriv,
+        metadata=_build_metadata(method, params, duration_ms),
+        quality_metrics=quality_metrics,
+        operation="derivative",
+        order=order,
+    )
+
+
+def integral_batch(
+    values: np.ndarray,
+    t: np.ndarray,
+    method: Literal["trapezoid", "simpson", "cumulative"] = "trapezoid",
+    params: dict | None = None,
+    max_workers: int | None = None,
+) -> CalcResult:
+    """
+    Calcula integrais de várias séries que compartilham o eixo ``t``.
+
+    Retorna uma área por linha (``(n_series,)``) para ``trapezoid``/``simpson``
+    e um bloco ``(n_series, n_points)`` para ``cumulative``.
+    """
+    start_time = time.perf_counter()
+
+    if params is None:
+        params = {}
+
+    t = np.asarray(t, dtype=float)
+    block = as_row_block(values, len(t), error=CalculusError)
+    n_series, n_points = block.shape
+
+    if n_points < 2:
+        raise CalculusError("Insufficient points for integration", {"n_points": n_points})
+
+    if method == "trapezoid":
+        result_values = map_row_chunks(lambda rows: trapezoid(rows, t, axis=-1), block, max_workers)
+
+    elif method == "simpson":
+        # Regra de Simpson (requer número ímpar de pontos)
+        n_used = n_points - 1 if n_points % 2 == 0 else n_points
+        result_values = map_row_chunks(
+            lambda rows: simpson(rows[:, :n_used], x=t[:n_used], axis=-1), block, max_workers,
+        )
+
+    elif method == "cumulative":
+        result_values = map_row_chunks(
+            lambda rows: cumtrapz(rows, t, axis=-1, initial=0.0), block, max_workers,
+        )
+
+    else:
+        raise CalculusError("Integral method not available", {"method": method})
+
+    result_values = np.asarray(result_values, dtype=float)
+    duration_ms = (time.perf_counter() - start_time) * 1000
+    n_valid = np.sum(np.isfinite(result_values))
+    n_nan = result_values.size - n_valid
+
+    quality_metrics = QualityMetrics(
+        n_valid=n_valid,
+        n_interpolated=0,
+        n_nan=n_nan,
+    )
+
+    logger.info("integral_batch_computed",
+               method=method,
+               n_series=n_series,
+               n_points=n_points,
+               duration_ms=duration_ms)
+
+    return CalcResult(
+        values=result_values,
+        metadata=_build_metadata(method, params, duration_ms),
+        quality_metrics=quality_metrics,
+        operation="integral",
+        order=None,
+    )
+
+
 def area_between(
     series_upper: np.ndarray,
     series_lower: np.ndarray,
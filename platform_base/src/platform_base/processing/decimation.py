@@ -0,0 +1,597 @@
+"""
+Decimation engine - compiled point selection shared by all plotting paths
+
+Every method returns *indices* into the input (int64, strictly increasing),
+so the same selection can be applied to the time axis and to any number of
+series. Kernels run over the whole array in a single compiled loop and write
+into preallocated output buffers:
+
+- ``lttb``: Largest Triangle Three Buckets, exactly ``n_out`` points
+- ``minmax``: min and max of ``n_out // 2`` equal-count buckets
+- ``m4``: first, min, max and last of ``n_out // 4`` buckets
+- ``peak_aware``: LTTB that swaps a bucket's point for its largest deviation
+  when that deviation exceeds a threshold (default 3 sigma)
+- ``uniform``: evenly spaced indices
+
+For large inputs LTTB and peak-aware first reduce the data to min/max
+candidates (MinMaxLTTB), so the expensive triangle pass only sees a few
+points per output point and the full array is scanned once.
+
+Kernels are compiled with ``numba`` (``nogil``, so several series can be
+decimated from worker threads). Without numba, equivalent numpy versions that
+loop over buckets (not samples) are used instead.
+"""
+
+from __future__ import annotations
+
+from typing import Literal
+
+import numpy as np
+
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from platform_base.utils.errors import DownsampleError
+from platform_base.utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+DecimationMethod = Literal["lttb", "minmax", "m4", "peak_aware", "uniform"]
+
+DECIMATION_METHODS: tuple[str, ...] = ("lttb", "minmax", "m4", "peak_aware", "uniform")
+
+# Inputs larger than ``LTTB_PRESELECT_RATIO * n_out`` are reduced to min/max
+# candidates before LTTB; each output point gets ``LTTB_PRESELECT_FACTOR``
+# candidates.
+LTTB_PRESELECT_RATIO = 32
+LTTB_PRESELECT_FACTOR = 4
+
+# Default peak threshold for ``peak_aware``, in standard deviations
+PEAK_SIGMA = 3.0
+
+
+def _jit(func):
+    """Compile ``func`` with numba when available, else keep it as Python."""
+    if not NUMBA_AVAILABLE:
+        return func
+    return numba.njit(cache=True, nogil=True)(func)
+
+
+# ---------------------------------------------------------------------------
+# Kernels
+# ---------------------------------------------------------------------------
+
+@_jit
+def _lttb_kernel(x, y, n_out, center, threshold, out):
+    """
+    LTTB over the full arrays; writes exactly ``n_out`` indices into ``out``.
+
+    When ``threshold`` is finite, a bucket whose largest ``|y - center|``
+    exceeds it contributes that point instead of the largest triangle.
+    """
+    n = x.shape[0]
+    every = (n - 2) / (n_out - 2)
+    check_peaks = threshold == threshold and threshold < np.inf
+    a = 0
+    out[0] = 0
+
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        if end > n - 1:
+            end = n - 1
+
+        next_start = end
+        next_end = int((i + 2) * every) + 1
+        if next_end > n:
+            next_end = n
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(next_start, next_end):
+            avg_x += x[j]
+            avg_y += y[j]
+        count = next_end - next_start
+        if count > 0:
+            avg_x /= count
+            avg_y /= count
+        else:
+            avg_x = x[n - 1]
+            avg_y = y[n - 1]
+
+        ax = x[a]
+        ay = y[a]
+        best_area = -1.0
+        best = start
+        peak_dev = -1.0
+        peak = start
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (y[j] - ay) - (ax - x[j]) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = j
+            if check_peaks:
+                dev = abs(y[j] - center)
+                if dev > peak_dev:
+                    peak_dev = dev
+                    peak = j
+
+        if check_peaks and peak_dev > threshold:
+            best = peak
+        out[i + 1] = best
+        a = best
+
+    out[n_out - 1] = n - 1
+
+
+@_jit
+def _bucket_extrema(y, start, end):
+    """
+    Indices of the min and max of ``y[start:end]``, ignoring NaN (-1 when
+    the bucket has no comparable value).
+
+    Four independent accumulators break the compare dependency chain, which
+    keeps the scan close to memory bandwidth.
+    """
+    lo0 = lo1 = lo2 = lo3 = -1
+    hi0 = hi1 = hi2 = hi3 = -1
+    a0 = a1 = a2 = a3 = np.inf
+    b0 = b1 = b2 = b3 = -np.inf
+    j = start
+    while j + 4 <= end:
+        v0 = y[j]
+        v1 = y[j + 1]
+        v2 = y[j + 2]
+        v3 = y[j + 3]
+        if v0 < a0:
+            a0 = v0
+            lo0 = j
+        if v1 < a1:
+            a1 = v1
+            lo1 = j + 1
+        if v2 < a2:
+            a2 = v2
+            lo2 = j + 2
+        if v3 < a3:
+            a3 = v3
+            lo3 = j + 3
+        if v0 > b0:
+            b0 = v0
+            hi0 = j
+        if v1 > b1:
+            b1 = v1
+            hi1 = j + 1
+        if v2 > b2:
+            b2 = v2
+            hi2 = j + 2
+        if v3 > b3:
+            b3 = v3
+            hi3 = j + 3
+        j += 4
+    while j < end:
+        v = y[j]
+        if v < a0:
+            a0 = v
+            lo0 = j
+        if v > b0:
+            b0 = v
+            hi0 = j
+        j += 1
+
+    # Merge lanes; ties resolve to the earliest index
+    lo = lo0
+    a = a0
+    for v, idx in ((a1, lo1), (a2, lo2), (a3, lo3)):
+        if idx >= 0 and (lo < 0 or v < a or (v == a and idx < lo)):
+            a = v
+            lo = idx
+    hi = hi0
+    b = b0
+    for v, idx in ((b1, hi1), (b2, hi2), (b3, hi3)):
+        if idx >= 0 and (hi < 0 or v > b or (v == b and idx < hi)):
+            b = v
+            hi = idx
+
+    # Constant +inf / -inf buckets only register on one side
+    if lo < 0:
+        lo = hi
+    if hi < 0:
+        hi = lo
+    return lo, hi
+
+
+@_jit
+def _minmax_kernel(y, n_buckets, out):
+    """Min and max (in index order) of each equal-count bucket; returns count."""
+    n = y.shape[0]
+    k = 0
+    for b in range(n_buckets):
+        start = b * n // n_buckets
+        end = (b + 1) * n // n_buckets
+        if start >= end:
+            continue
+        lo, hi = _bucket_extrema(y, start, end)
+        if lo < 0:
+            # Bucket only NaN: keep one point so the gap stays visible
+            out[k] = start
+            k += 1
+        elif lo == hi:
+            out[k] = lo
+            k += 1
+        else:
+            out[k] = min(lo, hi)
+            out[k + 1] = max(lo, hi)
+            k += 2
+    return k
+
+
+@_jit
+def _m4_kernel(y, n_buckets, out):
+    """First, min, max and last of each equal-count bucket; returns count."""
+    n = y.shape[0]
+    k = 0
+    for b in range(n_buckets):
+        start = b * n // n_buckets
+        end = (b + 1) * n // n_buckets
+        if start >= end:
+            continue
+        lo, hi = _bucket_extrema(y, start, end)
+        out[k] = start
+        k += 1
+        if lo >= 0:
+            first = min(lo, hi)
+            second = max(lo, hi)
+            if first != out[k - 1]:
+                out[k] = first
+                k += 1
+            if second != out[k - 1]:
+                out[k] = second
+                k += 1
+        if end - 1 != out[k - 1]:
+            out[k] = end - 1
+            k += 1
+    return k
+
+
+@_jit
+def _mean_std(y):
+    """Mean and standard deviation ignoring NaN (single pass)."""
+    total = 0.0
+    total_sq = 0.0
+    count = 0
+    for j in range(y.shape[0]):
+        v = y[j]
+        if v == v:
+            total += v
+            total_sq += v * v
+            count += 1
+    if count == 0:
+        return np.nan, np.nan
+    mean = total / count
+    var = total_sq / count - mean * mean
+    return mean, np.sqrt(max(var, 0.0))
+
+
+# ---------------------------------------------------------------------------
+# Numpy fallbacks (same contracts, one numpy call per bucket)
+# ---------------------------------------------------------------------------
+
+def _lttb_numpy(x, y, n_out, center, threshold, out):
+    """Numpy version of ``_lttb_kernel``."""
+    n = x.shape[0]
+    every = (n - 2) / (n_out - 2)
+    check_peaks = bool(np.isfinite(threshold))
+    a = 0
+    out[0] = 0
+
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = min(int((i + 1) * every) + 1, n - 1)
+        next_end = min(int((i + 2) * every) + 1, n)
+        if next_end > end:
+            avg_x = x[end:next_end].mean()
+            avg_y = y[end:next_end].mean()
+        else:
+            avg_x = x[n - 1]
+            avg_y = y[n - 1]
+
+        xs = x[start:end]
+        ys = y[start:end]
+        if end <= start:
+            out[i + 1] = start
+            a = start
+            continue
+        area = np.abs((x[a] - avg_x) * (ys - y[a]) - (x[a] - xs) * (avg_y - y[a]))
+        best = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        if check_peaks:
+            dev = np.nan_to_num(np.abs(ys - center), nan=-1.0)
+            peak = int(np.argmax(dev))
+            if dev[peak] > threshold:
+                best = start + peak
+        out[i + 1] = best
+        a = best
+
+    out[n_out - 1] = n - 1
+
+
+def _extrema_numpy(segment):
+    """Local indices of the min and max of ``segment`` ignoring NaN (-1 if none)."""
+    lo = int(np.argmin(segment))
+    hi = int(np.argmax(segment))
+    if segment[lo] == segment[lo] and segment[hi] == segment[hi]:
+        return lo, hi
+    valid = ~np.isnan(segment)
+    if not valid.any():
+        return -1, -1
+    return int(np.nanargmin(segment)), int(np.nanargmax(segment))
+
+
+def _minmax_numpy(y, n_buckets, out):
+    """Numpy version of ``_minmax_kernel``."""
+    n = y.shape[0]
+    k = 0
+    for b in range(n_buckets):
+        start = b * n // n_buckets
+        end = (b + 1) * n // n_buckets
+        if start >= end:
+            continue
+        lo, hi = _extrema_numpy(y[start:end])
+        if lo < 0:
+            out[k] = start
+            k += 1
+        elif lo == hi:
+            out[k] = start + lo
+            k += 1
+        else:
+            out[k] = start + min(lo, hi)
+            out[k + 1] = start + max(lo, hi)
+            k += 2
+    return k
+
+
+def _m4_numpy(y, n_buckets, out):
+    """Numpy version of ``_m4_kernel``."""
+    n = y.shape[0]
+    k = 0
+    for b in range(n_buckets):
+        start = b * n // n_buckets
+        end = (b + 1) * n // n_buckets
+        if start >= end:
+            continue
+        lo, hi = _extrema_numpy(y[start:end])
+        out[k] = start
+        k += 1
+        if lo >= 0:
+            for idx in (start + min(lo, hi), start + max(lo, hi)):
+                if idx != out[k - 1]:
+                    out[k] = idx
+                    k += 1
+        if end - 1 != out[k - 1]:
+            out[k] = end - 1
+            k += 1
+    return k
+
+
+def _mean_std_numpy(y):
+    """Numpy version of ``_mean_std``."""
+    valid = y[~np.isnan(y)]
+    if valid.size == 0:
+        return np.nan, np.nan
+    return float(valid.mean()), float(valid.std())
+
+
+if NUMBA_AVAILABLE:
+    _lttb_impl, _minmax_impl, _m4_impl, _mean_std_impl = (
+        _lttb_kernel, _minmax_kernel, _m4_kernel, _mean_std)
+else:
+    logger.info("numba_decimation_not_available",
+                message="Using numpy decimation kernels")
+    _lttb_impl, _minmax_impl, _m4_impl, _mean_std_impl = (
+        _lttb_numpy, _minmax_numpy, _m4_numpy, _mean_std_numpy)
+
+
+# ---------------------------------------------------------------------------
+# API
+# ---------------------------------------------------------------------------
+
+def _as_float(values: np.ndarray) -> np.ndarray:
+    values = np.asarray(values)
+    if values.dtype.kind in "mM":
+        values = values.view(np.int64)
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _as_values(values: np.ndarray) -> np.ndarray:
+    values = np.asarray(values)
+    if values.dtype.kind != "f":
+        return _as_float(values)
+    return np.ascontiguousarray(values)
+
+
+def _output_buffer(out: np.ndarray | None, size: int) -> np.ndarray:
+    if out is None:
+        return np.empty(size, dtype=np.int64)
+    if out.dtype != np.int64 or out.ndim != 1 or out.shape[0] < size:
+        raise DownsampleError(
+            "Output buffer must be a 1-D int64 array large enough for the selection",
+            {"required": size, "shape": out.shape, "dtype": str(out.dtype)},
+        )
+    return out
+
+
+def _uniform_indices(n: int, n_out: int, out: np.ndarray | None) -> np.ndarray:
+    buffer = _output_buffer(out, n_out)
+    buffer[:n_out] = np.linspace(0, n - 1, n_out).astype(np.int64)
+    return buffer[:n_out]
+
+
+def _lttb_indices(
+    x: np.ndarray | None,
+    y: np.ndarray,
+    n_out: int,
+    center: float,
+    threshold: float,
+    out: np.ndarray | None,
+) -> np.ndarray:
+    n = y.shape[0]
+    buffer = _output_buffer(out, n_out)
+
+    if n <= LTTB_PRESELECT_RATIO * n_out:
+        xs = _as_float(x) if x is not None else np.arange(n, dtype=np.float64)
+        _lttb_impl(xs, y, n_out, center, threshold, buffer)
+        return buffer[:n_out]
+
+    # MinMaxLTTB: LTTB only over per-bucket extrema (plus the endpoints)
+    n_buckets = n_out * LTTB_PRESELECT_FACTOR // 2
+    candidates = np.empty(2 * n_buckets + 2, dtype=np.int64)
+    k = _minmax_impl(y, n_buckets, candidates[1:])
+    candidates[0] = 0
+    if candidates[k] != n - 1:
+        k += 1
+        candidates[k] = n - 1
+    if candidates[1] == 0:
+        candidates = candidates[1:k + 1]
+    else:
+        candidates = candidates[:k + 1]
+
+    xc = _as_float(x[candidates]) if x is not None else candidates.astype(np.float64)
+    yc = np.ascontiguousarray(y[candidates])
+    if candidates.shape[0] <= n_out:
+        buffer[:candidates.shape[0]] = candidates
+        return buffer[:candidates.shape[0]]
+
+    _lttb_impl(xc, yc, n_out, center, threshold, buffer)
+    buffer[:n_out] = candidates[buffer[:n_out]]
+    return buffer[:n_out]
+
+
+def _series_indices(
+    x: np.ndarray | None,
+    y: np.ndarray,
+    n_out: int,
+    method: str,
+    peak_center: float | None,
+    peak_threshold: float | None,
+    out: np.ndarray | None,
+) -> np.ndarray:
+    n = y.shape[0]
+    if n <= n_out:
+        buffer = _output_buffer(out, n)
+        buffer[:n] = np.arange(n)
+        return buffer[:n]
+
+    if method == "uniform" or n_out < 2 or (n_out < 3 and method in ("lttb", "peak_aware")):
+        return _uniform_indices(n, n_out, out)
+
+    if method == "minmax" or (method == "m4" and n_out < 4):
+        buffer = _output_buffer(out, n_out)
+        k = _minmax_impl(y, n_out // 2, buffer)
+        return buffer[:k]
+
+    if method == "m4":
+        buffer = _output_buffer(out, n_out)
+        k = _m4_impl(y, n_out // 4, buffer)
+        return buffer[:k]
+
+    center, threshold = 0.0, np.inf
+    if method == "peak_aware":
+        if peak_center is None or peak_threshold is None:
+            mean, std = _mean_std_impl(y)
+            center = mean if peak_center is None else peak_center
+            threshold = PEAK_SIGMA * std if peak_threshold is None else peak_threshold
+        else:
+            center, threshold = peak_center, peak_threshold
+    return _lttb_indices(x, y, n_out, float(center), float(threshold), out)
+
+
+def decimate_indices(
+    x: np.ndarray | None,
+    y: np.ndarray,
+    n_out: int,
+    method: DecimationMethod = "lttb",
+    *,
+    peak_center: float | None = None,
+    peak_threshold: float | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Select at most ``n_out`` points of ``y`` and return their indices.
+
+    Args:
+        x: Shared x axis (time), or None to use sample positions. Only LTTB
+            and peak-aware read it.
+        y: Values, 1-D ``(n,)`` or 2-D ``(n_series, n)``. For 2-D input each
+            series gets ``n_out // n_series`` points and the union of the
+            selections is returned, so one index set serves every series.
+        n_out: Target number of points
+        method: One of ``DECIMATION_METHODS``
+        peak_center: Reference level for ``peak_aware`` (default: mean)
+        peak_threshold: Deviation that marks a peak (default: 3 sigma)
+        out: Preallocated int64 buffer with room for ``n_out`` indices
+            (1-D input only); the result is a view of it
+
+    Returns:
+        Strictly increasing int64 indices. Inputs with ``n <= n_out`` return
+        every index.
+
+    Raises:
+        DownsampleError: Unknown method, bad target or mismatched shapes
+    """
+    if method not in DECIMATION_METHODS:
+        raise DownsampleError(
+            f"Decimation method '{method}' not supported",
+            {"method": method, "supported": list(DECIMATION_METHODS)},
+        )
+    if n_out < 1:
+        raise DownsampleError("Target points must be positive", {"n_out": n_out})
+
+    y = np.asarray(y)
+    if y.ndim not in (1, 2):
+        raise DownsampleError("Values must be 1-D or 2-D", {"shape": y.shape})
+    n = y.shape[-1]
+    if x is not None and len(x) != n:
+        raise DownsampleError(
+            "Time and value arrays must have same length",
+            {"time_len": len(x), "values_len": n},
+        )
+
+    if y.ndim == 1:
+        return _series_indices(x, _as_values(y), n_out, method,
+                               peak_center, peak_threshold, out)
+
+    n_series = y.shape[0]
+    if n_series == 0 or n <= n_out:
+        return np.arange(n, dtype=np.int64)
+    per_series = max(n_out // n_series, 4 if method == "m4" else 3)
+    selected = np.empty(n_series * per_series, dtype=np.int64)
+    k = 0
+    for row in y:
+        idx = _series_indices(x, _as_values(row), per_series, method,
+                              peak_center, peak_threshold, selected[k:])
+        k += idx.shape[0]
+    return np.unique(selected[:k])
+
+
+def decimate(
+    x: np.ndarray,
+    y: np.ndarray,
+    n_out: int,
+    method: DecimationMethod = "lttb",
+    **kwargs,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Decimate ``x`` and ``y`` with ``decimate_indices``.
+
+    ``y`` may be 2-D ``(n_series, n)``; the returned values keep that layout
+    with the shared selection applied to every row.
+
+    Returns:
+        Tuple ``(x_out, y_out)``
+    """
+    indices = decimate_indices(x, y, n_out, method, **kwargs)
+    y = np.asarray(y)
+    return np.asarray(x)[indices], y[..., indices]
@@ -5,6 +5,9 @@ Implements efficient downsampling methods to handle large datasets:
 - LTTB (Largest Triangle Three Buckets) - preserves visual characteristics
 - MinMax - preserves extrema for each interval
 - Adaptive - variable density based on data variance
+
+LTTB, MinMax and uniform selection run on the shared decimation engine
+(``processing.decimation``).
 """
 
 from __future__ import annotations
@@ -16,13 +19,8 @@ from typing import Literal
 import numpy as np
 
 
-try:
-    import numba
-    NUMBA_AVAILABLE = True
-except ImportError:
-    NUMBA_AVAILABLE = False
-
 from platform_base.core.models import DownsampleResult, QualityMetrics, ResultMetadata
+from platform_base.processing.decimation import decimate_indices
 from platform_base.profiling.decorators import performance_critical, profile
 from platform_base.utils.errors import DownsampleError
 from platform_base.utils.logging import get_logger
@@ -50,64 +48,6 @@ def _build_metadata(method: str, params: dict, duration_ms: float = 0.0) -> Resu
     )
 
 
-# Numba-optimized functions for critical performance
-def _create_numba_functions():
-    """Create numba-optimized downsampling functions if available."""
-    if not NUMBA_AVAILABLE:
-        logger.info("numba_downsampling_not_available",
-                   message="Using standard numpy implementations")
-        return None, None, None
-
-    @numba.jit(nopython=True, cache=True)
-    def _triangle_area_numba(p1_x, p1_y, p2_x, p2_y, p3_x, p3_y):
-        """Calculate triangle area using numba"""
-        return abs((p1_x * (p2_y - p3_y) + p2_x * (p3_y - p1_y) + p3_x * (p1_y - p2_y)) / 2.0)
-
-    @numba.jit(nopython=True, cache=True)
-    def _lttb_bucket_numba(t_bucket, v_bucket, prev_point, next_avg_point):
-        """LTTB bucket processing with numba"""
-        max_area = -1.0
-        max_idx = 0
-
-        for i in range(len(t_bucket)):
-            area = _triangle_area_numba(
-                prev_point[0], prev_point[1],
-                t_bucket[i], v_bucket[i],
-                next_avg_point[0], next_avg_point[1],
-            )
-            if area > max_area:
-                max_area = area
-                max_idx = i
-
-        return max_idx, max_area
-
-    @numba.jit(nopython=True, cache=True)
-    def _minmax_bucket_numba(v_bucket):
-        """MinMax bucket processing with numba"""
-        min_val = v_bucket[0]
-        max_val = v_bucket[0]
-        min_idx = 0
-        max_idx = 0
-
-        for i in range(1, len(v_bucket)):
-            if v_bucket[i] < min_val:
-                min_val = v_bucket[i]
-                min_idx = i
-            elif v_bucket[i] > max_val:
-                max_val = v_bucket[i]
-                max_idx = i
-
-        return min_idx, max_idx
-
-    logger.info("numba_downsampling_compiled",
-               message="Numba downsampling functions compiled successfully")
-    return _triangle_area_numba, _lttb_bucket_numba, _minmax_bucket_numba
-
-
-# Initialize numba functions
-_triangle_area_numba, _lttb_bucket_numba, _minmax_bucket_numba = _create_numba_functions()
-
-
 def _lttb_downsample(
     t: np.ndarray,
     values: np.ndarray,
@@ -127,99 +67,11 @@ def _lttb_downsample(
     Returns:
         Tuple of (downsampled_t, downsampled_values, selected_indices)
     """
-    n_data = len(t)
-
-    if n_points >= n_data:
-        return t.copy(), values.copy(), np.arange(n_data)
-
-    if n_points < 3:
-        # For very few points, just take first, middle, last
-        indices = [0, n_data // 2, n_data - 1]
-        indices = indices[:n_points]
-        return t[indices], values[indices], np.array(indices)
-
-    # Calculate bucket size
-    bucket_size = (n_data - 2) / (n_points - 2)
-
-    # Always include first and last points
-    selected_indices = [0]
-    selected_t = [t[0]]
-    selected_values = [values[0]]
-
-    # Process intermediate buckets
-    prev_point = (t[0], values[0])
-
-    for i in range(n_points - 2):
-        # Current bucket range
-        bucket_start = int(i * bucket_size) + 1
-        bucket_end = int((i + 1) * bucket_size) + 1
-
-        bucket_end = min(n_data - 1, bucket_end)
-
-        if bucket_start >= bucket_end:
-            continue
-
-        # Calculate average point for next bucket (for triangle area calculation)
-        if i < n_points - 3:  # Not the last bucket
-            next_bucket_start = bucket_end
-            next_bucket_end = int((i + 2) * bucket_size) + 1
-            next_bucket_end = min(n_data, next_bucket_end)
-
-            if next_bucket_start < next_bucket_end:
-                next_avg_t = np.mean(t[next_bucket_start:next_bucket_end])
-                next_avg_val = np.mean(values[next_bucket_start:next_bucket_end])
-            else:
-                next_avg_t = t[-1]
-                next_avg_val = values[-1]
-        else:
-            # For last bucket, use last point
-            next_avg_t = t[-1]
-            next_avg_val = values[-1]
-
-        next_avg_point = (next_avg_t, next_avg_val)
-
-        # Find point in bucket that creates largest triangle
-        t_bucket = t[bucket_start:bucket_end]
-        v_bucket = values[bucket_start:bucket_end]
-
-        if len(t_bucket) == 0:
-            continue
-
-        # Use numba optimization if available
-        if NUMBA_AVAILABLE and _lttb_bucket_numba is not None and len(t_bucket) > 10:
-            max_idx, _ = _lttb_bucket_numba(t_bucket, v_bucket, prev_point, next_avg_point)
-        else:
-            # Standard implementation
-            max_area = -1
-            max_idx = 0
-
-            for j, (t_val, v_val) in enumerate(zip(t_bucket, v_bucket, strict=False)):
-                # Calculate triangle area
-                area = abs((prev_point[0] * (v_val - next_avg_point[1]) +
-                           t_val * (next_avg_point[1] - prev_point[1]) +
-                           next_avg_point[0] * (prev_point[1] - v_val)) / 2.0)
-
-                if area > max_area:
-                    max_area = area
-                    max_idx = j
-
-        # Select point
-        actual_idx = bucket_start + max_idx
-        selected_indices.append(actual_idx)
-        selected_t.append(t[actual_idx])
-        selected_values.append(values[actual_idx])
-
-        prev_point = (t[actual_idx], values[actual_idx])
-
-    # Always include last point
-    if selected_indices[-1] != n_data - 1:
-        selected_indices.append(n_data - 1)
-        selected_t.append(t[-1])
-        selected_values.append(values[-1])
+    if n_points >= len(t):
+        return t.copy(), values.copy(), np.arange(len(t))
 
-    return (np.array(selected_t),
-            np.array(selected_values),
-            np.array(selected_indices))
+    indices = decimate_indices(t, values, n_points, "lttb")
+    return t[indices], values[indices], indices
 
 
 def _minmax_downsample(
@@ -241,68 +93,51 @@ def _minmax_downsample(
     Returns:
         Tuple of (downsampled_t, downsampled_values, selected_indices)
     """
-    n_data = len(t)
-
-    if n_points >= n_data:
-        return t.copy(), values.copy(), np.arange(n_data)
+    if n_points >= len(t):
+        return t.copy(), values.copy(), np.arange(len(t))
 
-    # Ensure even number of points (min/max pairs)
-    n_buckets = max(1, n_points // 2)
-    bucket_size = n_data / n_buckets
-
-    selected_indices = []
-    selected_t = []
-    selected_values = []
+    indices = decimate_indices(t, values, max(2, n_points), "minmax")
+    return t[indices], values[indices], indices
 
-    for i in range(n_buckets):
-        bucket_start = int(i * bucket_size)
-        bucket_end = int((i + 1) * bucket_size)
 
-        if i == n_buckets - 1:  # Last bucket
-            bucket_end = n_data
+def _rolling_variance(values: np.ndarray, half_window: int) -> np.ndarray:
+    """
+    Population variance of ``values[i - half_window : i + half_window + 1]``
+    (clipped at the edges) for every ``i``, from running sums of the first
+    and second moments. Values are shifted by the first sample so the
+    moments stay small and constant stretches give exactly zero.
+    """
+    n_data = len(values)
+    shifted = np.asarray(values, dtype=np.float64) - values[0]
+    sums = np.zeros(n_data + 1)
+    sums_sq = np.zeros(n_data + 1)
+    np.cumsum(shifted, out=sums[1:])
+    np.cumsum(shifted * shifted, out=sums_sq[1:])
 
-        if bucket_start >= bucket_end:
-            continue
+    positions = np.arange(n_data)
+    starts = np.maximum(positions - half_window, 0)
+    ends = np.minimum(positions + half_window + 1, n_data)
+    counts = ends - starts
 
-        # Get bucket data
-        t[bucket_start:bucket_end]
-        v_bucket = values[bucket_start:bucket_end]
+    mean = (sums[ends] - sums[starts]) / counts
+    variances = (sums_sq[ends] - sums_sq[starts]) / counts - mean * mean
+    np.maximum(variances, 0.0, out=variances)
+    variances[counts < 2] = 0.0
+    return variances
 
-        if len(v_bucket) == 0:
-            continue
 
-        # Find min and max indices
-        if NUMBA_AVAILABLE and _minmax_bucket_numba is not None and len(v_bucket) > 10:
-            min_idx_local, max_idx_local = _minmax_bucket_numba(v_bucket)
-        else:
-            min_idx_local = np.argmin(v_bucket)
-            max_idx_local = np.argmax(v_bucket)
-
-        # Convert to global indices
-        min_idx = bucket_start + min_idx_local
-        max_idx = bucket_start + max_idx_local
-
-        # Add points in time order
-        indices_to_add = sorted([min_idx, max_idx])
-        for idx in indices_to_add:
-            if idx not in selected_indices:  # Avoid duplicates
-                selected_indices.append(idx)
-                selected_t.append(t[idx])
-                selected_values.append(values[idx])
-
-    # Sort by time order
-    if selected_indices:
-        sort_order = np.argsort(selected_t)
-        selected_indices = np.array(selected_indices)[sort_order]
-        selected_t = np.array(selected_t)[sort_order]
-        selected_values = np.array(selected_values)[sort_order]
-    else:
-        # Fallback: select first and last points
-        selected_indices = np.array([0, n_data - 1])
-        selected_t = np.array([t[0], t[-1]])
-        selected_values = np.array([values[0], values[-1]])
-
-    return selected_t, selected_values, selected_indices
+def _closest_sorted(sorted_values: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    For each target, the first index of the closest entry of a non-decreasing
+    array (same result as ``argmin(abs(sorted_values - target))``).
+    """
+    n = len(sorted_values)
+    right = np.clip(np.searchsorted(sorted_values, targets, side="left"), 1, n - 1)
+    left = right - 1
+    # Ties go to the lower value, as argmin returns the first minimum
+    take_left = (targets - sorted_values[left]) <= (sorted_values[right] - targets)
+    closest_values = np.where(take_left, sorted_values[left], sorted_values[right])
+    return np.searchsorted(sorted_values, closest_values, side="left")
 
 
 def _adaptive_downsample(
@@ -331,15 +166,9 @@ def _adaptive_downsample(
     if n_points >= n_data:
         return t.copy(), values.copy(), np.arange(n_data)
 
-    # Calculate local variance using sliding window
+    # Local variance over a centered sliding window
     window_size = max(3, n_data // 100)  # Adaptive window size
-    variances = np.zeros(n_data)
-
-    for i in range(n_data):
-        start_idx = max(0, i - window_size // 2)
-        end_idx = min(n_data, i + window_size // 2 + 1)
-        window_values = values[start_idx:end_idx]
-        variances[i] = np.var(window_values) if len(window_values) > 1 else 0.0
+    variances = _rolling_variance(values, window_size // 2)
 
     # Normalize variances
     max_variance = np.max(variances)
@@ -353,31 +182,12 @@ def _adaptive_downsample(
     importance = variances / np.sum(variances)
     cumulative_importance = np.cumsum(importance)
 
-    # Select points based on importance distribution
-    selected_indices = []
-    target_spacing = 1.0 / n_points
-
-    # Always include first point
-    selected_indices.append(0)
-
-    # Select intermediate points
-    for i in range(1, n_points - 1):
-        target_cumulative = i * target_spacing
-
-        # Find closest point in cumulative importance
-        closest_idx = np.argmin(np.abs(cumulative_importance - target_cumulative))
+    # Index whose cumulative importance is closest to each target i / n_points
+    targets = np.arange(1, n_points - 1) / n_points
+    closest = _closest_sorted(cumulative_importance, targets)
 
-        # Avoid duplicates
-        if closest_idx not in selected_indices:
-            selected_indices.append(closest_idx)
-
-    # Always include last point
-    if (n_data - 1) not in selected_indices:
-        selected_indices.append(n_data - 1)
-
-    # Sort indices
-    selected_indices = sorted(set(selected_indices))
-    selected_indices = np.array(selected_indices)
+    # First and last points are always kept; duplicates collapse
+    selected_indices = np.unique(np.concatenate(([0], closest, [n_data - 1])))
 
     return t[selected_indices], values[selected_indices], selected_indices
 
@@ -400,14 +210,10 @@ def _uniform_downsample(
     Returns:
         Tuple of (downsampled_t, downsampled_values, selected_indices)
     """
-    n_data = len(t)
-
-    if n_points >= n_data:
-        return t.copy(), values.copy(), np.arange(n_data)
-
-    # Generate uniform indices
-    indices = np.linspace(0, n_data - 1, n_points, dtype=int)
+    if n_points >= len(t):
+        return t.copy(), values.copy(), np.arange(len(t))
 
+    indices = decimate_indices(t, values, n_points, "uniform")
     return t[indices], values[indices], indices
 
 
@@ -0,0 +1,644 @@
+"""
+Dynamic Time Warping engine
+
+Compiled (numba, optional) DTW core shared by the DTW plugins:
+
+- Global constraints as per-row column bounds ``lo[i] <= j <= hi[i]``:
+  full, Sakoe-Chiba band (around the scaled diagonal) or Itakura
+  parallelogram. Only cells inside the band are computed.
+- ``dtw_distance`` keeps two band-wide rows (O(window) memory) and abandons
+  early once every cell of a row exceeds ``max_distance``.
+- ``dtw_path`` stores the accumulated cost of the band cells only (ragged
+  rows) and backtracks the warping path on it.
+- ``dtw_path_multiscale`` (FastDTW) aligns coarsened copies of the series
+  and refines the projected path within a radius, so time and memory grow
+  linearly with the series length.
+- ``lb_kim``/``lb_keogh`` lower bounds prune pairs in
+  ``dtw_distance_matrix``, whose pairs run on a thread pool (the kernels
+  release the GIL).
+
+Without numba the same kernels run as plain Python (slow, for small inputs).
+"""
+
+from __future__ import annotations
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from platform_base.processing.parallel import DEFAULT_MAX_WORKERS
+from platform_base.utils.errors import ValidationError
+from platform_base.utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# Point cost per metric (kernel ids)
+DTW_METRICS = {
+    "euclidean": 0,
+    "sqeuclidean": 1,
+    "manhattan": 2,
+    "cosine": 3,
+}
+
+DTW_BANDS = {"sakoe_chiba", "itakura"}
+
+DTW_STEP_PATTERNS = {"symmetric", "asymmetric"}
+
+# Exact searches above this many cells switch to multiscale in "auto" modes
+DTW_EXACT_MAX_CELLS = 25_000_000
+
+# Metrics whose 1-D point cost is a monotone function of |x - y| (LB_Keogh)
+_KEOGH_METRICS = {"euclidean", "sqeuclidean", "manhattan"}
+
+
+def _jit(func):
+    """Compile a kernel with numba (nogil) when available."""
+    if NUMBA_AVAILABLE:
+        return numba.jit(nopython=True, cache=True, nogil=True)(func)
+    return func
+
+
+# ============================================================================
+# Kernels
+# ============================================================================
+
+@_jit
+def _point_cost(x: np.ndarray, y: np.ndarray, i: int, j: int, metric: int) -> float:
+    """Cost between samples x[i] and y[j] (rows of (n, d) arrays)."""
+    d = x.shape[1]
+    if metric == 3:
+        dot = 0.0
+        nx = 0.0
+        ny = 0.0
+        for k in range(d):
+            dot += x[i, k] * y[j, k]
+            nx += x[i, k] * x[i, k]
+            ny += y[j, k] * y[j, k]
+        if nx == 0.0 or ny == 0.0:
+            return 1.0
+        return 1.0 - dot / (math.sqrt(nx) * math.sqrt(ny))
+
+    acc = 0.0
+    for k in range(d):
+        diff = x[i, k] - y[j, k]
+        if metric == 2:
+            acc += abs(diff)
+        else:
+            acc += diff * diff
+    if metric == 0:
+        return math.sqrt(acc)
+    return acc
+
+
+@_jit
+def _fill_row(
+    x: np.ndarray,
+    y: np.ndarray,
+    i: int,
+    lo: int,
+    hi: int,
+    prev: np.ndarray,
+    prev_lo: int,
+    prev_hi: int,
+    curr: np.ndarray,
+    metric: int,
+    asymmetric: bool,
+) -> float:
+    """Accumulated cost of row i (columns lo..hi) into ``curr``; returns the row minimum."""
+    row_min = np.inf
+    for j in range(lo, hi + 1):
+        cost = _point_cost(x, y, i, j, metric)
+        if i == 0 and j == 0:
+            value = cost
+        else:
+            best = np.inf
+            if i > 0 and prev_lo <= j <= prev_hi:
+                up = prev[j - prev_lo]
+                if asymmetric:
+                    up += cost
+                best = up
+            if i > 0 and prev_lo <= j - 1 <= prev_hi:
+                diag = prev[j - 1 - prev_lo]
+                if diag < best:
+                    best = diag
+            if j > lo:
+                left = curr[j - 1 - lo]
+                if left < best:
+                    best = left
+            value = cost + best
+        curr[j - lo] = value
+        if value < row_min:
+            row_min = value
+    return row_min
+
+
+@_jit
+def _dtw_distance_kernel(
+    x: np.ndarray,
+    y: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    metric: int,
+    asymmetric: bool,
+    abandon: float,
+) -> float:
+    """DTW distance with two rolling band rows; inf once a row exceeds ``abandon``."""
+    n = x.shape[0]
+    m = y.shape[0]
+    width = 0
+    for i in range(n):
+        if hi[i] - lo[i] + 1 > width:
+            width = hi[i] - lo[i] + 1
+    prev = np.full(width, np.inf)
+    curr = np.full(width, np.inf)
+    prev_lo = 0
+    prev_hi = -1
+
+    for i in range(n):
+        row_min = _fill_row(x, y, i, lo[i], hi[i], prev, prev_lo, prev_hi, curr,
+                            metric, asymmetric)
+        # Custos não negativos: o mínimo da linha limita a distância final
+        if row_min > abandon:
+            return np.inf
+        prev, curr = curr, prev
+        prev_lo = lo[i]
+        prev_hi = hi[i]
+
+    if prev_hi != m - 1:
+        return np.inf
+    return prev[m - 1 - prev_lo]
+
+
+@_jit
+def _dtw_ragged_kernel(
+    x: np.ndarray,
+    y: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    offsets: np.ndarray,
+    metric: int,
+    asymmetric: bool,
+) -> np.ndarray:
+    """Accumulated cost of the band cells only, row i at cells[offsets[i]:offsets[i + 1]]."""
+    n = x.shape[0]
+    cells = np.full(offsets[n], np.inf)
+    empty = np.full(1, np.inf)
+
+    for i in range(n):
+        row = cells[offsets[i]:offsets[i + 1]]
+        if i == 0:
+            _fill_row(x, y, 0, lo[0], hi[0], empty, 0, -1, row, metric, asymmetric)
+        else:
+            prev = cells[offsets[i - 1]:offsets[i]]
+            _fill_row(x, y, i, lo[i], hi[i], prev, lo[i - 1], hi[i - 1], row,
+                      metric, asymmetric)
+    return cells
+
+
+@_jit
+def _ragged_value(cells: np.ndarray, offsets: np.ndarray, lo: np.ndarray, hi: np.ndarray,
+                  i: int, j: int) -> float:
+    if j < lo[i] or j > hi[i]:
+        return np.inf
+    return cells[offsets[i] + j - lo[i]]
+
+
+@_jit
+def _ragged_path_kernel(cells: np.ndarray, offsets: np.ndarray, lo: np.ndarray, hi: np.ndarray,
+                        m: int) -> np.ndarray:
+    """Backtrack the optimal path from (n-1, m-1); ties prefer diagonal, then up."""
+    n = lo.shape[0]
+    path = np.empty((n + m - 1, 2), dtype=np.int64)
+    i = n - 1
+    j = m - 1
+    k = 0
+    path[0, 0] = i
+    path[0, 1] = j
+    while i > 0 or j > 0:
+        if i == 0:
+            j -= 1
+        elif j == 0:
+            i -= 1
+        else:
+            diag = _ragged_value(cells, offsets, lo, hi, i - 1, j - 1)
+            up = _ragged_value(cells, offsets, lo, hi, i - 1, j)
+            left = _ragged_value(cells, offsets, lo, hi, i, j - 1)
+            if diag <= up and diag <= left:
+                i -= 1
+                j -= 1
+            elif up <= left:
+                i -= 1
+            else:
+                j -= 1
+        k += 1
+        path[k, 0] = i
+        path[k, 1] = j
+    return path[:k + 1][::-1].copy()
+
+
+@_jit
+def _envelope_kernel(y: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Min/max of y[lo[i]:hi[i] + 1] per row (monotone deques; lo, hi non-decreasing)."""
+    n = lo.shape[0]
+    upper = np.empty(n)
+    lower = np.empty(n)
+    dq_max = np.empty(y.shape[0], dtype=np.int64)
+    dq_min = np.empty(y.shape[0], dtype=np.int64)
+    h_max = t_max = h_min = t_min = 0
+    nxt = 0
+    for i in range(n):
+        while nxt <= hi[i]:
+            while t_max > h_max and y[dq_max[t_max - 1]] <= y[nxt]:
+                t_max -= 1
+            dq_max[t_max] = nxt
+            t_max += 1
+            while t_min > h_min and y[dq_min[t_min - 1]] >= y[nxt]:
+                t_min -= 1
+            dq_min[t_min] = nxt
+            t_min += 1
+            nxt += 1
+        while dq_max[h_max] < lo[i]:
+            h_max += 1
+        while dq_min[h_min] < lo[i]:
+            h_min += 1
+        upper[i] = y[dq_max[h_max]]
+        lower[i] = y[dq_min[h_min]]
+    return lower, upper
+
+
+# ============================================================================
+# Public API
+# ============================================================================
+
+@dataclass
+class DTWAlignment:
+    """Warping path (k x 2 index pairs), distance and optional dense cost matrix"""
+    distance: float
+    path: np.ndarray
+    cost_matrix: np.ndarray | None = None
+
+
+def _as_samples(values: np.ndarray, name: str) -> np.ndarray:
+    samples = np.asarray(values, dtype=np.float64)
+    if samples.ndim == 1:
+        samples = samples.reshape(-1, 1)
+    if samples.ndim != 2 or samples.shape[0] == 0:
+        raise ValidationError("DTW input must be a non-empty 1-D or (n, d) array",
+                              {"name": name, "shape": samples.shape})
+    return np.ascontiguousarray(samples)
+
+
+def _check_options(metric: str, step_pattern: str) -> tuple[int, bool]:
+    if metric not in DTW_METRICS:
+        raise ValidationError("Unknown DTW distance metric",
+                              {"metric": metric, "supported": sorted(DTW_METRICS)})
+    if step_pattern not in DTW_STEP_PATTERNS:
+        raise ValidationError("Unknown DTW step pattern",
+                              {"step_pattern": step_pattern, "supported": sorted(DTW_STEP_PATTERNS)})
+    return DTW_METRICS[metric], step_pattern == "asymmetric"
+
+
+def dtw_band(
+    n: int,
+    m: int,
+    window: int | None = None,
+    band: Literal["sakoe_chiba", "itakura"] = "sakoe_chiba",
+    max_slope: float = 2.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Column bounds ``lo[i] <= j <= hi[i]`` of the DTW search region.
+
+    Args:
+        n: Length of the first series (rows)
+        m: Length of the second series (columns)
+        window: Sakoe-Chiba half-width around the diagonal scaled to (n, m);
+            None = no constraint
+        band: "sakoe_chiba" or "itakura" (parallelogram, ignores ``window``)
+        max_slope: Itakura maximum local slope (> 1)
+
+    Returns:
+        (lo, hi) int64 arrays of length n. Bounds are non-decreasing and
+        connected, so (n-1, m-1) is always reachable from (0, 0).
+    """
+    if band not in DTW_BANDS:
+        raise ValidationError("Unknown DTW band", {"band": band, "supported": sorted(DTW_BANDS)})
+    if window is not None and window < 0:
+        raise ValidationError("DTW window must be >= 0", {"window": window})
+
+    rows = np.arange(n, dtype=np.float64)
+    u = rows / (n - 1) if n > 1 else np.zeros(n)
+    if band == "itakura":
+        if max_slope <= 1.0:
+            raise ValidationError("Itakura max_slope must be > 1", {"max_slope": max_slope})
+        v_lo = np.maximum(u / max_slope, 1.0 - max_slope * (1.0 - u))
+        v_hi = np.minimum(max_slope * u, 1.0 - (1.0 - u) / max_slope)
+        lo = np.ceil(v_lo * (m - 1) - 1e-9)
+        hi = np.floor(v_hi * (m - 1) + 1e-9)
+    elif window is None:
+        lo = np.zeros(n)
+        hi = np.full(n, m - 1.0)
+    else:
+        # Meia-largura mínima para que linhas vizinhas se conectem
+        slope = (m - 1) / (n - 1) if n > 1 else 0.0
+        half = max(float(window), math.ceil(slope))
+        center = u * (m - 1)
+        lo = np.ceil(center - half)
+        hi = np.floor(center + half)
+
+    return _connect_band(lo, hi, m)
+
+
+def _connect_band(lo: np.ndarray, hi: np.ndarray, m: int) -> tuple[np.ndarray, np.ndarray]:
+    """Clip bounds to [0, m-1], make them non-decreasing and connect (0, 0) to (n-1, m-1)."""
+    lo = np.clip(lo, 0, m - 1).astype(np.int64)
+    hi = np.clip(hi, 0, m - 1).astype(np.int64)
+    lo[0] = 0
+    hi[-1] = m - 1
+    lo = np.maximum.accumulate(lo)
+    hi = np.maximum.accumulate(np.maximum(hi, lo))
+    hi[:-1] = np.maximum(hi[:-1], lo[1:] - 1)
+    return lo, hi
+
+
+def dtw_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: int | None = None,
+    band: Literal["sakoe_chiba", "itakura"] = "sakoe_chiba",
+    metric: str = "euclidean",
+    step_pattern: str = "symmetric",
+    max_distance: float | None = None,
+    max_slope: float = 2.0,
+) -> float:
+    """
+    DTW distance with O(band width) memory.
+
+    Args:
+        x, y: Series (1-D or (n, d) multivariate)
+        window: Sakoe-Chiba half-width (None = unconstrained)
+        band: Global constraint ("sakoe_chiba" or "itakura")
+        metric: Point cost ("euclidean", "sqeuclidean", "manhattan", "cosine")
+        step_pattern: "symmetric" or "asymmetric" (vertical steps pay twice)
+        max_distance: Early-abandon threshold; inf is returned above it
+        max_slope: Itakura maximum slope
+
+    Returns:
+        Accumulated cost of the optimal path (inf if abandoned)
+    """
+    xs = _as_samples(x, "x")
+    ys = _as_samples(y, "y")
+    metric_id, asymmetric = _check_options(metric, step_pattern)
+    lo, hi = dtw_band(len(xs), len(ys), window, band, max_slope)
+    abandon = np.inf if max_distance is None else float(max_distance)
+    return float(_dtw_distance_kernel(xs, ys, lo, hi, metric_id, asymmetric, abandon))
+
+
+def dtw_path(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: int | None = None,
+    band: Literal["sakoe_chiba", "itakura"] = "sakoe_chiba",
+    metric: str = "euclidean",
+    step_pattern: str = "symmetric",
+    return_cost_matrix: bool = False,
+    max_slope: float = 2.0,
+) -> DTWAlignment:
+    """
+    DTW distance and warping path.
+
+    The accumulated cost is stored for the band cells only; the dense (n, m)
+    matrix (inf outside the band) is built only when ``return_cost_matrix``
+    is set.
+    """
+    xs = _as_samples(x, "x")
+    ys = _as_samples(y, "y")
+    metric_id, asymmetric = _check_options(metric, step_pattern)
+    lo, hi = dtw_band(len(xs), len(ys), window, band, max_slope)
+
+    return _align_in_band(xs, ys, lo, hi, metric_id, asymmetric, return_cost_matrix)
+
+
+def _align_in_band(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    metric_id: int,
+    asymmetric: bool,
+    return_cost_matrix: bool = False,
+) -> DTWAlignment:
+    """Distance and path searching only the cells lo[i] <= j <= hi[i]."""
+    offsets = np.zeros(len(lo) + 1, dtype=np.int64)
+    np.cumsum(hi - lo + 1, out=offsets[1:])
+    cells = _dtw_ragged_kernel(xs, ys, lo, hi, offsets, metric_id, asymmetric)
+    m = len(ys)
+    distance = float(cells[-1])
+    path = _ragged_path_kernel(cells, offsets, lo, hi, m)
+
+    cost_matrix = None
+    if return_cost_matrix:
+        cost_matrix = np.full((len(xs), m), np.inf)
+        for i in range(len(xs)):
+            cost_matrix[i, lo[i]:hi[i] + 1] = cells[offsets[i]:offsets[i + 1]]
+
+    return DTWAlignment(distance=distance, path=path, cost_matrix=cost_matrix)
+
+
+def _coarsen(samples: np.ndarray) -> np.ndarray:
+    """Halve the resolution by averaging pairs (odd tail kept as is)."""
+    half = len(samples) // 2
+    coarse = 0.5 * (samples[0:2 * half:2] + samples[1:2 * half:2])
+    if len(samples) % 2:
+        coarse = np.vstack([coarse, samples[-1:]])
+    return coarse
+
+
+def _project_window(path: np.ndarray, n: int, m: int, radius: int) -> tuple[np.ndarray, np.ndarray]:
+    """Column bounds of the fine cells covered by a coarse path, widened by ``radius``."""
+    rows = np.concatenate([2 * path[:, 0], 2 * path[:, 0] + 1])
+    cols = np.concatenate([2 * path[:, 1], 2 * path[:, 1] + 1])
+    keep = rows < n
+    rows = rows[keep]
+    cols = np.minimum(cols[keep], m - 1)
+
+    lo = np.full(n, m - 1, dtype=np.int64)
+    hi = np.zeros(n, dtype=np.int64)
+    np.minimum.at(lo, rows, cols)
+    np.maximum.at(hi, rows, cols)
+
+    # Raio em linhas e colunas: bounds monótonos, então min/max da vizinhança
+    # são os extremos da janela
+    index = np.arange(n)
+    lo = lo[np.maximum(index - radius, 0)] - radius
+    hi = hi[np.minimum(index + radius, n - 1)] + radius
+    return _connect_band(lo, hi, m)
+
+
+def dtw_path_multiscale(
+    x: np.ndarray,
+    y: np.ndarray,
+    radius: int = 10,
+    metric: str = "euclidean",
+    step_pattern: str = "symmetric",
+    min_size: int | None = None,
+) -> DTWAlignment:
+    """
+    Approximate DTW path by multiscale refinement (FastDTW).
+
+    Both series are halved repeatedly down to ``min_size`` samples; the
+    coarsest pair is aligned exactly, then each level's path is projected
+    onto the next finer level and DTW is re-run only within ``radius``
+    cells of it. Time and memory are O((n + m) * radius); the result is
+    exact whenever the optimal path stays inside the refined windows.
+
+    Args:
+        x, y: Series (1-D or (n, d) multivariate)
+        radius: Refinement half-width (cells) around the projected path
+        metric: Point cost ("euclidean", "sqeuclidean", "manhattan", "cosine")
+        step_pattern: "symmetric" or "asymmetric"
+        min_size: Length below which the alignment is exact
+            (default ``radius + 2``)
+
+    Returns:
+        DTWAlignment (no cost matrix)
+    """
+    if radius < 0:
+        raise ValidationError("Multiscale DTW radius must be >= 0", {"radius": radius})
+    xs = _as_samples(x, "x")
+    ys = _as_samples(y, "y")
+    metric_id, asymmetric = _check_options(metric, step_pattern)
+    min_size = max(radius + 2, 2) if min_size is None else max(int(min_size), 2)
+
+    levels = [(xs, ys)]
+    while len(levels[-1][0]) > min_size and len(levels[-1][1]) > min_size:
+        cx, cy = levels[-1]
+        levels.append((_coarsen(cx), _coarsen(cy)))
+
+    cx, cy = levels.pop()
+    lo, hi = dtw_band(len(cx), len(cy))
+    alignment = _align_in_band(cx, cy, lo, hi, metric_id, asymmetric)
+    while levels:
+        fx, fy = levels.pop()
+        lo, hi = _project_window(alignment.path, len(fx), len(fy), radius)
+        alignment = _align_in_band(fx, fy, lo, hi, metric_id, asymmetric)
+
+    logger.debug("dtw_multiscale_computed", n=len(xs), m=len(ys), radius=radius,
+                 cells=int(np.sum(hi - lo + 1)))
+    return alignment
+
+
+def lb_kim(x: np.ndarray, y: np.ndarray, metric: str = "euclidean") -> float:
+    """LB_Kim: every warping path contains the first and last cells."""
+    xs = _as_samples(x, "x")
+    ys = _as_samples(y, "y")
+    metric_id, _ = _check_options(metric, "symmetric")
+    bound = _point_cost(xs, ys, 0, 0, metric_id)
+    if len(xs) > 1 or len(ys) > 1:
+        bound += _point_cost(xs, ys, len(xs) - 1, len(ys) - 1, metric_id)
+    return float(bound)
+
+
+def lb_keogh(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: int | None = None,
+    band: Literal["sakoe_chiba", "itakura"] = "sakoe_chiba",
+    metric: str = "euclidean",
+    max_slope: float = 2.0,
+) -> float:
+    """
+    LB_Keogh for univariate series under the same band as the DTW.
+
+    Each row i of a warping path matches x[i] with some y[j] inside the
+    band, so its cost is at least the distance from x[i] to the envelope
+    [min, max] of y over the band row. Returns 0 where the bound does not
+    apply (multivariate series, cosine metric).
+    """
+    xs = _as_samples(x, "x")
+    ys = _as_samples(y, "y")
+    _check_options(metric, "symmetric")
+    if xs.shape[1] != 1 or ys.shape[1] != 1 or metric not in _KEOGH_METRICS:
+        return 0.0
+
+    lo, hi = dtw_band(len(xs), len(ys), window, band, max_slope)
+    lower, upper = _envelope_kernel(ys[:, 0], lo, hi)
+    values = xs[:, 0]
+    excess = np.maximum(np.maximum(values - upper, lower - values), 0.0)
+    if metric == "sqeuclidean":
+        return float(np.sum(excess * excess))
+    return float(np.sum(excess))
+
+
+def dtw_distance_matrix(
+    series: list[np.ndarray],
+    window: int | None = None,
+    band: Literal["sakoe_chiba", "itakura"] = "sakoe_chiba",
+    metric: str = "euclidean",
+    step_pattern: str = "symmetric",
+    normalize: bool = False,
+    max_distance: float | None = None,
+    max_slope: float = 2.0,
+    max_workers: int | None = None,
+) -> np.ndarray:
+    """
+    Pairwise DTW distances (symmetric, zero diagonal).
+
+    With ``max_distance``, pairs whose LB_Kim/LB_Keogh lower bound already
+    exceeds it are skipped and the DTW of the others is abandoned as soon as
+    it does; those pairs are reported as inf.
+
+    Args:
+        series: Series to compare
+        normalize: Divide each distance by n + m (``max_distance`` is then
+            in normalized units too)
+        max_workers: Threads evaluating pairs (default ``DEFAULT_MAX_WORKERS``)
+
+    Returns:
+        (n_series, n_series) distance matrix
+    """
+    samples = [_as_samples(values, f"series[{k}]") for k, values in enumerate(series)]
+    metric_id, asymmetric = _check_options(metric, step_pattern)
+    n_series = len(samples)
+    result = np.zeros((n_series, n_series))
+    pairs = [(a, b) for a in range(n_series) for b in range(a + 1, n_series)]
+
+    def evaluate(pair: tuple[int, int]) -> tuple[float, str]:
+        xs, ys = samples[pair[0]], samples[pair[1]]
+        scale = len(xs) + len(ys) if normalize else 1.0
+        threshold = np.inf if max_distance is None else float(max_distance) * scale
+        if np.isfinite(threshold):
+            bound = max(lb_kim(xs, ys, metric),
+                        lb_keogh(xs, ys, window, band, metric, max_slope))
+            if bound > threshold:
+                return np.inf, "pruned"
+        lo, hi = dtw_band(len(xs), len(ys), window, band, max_slope)
+        distance = _dtw_distance_kernel(xs, ys, lo, hi, metric_id, asymmetric, threshold)
+        if not np.isfinite(distance):
+            return np.inf, "abandoned"
+        return distance / scale, "computed"
+
+    workers = min(max_workers or DEFAULT_MAX_WORKERS, max(len(pairs), 1))
+    if workers <= 1 or not NUMBA_AVAILABLE:
+        outcomes = [evaluate(pair) for pair in pairs]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dtw_pairs") as pool:
+            outcomes = list(pool.map(evaluate, pairs))
+
+    for (a, b), (distance, _) in zip(pairs, outcomes, strict=True):
+        result[a, b] = result[b, a] = distance
+
+    statuses = [status for _, status in outcomes]
+    logger.debug("dtw_distance_matrix_computed", n_series=n_series, n_pairs=len(pairs),
+                 pruned=statuses.count("pruned"), abandoned=statuses.count("abandoned"),
+                 workers=workers)
+    return result
@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING, Literal
 import numpy as np
 from scipy import signal
 
+from platform_base.processing.parallel import as_row_block, map_row_chunks
 from platform_base.utils.errors import ValidationError
 from platform_base.utils.logging import get_logger
 
@@ -43,53 +44,12 @@ class FilterResult:
     method: str                            # Filter design method
 
 
-def apply_filter(
-    values: NDArray[np.float64],
+def _normalized_cutoff(
     sampling_rate: float,
     filter_type: FilterType,
     cutoff_frequency: float | tuple[float, float],
-    filter_order: int = 4,
-    method: FilterMethod = "butter",
-    zero_phase: bool = True,
-) -> FilterResult:
-    """
-    Apply digital filter to signal.
-    
-    Args:
-        values: Input signal values
-        sampling_rate: Sampling rate in Hz
-        filter_type: Type of filter ('lowpass', 'highpass', 'bandpass', 'bandstop')
-        cutoff_frequency: Cutoff frequency in Hz (single value for lowpass/highpass,
-                         tuple of (low, high) for bandpass/bandstop)
-        filter_order: Filter order (higher = sharper transition, more ringing)
-        method: Filter design method ('butter', 'chebyshev1', 'chebyshev2', 'elliptic', 'bessel')
-        zero_phase: Use zero-phase filtering (filtfilt instead of lfilter)
-        
-    Returns:
-        FilterResult with filtered signal
-        
-    Raises:
-        ValidationError: If input parameters are invalid
-    """
-    # Validate inputs
-    if len(values) < 2:
-        raise ValidationError("Filtering requires at least 2 data points")
-
-    if sampling_rate <= 0:
-        raise ValidationError(f"Sampling rate must be positive, got {sampling_rate}")
-
-    if filter_order < 1:
-        raise ValidationError(f"Filter order must be at least 1, got {filter_order}")
-
-    # Remove NaN values
-    clean_values = values[~np.isnan(values)]
-
-    if len(clean_values) < 2 * filter_order:
-        raise ValidationError(
-            f"Not enough valid data points for filter order {filter_order} "
-            f"(need at least {2 * filter_order})"
-        )
-
+) -> float | tuple[float, float]:
+    """Validate cutoff frequencies and normalize them to the Nyquist frequency."""
     # Normalize cutoff frequencies to Nyquist frequency
     nyquist_freq = sampling_rate / 2
 
@@ -105,7 +65,7 @@ def apply_filter(
                 f"({nyquist_freq} Hz), got {cutoff_frequency} Hz"
             )
 
-        normalized_cutoff = cutoff_frequency / nyquist_freq
+        return cutoff_frequency / nyquist_freq
 
     elif filter_type in ("bandpass", "bandstop"):
         if not isinstance(cutoff_frequency, tuple) or len(cutoff_frequency) != 2:
@@ -127,10 +87,25 @@ def apply_filter(
                 f"({nyquist_freq} Hz), got ({low_freq}, {high_freq})"
             )
 
-        normalized_cutoff = (low_freq / nyquist_freq, high_freq / nyquist_freq)
+        return (low_freq / nyquist_freq, high_freq / nyquist_freq)
+
+    raise ValidationError(f"Unknown filter type: {filter_type}")
+
+
+def design_filter(
+    sampling_rate: float,
+    filter_type: FilterType,
+    cutoff_frequency: float | tuple[float, float],
+    filter_order: int = 4,
+    method: FilterMethod = "butter",
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Design a digital filter and return its ``(b, a)`` coefficients.
 
-    else:
-        raise ValidationError(f"Unknown filter type: {filter_type}")
+    Raises:
+        ValidationError: If the cutoff or design parameters are invalid
+    """
+    normalized_cutoff = _normalized_cutoff(sampling_rate, filter_type, cutoff_frequency)
 
     # Design filter
     try:
@@ -154,6 +129,58 @@ def apply_filter(
     except Exception as e:
         raise ValidationError(f"Filter design failed: {str(e)}")
 
+    return b, a
+
+
+def apply_filter(
+    values: NDArray[np.float64],
+    sampling_rate: float,
+    filter_type: FilterType,
+    cutoff_frequency: float | tuple[float, float],
+    filter_order: int = 4,
+    method: FilterMethod = "butter",
+    zero_phase: bool = True,
+) -> FilterResult:
+    """
+    Apply digital filter to signal.
+    
+    Args:
+        values: Input signal values
+        sampling_rate: Sampling rate in Hz
+        filter_type: Type of filter ('lowpass', 'highpass', 'bandpass', 'bandstop')
+        cutoff_frequency: Cutoff frequency in Hz (single value for lowpass/highpass,
+                         tuple of (low, high) for bandpass/bandstop)
+        filter_order: Filter order (higher = sharper transition, more ringing)
+        method: Filter design method ('butter', 'chebyshev1', 'chebyshev2', 'elliptic', 'bessel')
+        zero_phase: Use zero-phase filtering (filtfilt instead of lfilter)
+        
+    Returns:
+        FilterResult with filtered signal
+        
+    Raises:
+        ValidationError: If input parameters are invalid
+    """
+    # Validate inputs
+    if len(values) < 2:
+        raise ValidationError("Filtering requires at least 2 data points")
+
+    if sampling_rate <= 0:
+        raise ValidationError(f"Sampling rate must be positive, got {sampling_rate}")
+
+    if filter_order < 1:
+        raise ValidationError(f"Filter order must be at least 1, got {filter_order}")
+
+    # Remove NaN values
+    clean_values = values[~np.isnan(values)]
+
+    if len(clean_values) < 2 * filter_order:
+        raise ValidationError(
+            f"Not enough valid data points for filter order {filter_order} "
+            f"(need at least {2 * filter_order})"
+        )
+
+    b, a = design_filter(sampling_rate, filter_type, cutoff_frequency, filter_order, method)
+
     # Apply filter
     try:
         if zero_phase:
@@ -187,6 +214,89 @@ def apply_filter(
     )
 
 
+def apply_filter_batch(
+    values: NDArray[np.float64],
+    sampling_rate: float,
+    filter_type: FilterType,
+    cutoff_frequency: float | tuple[float, float],
+    filter_order: int = 4,
+    method: FilterMethod = "butter",
+    zero_phase: bool = True,
+    max_workers: int | None = None,
+) -> NDArray[np.float64]:
+    """
+    Apply the same digital filter to a batch of series sharing one time axis.
+
+    The filter is designed once and applied along the last axis of row
+    chunks running in parallel. Unlike :func:`apply_filter`, rows keep their
+    length: NaN samples are skipped while filtering and stay NaN in the output.
+
+    Args:
+        values: ``(n_series, n_points)`` block (one series per row)
+        sampling_rate: Sampling rate in Hz
+        filter_type: Type of filter ('lowpass', 'highpass', 'bandpass', 'bandstop')
+        cutoff_frequency: Cutoff frequency in Hz (or (low, high) tuple)
+        filter_order: Filter order
+        method: Filter design method
+        zero_phase: Use zero-phase filtering (filtfilt instead of lfilter)
+        max_workers: Worker threads (None = default, 1 = serial)
+
+    Returns:
+        Filtered ``(n_series, n_points)`` block
+
+    Raises:
+        ValidationError: If input parameters are invalid
+    """
+    block = as_row_block(values)
+
+    if block.shape[1] < 2:
+        raise ValidationError("Filtering requires at least 2 data points")
+
+    if sampling_rate <= 0:
+        raise ValidationError(f"Sampling rate must be positive, got {sampling_rate}")
+
+    if filter_order < 1:
+        raise ValidationError(f"Filter order must be at least 1, got {filter_order}")
+
+    nan_mask = np.isnan(block)
+    nan_rows = np.flatnonzero(nan_mask.any(axis=1))
+    valid_counts = block.shape[1] - nan_mask.sum(axis=1)
+
+    if valid_counts.min(initial=block.shape[1]) < 2 * filter_order:
+        raise ValidationError(
+            f"Not enough valid data points for filter order {filter_order} "
+            f"(need at least {2 * filter_order})"
+        )
+
+    b, a = design_filter(sampling_rate, filter_type, cutoff_frequency, filter_order, method)
+    apply = signal.filtfilt if zero_phase else signal.lfilter
+
+    try:
+        filtered = map_row_chunks(lambda rows: apply(b, a, rows, axis=-1), block, max_workers)
+
+        # Rows with gaps: filter the valid samples, as apply_filter does
+        for row in nan_rows:
+            valid = ~nan_mask[row]
+            filtered[row, valid] = apply(b, a, block[row, valid])
+            filtered[row, ~valid] = np.nan
+
+    except Exception as e:
+        raise ValidationError(f"Filter application failed: {str(e)}")
+
+    logger.info(
+        "filter_batch_applied",
+        filter_type=filter_type,
+        cutoff_frequency=cutoff_frequency,
+        method=method,
+        order=filter_order,
+        n_series=block.shape[0],
+        n_points=block.shape[1],
+        zero_phase=zero_phase,
+    )
+
+    return filtered
+
+
 def apply_lowpass_filter(
     values: NDArray[np.float64],
     sampling_rate: float,
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import numpy as np
 from scipy.interpolate import CubicSpline, UnivariateSpline
@@ -27,11 +31,15 @@ except ImportError:
     GPR_AVAILABLE = False
 
 from platform_base.core.models import InterpolationInfo, InterpResult, ResultMetadata
+from platform_base.processing.parallel import DEFAULT_MAX_WORKERS
 from platform_base.profiling.decorators import performance_critical, profile
 from platform_base.utils.errors import InterpolationError
 from platform_base.utils.logging import get_logger
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 logger = get_logger(__name__)
 
 SUPPORTED_METHODS = {
@@ -115,33 +123,42 @@ def _interp_mask(values: np.ndarray) -> np.ndarray:
 # Advanced Interpolation Methods
 # ============================================================================
 
+# Targets solved per batch in MLS (bounds the (batch, k, degree+1) design tensor)
+MLS_BATCH_SIZE = 65_536
+
+
 def _mls_interpolate(
     t_valid: np.ndarray,
     v_valid: np.ndarray,
     t_target: np.ndarray,
     degree: int = 2,
     weight_radius: float | None = None,
+    n_neighbors: int | None = None,
 ) -> np.ndarray:
     """
     Moving Least Squares (MLS) interpolation.
 
     Fits a local polynomial at each target point using weighted least squares,
-    where weights decrease with distance from the target point.
+    where weights decrease with distance from the target point. Only the
+    ``n_neighbors`` valid points around each target (located with
+    ``searchsorted`` on the sorted time axis) enter its fit, and the normal
+    equations of all targets are solved as one batched system.
 
     Args:
-        t_valid: Known time points
+        t_valid: Known time points (sorted, unique)
         v_valid: Known values
         t_target: Target time points for interpolation
         degree: Polynomial degree (1=linear, 2=quadratic, 3=cubic)
         weight_radius: Radius for weight function (default: auto from data)
+        n_neighbors: Points per local fit (default: max(16, 4 * (degree + 1)))
 
     Returns:
         Interpolated values at t_target
     """
     n_valid = len(t_valid)
-    n_target = len(t_target)
+    n_coeffs = degree + 1
 
-    if n_valid < degree + 1:
+    if n_valid < n_coeffs:
         logger.warning("mls_insufficient_points", n_points=n_valid, degree=degree)
         return np.interp(t_target, t_valid, v_valid)
 
@@ -149,37 +166,57 @@ def _mls_interpolate(
     if weight_radius is None:
         weight_radius = 3.0 * np.median(np.diff(t_valid))
 
-    result = np.zeros(n_target)
+    if n_neighbors is None:
+        n_neighbors = max(16, 4 * n_coeffs)
+    k = int(min(max(n_neighbors, n_coeffs), n_valid))
+
+    result = np.empty(len(t_target))
+    offsets = np.arange(k)
 
-    for i, t in enumerate(t_target):
-        # Compute weights (Gaussian kernel)
-        distances = np.abs(t_valid - t)
-        weights = np.exp(-(distances / weight_radius) ** 2)
+    for start in range(0, len(t_target), MLS_BATCH_SIZE):
+        t = t_target[start:start + MLS_BATCH_SIZE]
 
-        # Clamp very small weights to avoid numerical issues
-        weights = np.maximum(weights, 1e-10)
+        # Janela contígua de k pontos centrada na posição de inserção
+        first = np.clip(np.searchsorted(t_valid, t) - k // 2, 0, n_valid - k)
+        idx = first[:, None] + offsets
+        dt = t_valid[idx] - t[:, None]
 
-        # Build design matrix for polynomial fitting
-        A = np.column_stack([t_valid ** p for p in range(degree + 1)])
+        # Compute weights (Gaussian kernel), clamped to avoid numerical issues
+        weights = np.maximum(np.exp(-(dt / weight_radius) ** 2), 1e-10)
+
+        # Polinômio centrado no alvo e escalado para [-1, 1]: o valor
+        # interpolado é o coeficiente constante
+        scale = np.max(np.abs(dt), axis=1, keepdims=True)
+        scale[scale == 0] = 1.0
+        A = (dt / scale)[:, :, None] ** np.arange(n_coeffs)
 
         # Weighted least squares: (A^T W A) c = A^T W v
-        W = np.diag(weights)
+        Aw = A * weights[:, :, None]
+        AtWA = np.einsum("mkp,mkq->mpq", Aw, A)
+        AtWv = np.einsum("mkp,mk->mp", Aw, v_valid[idx])
 
         try:
-            AtWA = A.T @ W @ A
-            AtWv = A.T @ W @ v_valid
-            coeffs = np.linalg.solve(AtWA, AtWv)
-
-            # Evaluate polynomial at target point
-            t_powers = np.array([t ** p for p in range(degree + 1)])
-            result[i] = np.dot(coeffs, t_powers)
+            coeffs = np.linalg.solve(AtWA, AtWv[:, :, None])[:, :, 0]
         except np.linalg.LinAlgError:
-            # Fallback to linear interpolation for this point
-            result[i] = np.interp([t], t_valid, v_valid)[0]
+            logger.debug("mls_singular_system_fallback", n_targets=len(t))
+            coeffs = np.einsum("mpq,mq->mp", np.linalg.pinv(AtWA), AtWv)
+
+        result[start:start + MLS_BATCH_SIZE] = coeffs[:, 0]
 
     return result
 
 
+def _gpr_kernel(kernel_type: str, length_scale: float, noise_level: float):
+    """Kernel (stationary + white noise) used by the GPR interpolators"""
+    if kernel_type == "matern":
+        return Matern(length_scale=length_scale, nu=2.5) + WhiteKernel(
+            noise_level=noise_level, noise_level_bounds=(1e-10, 1e5),
+        )
+    return RBF(length_scale=length_scale) + WhiteKernel(
+        noise_level=noise_level, noise_level_bounds=(1e-10, 1e5),
+    )
+
+
 def _gpr_interpolate(
     t_valid: np.ndarray,
     v_valid: np.ndarray,
@@ -230,15 +267,7 @@ def _gpr_interpolate(
     if length_scale is None:
         length_scale = np.median(np.diff(t_valid_norm)) * 3.0
 
-    # Define kernel
-    if kernel_type == "matern":
-        kernel = Matern(length_scale=length_scale, nu=2.5) + WhiteKernel(
-            noise_level=noise_level, noise_level_bounds=(1e-10, 1e5),
-        )
-    else:  # rbf
-        kernel = RBF(length_scale=length_scale) + WhiteKernel(
-            noise_level=noise_level, noise_level_bounds=(1e-10, 1e5),
-        )
+    kernel = _gpr_kernel(kernel_type, length_scale, noise_level)
 
     # Fit GPR
     gpr = GaussianProcessRegressor(
@@ -260,6 +289,166 @@ def _gpr_interpolate(
     return y_pred, y_std
 
 
+# Kernels otimizados por janela, indexados pelo hash dos dados normalizados
+# (reexecuções sobre os mesmos dados pulam a otimização de hiperparâmetros)
+GPR_KERNEL_CACHE_SIZE = 256
+_gpr_kernel_cache: OrderedDict[str, object] = OrderedDict()
+_gpr_kernel_cache_lock = threading.Lock()
+
+
+def _fit_gpr_window(
+    t_window: np.ndarray,
+    v_window: np.ndarray,
+    kernel,
+    n_restarts: int,
+    optimize: bool,
+):
+    """Fit one window GP; optimized kernels are cached by window hash."""
+    key = None
+    if optimize:
+        hasher = hashlib.sha1(repr((kernel, n_restarts)).encode())
+        hasher.update(t_window.tobytes())
+        hasher.update(v_window.tobytes())
+        key = hasher.hexdigest()
+        with _gpr_kernel_cache_lock:
+            cached = _gpr_kernel_cache.get(key)
+            if cached is not None:
+                _gpr_kernel_cache.move_to_end(key)
+                kernel, optimize = cached, False
+
+    gpr = GaussianProcessRegressor(
+        kernel=kernel,
+        n_restarts_optimizer=n_restarts if optimize else 0,
+        optimizer="fmin_l_bfgs_b" if optimize else None,
+        normalize_y=False,
+        alpha=1e-10,
+        random_state=0,
+    )
+    gpr.fit(t_window.reshape(-1, 1), v_window)
+
+    if key is not None and optimize:
+        with _gpr_kernel_cache_lock:
+            _gpr_kernel_cache[key] = gpr.kernel_
+            while len(_gpr_kernel_cache) > GPR_KERNEL_CACHE_SIZE:
+                _gpr_kernel_cache.popitem(last=False)
+    return gpr
+
+
+def _gpr_interpolate_windowed(
+    t_valid: np.ndarray,
+    v_valid: np.ndarray,
+    t_target: np.ndarray,
+    length_scale: float | None = None,
+    kernel_type: Literal["rbf", "matern"] = "rbf",
+    noise_level: float = 0.1,
+    n_restarts: int = 3,
+    window_points: int = 256,
+    optimize: Literal["shared", "per_window"] = "shared",
+    max_workers: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Local GPR interpolation on windows around the gaps.
+
+    The valid samples are split into blocks of ``window_points // 2``; the
+    targets falling inside a block are predicted by a GP fitted on that block
+    plus ``window_points // 4`` context samples on each side, so each fit is
+    O(window_points³) regardless of the series length. Time is expressed in
+    units of the median sampling step (relative to the window centre) and
+    values are normalized per window, which makes hyperparameters comparable
+    across windows: with ``optimize="shared"`` they are optimized once, on
+    the window with the most targets, and reused by every other window;
+    ``"per_window"`` optimizes each window. Optimized kernels are cached by
+    window hash and window fits run on a thread pool.
+
+    Args:
+        t_valid: Known time points (sorted, unique)
+        v_valid: Known values
+        t_target: Target time points for interpolation
+        length_scale: Kernel length scale, in the units of ``_gpr_interpolate``
+            (default: 3 sampling steps)
+        kernel_type: Kernel type ("rbf" or "matern")
+        noise_level: Expected noise level in data
+        n_restarts: Number of optimizer restarts
+        window_points: Training samples per window
+        optimize: Hyperparameter optimization ("shared" or "per_window")
+        max_workers: Threads for window fits (default ``DEFAULT_MAX_WORKERS``)
+
+    Returns:
+        Tuple of (interpolated_values, std_deviation)
+
+    Raises:
+        InterpolationError: If sklearn not available or invalid window settings
+    """
+    if not GPR_AVAILABLE:
+        raise InterpolationError(
+            "GPR interpolation requires scikit-learn. Install with: pip install scikit-learn",
+            {"method": "gpr", "missing_package": "scikit-learn"},
+        )
+    if window_points < 8:
+        raise InterpolationError("GPR window_points must be >= 8",
+                                 {"method": "gpr", "window_points": window_points})
+    if optimize not in ("shared", "per_window"):
+        raise InterpolationError("Invalid GPR window optimization",
+                                 {"method": "gpr", "optimize": optimize,
+                                  "supported": ["shared", "per_window"]})
+    if len(t_target) == 0:
+        return np.empty(0), np.empty(0)
+
+    n_valid = len(t_valid)
+    span = window_points // 2
+    context = window_points // 4
+    dt_scale = float(np.median(np.diff(t_valid))) or 1.0
+    if length_scale is None:
+        length_scale = 3.0
+    else:
+        # Mesma unidade do modo global (tempo normalizado pelo desvio padrão)
+        length_scale = length_scale * (float(np.std(t_valid)) or 1.0) / dt_scale
+    kernel = _gpr_kernel(kernel_type, length_scale, noise_level)
+
+    # Targets agrupados pelo bloco de pontos válidos em que caem
+    block_of = np.minimum(np.searchsorted(t_valid, t_target), n_valid - 1) // span
+    blocks, counts = np.unique(block_of, return_counts=True)
+    groups = np.split(np.argsort(block_of, kind="stable"), np.cumsum(counts)[:-1])
+
+    def window(block: int) -> tuple[np.ndarray, np.ndarray, float, float, float]:
+        lo = max(0, block * span - context)
+        hi = min(n_valid, (block + 1) * span + context)
+        t_w = t_valid[lo:hi]
+        center = float(t_w[len(t_w) // 2])
+        v_w = v_valid[lo:hi]
+        v_mean = float(np.mean(v_w))
+        v_std = float(np.std(v_w)) or 1.0
+        return (t_w - center) / dt_scale, (v_w - v_mean) / v_std, center, v_mean, v_std
+
+    if optimize == "shared":
+        t_w, v_w, *_ = window(int(blocks[np.argmax(counts)]))
+        kernel = _fit_gpr_window(t_w, v_w, kernel, n_restarts, optimize=True).kernel_
+    per_window = optimize == "per_window"
+
+    y_pred = np.empty(len(t_target))
+    y_std = np.empty(len(t_target))
+
+    def predict(block: int, targets: np.ndarray) -> None:
+        t_w, v_w, center, v_mean, v_std = window(block)
+        gpr = _fit_gpr_window(t_w, v_w, kernel, n_restarts, optimize=per_window)
+        mean, std = gpr.predict(((t_target[targets] - center) / dt_scale).reshape(-1, 1),
+                                return_std=True)
+        y_pred[targets] = mean * v_std + v_mean
+        y_std[targets] = std * v_std
+
+    workers = min(max_workers or DEFAULT_MAX_WORKERS, len(blocks))
+    if workers <= 1:
+        for block, targets in zip(blocks.tolist(), groups, strict=True):
+            predict(block, targets)
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gpr_window") as pool:
+            list(pool.map(predict, blocks.tolist(), groups))
+
+    logger.debug("gpr_windows_fitted", n_windows=len(blocks), window_points=window_points,
+                 optimize=optimize, workers=workers)
+    return y_pred, y_std
+
+
 def _lomb_scargle_interpolate(
     t_valid: np.ndarray,
     v_valid: np.ndarray,
@@ -321,6 +510,7 @@ def _lomb_scargle_interpolate(
 
     # Estimate amplitudes and phases for each component
     result = np.full(len(t_target), v_mean)
+    fitted = np.full(len(t_valid), v_mean)
 
     for freq, _power in zip(top_freqs, top_powers, strict=False):
         omega = 2 * np.pi * freq
@@ -336,11 +526,14 @@ def _lomb_scargle_interpolate(
 
             # Reconstruct at target points
             result += a * np.cos(omega * t_target) + b * np.sin(omega * t_target)
+            fitted += A @ coeffs
         except np.linalg.LinAlgError:
             continue
 
-    # Scale result to match original variance approximately
-    result_std = np.std(result)
+    # Scale result to match original variance approximately (the spread of
+    # the reconstruction is measured on the known samples, so it does not
+    # depend on which targets are evaluated)
+    result_std = np.std(fitted)
     original_std = np.std(v_valid)
     if result_std > 0:
         result = v_mean + (result - v_mean) * (original_std / result_std) * 0.8
@@ -348,6 +541,106 @@ def _lomb_scargle_interpolate(
     return result
 
 
+# ============================================================================
+# Gap-local evaluation
+# ============================================================================
+
+# Valid samples on each side of a gap used for local spline fits
+GAP_CONTEXT_POINTS = 32
+
+# Above this many gap windows (or when the windows cover most of the series)
+# a single global fit is cheaper than the per-window fits
+GAP_LOCAL_MAX_SEGMENTS = 1_000
+
+
+def _gap_segments(
+    t_valid: np.ndarray,
+    t_target: np.ndarray,
+    context: int,
+) -> list[tuple[int, int, np.ndarray]] | None:
+    """
+    Group missing targets into gap windows sharing one local fit.
+
+    Targets are run-length encoded by their insertion position in
+    ``t_valid`` (one run per gap); each gap gets ``context`` valid samples on
+    each side and overlapping windows are merged.
+
+    Returns:
+        ``(lo, hi, target_indices)`` per window (fit on ``t_valid[lo:hi]``),
+        or None when one global fit is cheaper
+    """
+    n_valid = len(t_valid)
+    pos = np.searchsorted(t_valid, t_target)
+    order = np.argsort(pos, kind="stable")
+    pos_sorted = pos[order]
+
+    run_starts = np.flatnonzero(np.r_[True, pos_sorted[1:] != pos_sorted[:-1]])
+    gap_pos = pos_sorted[run_starts]
+    lo = np.maximum(gap_pos - context, 0)
+    hi = np.minimum(gap_pos + context, n_valid)
+
+    # Janelas de mesmo tamanho: hi é monotônico, então basta comparar vizinhas
+    seg_first = np.flatnonzero(np.r_[True, lo[1:] > hi[:-1]])
+    seg_last = np.r_[seg_first[1:] - 1, len(gap_pos) - 1]
+    seg_lo = lo[seg_first]
+    seg_hi = hi[seg_last]
+
+    if (len(seg_first) > GAP_LOCAL_MAX_SEGMENTS
+            or int(np.sum(seg_hi - seg_lo)) > n_valid // 2):
+        return None
+
+    bounds = np.r_[run_starts[seg_first], len(t_target)]
+    return [
+        (int(seg_lo[i]), int(seg_hi[i]), order[bounds[i]:bounds[i + 1]])
+        for i in range(len(seg_first))
+    ]
+
+
+def _evaluate_in_gaps(
+    fit: Callable[[np.ndarray, np.ndarray], Callable[[np.ndarray], np.ndarray]],
+    t_valid: np.ndarray,
+    v_valid: np.ndarray,
+    t_target: np.ndarray,
+    context: int | None,
+) -> np.ndarray:
+    """
+    Evaluate a fitted interpolant at the missing targets only.
+
+    ``fit(t, v)`` builds the interpolant. With ``context`` it is fitted on the
+    window around each gap (see ``_gap_segments``), otherwise once on all
+    valid samples.
+    """
+    segments = None if context is None else _gap_segments(t_valid, t_target, context)
+    if segments is None:
+        return np.asarray(fit(t_valid, v_valid)(t_target), dtype=float)
+
+    result = np.empty(len(t_target))
+    for lo, hi, targets in segments:
+        result[targets] = fit(t_valid[lo:hi], v_valid[lo:hi])(t_target[targets])
+    logger.debug("gap_local_fits", n_windows=len(segments), n_targets=len(t_target),
+                 context=context)
+    return result
+
+
+def _gap_result(
+    values: np.ndarray,
+    mask_missing: np.ndarray,
+    filled: np.ndarray,
+    method: str,
+    params: dict,
+) -> InterpResult:
+    """InterpResult with ``filled`` written into the missing positions"""
+    interp_values = values.copy()
+    interp_values[mask_missing] = filled
+    method_used = np.full(len(values), "original", dtype="<U32")
+    method_used[mask_missing] = method
+    info = InterpolationInfo(
+        is_interpolated_mask=mask_missing,
+        method_used=method_used,
+    )
+    return InterpResult(values=interp_values, interpolation_info=info, metadata=_build_metadata(method, params))
+
+
 @profile(target_name="interpolation_1m")
 @performance_critical(max_time_seconds=2.0, operation_name="interpolation")
 def interpolate(
@@ -375,6 +668,14 @@ def interpolate(
     if len(t_valid) < 2:
         raise InterpolationError("Not enough points for interpolation", {"method": method})
 
+    # Sem lacunas não há o que interpolar (resample_grid gera uma nova grade)
+    if method != "resample_grid" and not mask_missing.any():
+        logger.debug("interpolation_no_gaps", method=method, n_points=len(values))
+        return _gap_result(values, mask_missing, np.empty(0), method, params)
+
+    # Só os instantes ausentes são avaliados
+    t_missing = t_seconds[mask_missing]
+
     order = np.argsort(t_valid)
     t_valid = t_valid[order]
     v_valid = v_valid[order]
@@ -384,44 +685,36 @@ def interpolate(
     if method == "linear":
         # Use Numba-optimized linear interpolation if available
         if NUMBA_AVAILABLE and _linear_interp_numba is not None and len(t_valid) > 1000:
-            logger.debug("using_numba_linear_interpolation", n_points=len(t_seconds))
-            interp_all = _linear_interp_numba(t_seconds, t_valid, v_valid)
+            logger.debug("using_numba_linear_interpolation", n_points=len(t_missing))
+            filled = _linear_interp_numba(t_missing, t_valid, v_valid)
         else:
-            interp_all = np.interp(t_seconds, t_valid, v_valid)
-
-        interp_values = values.copy()
-        interp_values[mask_missing] = interp_all[mask_missing]
-        method_used = np.where(mask_missing, method, "original")
-        info = InterpolationInfo(
-            is_interpolated_mask=mask_missing,
-            method_used=method_used.astype("<U32"),
-        )
-        return InterpResult(values=interp_values, interpolation_info=info, metadata=_build_metadata(method, params))
+            filled = np.interp(t_missing, t_valid, v_valid)
+        return _gap_result(values, mask_missing, filled, method, params)
 
     if method == "spline_cubic":
-        spline = CubicSpline(t_valid, v_valid)
-        interp_all = spline(t_seconds)
-        interp_values = values.copy()
-        interp_values[mask_missing] = interp_all[mask_missing]
-        method_used = np.where(mask_missing, method, "original")
-        info = InterpolationInfo(
-            is_interpolated_mask=mask_missing,
-            method_used=method_used.astype("<U32"),
-        )
-        return InterpResult(values=interp_values, interpolation_info=info, metadata=_build_metadata(method, params))
+        # Interpolating spline: the influence of distant samples decays
+        # exponentially, so a local fit around each gap matches the global one
+        context = params.get("gap_context", GAP_CONTEXT_POINTS)
+        if context is not None and context < 4:
+            raise InterpolationError("gap_context must be >= 4", {"method": method, "gap_context": context})
+        filled = _evaluate_in_gaps(CubicSpline, t_valid, v_valid, t_missing, context)
+        return _gap_result(values, mask_missing, filled, method, params)
 
     if method == "smoothing_spline":
+        # Smoothing is a global criterion: fit once unless gap_context is given,
+        # in which case each window gets its share of the smoothing factor s
         smoothing = params.get("s")
-        spline = UnivariateSpline(t_valid, v_valid, s=smoothing)
-        interp_all = spline(t_seconds)
-        interp_values = values.copy()
-        interp_values[mask_missing] = interp_all[mask_missing]
-        method_used = np.where(mask_missing, method, "original")
-        info = InterpolationInfo(
-            is_interpolated_mask=mask_missing,
-            method_used=method_used.astype("<U32"),
-        )
-        return InterpResult(values=interp_values, interpolation_info=info, metadata=_build_metadata(method, params))
+        context = params.get("gap_context")
+        if context is not None and context < 4:
+            raise InterpolationError("gap_context must be >= 4", {"method": method, "gap_context": context})
+        n_valid = len(t_valid)
+
+        def fit(t_window: np.ndarray, v_window: np.ndarray) -> UnivariateSpline:
+            s = None if smoothing is None else smoothing * len(t_window) / n_valid
+            return UnivariateSpline(t_window, v_window, s=s)
+
+        filled = _evaluate_in_gaps(fit, t_valid, v_valid, t_missing, context)
+        return _gap_result(values, mask_missing, filled, method, params)
 
     if method == "resample_grid":
         dt = params.get("dt")
@@ -452,18 +745,13 @@ def interpolate(
 
         degree = params.get("degree", 2)
         weight_radius = params.get("weight_radius")
+        n_neighbors = params.get("n_neighbors")
 
-        interp_all = _mls_interpolate(t_valid, v_valid, t_seconds,
-                                      degree=degree, weight_radius=weight_radius)
-
-        interp_values = values.copy()
-        interp_values[mask_missing] = interp_all[mask_missing]
-        method_used = np.where(mask_missing, method, "original")
-        info = InterpolationInfo(
-            is_interpolated_mask=mask_missing,
-            method_used=method_used.astype("<U32"),
+        filled = _mls_interpolate(
+            t_valid, v_valid, t_missing,
+            degree=degree, weight_radius=weight_radius, n_neighbors=n_neighbors,
         )
-        return InterpResult(values=interp_values, interpolation_info=info, metadata=_build_metadata(method, params))
+        return _gap_result(values, mask_missing, filled, method, params)
 
     if method == "gpr":
         # Gaussian Process Regression interpolation
@@ -480,38 +768,67 @@ def interpolate(
         noise_level = params.get("noise_level", 0.1)
         n_restarts = params.get("n_restarts", 3)
 
-        # GPR can be slow for large datasets, subsample if needed
+        # Exact GPR is O(N³): above max_train_points use local windows
+        # ("auto"/"windowed") or subsample the training set ("global")
         max_train_points = params.get("max_train_points", 1000)
-        if len(t_valid) > max_train_points:
-            logger.warning("gpr_subsampling",
-                          original_points=len(t_valid),
-                          subsampled_to=max_train_points)
-            indices = np.linspace(0, len(t_valid) - 1, max_train_points, dtype=int)
-            t_train = t_valid[indices]
-            v_train = v_valid[indices]
+        mode = params.get("mode", "auto")
+        if mode not in ("auto", "global", "windowed"):
+            raise InterpolationError("Invalid GPR mode",
+                                     {"method": method, "mode": mode,
+                                      "supported": ["auto", "global", "windowed"]})
+        if mode == "auto":
+            mode = "windowed" if len(t_valid) > max_train_points else "global"
+
+        std_missing = np.zeros(int(np.count_nonzero(mask_missing)))
+        interp_values = values.copy()
+        if mode == "windowed":
+            interp_values[mask_missing], std_missing = _gpr_interpolate_windowed(
+                t_valid, v_valid, t_missing,
+                length_scale=length_scale,
+                kernel_type=kernel_type,
+                noise_level=noise_level,
+                n_restarts=n_restarts,
+                window_points=params.get("window_points", 256),
+                optimize=params.get("optimize", "shared"),
+                max_workers=params.get("max_workers"),
+            )
         else:
-            t_train = t_valid
-            v_train = v_valid
-
-        interp_all, std_all = _gpr_interpolate(
-            t_train, v_train, t_seconds,
-            length_scale=length_scale,
-            kernel_type=kernel_type,
-            noise_level=noise_level,
-            n_restarts=n_restarts,
-        )
+            if len(t_valid) > max_train_points:
+                logger.warning("gpr_subsampling",
+                              original_points=len(t_valid),
+                              subsampled_to=max_train_points)
+                indices = np.linspace(0, len(t_valid) - 1, max_train_points, dtype=int)
+                t_train = t_valid[indices]
+                v_train = v_valid[indices]
+            else:
+                t_train = t_valid
+                v_train = v_valid
+
+            interp_values[mask_missing], std_missing = _gpr_interpolate(
+                t_train, v_train, t_missing,
+                length_scale=length_scale,
+                kernel_type=kernel_type,
+                noise_level=noise_level,
+                n_restarts=n_restarts,
+            )
 
-        interp_values = values.copy()
-        interp_values[mask_missing] = interp_all[mask_missing]
+        # Desvio padrão por ponto (0 nos originais) e confiança relativa à
+        # dispersão dos dados: 1 = original, 0 = incerteza da ordem do sinal
+        std_all = np.zeros(len(values))
+        std_all[mask_missing] = std_missing
+        v_scale = float(np.std(v_valid)) or 1.0
         method_used = np.where(mask_missing, method, "original")
         info = InterpolationInfo(
             is_interpolated_mask=mask_missing,
             method_used=method_used.astype("<U32"),
+            confidence=np.clip(1.0 - std_all / v_scale, 0.0, 1.0),
+            uncertainty_std=std_all,
         )
 
         # Store uncertainty in params for metadata
         result_params = params.copy()
-        result_params["uncertainty_std"] = float(np.mean(std_all[mask_missing])) if np.any(mask_missing) else 0.0
+        result_params["mode"] = mode
+        result_params["uncertainty_std"] = float(np.mean(std_missing)) if len(std_missing) else 0.0
 
         return InterpResult(values=interp_values, interpolation_info=info, metadata=_build_metadata(method, result_params))
 
@@ -530,21 +847,13 @@ def interpolate(
         max_freq = params.get("max_freq")
         n_components = params.get("n_components", 20)
 
-        interp_all = _lomb_scargle_interpolate(
-            t_valid, v_valid, t_seconds,
+        filled = _lomb_scargle_interpolate(
+            t_valid, v_valid, t_missing,
             n_frequencies=n_frequencies,
             min_freq=min_freq,
             max_freq=max_freq,
             n_components=n_components,
         )
-
-        interp_values = values.copy()
-        interp_values[mask_missing] = interp_all[mask_missing]
-        method_used = np.where(mask_missing, method, "original")
-        info = InterpolationInfo(
-            is_interpolated_mask=mask_missing,
-            method_used=method_used.astype("<U32"),
-        )
-        return InterpResult(values=interp_values, interpolation_info=info, metadata=_build_metadata(method, params))
+        return _gap_result(values, mask_missing, filled, method, params)
 
     raise InterpolationError("Interpolation method not implemented", {"method": method})
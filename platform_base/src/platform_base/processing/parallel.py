@@ -0,0 +1,95 @@
+"""
+Row-parallel helpers for batched multi-series processing
+
+Batched operations take a 2-D block ``(n_series, n_points)`` sharing one time
+axis. Each operation is written against a block of rows (numpy/scipy calls
+with ``axis=-1``), so parameters are validated and filter/Savitzky-Golay
+designs are computed once per call; ``map_row_chunks`` then splits the rows
+into contiguous chunks and runs them on a thread pool. The scipy/numpy
+kernels used by the batched operations release the GIL, so chunks run
+concurrently.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from platform_base.utils.errors import ValidationError
+from platform_base.utils.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+logger = get_logger(__name__)
+
+# Worker threads per batched call (``max_workers=None``)
+DEFAULT_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Blocks smaller than this (in samples) run on the calling thread
+MIN_PARALLEL_SAMPLES = 200_000
+
+
+def as_row_block(
+    values: np.ndarray,
+    n_points: int | None = None,
+    error: type[Exception] = ValidationError,
+) -> np.ndarray:
+    """
+    Validate a batch of series as a C-contiguous float64 ``(n_series, n_points)`` block.
+
+    Args:
+        values: 2-D array (one series per row) or sequence of equal-length series
+        n_points: Expected row length (length of the shared time axis)
+        error: Exception raised on invalid shapes (the caller's error type)
+
+    Returns:
+        The block (no copy when already contiguous float64)
+    """
+    block = np.ascontiguousarray(values, dtype=np.float64)
+    if block.ndim != 2:
+        raise error("Batched values must be a 2-D (n_series, n_points) array",
+                    {"shape": block.shape})
+    if n_points is not None and block.shape[1] != n_points:
+        raise error("Time and value arrays must have same length",
+                    {"time_len": n_points, "values_len": block.shape[1]})
+    return block
+
+
+def map_row_chunks(
+    func: Callable[[np.ndarray], np.ndarray],
+    block: np.ndarray,
+    max_workers: int | None = None,
+) -> np.ndarray:
+    """
+    Apply ``func`` to contiguous row chunks of ``block`` and stack the results.
+
+    ``func`` receives a ``(rows, n_points)`` view and returns one result per
+    row along axis 0 (e.g. ``(rows, n_points)`` or ``(rows,)``).
+
+    Args:
+        func: Row-block operation
+        block: ``(n_series, n_points)`` input
+        max_workers: Thread count (default ``DEFAULT_MAX_WORKERS``; 1 = serial)
+
+    Returns:
+        Results concatenated along axis 0, in row order
+    """
+    n_rows = block.shape[0]
+    workers = min(max_workers or DEFAULT_MAX_WORKERS, n_rows)
+    if workers <= 1 or block.size < MIN_PARALLEL_SAMPLES:
+        return np.asarray(func(block))
+
+    bounds = np.linspace(0, n_rows, workers + 1).astype(int)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="row_batch") as pool:
+        futures = [pool.submit(func, block[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+        results = [np.asarray(future.result()) for future in futures]
+
+    logger.debug("row_chunks_processed", n_rows=n_rows, n_points=block.shape[1],
+                 workers=workers)
+    return np.concatenate(results, axis=0)
@@ -0,0 +1,336 @@
+"""
+Min/max pyramid - persistent multi-resolution index for plotting
+
+A ``MinMaxPyramid`` is built once per series and answers "at most two points
+per pixel for samples ``[start, stop)``" in O(pixels), independent of the
+series length, so zoom and pan never rescan the raw data.
+
+Layout: level 0 splits the series into buckets of ``bucket_size`` samples
+(default 64); level ``k`` merges pairs of level ``k - 1`` buckets, so bucket
+``j`` of level ``k`` covers ``[j * bucket_size * 2**k, (j + 1) * bucket_size * 2**k)``.
+Each bucket stores the indices of its min and max (NaN ignored, -1 when the
+bucket has no value). Its first and last samples are the bucket bounds, so
+they are implied rather than stored. All levels are concatenated into two
+int64 arrays plus an ``offsets`` table, which is how the pyramid is persisted
+next to the series in the columnar store (``io/columnar.py``) and reopened
+memory-mapped.
+
+A query picks the finest level whose buckets over the range fit the pixel
+budget, takes the min/max of every whole bucket, resolves the two partial
+buckets at the edges from nodes of the finer levels (segment-tree walk plus
+a scan of fewer than ``bucket_size`` raw samples at each end),
+and always includes the first and last sample of the range.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from platform_base.processing.decimation import (
+    NUMBA_AVAILABLE,
+    _bucket_extrema,
+    _extrema_numpy,
+    _jit,
+)
+from platform_base.utils.errors import DownsampleError
+from platform_base.utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# Samples per level-0 bucket; coarser levels double it
+PYRAMID_BUCKET_SIZE = 64
+
+# Samples per block in the numpy level-0 fallback (bounds temporary memory)
+_NUMPY_BLOCK = 1 << 20
+
+
+@_jit
+def _level0_kernel(y, bucket_size, lo_out, hi_out):
+    """Min/max indices of every ``bucket_size`` block of ``y``."""
+    n = y.shape[0]
+    for b in range(lo_out.shape[0]):
+        start = b * bucket_size
+        end = min(start + bucket_size, n)
+        lo, hi = _bucket_extrema(y, start, end)
+        lo_out[b] = lo
+        hi_out[b] = hi
+
+
+def _level0_numpy(y, bucket_size, lo_out, hi_out):
+    """Numpy version of ``_level0_kernel`` (block-wise argmin/argmax)."""
+    n = y.shape[0]
+    step = bucket_size * max(1, _NUMPY_BLOCK // bucket_size)
+    for start in range(0, n, step):
+        block = np.asarray(y[start:start + step])
+        n_full = block.shape[0] // bucket_size
+        first = start // bucket_size
+        if n_full:
+            seg = block[:n_full * bucket_size].reshape(n_full, bucket_size)
+            nan = np.isnan(seg)
+            offsets = start + np.arange(n_full, dtype=np.int64) * bucket_size
+            lo = offsets + np.argmin(np.where(nan, np.inf, seg), axis=1)
+            hi = offsets + np.argmax(np.where(nan, -np.inf, seg), axis=1)
+            empty = nan.all(axis=1)
+            lo[empty] = -1
+            hi[empty] = -1
+            lo_out[first:first + n_full] = lo
+            hi_out[first:first + n_full] = hi
+        if block.shape[0] > n_full * bucket_size:
+            tail_start = start + n_full * bucket_size
+            lo, hi = _extrema_numpy(block[n_full * bucket_size:])
+            lo_out[first + n_full] = tail_start + lo if lo >= 0 else -1
+            hi_out[first + n_full] = tail_start + hi if hi >= 0 else -1
+
+
+_level0_impl = _level0_kernel if NUMBA_AVAILABLE else _level0_numpy
+
+
+def _gather(values: np.ndarray, indices: np.ndarray, fill: float) -> np.ndarray:
+    """``values[indices]`` with ``fill`` where the index is -1."""
+    valid = indices >= 0
+    out = np.full(indices.shape[0], fill)
+    out[valid] = values[indices[valid]]
+    return out
+
+
+def _merge_level(values: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Merge pairs of buckets into the next level (ties keep the earlier index)."""
+    if lo.shape[0] % 2:
+        lo = np.append(lo, -1)
+        hi = np.append(hi, -1)
+    lo_a, lo_b = lo[0::2], lo[1::2]
+    hi_a, hi_b = hi[0::2], hi[1::2]
+    take_lo_b = (_gather(values, lo_b, np.inf) < _gather(values, lo_a, np.inf)) | (lo_a < 0)
+    take_hi_b = (_gather(values, hi_b, -np.inf) > _gather(values, hi_a, -np.inf)) | (hi_a < 0)
+    return np.where(take_lo_b, lo_b, lo_a), np.where(take_hi_b, hi_b, hi_a)
+
+
+class MinMaxPyramid:
+    """
+    Per-series min/max pyramid over power-of-two buckets.
+
+    Build with ``MinMaxPyramid(values)`` or reopen persisted arrays with
+    ``MinMaxPyramid.from_arrays``. ``values`` is kept by reference (it may be a
+    memmap); queries only touch O(pixels + bucket_size) of it.
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        bucket_size: int = PYRAMID_BUCKET_SIZE,
+        *,
+        _arrays: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None,
+    ):
+        values = np.asanyarray(values)
+        if values.ndim != 1:
+            raise DownsampleError("Pyramid values must be 1-D", {"shape": values.shape})
+        if bucket_size < 2:
+            raise DownsampleError("Pyramid bucket size must be at least 2",
+                                  {"bucket_size": bucket_size})
+
+        self.values = values
+        self.bucket_size = int(bucket_size)
+
+        if _arrays is None:
+            _arrays = self._build()
+        self._lo, self._hi, self._offsets = _arrays
+        self._levels = [
+            (self._lo[a:b], self._hi[a:b])
+            for a, b in zip(self._offsets[:-1], self._offsets[1:])
+        ]
+
+    @classmethod
+    def from_arrays(
+        cls,
+        values: np.ndarray,
+        lo: np.ndarray,
+        hi: np.ndarray,
+        offsets: np.ndarray | list[int],
+        bucket_size: int = PYRAMID_BUCKET_SIZE,
+    ) -> MinMaxPyramid:
+        """Reopen a pyramid from ``to_arrays`` output (arrays may be memmaps)."""
+        offsets = np.asarray(offsets, dtype=np.int64)
+        n_buckets = max(-(-len(values) // bucket_size), 1)
+        if len(offsets) < 2 or offsets[1] != n_buckets or offsets[-1] != len(lo) or len(lo) != len(hi):
+            raise DownsampleError(
+                "Pyramid arrays do not match the series",
+                {"n_points": len(values), "bucket_size": bucket_size, "n_nodes": len(lo)},
+            )
+        return cls(values, bucket_size, _arrays=(lo, hi, offsets))
+
+    def to_arrays(self) -> dict[str, Any]:
+        """Concatenated level arrays: ``lo``, ``hi``, ``offsets`` and ``bucket_size``."""
+        return {
+            "lo": self._lo,
+            "hi": self._hi,
+            "offsets": self._offsets,
+            "bucket_size": self.bucket_size,
+        }
+
+    def _build(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        values = self.values
+        if values.dtype != np.float64:
+            values = values.astype(np.float64)
+        n_buckets = max(-(-values.shape[0] // self.bucket_size), 1)
+
+        lo = np.empty(n_buckets, dtype=np.int64)
+        hi = np.empty(n_buckets, dtype=np.int64)
+        if values.shape[0]:
+            _level0_impl(values, self.bucket_size, lo, hi)
+        else:
+            lo[:] = -1
+            hi[:] = -1
+
+        levels_lo, levels_hi = [lo], [hi]
+        while lo.shape[0] > 1:
+            lo, hi = _merge_level(values, lo, hi)
+            levels_lo.append(lo)
+            levels_hi.append(hi)
+
+        offsets = np.zeros(len(levels_lo) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([level.shape[0] for level in levels_lo])
+        logger.debug("minmax_pyramid_built", n_points=int(values.shape[0]),
+                     n_levels=len(levels_lo), n_nodes=int(offsets[-1]))
+        return np.concatenate(levels_lo), np.concatenate(levels_hi), offsets
+
+    @property
+    def n_points(self) -> int:
+        return int(self.values.shape[0])
+
+    @property
+    def n_levels(self) -> int:
+        return len(self._levels)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self._lo.nbytes + self._hi.nbytes)
+
+    def _range_extrema(self, start: int, stop: int) -> tuple[int, int]:
+        """Min/max indices of ``values[start:stop]`` from pyramid nodes."""
+        size = self.bucket_size
+        head_end = min(stop, -(-start // size) * size)
+        tail_start = max(head_end, stop // size * size)
+        candidates = []
+
+        for a, b in ((start, head_end), (tail_start, stop)):
+            if b > a:
+                lo, hi = _extrema_numpy(np.asarray(self.values[a:b], dtype=np.float64))
+                if lo >= 0:
+                    candidates.extend((a + lo, a + hi))
+
+        # Aligned middle: bottom-up segment-tree walk over the levels
+        p, q = head_end // size, tail_start // size
+        level = 0
+        while p < q:
+            lo_level, hi_level = self._levels[level]
+            if p & 1:
+                candidates.extend((lo_level[p], hi_level[p]))
+                p += 1
+            if q & 1:
+                q -= 1
+                candidates.extend((lo_level[q], hi_level[q]))
+            p >>= 1
+            q >>= 1
+            level += 1
+
+        indices = np.array([c for c in candidates if c >= 0], dtype=np.int64)
+        if indices.shape[0] == 0:
+            return -1, -1
+        vals = np.asarray(self.values[indices], dtype=np.float64)
+        order = np.argsort(indices, kind="stable")
+        indices, vals = indices[order], vals[order]
+        return int(indices[np.argmin(vals)]), int(indices[np.argmax(vals)])
+
+    def indices(self, start: int, stop: int, n_pixels: int) -> np.ndarray:
+        """
+        Select at most ``2 * n_pixels`` indices of ``values[start:stop]``.
+
+        Every selected bucket contributes its min and max, so the envelope
+        drawn at ``n_pixels`` width matches the raw data. Buckets without
+        values contribute their first sample, keeping NaN gaps visible.
+
+        Args:
+            start: First sample of the range
+            stop: End of the range (exclusive)
+            n_pixels: Horizontal resolution of the view (at least 4 is used)
+
+        Returns:
+            Strictly increasing int64 indices including ``start`` and ``stop - 1``
+        """
+        start = max(int(start), 0)
+        stop = min(int(stop), self.n_points)
+        if stop <= start:
+            return np.empty(0, dtype=np.int64)
+        n_pixels = max(int(n_pixels), 4)
+        span = stop - start
+        if span <= 2 * n_pixels:
+            return np.arange(start, stop, dtype=np.int64)
+
+        # Finest level whose whole buckets, plus two edges, fit the budget
+        level = 0
+        size = self.bucket_size
+        while level < self.n_levels - 1 and span // size + 3 > n_pixels:
+            level += 1
+            size <<= 1
+
+        first_full = -(-start // size)
+        end_full = stop // size
+        parts = [np.array([start, stop - 1], dtype=np.int64)]
+
+        if first_full >= end_full:
+            edges = [(start, stop)]
+        else:
+            edges = [(start, first_full * size), (end_full * size, stop)]
+            lo_level, hi_level = self._levels[level]
+            lo = np.asarray(lo_level[first_full:end_full])
+            hi = np.asarray(hi_level[first_full:end_full])
+            empty = lo < 0
+            if empty.any():
+                bucket_start = np.arange(first_full, end_full, dtype=np.int64) * size
+                lo = np.where(empty, bucket_start, lo)
+                hi = np.where(empty, bucket_start, hi)
+            parts.extend((lo, hi))
+
+        for a, b in edges:
+            if b > a:
+                lo, hi = self._range_extrema(a, b)
+                parts.append(np.array([lo, hi] if lo >= 0 else [a], dtype=np.int64))
+
+        return np.unique(np.concatenate(parts))
+
+    def window(
+        self,
+        t: np.ndarray,
+        t0: float,
+        t1: float,
+        n_pixels: int,
+    ) -> np.ndarray:
+        """
+        ``indices`` for the time window ``[t0, t1]`` of a sorted time axis.
+
+        One sample beyond each edge is included so lines reach the border of
+        the view.
+        """
+        if len(t) != self.n_points:
+            raise DownsampleError(
+                "Time and value arrays must have same length",
+                {"time_len": len(t), "values_len": self.n_points},
+            )
+        start = max(int(np.searchsorted(t, t0, side="left")) - 1, 0)
+        stop = min(int(np.searchsorted(t, t1, side="right")) + 1, self.n_points)
+        return self.indices(start, stop, n_pixels)
+
+
+def series_pyramid(series: Any) -> MinMaxPyramid:
+    """
+    Pyramid attached to ``series`` (a ``core.models.Series``), built on first
+    use and rebuilt when the series values were replaced.
+    """
+    pyramid = getattr(series, "pyramid", None)
+    if not isinstance(pyramid, MinMaxPyramid) or pyramid.values is not series.values:
+        pyramid = MinMaxPyramid(series.values)
+        series.pyramid = pyramid
+    return pyramid
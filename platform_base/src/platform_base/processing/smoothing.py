@@ -1,14 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
 
-from scipy.ndimage import gaussian_filter1d
+import numpy as np
+from scipy.ndimage import gaussian_filter1d, median_filter
 from scipy.signal import butter, filtfilt, medfilt, savgol_filter
 
-
-if TYPE_CHECKING:
-    import numpy as np
+from platform_base.processing.parallel import as_row_block, map_row_chunks
 
 
 @dataclass
@@ -38,3 +36,52 @@ def smooth(values: np.ndarray, method: str, params: dict) -> np.ndarray:
         return filtfilt(b, a, values)
 
     raise ValueError(f"Unknown smoothing method: {method}")
+
+
+def smooth_batch(
+    values: np.ndarray,
+    method: str,
+    params: dict,
+    max_workers: int | None = None,
+) -> np.ndarray:
+    """
+    ``smooth`` applied to every row of a ``(n_series, n_points)`` block.
+
+    Parameters and the lowpass design are resolved once; each thread smooths
+    a chunk of rows with a single ``axis=-1`` call. Row ``i`` of the result
+    equals ``smooth(values[i], method, params)``.
+    """
+    block = as_row_block(values, error=ValueError)
+
+    if method == "savitzky_golay":
+        window_length = params.get("window_length", 7)
+        polyorder = params.get("polyorder", 3)
+
+        def run(rows):
+            return savgol_filter(rows, window_length=window_length, polyorder=polyorder, axis=-1)
+
+    elif method == "gaussian":
+        sigma = params.get("sigma", 1.0)
+
+        def run(rows):
+            return gaussian_filter1d(rows, sigma=sigma, axis=-1)
+
+    elif method == "median":
+        kernel_size = params.get("kernel_size", 5)
+
+        def run(rows):
+            # Same as medfilt (zero-padded edges), applied along each row
+            return median_filter(rows, size=(1, kernel_size), mode="constant", cval=0.0)
+
+    elif method == "lowpass":
+        cutoff = params.get("cutoff", 0.1)
+        order = params.get("order", 3)
+        b, a = butter(order, cutoff, btype="low")
+
+        def run(rows):
+            return filtfilt(b, a, rows, axis=-1)
+
+    else:
+        raise ValueError(f"Unknown smoothing method: {method}")
+
+    return map_row_chunks(run, block, max_workers)
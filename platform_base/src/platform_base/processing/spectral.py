@@ -0,0 +1,317 @@
+"""
+Spectral analysis - real-FFT periodogram, Welch PSD and STFT spectrograms
+
+Segments are read and transformed in batches of ``SEGMENT_BATCH`` so memory
+stays constant in the series length:
+
+- Sources can be a series (ndarray, ``np.memmap``, ``LazyDataArray`` or
+  anything with ``.ndim``) or any other iterable of chunks (list of
+  arrays, generator, chunked reader); chunk boundaries need not align
+  with segments.
+- Each batch is transformed with one ``scipy.fft.rfft`` call over the
+  segment axis, split across ``workers`` threads.
+- Windows (and their scale factors) are cached per (name, length);
+  scipy.fft keeps its own plan cache for repeated lengths.
+
+Conventions (one-sided spectra, scaling, segment times) follow
+``scipy.signal.welch``/``scipy.signal.spectrogram``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from scipy import fft as sp_fft
+from scipy import signal
+
+from platform_base.processing.parallel import DEFAULT_MAX_WORKERS
+from platform_base.utils.errors import ValidationError
+from platform_base.utils.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+logger = get_logger(__name__)
+
+# Segments transformed per rfft call
+SEGMENT_BATCH = 512
+
+DETREND_MODES = (None, False, "constant", "linear")
+
+SCALINGS = ("density", "spectrum")
+
+
+@dataclass
+class WelchResult:
+    """Result of Welch PSD estimation"""
+    frequencies: NDArray[np.float64]  # Frequency bins (Hz)
+    psd: NDArray[np.float64]          # Averaged power (density or spectrum)
+    n_segments: int                   # Segments averaged (NaN segments skipped)
+    nperseg: int                      # Segment length
+    sampling_rate: float              # Sampling rate (Hz)
+
+
+@dataclass
+class SpectrogramResult:
+    """Result of STFT spectrogram"""
+    frequencies: NDArray[np.float64]  # Frequency bins (Hz)
+    times: NDArray[np.float64]        # Segment centres (s)
+    power: NDArray[np.float64]        # (n_frequencies, n_segments)
+    nperseg: int                      # Segment length
+    sampling_rate: float              # Sampling rate (Hz)
+
+
+def get_window(window: str | tuple | list, nperseg: int) -> NDArray[np.float64]:
+    """Periodic window of length ``nperseg`` (cached, read-only); accepts scipy specs like ("tukey", 0.25)."""
+    # Specs em lista (ex.: vindas de JSON) viram tupla para a chave do cache
+    if isinstance(window, list):
+        window = tuple(window)
+    return _cached_window(window, nperseg)
+
+
+@lru_cache(maxsize=32)
+def _cached_window(window: str | tuple, nperseg: int) -> NDArray[np.float64]:
+    try:
+        values = signal.get_window(window, nperseg)
+    except ValueError as exc:
+        raise ValidationError(f"Unknown window function: {window}") from exc
+    values = np.asarray(values, dtype=np.float64)
+    values.flags.writeable = False
+    return values
+
+
+def _segment_scale(window: str | tuple, nperseg: int, fs: float, scaling: str) -> float:
+    win = get_window(window, nperseg)
+    if scaling == "density":
+        return 1.0 / (fs * np.sum(win * win))
+    return 1.0 / np.sum(win) ** 2
+
+
+def _check_params(fs: float, nperseg: int, noverlap: int,
+                  detrend: Any, scaling: str) -> int:
+    """Validate shared parameters; returns the hop between segments."""
+    if fs <= 0:
+        raise ValidationError(f"Sampling rate must be positive, got {fs}")
+    if nperseg < 2:
+        raise ValidationError(f"nperseg must be at least 2, got {nperseg}")
+    if not 0 <= noverlap < nperseg:
+        raise ValidationError(f"noverlap must be in [0, nperseg), got {noverlap}")
+    if detrend not in DETREND_MODES:
+        raise ValidationError(f"Unknown detrend mode: {detrend}")
+    if scaling not in SCALINGS:
+        raise ValidationError(f"Unknown scaling: {scaling}")
+    return nperseg - noverlap
+
+
+def _is_series(source: Any) -> bool:
+    """Arrays (ndarray, memmap) and ``LazyDataArray`` are one series; anything else is chunks."""
+    if hasattr(source, "ndim"):
+        return True
+    from platform_base.processing.lazy_loading import LazyDataArray
+    return isinstance(source, LazyDataArray)
+
+
+def _iter_segment_batches(
+    source: Any,
+    nperseg: int,
+    step: int,
+    batch: int = SEGMENT_BATCH,
+) -> Iterator[NDArray[np.float64]]:
+    """
+    Yield (k, nperseg) blocks of consecutive segments.
+
+    Series sources are read one batch range at a time; iterables of
+    chunks are buffered only up to the samples the next batch needs.
+    """
+    span = (batch - 1) * step + nperseg  # amostras cobertas por um lote
+
+    if _is_series(source):
+        n = len(source)
+        n_segments = 0 if n < nperseg else (n - nperseg) // step + 1
+        for first in range(0, n_segments, batch):
+            count = min(batch, n_segments - first)
+            start = first * step
+            stop = start + (count - 1) * step + nperseg
+            values = np.asarray(source[start:stop], dtype=np.float64)
+            yield np.lib.stride_tricks.sliding_window_view(values, nperseg)[::step][:count]
+        return
+
+    buffer = np.empty(0)
+    for chunk in source:
+        buffer = np.concatenate([buffer, np.asarray(chunk, dtype=np.float64).ravel()])
+        while len(buffer) >= span:
+            yield np.lib.stride_tricks.sliding_window_view(buffer[:span], nperseg)[::step]
+            buffer = buffer[batch * step:]
+    if len(buffer) >= nperseg:
+        yield np.lib.stride_tricks.sliding_window_view(buffer, nperseg)[::step]
+
+
+def _segment_power(
+    segments: NDArray[np.float64],
+    window: str | tuple,
+    detrend: Any,
+    scale: float,
+    workers: int,
+) -> NDArray[np.float64]:
+    """One-sided scaled power of each segment (rows)."""
+    nperseg = segments.shape[1]
+    if detrend == "constant":
+        segments = segments - segments.mean(axis=1, keepdims=True)
+    elif detrend == "linear":
+        segments = signal.detrend(segments, axis=1, type="linear")
+    spectrum = sp_fft.rfft(segments * get_window(window, nperseg), axis=1, workers=workers)
+    power = (spectrum.real ** 2 + spectrum.imag ** 2) * scale
+    # Bins positivos valem pelos negativos (exceto DC e Nyquist)
+    if nperseg % 2:
+        power[:, 1:] *= 2.0
+    else:
+        power[:, 1:-1] *= 2.0
+    return power
+
+
+def welch_psd(
+    source: Any,
+    fs: float,
+    nperseg: int = 256,
+    noverlap: int | None = None,
+    window: str | tuple = "hann",
+    detrend: Any = "constant",
+    scaling: str = "density",
+    max_workers: int | None = None,
+) -> WelchResult:
+    """
+    Welch power spectral density, accumulated segment by segment.
+
+    Args:
+        source: Series (ndarray, memmap, LazyDataArray) or iterable of chunks
+        fs: Sampling rate in Hz
+        nperseg: Segment length
+        noverlap: Overlap between segments (default nperseg // 2)
+        window: Window accepted by ``scipy.signal.get_window``
+        detrend: None, 'constant' or 'linear' (per segment)
+        scaling: 'density' (V²/Hz) or 'spectrum' (V²)
+        max_workers: FFT threads per batch (default ``DEFAULT_MAX_WORKERS``)
+
+    Returns:
+        WelchResult; segments containing NaN are left out of the average
+
+    Raises:
+        ValidationError: If parameters are invalid or no segment is complete
+    """
+    noverlap = nperseg // 2 if noverlap is None else noverlap
+    step = _check_params(fs, nperseg, noverlap, detrend, scaling)
+    scale = _segment_scale(window, nperseg, fs, scaling)
+    workers = max_workers or DEFAULT_MAX_WORKERS
+
+    total = np.zeros(nperseg // 2 + 1)
+    n_segments = 0
+    n_skipped = 0
+    for segments in _iter_segment_batches(source, nperseg, step):
+        valid = ~np.isnan(segments).any(axis=1)
+        n_skipped += int(np.count_nonzero(~valid))
+        if not valid.all():
+            segments = segments[valid]
+        if len(segments):
+            total += _segment_power(segments, window, detrend, scale, workers).sum(axis=0)
+            n_segments += len(segments)
+
+    if n_segments == 0:
+        raise ValidationError(f"No complete NaN-free segment of {nperseg} samples")
+
+    logger.debug("welch_psd_computed", nperseg=nperseg, n_segments=n_segments,
+                 n_skipped=n_skipped)
+
+    return WelchResult(
+        frequencies=sp_fft.rfftfreq(nperseg, d=1.0 / fs),
+        psd=total / n_segments,
+        n_segments=n_segments,
+        nperseg=nperseg,
+        sampling_rate=fs,
+    )
+
+
+def stft_spectrogram(
+    source: Any,
+    fs: float,
+    nperseg: int = 256,
+    noverlap: int | None = None,
+    window: str | tuple = "hann",
+    detrend: Any = "constant",
+    scaling: str = "density",
+    max_workers: int | None = None,
+) -> SpectrogramResult:
+    """
+    STFT power spectrogram, transformed in segment batches.
+
+    Memory beyond the (n_frequencies, n_segments) output is one batch of
+    segments. Segments containing NaN yield NaN columns.
+
+    Args:
+        source: Series (ndarray, memmap, LazyDataArray) or iterable of chunks
+        fs: Sampling rate in Hz
+        noverlap: Overlap between segments (default nperseg // 8)
+        nperseg, window, detrend, scaling, max_workers: as in ``welch_psd``
+
+    Returns:
+        SpectrogramResult
+
+    Raises:
+        ValidationError: If parameters are invalid or no segment is complete
+    """
+    noverlap = nperseg // 8 if noverlap is None else noverlap
+    step = _check_params(fs, nperseg, noverlap, detrend, scaling)
+    scale = _segment_scale(window, nperseg, fs, scaling)
+    workers = max_workers or DEFAULT_MAX_WORKERS
+
+    columns = [
+        _segment_power(segments, window, detrend, scale, workers).T
+        for segments in _iter_segment_batches(source, nperseg, step)
+    ]
+    if not columns:
+        raise ValidationError(f"Series shorter than one segment of {nperseg} samples")
+
+    power = np.concatenate(columns, axis=1)
+    times = (np.arange(power.shape[1]) * step + nperseg / 2) / fs
+
+    logger.debug("stft_spectrogram_computed", nperseg=nperseg, n_segments=power.shape[1])
+
+    return SpectrogramResult(
+        frequencies=sp_fft.rfftfreq(nperseg, d=1.0 / fs),
+        times=times,
+        power=power,
+        nperseg=nperseg,
+        sampling_rate=fs,
+    )
+
+
+def compute_fft(
+    values: NDArray[np.float64],
+    fs: float,
+    window: str | None = "hann",
+    detrend: bool = True,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    One-sided power spectrum of the whole (NaN-stripped) signal via rfft.
+
+    Returns:
+        (frequencies, power)
+    """
+    clean = np.asarray(values, dtype=np.float64)
+    clean = clean[~np.isnan(clean)]
+    if len(clean) < 2:
+        raise ValidationError("Not enough valid data points for FFT (need at least 2)")
+    if fs <= 0:
+        raise ValidationError(f"Sampling rate must be positive, got {fs}")
+    if detrend:
+        clean = signal.detrend(clean)
+    if window:
+        # Janela do tamanho do sinal inteiro: não vale a pena guardar no cache
+        clean = clean * signal.get_window(window, len(clean))
+    spectrum = sp_fft.rfft(clean)
+    return sp_fft.rfftfreq(len(clean), d=1.0 / fs), np.abs(spectrum) ** 2
@@ -7,11 +7,19 @@ import numpy as np
 from scipy.interpolate import CubicSpline, interp1d
 
 from platform_base.core.models import QualityMetrics, ResultMetadata, SyncResult
+from platform_base.processing.parallel import map_row_chunks
 from platform_base.profiling.decorators import performance_critical, profile
 from platform_base.utils.errors import InterpolationError
 from platform_base.utils.logging import get_logger
 
 
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
 logger = get_logger(__name__)
 
 SUPPORTED_SYNC_METHODS = {
@@ -199,6 +207,123 @@ def _compute_confidence(
     return float(np.clip(confidence, 0.0, 1.0))
 
 
+# Numba-compiled 2-state (position, velocity) Kalman filter and RTS smoother
+def _create_numba_kalman_functions():
+    """Create numba kernels for the constant-velocity Kalman filter/smoother."""
+    if not NUMBA_AVAILABLE:
+        logger.info("numba_kalman_not_available", message="Using KalmanFilter1D python loop")
+        return None, None
+
+    # Mesmas equações de KalmanFilter1D.predict/update escritas em escalares:
+    # P é guardado como (p00, p01, p10, p11), sem alocar matrizes por amostra
+    @numba.jit(nopython=True, cache=True, nogil=True)
+    def _kalman_forward_numba(
+        values: np.ndarray,
+        t: np.ndarray,
+        q: float,
+        r: float,
+        states: np.ndarray,
+        covs: np.ndarray,
+    ) -> None:
+        """Filtered states (n, 2) and covariances (n, 4) written in place."""
+        n = len(values)
+        x0 = values[0]
+        x1 = 0.0
+        p00, p01, p10, p11 = 1.0, 0.0, 0.0, 1.0
+        states[0, 0] = x0
+        states[0, 1] = x1
+        covs[0, 0], covs[0, 1], covs[0, 2], covs[0, 3] = p00, p01, p10, p11
+
+        for i in range(1, n):
+            dt = t[i] - t[i - 1]
+            if dt <= 0:
+                dt = 1e-6
+
+            # Predict: x = F x, P = F P F^T + Q
+            x0 = x0 + dt * x1
+            a00 = p00 + dt * p10
+            a01 = p01 + dt * p11
+            p00 = a00 + dt * a01 + q * dt**4 / 4
+            p01 = a01 + q * dt**3 / 2
+            p10 = p10 + dt * p11 + q * dt**3 / 2
+            p11 = p11 + q * dt**2
+
+            # Update: K = P H^T / S, x += K y, P = (I - K H) P
+            s = p00 + r
+            k0 = p00 / s
+            k1 = p10 / s
+            y = values[i] - x0
+            x0 = x0 + k0 * y
+            x1 = x1 + k1 * y
+            b00 = (1.0 - k0) * p00
+            b01 = (1.0 - k0) * p01
+            p10 = p10 - k1 * p00
+            p11 = p11 - k1 * p01
+            p00 = b00
+            p01 = b01
+
+            states[i, 0] = x0
+            states[i, 1] = x1
+            covs[i, 0], covs[i, 1], covs[i, 2], covs[i, 3] = p00, p01, p10, p11
+
+    # nogil: linhas rodam em paralelo nas threads de map_row_chunks
+    @numba.jit(nopython=True, cache=True, nogil=True)
+    def _kalman_rts_rows_numba(block: np.ndarray, t: np.ndarray, q: float, r: float) -> np.ndarray:
+        """RTS-smoothed position of each row (same equations as _kalman_smooth_series)."""
+        n_rows, n = block.shape
+        smoothed = np.empty((n_rows, n))
+        states = np.empty((n, 2))
+        covs = np.empty((n, 4))
+
+        for row in range(n_rows):
+            _kalman_forward_numba(block[row], t, q, r, states, covs)
+            xs0 = states[n - 1, 0]
+            xs1 = states[n - 1, 1]
+            smoothed[row, n - 1] = xs0
+
+            for i in range(n - 2, -1, -1):
+                dt = t[i + 1] - t[i]
+                if dt <= 0:
+                    dt = 1e-6
+                f00, f01, f10, f11 = covs[i, 0], covs[i, 1], covs[i, 2], covs[i, 3]
+
+                # Predição de i+1 recalculada a partir do estado filtrado em i
+                xp0 = states[i, 0] + dt * states[i, 1]
+                xp1 = states[i, 1]
+                a00 = f00 + dt * f10
+                a01 = f01 + dt * f11
+                pp00 = a00 + dt * a01 + q * dt**4 / 4
+                pp01 = a01 + q * dt**3 / 2
+                pp10 = f10 + dt * f11 + q * dt**3 / 2
+                pp11 = f11 + q * dt**2
+
+                # C = P_f F^T inv(P_pred)
+                det = pp00 * pp11 - pp01 * pp10
+                if det == 0.0:
+                    c00 = c01 = c10 = c11 = 0.0
+                else:
+                    m00 = f00 + dt * f01
+                    m10 = f10 + dt * f11
+                    c00 = (m00 * pp11 - f01 * pp10) / det
+                    c01 = (f01 * pp00 - m00 * pp01) / det
+                    c10 = (m10 * pp11 - f11 * pp10) / det
+                    c11 = (f11 * pp00 - m10 * pp01) / det
+
+                d0 = xs0 - xp0
+                d1 = xs1 - xp1
+                xs0 = states[i, 0] + c00 * d0 + c01 * d1
+                xs1 = states[i, 1] + c10 * d0 + c11 * d1
+                smoothed[row, i] = xs0
+
+        return smoothed
+
+    logger.info("numba_kalman_compiled", message="Numba Kalman kernels compiled successfully")
+    return _kalman_forward_numba, _kalman_rts_rows_numba
+
+
+_kalman_forward_numba, _kalman_rts_rows_numba = _create_numba_kalman_functions()
+
+
 class KalmanFilter1D:
     """
     1D Kalman filter for time series alignment and smoothing.
@@ -305,6 +430,17 @@ class KalmanFilter1D:
             Tuple of (filtered_values, velocities)
         """
         n = len(t)
+        if NUMBA_AVAILABLE and _kalman_forward_numba is not None and n > 0:
+            states = np.empty((n, 2))
+            covs = np.empty((n, 4))
+            _kalman_forward_numba(np.asarray(values, dtype=np.float64),
+                                  np.asarray(t, dtype=np.float64),
+                                  float(self.process_noise), float(self.measurement_noise),
+                                  states, covs)
+            self.x = states[-1].copy()
+            self.P = covs[-1].reshape(2, 2).copy()
+            return states[:, 0].copy(), states[:, 1].copy()
+
         filtered = np.zeros(n)
         velocities = np.zeros(n)
 
@@ -340,6 +476,13 @@ def _kalman_smooth_series(
 
     Uses forward-backward smoothing (RTS smoother) for optimal results.
     """
+    if NUMBA_AVAILABLE and _kalman_rts_rows_numba is not None and len(values) > 0:
+        return _kalman_rts_rows_numba(
+            np.asarray(values, dtype=np.float64)[None, :],
+            np.asarray(t, dtype=np.float64),
+            float(process_noise), float(measurement_noise),
+        )[0]
+
     kf = KalmanFilter1D(
         process_noise=process_noise,
         measurement_noise=measurement_noise,
@@ -395,6 +538,34 @@ def _kalman_smooth_series(
     return smoothed
 
 
+def _kalman_smooth_rows(
+    block: np.ndarray,
+    t: np.ndarray,
+    process_noise: float = 0.01,
+    measurement_noise: float = 0.1,
+    max_workers: int | None = None,
+) -> np.ndarray:
+    """
+    Kalman/RTS smoothing of every row of an ``(n_series, n_points)`` block.
+
+    Rows share the time axis ``t``; with numba the compiled kernel runs on
+    row chunks in parallel (see ``map_row_chunks``).
+    """
+    block = np.ascontiguousarray(block, dtype=np.float64)
+    t = np.ascontiguousarray(t, dtype=np.float64)
+    if block.shape[1] == 0:
+        return block.copy()
+
+    if NUMBA_AVAILABLE and _kalman_rts_rows_numba is not None:
+        q, r = float(process_noise), float(measurement_noise)
+        return map_row_chunks(lambda rows: _kalman_rts_rows_numba(rows, t, q, r),
+                              block, max_workers)
+
+    return np.stack([
+        _kalman_smooth_series(row, t, process_noise, measurement_noise) for row in block
+    ])
+
+
 @profile(target_name="synchronization_1m")
 @performance_critical(max_time_seconds=5.0, operation_name="synchronization")
 def synchronize(
@@ -420,6 +591,7 @@ def synchronize(
             - interp_method: Interpolation method ("linear", "cubic", "nearest")
             - process_noise: Kalman filter process noise (kalman_align only)
             - measurement_noise: Kalman measurement noise (kalman_align only)
+            - max_workers: Threads smoothing series in parallel (kalman_align only)
 
     Returns:
         SyncResult with synchronized series, alignment error, and confidence
@@ -471,20 +643,21 @@ def synchronize(
         process_noise = params.get("process_noise", 0.01)
         measurement_noise = params.get("measurement_noise", 0.1)
 
-        for key, series in series_dict.items():
-            t_series = t_dict[key]
+        # First interpolate every series to the common grid
+        block = np.stack([
+            _interpolate_to_grid(t_dict[key], series, t_common, interp_method)
+            for key, series in series_dict.items()
+        ])
 
-            # First interpolate to common grid
-            interpolated = _interpolate_to_grid(t_series, series, t_common, interp_method)
-
-            # Then apply Kalman smoothing
-            smoothed = _kalman_smooth_series(
-                interpolated,
-                t_common,
-                process_noise=process_noise,
-                measurement_noise=measurement_noise,
-            )
-            synced_series[key] = smoothed
+        # Then smooth all series at once (rows in parallel)
+        smoothed = _kalman_smooth_rows(
+            block,
+            t_common,
+            process_noise=process_noise,
+            measurement_noise=measurement_noise,
+            max_workers=params.get("max_workers"),
+        )
+        synced_series = dict(zip(series_dict, smoothed, strict=True))
 
     # Compute quality metrics
     alignment_error = _compute_alignment_error(
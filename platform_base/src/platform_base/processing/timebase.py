@@ -3,12 +3,31 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import numpy as np
+import pandas as pd
 
 
 if TYPE_CHECKING:
     from datetime import datetime
 
 
+# Formatos comuns de timestamp (mais específicos primeiro)
+TIMESTAMP_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",      # 2025-08-10 00:00:00
+    "%Y-%m-%d %H:%M:%S.%f",   # 2025-08-10 00:00:00.123456
+    "%Y-%m-%dT%H:%M:%S",      # ISO format
+    "%Y-%m-%dT%H:%M:%S.%f",   # ISO with microseconds
+    "%Y-%m-%d",               # Date only
+    "%d/%m/%Y %H:%M:%S",      # Brazilian format
+    "%d/%m/%Y",               # Brazilian date only
+    "%m/%d/%Y %H:%M:%S",      # US format
+    "%m/%d/%Y",               # US date only
+)
+
+# Fração máxima de NaT aceita ao aplicar o formato detectado com coerção;
+# acima disso o formato é considerado errado e os demais são testados.
+_MAX_COERCED_FRACTION = 0.5
+
+
 def to_seconds(t_datetime: np.ndarray) -> np.ndarray:
     if len(t_datetime) == 0:
         return np.array([], dtype=float)
@@ -24,3 +43,55 @@ def to_seconds(t_datetime: np.ndarray) -> np.ndarray:
 def to_datetime(t_seconds: np.ndarray, origin: datetime) -> np.ndarray:
     origin64 = np.datetime64(origin)
     return origin64 + t_seconds.astype("timedelta64[s]")
+
+
+def detect_timestamp_format(data: pd.Series | pd.Index, sample_size: int = 1000) -> str | None:
+    """
+    Detecta o formato de timestamp numa amostra da coluna.
+
+    Returns:
+        Formato ``strptime`` compatível com toda a amostra, ou None se nenhum
+        dos ``TIMESTAMP_FORMATS`` servir.
+    """
+    sample = pd.Series(data[:sample_size]).dropna()
+    if sample.empty:
+        return None
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            pd.to_datetime(sample, format=fmt, errors="raise")
+        except (ValueError, TypeError):
+            continue
+        return fmt
+    return None
+
+
+def parse_timestamps(data: pd.Series | pd.Index, fmt: str | None = None) -> pd.DatetimeIndex:
+    """
+    Converte timestamps aplicando um único formato sobre a coluna inteira.
+
+    O formato é detectado numa amostra (ou informado em ``fmt``) e aplicado uma
+    só vez. Valores que não casam com ele (ex.: células em branco) viram NaT;
+    os demais formatos e a inferência do pandas só são tentados se a maior
+    parte da coluna não casar com o formato detectado.
+    """
+    if pd.api.types.is_datetime64_any_dtype(data):
+        return pd.DatetimeIndex(data)
+
+    fmt = fmt or detect_timestamp_format(data)
+    if fmt:
+        try:
+            return pd.DatetimeIndex(pd.to_datetime(data, format=fmt, errors="raise"))
+        except (ValueError, TypeError):
+            parsed = pd.DatetimeIndex(pd.to_datetime(data, format=fmt, errors="coerce"))
+        if len(parsed) == 0 or parsed.isna().mean() <= _MAX_COERCED_FRACTION:
+            return parsed
+
+    for candidate in TIMESTAMP_FORMATS:
+        if candidate == fmt:
+            continue
+        try:
+            return pd.DatetimeIndex(pd.to_datetime(data, format=candidate, errors="raise"))
+        except (ValueError, TypeError):
+            continue
+
+    return pd.DatetimeIndex(pd.to_datetime(data, errors="coerce"))
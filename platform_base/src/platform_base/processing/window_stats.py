@@ -0,0 +1,472 @@
+"""
+Window statistics engine - tumbling and rolling statistics for series blocks
+
+Computes every requested statistic for every series of a
+``(n_series, n_points)`` block in one vectorized pass, ignoring NaN:
+
+- Tumbling windows: the block is reshaped to (n_series, n_windows, window);
+  sums/counts are shared by mean/var/std, and one sort along the window
+  axis serves median and every quantile.
+- Rolling (trailing) windows: mean/var/sum from cumulative sums restarted
+  every ``window`` samples around a per-block anchor (limits cancellation
+  on drifting series), min/max with the van
+  Herk/Gil-Werman block prefix/suffix scan (O(n) in the window size), and
+  median/quantiles from a sorted window updated by binary insert/delete
+  (numba, optional).
+
+Statistic names: count, sum, mean, var, std, min, max, range, median and
+``q<percent>`` quantiles (e.g. ``q25``, ``q99.5``).
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from platform_base.processing.parallel import as_row_block, map_row_chunks
+from platform_base.utils.errors import ValidationError
+from platform_base.utils.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+
+logger = get_logger(__name__)
+
+WINDOW_STATISTICS = ("count", "sum", "mean", "var", "std", "min", "max", "range", "median")
+
+DEFAULT_STATISTICS = ("mean", "std", "min", "max")
+
+
+def _quantile_of(name: str) -> float | None:
+    """Quantile in [0, 1] for 'median'/'q<percent>' names (None otherwise)."""
+    if name == "median":
+        return 0.5
+    if name.startswith("q"):
+        try:
+            percent = float(name[1:])
+        except ValueError:
+            return None
+        if 0.0 <= percent <= 100.0:
+            return percent / 100.0
+    return None
+
+
+def _check_statistics(statistics: Sequence[str]) -> list[str]:
+    names = list(statistics)
+    unknown = [name for name in names
+               if name not in WINDOW_STATISTICS and _quantile_of(name) is None]
+    if unknown:
+        raise ValidationError("Unknown window statistics",
+                              {"unknown": unknown, "supported": list(WINDOW_STATISTICS) + ["q<percent>"]})
+    return names
+
+
+def _as_block(values: NDArray[np.float64]) -> tuple[np.ndarray, bool]:
+    """(n_series, n_points) view of 1-D or 2-D input; flag says whether it was 1-D."""
+    array = np.asarray(values, dtype=np.float64)
+    if array.ndim == 1:
+        return np.ascontiguousarray(array).reshape(1, -1), True
+    return as_row_block(array), False
+
+
+def _sorted_quantiles(
+    ordered: np.ndarray,
+    counts: np.ndarray,
+    quantiles: list[float],
+) -> list[np.ndarray]:
+    """Linear-interpolated quantiles of windows sorted along the last axis (NaN last)."""
+    results = []
+    last = np.maximum(counts - 1, 0)
+    for q in quantiles:
+        position = last * q
+        below = np.floor(position).astype(np.int64)
+        above = np.minimum(below + 1, last)
+        low = np.take_along_axis(ordered, below[..., None], axis=-1)[..., 0]
+        high = np.take_along_axis(ordered, above[..., None], axis=-1)[..., 0]
+        value = low + (high - low) * (position - below)
+        results.append(np.where(counts > 0, value, np.nan))
+    return results
+
+
+# ============================================================================
+# Tumbling windows
+# ============================================================================
+
+def tumbling_stats(
+    values: NDArray[np.float64],
+    window: int,
+    statistics: Sequence[str] = DEFAULT_STATISTICS,
+    ddof: int = 0,
+) -> dict[str, NDArray[np.float64]]:
+    """
+    Statistics of consecutive non-overlapping windows (trailing partial window dropped).
+
+    Args:
+        values: (n_points,) series or (n_series, n_points) block
+        window: Window length in samples
+        statistics: Names to compute (see module docstring)
+        ddof: Delta degrees of freedom for var/std
+
+    Returns:
+        Mapping name -> (n_series, n_windows) array ((n_windows,) for 1-D input);
+        windows without valid samples give NaN (count 0)
+    """
+    names = _check_statistics(statistics)
+    block, squeeze = _as_block(values)
+    if window < 1:
+        raise ValidationError("Window must be >= 1", {"window": window})
+
+    n_series, n_points = block.shape
+    n_windows = n_points // window
+    windows = block[:, :n_windows * window].reshape(n_series, n_windows, window)
+    result = _window_axis_stats(windows, names, ddof)
+
+    logger.debug("tumbling_stats_computed", n_series=n_series, n_windows=n_windows,
+                 statistics=names)
+    return {name: (array[0] if squeeze else array) for name, array in result.items()}
+
+
+def describe(
+    values: NDArray[np.float64],
+    statistics: Sequence[str] = ("min", "max", "mean", "std", "median"),
+    ddof: int = 0,
+) -> dict[str, float]:
+    """
+    NaN-aware summary statistics of a whole series (one window).
+
+    NaN are dropped once (only if present) and the rest are plain numpy
+    reductions; median/quantiles share one partition-based ``np.quantile``.
+    """
+    names = _check_statistics(statistics)
+    data = np.asarray(values, dtype=np.float64).ravel()
+    if data.size and np.isnan(data.min()):  # min propaga NaN sem alocar máscara
+        data = data[~np.isnan(data)]
+    count = data.size
+    nan = float("nan")
+
+    result: dict[str, float] = {"count": float(count)}
+    if count:
+        if {"sum", "mean"} & set(names):
+            result["sum"] = float(data.sum())
+            result["mean"] = result["sum"] / count
+        if {"var", "std"} & set(names):
+            result["var"] = float(data.var(ddof=ddof)) if count > ddof else nan
+            result["std"] = float(np.sqrt(result["var"]))
+        if {"min", "range"} & set(names):
+            result["min"] = float(data.min())
+        if {"max", "range"} & set(names):
+            result["max"] = float(data.max())
+        if "range" in names:
+            result["range"] = result["max"] - result["min"]
+        quantile_names = [name for name in names if _quantile_of(name) is not None]
+        if quantile_names:
+            quantiles = np.quantile(data, [_quantile_of(name) for name in quantile_names])
+            result.update(zip(quantile_names, map(float, quantiles), strict=True))
+    return {name: result.get(name, nan) for name in names}
+
+
+def _window_axis_stats(windows: np.ndarray, names: list[str], ddof: int) -> dict[str, np.ndarray]:
+    """All statistics along the last axis, sharing counts/sums/sort."""
+    valid = ~np.isnan(windows)
+    counts = valid.sum(axis=-1)
+    empty = counts == 0
+    result: dict[str, np.ndarray] = {}
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if {"sum", "mean", "var", "std"} & set(names):
+            zeroed = np.where(valid, windows, 0.0)
+            sums = zeroed.sum(axis=-1)
+            means = np.where(empty, np.nan, sums / counts)
+            if {"var", "std"} & set(names):
+                centered = np.where(valid, windows - means[..., None], 0.0)
+                dof = counts - ddof
+                var = np.where(dof > 0, (centered * centered).sum(axis=-1) / dof, np.nan)
+        if {"min", "range"} & set(names):
+            minimum = np.where(empty, np.nan, np.where(valid, windows, np.inf).min(axis=-1))
+        if {"max", "range"} & set(names):
+            maximum = np.where(empty, np.nan, np.where(valid, windows, -np.inf).max(axis=-1))
+
+    quantile_names = [name for name in names if _quantile_of(name) is not None]
+    if quantile_names:
+        ordered = np.sort(windows, axis=-1)
+        quantiles = _sorted_quantiles(ordered, counts, [_quantile_of(name) for name in quantile_names])
+        result.update(zip(quantile_names, quantiles, strict=True))
+
+    for name in names:
+        if name == "count":
+            result[name] = counts.astype(np.float64)
+        elif name == "sum":
+            result[name] = np.where(empty, np.nan, sums)
+        elif name == "mean":
+            result[name] = means
+        elif name == "var":
+            result[name] = var
+        elif name == "std":
+            result[name] = np.sqrt(var)
+        elif name == "min":
+            result[name] = minimum
+        elif name == "max":
+            result[name] = maximum
+        elif name == "range":
+            result[name] = maximum - minimum
+    return {name: result[name] for name in names}
+
+
+# ============================================================================
+# Rolling windows
+# ============================================================================
+
+def _rolling_sums(block: np.ndarray, window: int) -> tuple[np.ndarray, ...]:
+    """
+    Trailing-window count, sum and sum of squares, shifted by a local anchor.
+
+    The series is cut into blocks of ``window`` samples, each with its own
+    anchor (the block mean; empty blocks inherit the previous one) and
+    cumulative sums restarting at the block start. A window ending in block
+    ``b`` is the head of ``b`` plus the tail of ``b - 1`` re-based to the
+    anchor of ``b``, so cancellation is bounded by the local spread, not by
+    the drift of the whole series. Returns the per-sample anchor as ``shift``.
+    """
+    n_series, n_points = block.shape
+    n_blocks = -(-n_points // window)
+    padded = np.full((n_series, n_blocks * window), np.nan)
+    padded[:, :n_points] = block
+    blocks = padded.reshape(n_series, n_blocks, window)
+
+    valid = ~np.isnan(blocks)
+    block_counts = valid.sum(axis=2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        anchors = np.where(valid, blocks, 0.0).sum(axis=2) / block_counts
+    # Blocos vazios herdam a âncora anterior (os primeiros, a próxima válida)
+    has_anchor = block_counts > 0
+    last = np.maximum.accumulate(np.where(has_anchor, np.arange(n_blocks), -1), axis=1)
+    first = np.argmax(has_anchor, axis=1)[:, None]
+    anchors = np.take_along_axis(anchors, np.where(last < 0, first, last), axis=1)
+    anchors = np.where(np.isnan(anchors), 0.0, anchors)
+
+    shifted = np.where(valid, blocks - anchors[..., None], 0.0)
+    head_n = np.cumsum(valid, axis=2, dtype=np.float64)
+    head_1 = np.cumsum(shifted, axis=2)
+    head_2 = np.cumsum(shifted * shifted, axis=2)
+
+    # Cauda do bloco anterior: posições k+1..window-1 de b-1 (zero para b = 0)
+    def tail(head: np.ndarray) -> np.ndarray:
+        out = np.zeros_like(head)
+        out[:, 1:] = head[:, :-1, -1:] - head[:, :-1]
+        return out
+
+    tail_n, tail_1, tail_2 = tail(head_n), tail(head_1), tail(head_2)
+    delta = np.zeros_like(anchors)
+    delta[:, 1:] = anchors[:, :-1] - anchors[:, 1:]
+    delta = delta[..., None]
+
+    counts = head_n + tail_n
+    sums = head_1 + tail_1 + tail_n * delta
+    squares = head_2 + tail_2 + 2.0 * delta * tail_1 + tail_n * delta * delta
+    shift = np.broadcast_to(anchors[..., None], blocks.shape)
+
+    def unpad(values: np.ndarray) -> np.ndarray:
+        return values.reshape(n_series, -1)[:, :n_points]
+
+    return unpad(counts), unpad(sums), unpad(squares), unpad(shift)
+
+
+def _rolling_extreme(block: np.ndarray, window: int, maximum: bool) -> np.ndarray:
+    """Trailing-window max (or min) by block prefix/suffix scans (van Herk/Gil-Werman)."""
+    fill = -np.inf if maximum else np.inf
+    reduce = np.maximum if maximum else np.minimum
+    n_series, n_points = block.shape
+    values = np.where(np.isnan(block), fill, block)
+
+    # Janelas iniciais parciais: preenche à esquerda com o elemento neutro
+    total = n_points + window - 1
+    n_blocks = -(-total // window)
+    padded = np.full((n_series, n_blocks * window), fill)
+    padded[:, window - 1:total] = values
+    blocks = padded.reshape(n_series, n_blocks, window)
+    prefix = reduce.accumulate(blocks, axis=2).reshape(n_series, -1)
+    suffix = reduce.accumulate(blocks[:, :, ::-1], axis=2)[:, :, ::-1].reshape(n_series, -1)
+
+    # Janela que termina em i (no array com padding) começa em i - window + 1
+    ends = np.arange(window - 1, total)
+    result = reduce(suffix[:, ends - window + 1], prefix[:, ends])
+    result[np.isinf(result)] = np.nan
+    return result
+
+
+def _create_numba_rolling_functions():
+    """Create numba kernel for sorted-window rolling quantiles."""
+    if not NUMBA_AVAILABLE:
+        logger.info("numba_rolling_not_available", message="Using bisect rolling quantiles")
+        return None
+
+    @numba.jit(nopython=True, cache=True, nogil=True)
+    def _rolling_quantiles_numba(
+        block: np.ndarray,
+        window: int,
+        quantiles: np.ndarray,
+        min_periods: int,
+    ) -> np.ndarray:
+        n_series, n_points = block.shape
+        n_q = quantiles.shape[0]
+        out = np.full((n_series, n_q, n_points), np.nan)
+        buffer = np.empty(window)
+
+        for row in range(n_series):
+            size = 0
+            for i in range(n_points):
+                value = block[row, i]
+                old = block[row, i - window] if i >= window else np.nan
+                # Posição do valor que sai (buffer ordenado, sem NaN)
+                out_pos = -1
+                if not np.isnan(old):
+                    out_pos = np.searchsorted(buffer[:size], old)
+                if np.isnan(value):
+                    if out_pos >= 0:
+                        for j in range(out_pos, size - 1):
+                            buffer[j] = buffer[j + 1]
+                        size -= 1
+                else:
+                    if out_pos < 0:
+                        out_pos = size
+                        size += 1
+                    # Desloca só o trecho entre a saída e o ponto de inserção
+                    j = out_pos
+                    while j > 0 and buffer[j - 1] > value:
+                        buffer[j] = buffer[j - 1]
+                        j -= 1
+                    while j < size - 1 and buffer[j + 1] < value:
+                        buffer[j] = buffer[j + 1]
+                        j += 1
+                    buffer[j] = value
+                if size >= min_periods and size > 0:
+                    for k in range(n_q):
+                        position = (size - 1) * quantiles[k]
+                        below = int(math.floor(position))
+                        above = min(below + 1, size - 1)
+                        out[row, k, i] = (buffer[below]
+                                          + (buffer[above] - buffer[below]) * (position - below))
+        return out
+
+    logger.info("numba_rolling_compiled", message="Numba rolling quantile kernel compiled")
+    return _rolling_quantiles_numba
+
+
+_rolling_quantiles_numba = _create_numba_rolling_functions()
+
+
+def _rolling_quantiles_python(
+    block: np.ndarray,
+    window: int,
+    quantiles: np.ndarray,
+    min_periods: int,
+) -> np.ndarray:
+    """Bisect fallback of the sorted-window kernel."""
+    n_series, n_points = block.shape
+    out = np.full((n_series, len(quantiles), n_points), np.nan)
+    for row in range(n_series):
+        ordered: list[float] = []
+        values = block[row]
+        for i in range(n_points):
+            if not math.isnan(values[i]):
+                bisect.insort(ordered, values[i])
+            if i >= window and not math.isnan(values[i - window]):
+                del ordered[bisect.bisect_left(ordered, values[i - window])]
+            size = len(ordered)
+            if size >= min_periods and size > 0:
+                for k, q in enumerate(quantiles):
+                    position = (size - 1) * q
+                    below = int(position)
+                    above = min(below + 1, size - 1)
+                    out[row, k, i] = ordered[below] + (ordered[above] - ordered[below]) * (position - below)
+    return out
+
+
+def rolling_stats(
+    values: NDArray[np.float64],
+    window: int,
+    statistics: Sequence[str] = DEFAULT_STATISTICS,
+    min_periods: int | None = None,
+    ddof: int = 0,
+    max_workers: int | None = None,
+) -> dict[str, NDArray[np.float64]]:
+    """
+    Trailing rolling-window statistics (window ending at each sample).
+
+    Args:
+        values: (n_points,) series or (n_series, n_points) block
+        window: Window length in samples
+        statistics: Names to compute (see module docstring)
+        min_periods: Valid samples a window needs (default ``window``);
+            below it the output is NaN
+        ddof: Delta degrees of freedom for var/std
+        max_workers: Threads for the quantile kernel (rows split)
+
+    Returns:
+        Mapping name -> array shaped like ``values``
+    """
+    names = _check_statistics(statistics)
+    block, squeeze = _as_block(values)
+    if window < 1:
+        raise ValidationError("Window must be >= 1", {"window": window})
+    min_periods = window if min_periods is None else max(int(min_periods), 1)
+
+    result: dict[str, np.ndarray] = {}
+    counts = None
+    if {"count", "sum", "mean", "var", "std"} & set(names):
+        counts, sums, squares, shift = _rolling_sums(block, window)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+            dof = counts - ddof
+            # Soma de quadrados em torno da média da janela (pode sair ~-eps)
+            var = np.where(dof > 0, np.maximum(squares - sums * means, 0.0) / dof, np.nan)
+        result["count"] = counts
+        result["sum"] = sums + shift * counts
+        result["mean"] = means + shift
+        result["var"] = var
+        result["std"] = np.sqrt(var)
+    if {"max", "range"} & set(names):
+        result["max"] = _rolling_extreme(block, window, maximum=True)
+    if {"min", "range"} & set(names):
+        result["min"] = _rolling_extreme(block, window, maximum=False)
+    if "range" in names:
+        result["range"] = result["max"] - result["min"]
+
+    quantile_names = [name for name in names if _quantile_of(name) is not None]
+    if quantile_names:
+        quantiles = np.array([_quantile_of(name) for name in quantile_names])
+        if _rolling_quantiles_numba is not None:
+            kernel = lambda rows: _rolling_quantiles_numba(rows, window, quantiles, min_periods)  # noqa: E731
+            stacked = map_row_chunks(kernel, block, max_workers)
+        else:
+            stacked = _rolling_quantiles_python(block, window, quantiles, min_periods)
+        for k, name in enumerate(quantile_names):
+            result[name] = stacked[:, k, :]
+
+    if counts is None:
+        counts = _rolling_sums(block, window)[0]
+    insufficient = counts < min_periods
+    output = {}
+    for name in names:
+        array = result[name]
+        if name != "count":
+            array = np.where(insufficient, np.nan, array)
+        output[name] = array[0] if squeeze else array
+
+    logger.debug("rolling_stats_computed", n_series=block.shape[0], n_points=block.shape[1],
+                 window=window, statistics=names)
+    return output
@@ -13,7 +13,7 @@ from dash.exceptions import PreventUpdate
 
 from platform_base.core.models import TimeWindow, ViewData
 from platform_base.io.loader import load
-from platform_base.processing.calculus import derivative, integral
+from platform_base.processing.calculus import derivative_batch, integral_batch
 from platform_base.processing.interpolation import interpolate
 from platform_base.processing.synchronization import synchronize
 from platform_base.ui.export import export_selection, export_session
@@ -279,24 +279,23 @@ def register_callbacks(app, app_state):
                     logger.warning("sync_failed", method=sync_method, error=str(e))
 
             # Apply calculus operations if requested
-            if calc_operation and calc_operation != "none":
-                processed_data = {}
-                for name, values in series_data.items():
-                    try:
-                        if calc_operation.startswith("derivative_"):
-                            order = int(calc_operation.split("_")[1])
-                            result = derivative(values, t_filtered, order, calc_method, {})
-                            processed_data[f"{name}_d{order}"] = result.values
-                        elif calc_operation == "integral":
-                            result = integral(values, t_filtered, "trapezoid", {})
-                            processed_data[f"{name}_int"] = result.values
-                    except Exception as e:
-                        logger.warning("calculus_failed",
-                                      operation=calc_operation, error=str(e))
-                        processed_data[name] = values
-
-                if processed_data:
-                    series_data = processed_data
+            if calc_operation and calc_operation != "none" and series_data:
+                # Todas as séries compartilham t_filtered: um único cálculo em lote
+                names = list(series_data)
+                block = np.vstack([series_data[name] for name in names])
+                try:
+                    if calc_operation.startswith("derivative_"):
+                        order = int(calc_operation.split("_")[1])
+                        result = derivative_batch(block, t_filtered, order, calc_method, {})
+                        series_data = {f"{name}_d{order}": row
+                                       for name, row in zip(names, result.values, strict=True)}
+                    elif calc_operation == "integral":
+                        result = integral_batch(block, t_filtered, "trapezoid", {})
+                        series_data = {f"{name}_int": np.atleast_1d(area)
+                                       for name, area in zip(names, result.values, strict=True)}
+                except Exception as e:
+                    logger.warning("calculus_failed",
+                                  operation=calc_operation, error=str(e))
 
             # Create figure
             return _create_timeseries_figure(
@@ -28,6 +28,12 @@ from typing import TYPE_CHECKING, Any
 import numpy as np
 from PyQt6.QtCore import QMutex, QObject, pyqtSignal
 
+from platform_base.caching.tiered import TieredCache, array_fingerprint
+from platform_base.core.memory_manager import get_memory_manager
+from platform_base.core.models import is_non_decreasing
+from platform_base.processing.decimation import decimate as engine_decimate
+from platform_base.processing.decimation import decimate_indices
+from platform_base.processing.pyramid import MinMaxPyramid
 from platform_base.utils.logging import get_logger
 
 
@@ -46,6 +52,17 @@ class DecimationMethod(Enum):
     RANDOM = auto()      # Amostragem aleatória
     EVERY_NTH = auto()   # Pega cada N pontos
     AVERAGE = auto()     # Média por bucket
+    M4 = auto()          # Primeiro, min, max e último por bucket
+    PEAK_AWARE = auto()  # LTTB que mantém picos acima de 3 sigma
+
+
+# Métodos executados pelo engine compilado de processing.decimation
+_ENGINE_METHODS = {
+    DecimationMethod.MINMAX: "minmax",
+    DecimationMethod.LTTB: "lttb",
+    DecimationMethod.M4: "m4",
+    DecimationMethod.PEAK_AWARE: "peak_aware",
+}
 
 
 @dataclass
@@ -65,9 +82,9 @@ class PerformanceConfig:
     # Método padrão
     decimation_method: DecimationMethod = DecimationMethod.MINMAX
 
-    # Cache
+    # Cache (limite em MB; encolhe sob pressão de memória)
     cache_enabled: bool = True
-    cache_size: int = 100
+    cache_max_mb: float = 64.0
 
     # Streaming
     chunk_size: int = 100_000
@@ -103,8 +120,11 @@ class DataDecimator:
             config: Configuração de performance
         """
         self._config = config or PerformanceConfig()
-        self._cache: dict[int, tuple[np.ndarray, np.ndarray]] = {}
-        self._mutex = QMutex()
+        self._cache = TieredCache(
+            max_memory_bytes=int(self._config.cache_max_mb * 1024 * 1024),
+            memory_manager=get_memory_manager(),
+            name="decimation",
+        )
 
     def decimate(
         self,
@@ -133,19 +153,23 @@ class DataDecimator:
         if n_points <= target:
             return x_data, y_data
 
-        # Verifica cache
-        cache_key = hash((y_data.tobytes()[:1000], target, method.value))
-        if self._config.cache_enabled and cache_key in self._cache:
-            logger.debug(f"decimation_cache_hit: key={cache_key}")
-            return self._cache[cache_key]
+        # Verifica cache (sem chave para arrays graváveis grandes: recalcular é mais barato)
+        cache_key = None
+        if self._config.cache_enabled:
+            fingerprint = array_fingerprint(x_data, y_data)
+            if fingerprint is not None:
+                cache_key = f"{fingerprint}:{target}:{method.name}"
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"decimation_cache_hit: key={cache_key}")
+                return cached
 
         # Executa decimação
         start_time = time.perf_counter()
 
-        if method == DecimationMethod.MINMAX:
-            result = self._decimate_minmax(x_data, y_data, target)
-        elif method == DecimationMethod.LTTB:
-            result = self._decimate_lttb(x_data, y_data, target)
+        if method in _ENGINE_METHODS:
+            result = engine_decimate(x_data, y_data, target, _ENGINE_METHODS[method])
         elif method == DecimationMethod.RANDOM:
             result = self._decimate_random(x_data, y_data, target)
         elif method == DecimationMethod.EVERY_NTH:
@@ -153,7 +177,7 @@ class DataDecimator:
         elif method == DecimationMethod.AVERAGE:
             result = self._decimate_average(x_data, y_data, target)
         else:
-            result = self._decimate_minmax(x_data, y_data, target)
+            result = engine_decimate(x_data, y_data, target, "minmax")
 
         elapsed = time.perf_counter() - start_time
         logger.info(
@@ -162,134 +186,12 @@ class DataDecimator:
             f"time={elapsed*1000:.1f}ms",
         )
 
-        # Armazena no cache
-        if self._config.cache_enabled:
-            self._mutex.lock()
-            try:
-                # Limita tamanho do cache
-                if len(self._cache) >= self._config.cache_size:
-                    # Remove entradas mais antigas
-                    oldest_keys = list(self._cache.keys())[:10]
-                    for k in oldest_keys:
-                        del self._cache[k]
-                self._cache[cache_key] = result
-            finally:
-                self._mutex.unlock()
+        # Armazena no cache (LRU por bytes, thread-safe)
+        if cache_key is not None:
+            self._cache.set(cache_key, result)
 
         return result
 
-    def _decimate_minmax(
-        self,
-        x_data: np.ndarray,
-        y_data: np.ndarray,
-        target_points: int,
-    ) -> tuple[np.ndarray, np.ndarray]:
-        """
-        Decimação Min/Max - preserva picos e vales
-
-        Para cada bucket, mantém min e max, preservando
-        características visuais importantes.
-        """
-        n_points = len(y_data)
-        n_buckets = target_points // 2  # 2 pontos por bucket
-        bucket_size = n_points / n_buckets
-
-        x_out = []
-        y_out = []
-
-        for i in range(n_buckets):
-            start = int(i * bucket_size)
-            end = int((i + 1) * bucket_size)
-
-            if start >= end:
-                continue
-
-            bucket_y = y_data[start:end]
-            bucket_x = x_data[start:end]
-
-            # Encontra índices de min e max
-            min_idx = np.argmin(bucket_y)
-            max_idx = np.argmax(bucket_y)
-
-            # Ordena por posição X para manter a ordem temporal
-            if min_idx < max_idx:
-                x_out.extend([bucket_x[min_idx], bucket_x[max_idx]])
-                y_out.extend([bucket_y[min_idx], bucket_y[max_idx]])
-            else:
-                x_out.extend([bucket_x[max_idx], bucket_x[min_idx]])
-                y_out.extend([bucket_y[max_idx], bucket_y[min_idx]])
-
-        return np.array(x_out), np.array(y_out)
-
-    def _decimate_lttb(
-        self,
-        x_data: np.ndarray,
-        y_data: np.ndarray,
-        target_points: int,
-    ) -> tuple[np.ndarray, np.ndarray]:
-        """
-        Largest Triangle Three Buckets (LTTB)
-
-        Algoritmo perceptualmente eficiente que preserva
-        a forma visual dos dados selecionando pontos
-        que maximizam a área de triângulos.
-        """
-        n_points = len(y_data)
-
-        if target_points >= n_points:
-            return x_data, y_data
-
-        # Sempre inclui primeiro e último ponto
-        bucket_size = (n_points - 2) / (target_points - 2)
-
-        x_out = [x_data[0]]
-        y_out = [y_data[0]]
-
-
-        for i in range(target_points - 2):
-            # Bucket atual
-            bucket_start = int((i + 0) * bucket_size) + 1
-            bucket_end = int((i + 1) * bucket_size) + 1
-
-            # Próximo bucket para calcular média
-            next_bucket_start = int((i + 1) * bucket_size) + 1
-            next_bucket_end = int((i + 2) * bucket_size) + 1
-            next_bucket_end = min(next_bucket_end, n_points)
-
-            # Média do próximo bucket
-            if next_bucket_end > next_bucket_start:
-                avg_x = np.mean(x_data[next_bucket_start:next_bucket_end])
-                avg_y = np.mean(y_data[next_bucket_start:next_bucket_end])
-            else:
-                avg_x = x_data[-1]
-                avg_y = y_data[-1]
-
-            # Encontra ponto no bucket atual que maximiza área do triângulo
-            max_area = -1
-            max_idx = bucket_start
-
-            prev_x = x_out[-1]
-            prev_y = y_out[-1]
-
-            for j in range(bucket_start, min(bucket_end, n_points)):
-                # Área do triângulo (fórmula simplificada)
-                area = abs(
-                    (prev_x - avg_x) * (y_data[j] - prev_y) -
-                    (prev_x - x_data[j]) * (avg_y - prev_y),
-                )
-                if area > max_area:
-                    max_area = area
-                    max_idx = j
-
-            x_out.append(x_data[max_idx])
-            y_out.append(y_data[max_idx])
-
-        # Adiciona último ponto
-        x_out.append(x_data[-1])
-        y_out.append(y_data[-1])
-
-        return np.array(x_out), np.array(y_out)
-
     def _decimate_random(
         self,
         x_data: np.ndarray,
@@ -352,11 +254,7 @@ class DataDecimator:
 
     def clear_cache(self):
         """Limpa o cache de decimação"""
-        self._mutex.lock()
-        try:
-            self._cache.clear()
-        finally:
-            self._mutex.unlock()
+        self._cache.clear()
         gc.collect()
 
 
@@ -365,7 +263,9 @@ class LODManager:
     Level of Detail (LOD) Manager
 
     Gerencia diferentes níveis de detalhe para
-    zoom adaptativo.
+    zoom adaptativo. As consultas por view são respondidas pela pirâmide
+    min/max da série (``processing.pyramid``) em O(pixels), sem varrer o
+    eixo X a cada zoom/pan.
     """
 
     def __init__(
@@ -373,6 +273,7 @@ class LODManager:
         x_data: np.ndarray,
         y_data: np.ndarray,
         config: PerformanceConfig | None = None,
+        pyramid: MinMaxPyramid | None = None,
     ):
         """
         Inicializa o gerenciador de LOD
@@ -381,11 +282,13 @@ class LODManager:
             x_data: Dados originais do eixo X
             y_data: Dados originais do eixo Y
             config: Configuração de performance
+            pyramid: Pirâmide já construída para ``y_data`` (ex.: do DatasetStore)
         """
         self._x_data = x_data
         self._y_data = y_data
         self._config = config or PerformanceConfig()
-        self._decimator = DataDecimator(self._config)
+        self._pyramid = pyramid if pyramid is not None else MinMaxPyramid(y_data)
+        self._x_sorted = is_non_decreasing(x_data)
         self._lod_cache: dict[int, tuple[np.ndarray, np.ndarray]] = {}
         self._mutex = QMutex()
 
@@ -393,7 +296,7 @@ class LODManager:
         self._precompute_lods()
 
     def _precompute_lods(self):
-        """Pré-computa níveis de LOD"""
+        """Pré-computa níveis de LOD (visões gerais da série inteira)"""
         n_points = len(self._y_data)
         n_levels = self._config.lod_levels
 
@@ -402,12 +305,10 @@ class LODManager:
             factor = 2 ** (n_levels - level - 1)
             target = min(n_points, self._config.target_display_points * factor)
 
-            x_dec, y_dec = self._decimator.decimate(
-                self._x_data, self._y_data, target,
-            )
-            self._lod_cache[level] = (x_dec, y_dec)
+            indices = self._pyramid.indices(0, n_points, target // 2)
+            self._lod_cache[level] = (self._x_data[indices], self._y_data[indices])
 
-            logger.debug(f"lod_precomputed: level={level}, points={len(x_dec)}")
+            logger.debug(f"lod_precomputed: level={level}, points={len(indices)}")
 
     def get_data_for_view(
         self,
@@ -424,33 +325,25 @@ class LODManager:
             view_width_pixels: Largura da view em pixels
 
         Returns:
-            Dados decimados apropriados para a view
+            Dados decimados apropriados para a view (até 2 pontos por pixel)
         """
-        # Filtra dados para range visível
+        if self._x_sorted:
+            # Janela por busca binária + pirâmide: custo independe do tamanho
+            start = int(np.searchsorted(self._x_data, x_min, side="left"))
+            stop = int(np.searchsorted(self._x_data, x_max, side="right"))
+            indices = self._pyramid.indices(start, stop, view_width_pixels)
+            return self._x_data[indices], self._y_data[indices]
+
+        # Eixo X fora de ordem: filtra dados para range visível
         mask = (self._x_data >= x_min) & (self._x_data <= x_max)
         visible_x = self._x_data[mask]
         visible_y = self._y_data[mask]
 
-        n_visible = len(visible_y)
-
-        # Se poucos pontos, retorna direto
-        if n_visible <= view_width_pixels * 2:
+        if len(visible_y) <= view_width_pixels * 2:
             return visible_x, visible_y
 
-        # Seleciona LOD apropriado
-        target_points = view_width_pixels * 2  # 2 pontos por pixel
-
-        # Encontra melhor nível de LOD
-        best_level = 0
-        for level, (x_lod, y_lod) in self._lod_cache.items():
-            if len(x_lod) >= target_points:
-                best_level = level
-
-        # Retorna dados do LOD filtrados para range
-        x_lod, y_lod = self._lod_cache.get(best_level, (visible_x, visible_y))
-        mask = (x_lod >= x_min) & (x_lod <= x_max)
-
-        return x_lod[mask], y_lod[mask]
+        indices = decimate_indices(visible_x, visible_y, view_width_pixels * 2, "minmax")
+        return visible_x[indices], visible_y[indices]
 
 
 class StreamingDataManager(QObject):
@@ -39,7 +39,9 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from platform_base.core.models import is_non_decreasing
 from platform_base.desktop.widgets.base import UiLoaderMixin
+from platform_base.processing.pyramid import series_pyramid
 from platform_base.ui.panels.performance import (
     DecimationMethod,
     PerformanceConfig,
@@ -127,6 +129,9 @@ class MatplotlibWidget(QWidget):
         # Legend pick event connection ID
         self._pick_cid = None
 
+        # Linhas grandes servidas pela pirâmide min/max: {line: (pyramid, x_data)}
+        self._line_pyramids = {}
+
         # Layout principal
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -304,6 +309,7 @@ class MatplotlibWidget(QWidget):
         """Cria o gráfico com base no tipo"""
         self.figure.clear()
         self.series_list = []  # Reset lista de séries
+        self._line_pyramids = {}
 
         try:
             if self.plot_type == "2d":
@@ -327,6 +333,8 @@ class MatplotlibWidget(QWidget):
         """Cria gráfico 2D de linha com design moderno, suporte a múltiplas séries, legenda interativa"""
         ax = self.figure.add_subplot(111)
         self._ax = ax  # Guardar referência para adicionar séries depois
+        # Zoom/pan re-consultam as pirâmides das séries grandes
+        ax.callbacks.connect("xlim_changed", self._on_xlim_changed)
 
         # Plotar série principal
         line_obj = self._plot_single_series(ax, self.series, self._dataset_name, self.current_color_idx)
@@ -364,8 +372,15 @@ class MatplotlibWidget(QWidget):
             x_data = np.arange(n_points)
             use_datetime = False
 
-        # Otimização de performance
-        if n_points > _perf_config.direct_render_limit:
+        # Otimização de performance: séries grandes com eixo ordenado usam a
+        # pirâmide min/max (até 2 pontos por pixel, re-consultada no zoom)
+        pyramid = None
+        if n_points > _perf_config.direct_render_limit and is_non_decreasing(x_data):
+            pyramid = series_pyramid(series)
+            indices = pyramid.indices(0, n_points, self._axes_width_pixels(ax))
+            x_render, y_render = x_data[indices], values[indices]
+            n_render = len(y_render)
+        elif n_points > _perf_config.direct_render_limit:
             x_render, y_render = decimate_for_plot(
                 x_data, values,
                 target_points=_perf_config.target_display_points,
@@ -393,8 +408,33 @@ class MatplotlibWidget(QWidget):
                               markevery=max(1, n_render//50), marker="o", markersize=3,
                               markerfacecolor=color, markeredgecolor="white", markeredgewidth=0.5)
 
+        if pyramid is not None:
+            self._line_pyramids[line] = (pyramid, x_data)
+
         return line
 
+    @staticmethod
+    def _axes_width_pixels(ax) -> int:
+        """Largura do eixo em pixels (resolução das consultas à pirâmide)"""
+        return max(int(ax.bbox.width), 100)
+
+    def _refresh_pyramid_lines(self, x_range: tuple[float, float] | None = None):
+        """Re-consulta as pirâmides para ``x_range`` (None = série inteira)"""
+        for line, (pyramid, x_data) in self._line_pyramids.items():
+            n_pixels = self._axes_width_pixels(line.axes)
+            if x_range is None:
+                indices = pyramid.indices(0, pyramid.n_points, n_pixels)
+            else:
+                indices = pyramid.window(x_data, x_range[0], x_range[1], n_pixels)
+            line.set_data(x_data[indices], pyramid.values[indices])
+
+    def _on_xlim_changed(self, ax):
+        """Re-decima as séries grandes para a janela visível após zoom/pan"""
+        if not self._line_pyramids:
+            return
+        self._refresh_pyramid_lines(ax.get_xlim())
+        self.canvas.draw_idle()
+
     def _setup_ax_style(self, ax):
         """Configura estilo moderno do eixo"""
         import matplotlib.dates as mdates
@@ -537,6 +577,7 @@ class MatplotlibWidget(QWidget):
             self._setup_interactive_legend(ax)
 
             # Ajustar limites do eixo
+            self._refresh_pyramid_lines()
             ax.relim()
             ax.autoscale_view()
 
@@ -731,6 +772,7 @@ class MatplotlibWidget(QWidget):
         try:
             ax = self.figure.gca()
             ax.autoscale(enable=True, axis="both", tight=True)
+            self._refresh_pyramid_lines()
             ax.relim()
             ax.autoscale_view()
             self.canvas.draw()
@@ -1054,6 +1096,7 @@ class MatplotlibWidget(QWidget):
     def _zoom_to_fit(self):
         """Ajusta zoom para mostrar todos os dados"""
         try:
+            self._refresh_pyramid_lines()
             for ax in self.figure.get_axes():
                 ax.relim()
                 ax.autoscale()
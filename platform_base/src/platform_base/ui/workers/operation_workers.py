@@ -17,6 +17,7 @@ import numpy as np
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtWidgets import QApplication
 
+from platform_base.core.job_scheduler import JobPriority, get_job_scheduler
 from platform_base.utils.logging import get_logger
 
 
@@ -35,6 +36,9 @@ class BaseOperationWorker(QObject):
     finished = pyqtSignal(object)    # result object
     error = pyqtSignal(str)          # error message
 
+    # Prioridade dos jobs no scheduler (operações do painel são interativas)
+    job_priority = JobPriority.INTERACTIVE
+
     def __init__(self, operation_name: str = "operation"):
         super().__init__()
         self.operation_name = operation_name
@@ -57,6 +61,15 @@ class BaseOperationWorker(QObject):
             return True
         return False
 
+    def _run_job(self, func, *args, **kwargs) -> Any:
+        """Executa o cálculo no scheduler de jobs e aguarda o resultado"""
+        future = get_job_scheduler().submit(
+            func, *args, priority=self.job_priority,
+            name=f"{self.operation_name}.{getattr(func, '__name__', 'job')}",
+            **kwargs,
+        )
+        return future.result()
+
 
 class CalculusWorker(BaseOperationWorker):
     """
@@ -101,7 +114,8 @@ class CalculusWorker(BaseOperationWorker):
                 order = self.params.get("order", 1)
                 method = self.params.get("method", "finite_diff")
 
-                result = derivative(
+                result = self._run_job(
+                    derivative,
                     self.values,
                     self.t,
                     order=order,
@@ -114,7 +128,8 @@ class CalculusWorker(BaseOperationWorker):
 
                 method = self.params.get("method", "trapezoid")
 
-                result = integral(
+                result = self._run_job(
+                    integral,
                     self.values,
                     self.t,
                     method=method,
@@ -132,14 +147,16 @@ class CalculusWorker(BaseOperationWorker):
                 method = self.params.get("method", "trapezoid")
 
                 if with_crossings:
-                    result = area_between_with_crossings(
+                    result = self._run_job(
+                        area_between_with_crossings,
                         self.values,
                         values_lower,
                         self.t,
                         method=method,
                     )
                 else:
-                    result = area_between(
+                    result = self._run_job(
+                        area_between,
                         self.values,
                         values_lower,
                         self.t,
@@ -213,20 +230,20 @@ class InterpolationWorker(BaseOperationWorker):
 
             # Executa interpolação baseada no método
             if self.method == "linear":
-                result = linear(self.values, self.t, t_new)
+                result = self._run_job(linear, self.values, self.t, t_new)
             elif self.method == "spline_cubic":
-                result = spline_cubic(self.values, self.t, t_new)
+                result = self._run_job(spline_cubic, self.values, self.t, t_new)
             elif self.method == "smoothing_spline":
                 s = self.params.get("s", None)
-                result = smoothing_spline(self.values, self.t, t_new, s=s)
+                result = self._run_job(smoothing_spline, self.values, self.t, t_new, s=s)
             elif self.method == "mls":
                 bandwidth = self.params.get("bandwidth", 0.1)
-                result = mls(self.values, self.t, t_new, bandwidth=bandwidth)
+                result = self._run_job(mls, self.values, self.t, t_new, bandwidth=bandwidth)
             elif self.method == "gpr":
                 kernel = self.params.get("kernel", "rbf")
-                result = gpr(self.values, self.t, t_new, kernel=kernel)
+                result = self._run_job(gpr, self.values, self.t, t_new, kernel=kernel)
             elif self.method == "lomb_scargle":
-                result = lomb_scargle(self.values, self.t, t_new)
+                result = self._run_job(lomb_scargle, self.values, self.t, t_new)
             else:
                 raise ValueError(f"Método de interpolação desconhecido: {self.method}")
 
@@ -458,6 +475,8 @@ class BatchOperationWorker(BaseOperationWorker):
     Worker para executar múltiplas operações em batch
     """
 
+    job_priority = JobPriority.BULK
+
     def __init__(self, operations: list[dict[str, Any]]):
         """
         Args:
@@ -530,7 +549,8 @@ class BatchOperationWorker(BaseOperationWorker):
 
         if op_type == "derivative":
             from platform_base.processing.calculus import derivative
-            return derivative(
+            return self._run_job(
+                derivative,
                 data.get("values"),
                 data.get("t"),
                 order=params.get("order", 1),
@@ -539,7 +559,8 @@ class BatchOperationWorker(BaseOperationWorker):
 
         if op_type == "integral":
             from platform_base.processing.calculus import integral
-            return integral(
+            return self._run_job(
+                integral,
                 data.get("values"),
                 data.get("t"),
                 method=params.get("method", "trapezoid"),
@@ -547,7 +568,8 @@ class BatchOperationWorker(BaseOperationWorker):
 
         if op_type == "interpolation":
             from platform_base.processing.interpolation import linear
-            return linear(
+            return self._run_job(
+                linear,
                 data.get("values"),
                 data.get("t"),
                 data.get("t_new"),
@@ -10,6 +10,13 @@ from typing import Optional
 import pandas as pd
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from platform_base.io.xlsx_reader import (
+    XlsxSheetCache,
+    read_xlsx,
+    read_xlsx_sheets,
+    xlsx_sheet_names,
+)
+
 
 class XlsxToCsvConverter(QObject):
     """
@@ -20,14 +27,36 @@ class XlsxToCsvConverter(QObject):
     - Configuração de delimitador
     - Configuração de encoding
     - Progress tracking
+    - Leitor streaming (sem openpyxl) com sheets decodificadas em paralelo
+    - Cache de conversão opcional: cada sheet é decodificada uma única vez
     """
     
     progress_updated = pyqtSignal(int, str)  # (progress%, message)
     conversion_completed = pyqtSignal(str)  # filepath
     conversion_failed = pyqtSignal(str)  # error message
     
-    def __init__(self):
+    def __init__(self, engine: str = "streaming", cache_dir: str | Path | None = None,
+                 max_workers: int | None = None):
+        """
+        Args:
+            engine: "streaming" (leitor XML próprio) ou "openpyxl"
+            cache_dir: Diretório do cache de sheets decodificadas (None = sem cache)
+            max_workers: Processos para decodificar sheets em paralelo
+        """
         super().__init__()
+        self.engine = engine
+        self.cache = XlsxSheetCache(cache_dir) if cache_dir is not None else None
+        self.max_workers = max_workers
+
+    def _streaming(self, xlsx_path: Path) -> bool:
+        return self.engine == "streaming" and xlsx_path.suffix.lower() != ".xls"
+
+    def _read_sheet(self, xlsx_path: Path, sheet_name: str | int) -> pd.DataFrame:
+        if not self._streaming(xlsx_path):
+            return pd.read_excel(xlsx_path, sheet_name=sheet_name, engine='openpyxl')
+        if self.cache is not None:
+            return self.cache.read(xlsx_path, sheet_name)
+        return read_xlsx(xlsx_path, sheet_name)
     
     def convert(
         self,
@@ -63,7 +92,7 @@ class XlsxToCsvConverter(QObject):
             self.progress_updated.emit(10, "Lendo arquivo XLSX...")
             
             # Lê o arquivo XLSX
-            df = pd.read_excel(xlsx_path, sheet_name=sheet_name, engine='openpyxl')
+            df = self._read_sheet(xlsx_path, 0 if sheet_name is None else sheet_name)
             
             self.progress_updated.emit(50, f"Lidas {len(df):,} linhas")
             
@@ -130,9 +159,17 @@ class XlsxToCsvConverter(QObject):
             
             self.progress_updated.emit(5, "Lendo arquivo XLSX...")
             
-            # Lê todas as sheets
-            excel_file = pd.ExcelFile(xlsx_path, engine='openpyxl')
-            sheet_names = excel_file.sheet_names
+            # Lê todas as sheets (streaming: decodificadas em paralelo)
+            if self._streaming(xlsx_path):
+                sheet_names = xlsx_sheet_names(xlsx_path)
+                if self.cache is not None:
+                    sheets = {name: self.cache.read(xlsx_path, name) for name in sheet_names}
+                else:
+                    sheets = read_xlsx_sheets(xlsx_path, sheet_names, max_workers=self.max_workers)
+            else:
+                excel_file = pd.ExcelFile(xlsx_path, engine='openpyxl')
+                sheet_names = excel_file.sheet_names
+                sheets = None
             
             total_sheets = len(sheet_names)
             converted_files = []
@@ -145,7 +182,10 @@ class XlsxToCsvConverter(QObject):
                 )
                 
                 # Lê sheet
-                df = pd.read_excel(excel_file, sheet_name=sheet_name)
+                if sheets is not None:
+                    df = sheets[sheet_name]
+                else:
+                    df = pd.read_excel(excel_file, sheet_name=sheet_name)
                 
                 # Nome do arquivo CSV
                 safe_sheet_name = "".join(
@@ -179,6 +219,8 @@ class XlsxToCsvConverter(QObject):
     def get_sheet_names(xlsx_path: str | Path) -> list[str]:
         """Retorna lista de nomes de sheets em um arquivo XLSX"""
         try:
+            if Path(xlsx_path).suffix.lower() != ".xls":
+                return xlsx_sheet_names(xlsx_path)
             excel_file = pd.ExcelFile(xlsx_path, engine='openpyxl')
             return excel_file.sheet_names
         except Exception:
@@ -202,6 +244,8 @@ class XlsxToCsvConverter(QObject):
             DataFrame com preview ou None se erro
         """
         try:
+            if Path(xlsx_path).suffix.lower() != ".xls":
+                return read_xlsx(xlsx_path, 0 if sheet_name is None else sheet_name, max_rows=nrows)
             df = pd.read_excel(
                 xlsx_path,
                 sheet_name=sheet_name,
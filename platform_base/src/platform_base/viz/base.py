@@ -5,113 +5,20 @@ from typing import TYPE_CHECKING, Literal
 
 import numpy as np
 
-try:
-    import numba
-    NUMBA_AVAILABLE = True
-except ImportError:
-    NUMBA_AVAILABLE = False
-
+from platform_base.caching.tiered import TieredCache, array_fingerprint
+from platform_base.core.memory_manager import get_memory_manager
+from platform_base.processing.decimation import decimate_indices
 from platform_base.utils.logging import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from platform_base.viz.config import VizConfig
 
 logger = get_logger(__name__)
 
-
-def _create_lttb_numba():
-    """Create numba-optimized LTTB if available."""
-    if not NUMBA_AVAILABLE:
-        return None
-
-    @numba.jit(nopython=True, cache=True)
-    def _lttb_numba(x: np.ndarray, y: np.ndarray, max_points: int) -> tuple[np.ndarray, np.ndarray]:
-        """
-        Numba-optimized Largest Triangle Three Buckets (LTTB) algorithm.
-
-        Preserva features críticos (peaks, valleys, edges) durante downsampling.
-        """
-        n = len(x)
-
-        if n <= max_points:
-            return x, y
-
-        if max_points < 3:
-            # Para casos extremos, retorna primeiro, meio e último ponto
-            indices = np.array([0, n//2, n-1])
-            return x[indices], y[indices]
-
-        # Inicializa resultado
-        result_x = np.empty(max_points)
-        result_y = np.empty(max_points)
-
-        # Sempre inclui primeiro e último ponto
-        result_x[0] = x[0]
-        result_y[0] = y[0]
-        result_x[max_points-1] = x[n-1]
-        result_y[max_points-1] = y[n-1]
-
-        # Calcula tamanho do bucket
-        bucket_size = (n - 2) / (max_points - 2)
-
-        # Último ponto selecionado (índice no array original)
-        a = 0
-
-        for i in range(1, max_points - 1):
-            # Calcula limites do bucket atual
-            avg_range_start = int((i - 1) * bucket_size) + 1
-            avg_range_end = int(i * bucket_size) + 1
-
-            # Calcula ponto médio do próximo bucket para referência
-            next_avg_range_start = int(i * bucket_size) + 1
-            next_avg_range_end = min(int((i + 1) * bucket_size) + 1, n)
-
-            # Calcula centroide do próximo bucket
-            avg_x = 0.0
-            avg_y = 0.0
-            avg_count = 0
-
-            for j in range(next_avg_range_start, next_avg_range_end):
-                avg_x += x[j]
-                avg_y += y[j]
-                avg_count += 1
-
-            if avg_count > 0:
-                avg_x /= avg_count
-                avg_y /= avg_count
-            else:
-                avg_x = x[next_avg_range_start] if next_avg_range_start < n else x[n-1]
-                avg_y = y[next_avg_range_start] if next_avg_range_start < n else y[n-1]
-
-            # Encontra ponto no bucket atual que forma maior triângulo
-            max_area = 0.0
-            max_area_point = avg_range_start
-
-            for j in range(avg_range_start, min(avg_range_end, n)):
-                # Calcula área do triângulo formado por:
-                # - último ponto selecionado (a)
-                # - ponto atual (j)
-                # - centroide do próximo bucket (avg_x, avg_y)
-
-                area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
-
-                if area > max_area:
-                    max_area = area
-                    max_area_point = j
-
-            # Seleciona ponto com maior área
-            result_x[i] = x[max_area_point]
-            result_y[i] = y[max_area_point]
-            a = max_area_point
-
-        return result_x, result_y
-
-    logger.info("lttb_numba_compiled")
-    return _lttb_numba
-
-
-# Initialize numba LTTB function
-_lttb_numba = _create_lttb_numba()
+# Limite do cache de decimação por figura
+DECIMATION_CACHE_MAX_BYTES = 32 * 1024 * 1024
 
 
 def _detect_features(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -123,12 +30,11 @@ def _detect_features(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarr
     """
     n = len(y)
     if n < 3:
-        return np.array([]), np.array([]), np.array([])
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, empty
 
-    # Detecta peaks (máximos locais)
-    peaks = []
-    valleys = []
-    edges = []
+    empty = np.array([], dtype=np.int64)
+    edges = empty
 
     # Calcula segunda derivada para detectar mudanças de curvatura
     if n >= 5:
@@ -137,16 +43,14 @@ def _detect_features(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarr
 
         # Detecta pontos de inflexão (edges)
         sign_changes = np.diff(np.sign(ddy))
-        edges = np.where(np.abs(sign_changes) > 0)[0] + 1
+        edges = np.flatnonzero(sign_changes) + 1
 
-    # Detecta peaks e valleys usando comparação local
-    for i in range(1, n-1):
-        if y[i] > y[i-1] and y[i] > y[i+1]:
-            peaks.append(i)
-        elif y[i] < y[i-1] and y[i] < y[i+1]:
-            valleys.append(i)
+    # Detecta peaks e valleys por comparação com os vizinhos (vetorizado)
+    center = y[1:-1]
+    peaks = np.flatnonzero((center > y[:-2]) & (center > y[2:])) + 1
+    valleys = np.flatnonzero((center < y[:-2]) & (center < y[2:])) + 1
 
-    return np.array(peaks), np.array(valleys), np.array(edges)
+    return peaks, valleys, edges
 
 
 def _downsample_lttb(
@@ -178,58 +82,59 @@ def _downsample_lttb(
         preserve_features = ["peaks", "valleys", "edges"]
 
     # Detecta features importantes se solicitado
-    critical_indices = set()
+    critical = np.array([], dtype=np.int64)
 
     if preserve_features:  # Only if non-empty list
         peaks, valleys, edges = _detect_features(x, y)
 
+        selected_features = []
         if "peaks" in preserve_features:
-            critical_indices.update(peaks)
+            selected_features.append(peaks)
         if "valleys" in preserve_features:
-            critical_indices.update(valleys)
+            selected_features.append(valleys)
         if "edges" in preserve_features:
-            critical_indices.update(edges)
+            selected_features.append(edges)
+        critical = np.unique(np.concatenate(selected_features)) if selected_features else critical
 
         logger.debug("features_detected",
                     peaks=len(peaks),
                     valleys=len(valleys),
                     edges=len(edges),
-                    total_critical=len(critical_indices))
+                    total_critical=len(critical))
 
-    # Use Numba-optimized LTTB for large datasets
-    if NUMBA_AVAILABLE and _lttb_numba is not None and n > 50000:
-        logger.debug("using_numba_lttb", n_points=n, max_points=max_points)
-        x_down, y_down = _lttb_numba(x, y, max_points)
-    else:
-        # Fallback to numpy implementation
-        x_down, y_down = _lttb_numpy(x, y, max_points)
+    lttb_indices = decimate_indices(x, y, max_points, "lttb")
 
     # Se temos features críticos, força sua inclusão no resultado
-    if critical_indices:
-        # Combina pontos LTTB com features críticos
-        lttb_indices = np.searchsorted(x, x_down)
-        all_indices = np.unique(np.concatenate([lttb_indices, list(critical_indices)]))
+    if len(critical) > 0:
+        all_indices = np.union1d(lttb_indices, critical)
 
         # Se excedeu max_points, remove pontos menos importantes
         if len(all_indices) > max_points:
             # Prioriza features críticos, depois pontos LTTB
-            critical_array = np.array(list(critical_indices))
-            lttb_only = np.setdiff1d(lttb_indices, critical_array)
+            lttb_only = np.setdiff1d(lttb_indices, critical, assume_unique=True)
 
-            n_keep_lttb = max_points - len(critical_array)
+            n_keep_lttb = max_points - len(critical)
             if n_keep_lttb > 0:
-                keep_lttb = lttb_only[:n_keep_lttb]
-                all_indices = np.unique(np.concatenate([critical_array, keep_lttb]))
+                # Mantém pontos LTTB espalhados por toda a série (inclui as extremidades)
+                keep = np.linspace(0, len(lttb_only) - 1, n_keep_lttb).astype(np.int64)
+                all_indices = np.union1d(critical, lttb_only[keep])
             else:
-                all_indices = critical_array[:max_points]
+                # Mais features que pontos: LTTB sobre os próprios features
+                # (mais as extremidades, que o LTTB sempre mantém)
+                candidates = np.union1d(critical, [0, n - 1])
+                all_indices = candidates[
+                    decimate_indices(x[candidates], y[candidates], max_points, "lttb")
+                ]
 
-        all_indices = np.sort(all_indices)
         x_down = x[all_indices]
         y_down = y[all_indices]
 
         logger.debug("features_preserved",
-                    critical_preserved=len(critical_indices),
+                    critical_preserved=len(critical),
                     final_points=len(x_down))
+    else:
+        x_down = x[lttb_indices]
+        y_down = y[lttb_indices]
 
     logger.debug("lttb_downsampling_complete",
                 original_points=n,
@@ -239,67 +144,6 @@ def _downsample_lttb(
     return x_down, y_down
 
 
-def _lttb_numpy(x: np.ndarray, y: np.ndarray, max_points: int) -> tuple[np.ndarray, np.ndarray]:
-    """Pure numpy implementation of LTTB algorithm."""
-    n = len(x)
-
-    # Edge cases: se temos poucos pontos, retorna todos
-    if n <= max_points:
-        return x.copy(), y.copy()
-
-    if max_points < 3:
-        indices = np.linspace(0, n-1, max_points, dtype=int)
-        return x[indices], y[indices]
-
-    # Always include first and last point
-    result_x = np.empty(max_points)
-    result_y = np.empty(max_points)
-
-    result_x[0] = x[0]
-    result_y[0] = y[0]
-    result_x[max_points-1] = x[n-1]
-    result_y[max_points-1] = y[n-1]
-
-    bucket_size = (n - 2) / (max_points - 2)
-    a = 0  # Last selected point index
-
-    for i in range(1, max_points - 1):
-        # Calculate bucket boundaries
-        avg_range_start = int((i - 1) * bucket_size) + 1
-        avg_range_end = int(i * bucket_size) + 1
-
-        # Calculate average point for next bucket
-        next_avg_range_start = int(i * bucket_size) + 1
-        next_avg_range_end = min(int((i + 1) * bucket_size) + 1, n)
-
-        # Calculate centroid of next bucket
-        if next_avg_range_end > next_avg_range_start:
-            avg_x = np.mean(x[next_avg_range_start:next_avg_range_end])
-            avg_y = np.mean(y[next_avg_range_start:next_avg_range_end])
-        else:
-            avg_x = x[next_avg_range_start] if next_avg_range_start < n else x[n-1]
-            avg_y = y[next_avg_range_start] if next_avg_range_start < n else y[n-1]
-
-        # Find point in current bucket that forms largest triangle
-        max_area = 0.0
-        max_area_point = avg_range_start
-
-        bucket_end = min(avg_range_end, n)
-        for j in range(avg_range_start, bucket_end):
-            # Calculate triangle area
-            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
-
-            if area > max_area:
-                max_area = area
-                max_area_point = j
-
-        result_x[i] = x[max_area_point]
-        result_y[i] = y[max_area_point]
-        a = max_area_point
-
-    return result_x, result_y
-
-
 class BaseFigure(ABC):
     """
     Classe base para todos os tipos de visualização conforme seção 10.2
@@ -307,13 +151,18 @@ class BaseFigure(ABC):
     Features:
     - Configuração unificada (VizConfig)
     - Downsampling inteligente (LTTB + preservação de features)
-    - Rendering otimizado (OpenGL + caching)
+    - Rendering otimizado (OpenGL + cache de decimação limitado por bytes)
     - Suporte a seleção interativa
     """
 
     def __init__(self, config: VizConfig):
         self.config = config
         self._cached_data = {}
+        self._decimation_cache = TieredCache(
+            max_memory_bytes=DECIMATION_CACHE_MAX_BYTES,
+            memory_manager=get_memory_manager(),
+            name="viz_decimation",
+        )
         self._last_render_params = {}
 
     @abstractmethod
@@ -384,6 +233,7 @@ class BaseFigure(ABC):
     def clear_cache(self):
         """Limpa cache interno"""
         self._cached_data.clear()
+        self._decimation_cache.clear()
         self._last_render_params.clear()
 
     def set_theme(self, theme_type: str):
@@ -393,6 +243,30 @@ class BaseFigure(ABC):
         self.config.apply_theme(theme)
         self.clear_cache()  # Force re-render with new theme
 
+    def _cached_downsampling(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        max_points: int,
+        method: str,
+        compute: Callable[[], tuple[np.ndarray, np.ndarray]],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Retorna resultado de decimação do cache ou executa ``compute``.
+
+        Re-renders com os mesmos arrays (tema, resize, seleção) não refazem
+        o downsampling.
+        """
+        fingerprint = array_fingerprint(x, y)
+        if fingerprint is None:
+            return compute()
+        key = f"decimate:{fingerprint}:{max_points}:{method}"
+        cached = self._decimation_cache.get(key)
+        if cached is None:
+            cached = compute()
+            self._decimation_cache.set(key, cached)
+        return cached
+
     def _apply_downsampling(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
         """
         Aplica downsampling conforme configuração.
@@ -407,13 +281,21 @@ class BaseFigure(ABC):
             return x, y
 
         method = perf_config.downsample_method
+        return self._cached_downsampling(
+            x, y, max_points, method,
+            lambda: self._compute_downsampling(x, y, max_points, method),
+        )
+
+    def _compute_downsampling(
+        self, x: np.ndarray, y: np.ndarray, max_points: int, method: str,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Executa o método de downsampling configurado (sem cache)."""
         preserve_features = ["peaks", "valleys", "edges"]  # Default feature preservation
 
         if method == "lttb":
             return _downsample_lttb(x, y, max_points, preserve_features)
         if method == "uniform":
-            # Simple uniform sampling
-            indices = np.linspace(0, len(x)-1, max_points, dtype=int)
+            indices = decimate_indices(x, y, max_points, "uniform")
             return x[indices], y[indices]
         if method == "adaptive":
             # Implementação simplificada adaptativa
@@ -427,28 +309,8 @@ class BaseFigure(ABC):
         if n <= max_points:
             return x, y
 
-        # Divide into buckets and take min/max from each bucket
-        bucket_size = n // (max_points // 2)  # Each bucket contributes 2 points (min, max)
-
-        result_indices = []
-        for i in range(0, n, bucket_size):
-            bucket_end = min(i + bucket_size, n)
-            bucket_y = y[i:bucket_end]
-
-            min_idx = i + np.argmin(bucket_y)
-            max_idx = i + np.argmax(bucket_y)
-
-            # Add both min and max indices
-            if min_idx != max_idx:
-                result_indices.extend(sorted([min_idx, max_idx]))
-            else:
-                result_indices.append(min_idx)
-
-        # Limit to max_points
-        result_indices = result_indices[:max_points]
-        result_indices = np.unique(result_indices)
-
-        return x[result_indices], y[result_indices]
+        indices = decimate_indices(x, y, max_points, "minmax")
+        return x[indices], y[indices]
 
     def _downsample_adaptive(self, x: np.ndarray, y: np.ndarray, max_points: int) -> tuple[np.ndarray, np.ndarray]:
         """Adaptive downsampling based on local variance."""
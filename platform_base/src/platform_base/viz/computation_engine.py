@@ -8,6 +8,8 @@ from typing import Tuple, Dict, Optional, List
 from scipy import integrate, interpolate, signal, stats
 from datetime import datetime, timedelta
 
+from platform_base.processing.window_stats import describe
+
 
 class ComputationEngine:
     """Performs mathematical computations on time series data"""
@@ -123,16 +125,17 @@ class ComputationEngine:
                 'min': np.nan, 'max': np.nan, 'std': np.nan, 'variance': np.nan
             }
         
+        summary = describe(clean_vals, ('mean', 'median', 'min', 'max', 'std', 'var'))
         mode_result = stats.mode(clean_vals, keepdims=True)
         
         return {
-            'mean': float(np.mean(clean_vals)),
-            'median': float(np.median(clean_vals)),
+            'mean': summary['mean'],
+            'median': summary['median'],
             'mode': float(mode_result.mode[0]) if len(mode_result.mode) > 0 else np.nan,
-            'min': float(np.min(clean_vals)),
-            'max': float(np.max(clean_vals)),
-            'std': float(np.std(clean_vals)),
-            'variance': float(np.var(clean_vals))
+            'min': summary['min'],
+            'max': summary['max'],
+            'std': summary['std'],
+            'variance': summary['var']
         }
     
     @staticmethod
@@ -25,8 +25,13 @@ try:
 except ImportError:
     PYQTGRAPH_AVAILABLE = False
 
+from platform_base.caching.tiered import TieredCache, array_fingerprint
+from platform_base.core.memory_manager import get_memory_manager
+from platform_base.core.models import is_non_decreasing
+from platform_base.processing.decimation import decimate_indices
+from platform_base.processing.pyramid import MinMaxPyramid, series_pyramid
 from platform_base.utils.logging import get_logger
-from platform_base.viz.base import BaseFigure, _downsample_lttb
+from platform_base.viz.base import DECIMATION_CACHE_MAX_BYTES, BaseFigure, _downsample_lttb
 
 if TYPE_CHECKING:
     from platform_base.core.models import Dataset, Series
@@ -92,6 +97,11 @@ class Plot2DWidget(QWidget):
         self._series_data = {}  # {series_id: (x, y, plot_item)}
         self._selection_enabled = True
         self._brush_selection = None
+        self._decimation_cache = TieredCache(
+            max_memory_bytes=DECIMATION_CACHE_MAX_BYTES,
+            memory_manager=get_memory_manager(),
+            name="plot2d_decimation",
+        )
 
         self._setup_ui()
         self._setup_connections()
@@ -171,7 +181,8 @@ class Plot2DWidget(QWidget):
         # Grid color is handled in showGrid call
 
     def add_series(self, series_id: str, x_data: np.ndarray, y_data: np.ndarray,
-                   series_index: int = 0, **plot_kwargs):
+                   series_index: int = 0, pyramid: MinMaxPyramid | None = None,
+                   **plot_kwargs):
         """
         Adiciona série ao gráfico
 
@@ -180,6 +191,7 @@ class Plot2DWidget(QWidget):
             x_data: Dados do eixo X (timestamps)
             y_data: Dados do eixo Y (valores)
             series_index: Índice para seleção de cor
+            pyramid: Pirâmide min/max de ``y_data`` (construída se necessário)
             **plot_kwargs: Argumentos adicionais para plotagem
         """
         start_time = time.perf_counter()
@@ -218,6 +230,7 @@ class Plot2DWidget(QWidget):
             "y_plot": y_plot,
             "plot_item": plot_item,
             "color": color,
+            "pyramid": self._series_pyramid(x_data, y_data, pyramid),
         }
 
         duration_ms = (time.perf_counter() - start_time) * 1000
@@ -240,6 +253,7 @@ class Plot2DWidget(QWidget):
         """Remove todas as séries"""
         for series_id in list(self._series_data.keys()):
             self.remove_series(series_id)
+        self._decimation_cache.clear()
 
     def update_series(self, series_id: str, x_data: np.ndarray, y_data: np.ndarray):
         """Atualiza dados de uma série existente"""
@@ -257,6 +271,7 @@ class Plot2DWidget(QWidget):
             series_data["y_original"] = y_data
             series_data["x_plot"] = x_plot
             series_data["y_plot"] = y_plot
+            series_data["pyramid"] = self._series_pyramid(x_data, y_data)
 
             logger.debug("series_updated", series_id=series_id, points=len(x_plot))
 
@@ -321,15 +336,48 @@ class Plot2DWidget(QWidget):
             return x, y
 
         method = self.config.performance.downsample_method
+        fingerprint = array_fingerprint(x, y)
+        key = None if fingerprint is None else f"{fingerprint}:{max_points}:{method}"
+        cached = None if key is None else self._decimation_cache.get(key)
+        if cached is not None:
+            return cached
 
         if method == "lttb":
-            return _downsample_lttb(x, y, max_points, ["peaks", "valleys", "edges"])
-        if method == "uniform":
-            indices = np.linspace(0, len(x)-1, max_points, dtype=int)
-            return x[indices], y[indices]
-        # Default to uniform sampling
-        indices = np.linspace(0, len(x)-1, max_points, dtype=int)
-        return x[indices], y[indices]
+            result = _downsample_lttb(x, y, max_points, ["peaks", "valleys", "edges"])
+        else:
+            # uniform (e default)
+            indices = decimate_indices(x, y, max_points, "uniform")
+            result = x[indices], y[indices]
+        if key is not None:
+            self._decimation_cache.set(key, result)
+        return result
+
+    def _series_pyramid(self, x: np.ndarray, y: np.ndarray,
+                        pyramid: MinMaxPyramid | None = None) -> MinMaxPyramid | None:
+        """Pirâmide para re-decimar séries grandes no zoom (None se desnecessária)"""
+        if len(x) <= self.config.performance.max_points_2d or not is_non_decreasing(x):
+            return None
+        if pyramid is not None and pyramid.values is y:
+            return pyramid
+        return MinMaxPyramid(y)
+
+    def _refresh_visible_series(self, x_min: float, x_max: float):
+        """
+        Re-decima as séries grandes para a janela visível (até 2 pontos por
+        pixel); com a série inteira visível volta à visão geral decimada.
+        """
+        large = [data for data in self._series_data.values() if data.get("pyramid") is not None]
+        if not large:
+            return
+        n_pixels = max(int(self.plot_widget.getViewBox().width()), 100)
+        for data in large:
+            pyramid = data["pyramid"]
+            x_data = data["x_original"]
+            indices = pyramid.window(x_data, x_min, x_max, n_pixels)
+            if len(indices) == 0 or (indices[0] == 0 and indices[-1] == pyramid.n_points - 1):
+                data["plot_item"].setData(data["x_plot"], data["y_plot"])
+            else:
+                data["plot_item"].setData(x_data[indices], pyramid.values[indices])
 
     def _on_selection_changed(self):
         """Handler para mudança de seleção"""
@@ -382,6 +430,7 @@ class Plot2DWidget(QWidget):
         """Handler para mudança de range"""
         view_box = self.plot_widget.getViewBox()
         x_range, y_range = view_box.viewRange()
+        self._refresh_visible_series(x_range[0], x_range[1])
         self.range_changed.emit(tuple(x_range), tuple(y_range))
 
 
@@ -411,11 +460,13 @@ class TimeseriesPlot(BaseFigure):
 
         # Add all series from dataset
         for i, (series_id, series) in enumerate(dataset.series.items()):
+            large = len(series.values) > self.config.performance.max_points_2d
             self._widget.add_series(
                 series_id=series.name or series_id,
                 x_data=dataset.t_seconds,
                 y_data=series.values,
                 series_index=i,
+                pyramid=series_pyramid(series) if large and dataset.is_monotonic else None,
             )
 
         # Auto-range to show all data
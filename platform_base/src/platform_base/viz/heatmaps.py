@@ -453,49 +453,38 @@ class StatisticalHeatmap(BaseFigure):
         if len(series_list) == 0:
             raise ValueError("No series in dataset")
 
+        from platform_base.processing.window_stats import WINDOW_STATISTICS, tumbling_stats
+
         n_series = len(series_list)
         n_stats = len(statistics)
         n_time = len(dataset.t_seconds)
-        n_windows = max(1, n_time // window_size)
-
-        # Calculate statistics matrix
-        stats_matrix = np.zeros((n_windows, n_series * n_stats))
-        window_labels = []
-        stat_labels = []
-
-        # Create labels
-        for series in series_list:
-            series_name = series.name or series.series_id
-            for stat in statistics:
-                stat_labels.append(f"{series_name}_{stat}")
-
-        # Calculate statistics for each window
-        for w in range(n_windows):
-            start_idx = w * window_size
-            end_idx = min((w + 1) * window_size, n_time)
-
-            window_labels.append(f"Win_{w}")
-
-            col_idx = 0
-            for series in series_list:
-                window_data = series.values[start_idx:end_idx]
-
-                for stat in statistics:
-                    if stat == "mean":
-                        value = np.nanmean(window_data)
-                    elif stat == "std":
-                        value = np.nanstd(window_data)
-                    elif stat == "min":
-                        value = np.nanmin(window_data)
-                    elif stat == "max":
-                        value = np.nanmax(window_data)
-                    elif stat == "median":
-                        value = np.nanmedian(window_data)
-                    else:
-                        value = np.nan
-
-                    stats_matrix[w, col_idx] = value
-                    col_idx += 1
+        # Série mais curta que a janela: uma janela com todos os dados
+        window = max(1, min(window_size, n_time))
+        n_windows = max(1, n_time // window)
+
+        # Bloco (n_series, n_time); séries mais curtas completadas com NaN
+        block = np.full((n_series, n_time), np.nan)
+        for row, series in enumerate(series_list):
+            values = np.asarray(series.values, dtype=np.float64)[:n_time]
+            block[row, :len(values)] = values
+
+        # Todas as estatísticas de todas as séries numa passada
+        supported = [stat for stat in statistics if stat in WINDOW_STATISTICS]
+        computed = tumbling_stats(block, window, supported) if n_time else {}
+
+        # Colunas: série por série, estatística por estatística
+        stats_matrix = np.full((n_windows, n_series, n_stats), np.nan)
+        for k, stat in enumerate(statistics):
+            if stat in computed:
+                stats_matrix[:, :, k] = computed[stat].T
+        stats_matrix = stats_matrix.reshape(n_windows, n_series * n_stats)
+
+        stat_labels = [
+            f"{series.name or series.series_id}_{stat}"
+            for series in series_list
+            for stat in statistics
+        ]
+        window_labels = [f"Win_{w}" for w in range(n_windows)]
 
         # Set data to widget
         self._widget.set_data(
@@ -792,7 +781,7 @@ def spectrogram_heatmap(signal: np.ndarray, sample_rate: float = None,
     Create a spectrogram heatmap.
     
     Args:
-        signal: 1D signal array
+        signal: 1D signal (array, memmap, LazyDataArray or iterable of chunks)
         sample_rate: Sampling rate in Hz (or use fs as alias)
         window_size: FFT window size
         overlap: Window overlap fraction
@@ -808,16 +797,18 @@ def spectrogram_heatmap(signal: np.ndarray, sample_rate: float = None,
         sample_rate = 1000.0  # Default sample rate
 
     try:
-        from scipy.signal import spectrogram as scipy_spectrogram
+        from platform_base.processing.spectral import stft_spectrogram
 
         nperseg = window_size
         noverlap = int(window_size * overlap)
 
-        f, t, Sxx = scipy_spectrogram(signal, fs=sample_rate, 
-                                       nperseg=nperseg, noverlap=noverlap)
+        # Segmentos em lotes: aceita memmap/LazyDataArray sem carregar tudo
+        result = stft_spectrogram(signal, sample_rate, nperseg=nperseg,
+                                  noverlap=noverlap, window=("tukey", 0.25))
+        f, t = result.frequencies, result.times
 
         # Convert to dB
-        Sxx_db = 10 * np.log10(Sxx + 1e-10)
+        Sxx_db = 10 * np.log10(result.power + 1e-10)
 
         # Create labels
         time_labels = [f"{ti:.2f}s" for ti in t[::max(1, len(t)//10)]]
@@ -8,6 +8,12 @@ import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
 from platform_base.core.models import SeriesID, SessionID, ViewID
+from platform_base.processing.decimation import (
+    LTTB_PRESELECT_FACTOR,
+    decimate,
+    decimate_indices,
+)
+from platform_base.processing.pyramid import MinMaxPyramid
 from platform_base.utils.logging import get_logger
 
 if TYPE_CHECKING:
@@ -17,6 +23,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# StreamFilters.downsample_method -> método do engine de decimação
+_STREAM_DECIMATION = {"lttb": "lttb", "minmax": "minmax", "adaptive": "uniform"}
+
 
 class ValuePredicate(BaseModel):
     series_id: SeriesID
@@ -141,6 +150,8 @@ class StreamingEngine:
         self.series_data: dict[SeriesID, np.ndarray] = {}
         self.eligible_indices: np.ndarray = np.array([])
         self.interpolation_masks: dict[SeriesID, np.ndarray] = {}
+        # Pirâmides min/max por série: janelas decimadas em O(pontos exibidos)
+        self._pyramids: dict[SeriesID, MinMaxPyramid] = {}
 
         # Multi-view subscription system
         self._subscribers: dict[ViewID, ViewSubscription] = {}
@@ -151,6 +162,7 @@ class StreamingEngine:
         time_points: np.ndarray,
         series_data: dict[SeriesID, np.ndarray] | None = None,
         interpolation_masks: dict[SeriesID, np.ndarray] | None = None,
+        pyramids: dict[SeriesID, MinMaxPyramid] | None = None,
     ) -> None:
         """
         Configura dados temporais e de séries para streaming.
@@ -159,11 +171,14 @@ class StreamingEngine:
             time_points: Array de timestamps em segundos
             series_data: Dict de séries com valores
             interpolation_masks: Dict de máscaras indicando pontos interpolados
+            pyramids: Pirâmides já construídas (ex.: ``DatasetStore.get_pyramid``);
+                as que faltarem são construídas no primeiro uso
         """
         self.time_points = time_points
         self.total_points = len(time_points)
         self.series_data = series_data or {}
         self.interpolation_masks = interpolation_masks or {}
+        self._pyramids = dict(pyramids or {})
 
         self.eligible_indices = self._apply_eligibility_filters()
 
@@ -257,58 +272,7 @@ class StreamingEngine:
         """
         if len(x) <= n_out:
             return x, y
-
-        # Bucket size
-        bucket_size = (len(x) - 2) / (n_out - 2)
-
-        # Always include first point
-        sampled_x = [x[0]]
-        sampled_y = [y[0]]
-
-        # Previous selected point
-        prev_idx = 0
-
-        for i in range(n_out - 2):
-            # Current bucket bounds
-            bucket_start = int((i + 1) * bucket_size) + 1
-            bucket_end = int((i + 2) * bucket_size) + 1
-            bucket_end = min(bucket_end, len(x) - 1)
-
-            # Next bucket average (for triangle calculation)
-            next_bucket_start = bucket_end
-            next_bucket_end = int((i + 3) * bucket_size) + 1
-            next_bucket_end = min(next_bucket_end, len(x))
-
-            if next_bucket_start < next_bucket_end:
-                avg_x = np.mean(x[next_bucket_start:next_bucket_end])
-                avg_y = np.mean(y[next_bucket_start:next_bucket_end])
-            else:
-                avg_x = x[-1]
-                avg_y = y[-1]
-
-            # Find point with largest triangle area in bucket
-            max_area = -1
-            max_idx = bucket_start
-
-            for j in range(bucket_start, bucket_end):
-                # Triangle area
-                area = abs(
-                    (x[prev_idx] - avg_x) * (y[j] - y[prev_idx]) -
-                    (x[prev_idx] - x[j]) * (avg_y - y[prev_idx]),
-                )
-                if area > max_area:
-                    max_area = area
-                    max_idx = j
-
-            sampled_x.append(x[max_idx])
-            sampled_y.append(y[max_idx])
-            prev_idx = max_idx
-
-        # Always include last point
-        sampled_x.append(x[-1])
-        sampled_y.append(y[-1])
-
-        return np.array(sampled_x), np.array(sampled_y)
+        return decimate(x, y, n_out, "lttb")
 
     def _get_window_data(self) -> tuple[dict[SeriesID, np.ndarray], np.ndarray]:
         """
@@ -326,40 +290,38 @@ class StreamingEngine:
             return {}, np.array([])
 
         window_eligible = self.eligible_indices[start_idx:end_idx]
-        window_time = self.time_points[window_eligible]
-
-        window_data: dict[SeriesID, np.ndarray] = {}
-
-        for series_id, values in self.series_data.items():
-            # Skip hidden series
-            if series_id in self.state.filters.hidden_series:
-                continue
-
-            series_values = values[window_eligible]
 
-            # Apply downsampling if needed
-            max_points = self.state.filters.max_points_per_window
-            if len(series_values) > max_points:
-                if self.state.filters.downsample_method == "lttb":
-                    window_time_ds, series_values = self._downsample_lttb(
-                        window_time, series_values, max_points,
-                    )
-                elif self.state.filters.downsample_method == "minmax":
-                    # MinMax preserves peaks
-                    step = len(series_values) // max_points
-                    indices = []
-                    for i in range(0, len(series_values) - step, step):
-                        chunk = series_values[i:i+step]
-                        indices.append(i + np.argmin(chunk))
-                        indices.append(i + np.argmax(chunk))
-                    indices = sorted(set(indices))
-                    series_values = series_values[indices]
-                    window_time = window_time[indices]
-                else:  # adaptive
-                    # Simple decimation
-                    step = max(1, len(series_values) // max_points)
-                    series_values = series_values[::step]
+        visible = [
+            series_id for series_id in self.series_data
+            if series_id not in self.state.filters.hidden_series
+        ]
+        if not visible:
+            return {}, self.time_points[window_eligible]
+
+        max_points = self.state.filters.max_points_per_window
+        method = _STREAM_DECIMATION.get(self.state.filters.downsample_method, "uniform")
+        contiguous = window_eligible[-1] - window_eligible[0] + 1 == len(window_eligible)
+        if len(window_eligible) > max_points and contiguous and method != "uniform":
+            # Janela sem furos de filtro: seleção direto das pirâmides, sem
+            # copiar a janela inteira
+            indices = self._pyramid_window_indices(
+                visible, int(window_eligible[0]), int(window_eligible[-1]) + 1,
+                max_points, method,
+            )
+            window_time = self.time_points[indices]
+            stacked = np.stack([self.series_data[sid][indices] for sid in visible])
+        else:
+            window_time = self.time_points[window_eligible]
+            # Decima todas as séries visíveis numa única chamada; a seleção é
+            # compartilhada, então o eixo de tempo continua válido para todas
+            stacked = np.stack([self.series_data[sid][window_eligible] for sid in visible])
+            if stacked.shape[1] > max_points:
+                indices = decimate_indices(window_time, stacked, max_points, method)
+                window_time = window_time[indices]
+                stacked = stacked[:, indices]
 
+        window_data: dict[SeriesID, np.ndarray] = {}
+        for series_id, series_values in zip(visible, stacked, strict=True):
             # Apply visual smoothing if configured
             if self.state.filters.visual_smoothing:
                 series_values = self._apply_visual_smoothing(series_values)
@@ -368,6 +330,39 @@ class StreamingEngine:
 
         return window_data, window_time
 
+    def _pyramid(self, series_id: SeriesID) -> MinMaxPyramid:
+        """Pirâmide da série, (re)construída quando os valores mudam"""
+        pyramid = self._pyramids.get(series_id)
+        values = self.series_data[series_id]
+        if pyramid is None or pyramid.values is not values:
+            pyramid = MinMaxPyramid(values)
+            self._pyramids[series_id] = pyramid
+        return pyramid
+
+    def _pyramid_window_indices(
+        self,
+        visible: list[SeriesID],
+        start: int,
+        stop: int,
+        max_points: int,
+        method: str,
+    ) -> np.ndarray:
+        """
+        Índices (absolutos) de ``[start, stop)`` a partir das pirâmides.
+
+        ``minmax`` usa o envelope de cada série diretamente; ``lttb`` aplica
+        LTTB sobre os candidatos min/max (MinMaxLTTB).
+        """
+        per_series = max(max_points // len(visible), 4)
+        n_pixels = per_series * LTTB_PRESELECT_FACTOR // 2 if method == "lttb" else per_series // 2
+        indices = np.unique(np.concatenate([
+            self._pyramid(sid).indices(start, stop, n_pixels) for sid in visible
+        ]))
+        if method == "lttb" and len(indices) > max_points:
+            stacked = np.stack([self.series_data[sid][indices] for sid in visible])
+            indices = indices[decimate_indices(self.time_points[indices], stacked, max_points, "lttb")]
+        return indices
+
     def _apply_visual_smoothing(self, values: np.ndarray) -> np.ndarray:
         """Apply visual smoothing to values (render-only, doesn't modify source)"""
         config = self.state.filters.visual_smoothing
@@ -60,6 +60,17 @@ def temp_csv_100k(tmp_path, medium_data):
     return csv_file
 
 
+@pytest.fixture
+def temp_xlsx_10k(tmp_path, small_data):
+    """Cria arquivo XLSX com 10K linhas"""
+    import pandas as pd
+
+    t, y = small_data
+    xlsx_file = tmp_path / "data_10k.xlsx"
+    pd.DataFrame({"time": t, "value": y}).to_excel(xlsx_file, index=False)
+    return xlsx_file
+
+
 # =============================================================================
 # PROCESSING BENCHMARKS
 # =============================================================================
@@ -138,6 +149,211 @@ class TestSmoothingBenchmarks:
         assert result is not None
 
 
+@pytest.fixture(scope="module")
+def channels_40x100k():
+    """40 canais de 100K pontos num eixo de tempo comum"""
+    rng = np.random.default_rng(14)
+    t = np.linspace(0, 100, 100_000)
+    block = np.sin(np.outer(np.arange(1, 41), t) / 10) + rng.normal(0, 0.1, (40, t.size))
+    return t, block
+
+
+@pytest.mark.benchmark(group="batch")
+class TestBatchBenchmarks:
+    """Benchmarks do processamento em lote (40 canais)"""
+
+    def test_derivative_batch_40x100k(self, benchmark, channels_40x100k):
+        """Benchmark derivada em lote 40 x 100K"""
+        from platform_base.processing.calculus import derivative_batch
+
+        t, block = channels_40x100k
+        result = benchmark(derivative_batch, block, t, order=1)
+
+        assert result.values.shape == block.shape
+
+    def test_derivative_per_series_40x100k(self, benchmark, channels_40x100k):
+        """Referência: derivada série a série 40 x 100K"""
+        from platform_base.processing.calculus import derivative
+
+        t, block = channels_40x100k
+        result = benchmark(lambda: [derivative(row, t, order=1) for row in block])
+
+        assert len(result) == len(block)
+
+    def test_filter_batch_40x100k(self, benchmark, channels_40x100k):
+        """Benchmark filtro passa-baixa em lote 40 x 100K"""
+        from platform_base.processing.filters import apply_filter_batch
+
+        t, block = channels_40x100k
+        result = benchmark(apply_filter_batch, block, 1000.0, "lowpass", 50.0)
+
+        assert result.shape == block.shape
+
+    def test_smooth_batch_40x100k(self, benchmark, channels_40x100k):
+        """Benchmark Savitzky-Golay em lote 40 x 100K"""
+        from platform_base.processing.smoothing import smooth_batch
+
+        t, block = channels_40x100k
+        result = benchmark(smooth_batch, block, "savitzky_golay", {"window_length": 51, "polyorder": 3})
+
+        assert result.shape == block.shape
+
+
+@pytest.fixture(scope="module")
+def channels_10x1m():
+    """10 canais de 1M pontos no mesmo eixo de tempo"""
+    rng = np.random.default_rng(20)
+    t = np.arange(1_000_000) * 1e-3
+    block = np.sin(np.outer(np.arange(1, 11), t)) + rng.normal(0, 0.1, (10, t.size))
+    return t, block
+
+
+@pytest.mark.benchmark(group="sync")
+class TestSyncBenchmarks:
+    """Benchmarks do alinhamento por Kalman/RTS"""
+
+    def test_kalman_smooth_10x1m(self, benchmark, channels_10x1m):
+        """Benchmark Kalman/RTS 10 x 1M"""
+        from platform_base.processing.synchronization import _kalman_smooth_rows
+
+        t, block = channels_10x1m
+        result = benchmark(_kalman_smooth_rows, block, t)
+
+        assert result.shape == block.shape
+
+    def test_kalman_align_10x1m(self, benchmark, channels_10x1m):
+        """Benchmark synchronize(kalman_align) 10 x 1M"""
+        from platform_base.processing.synchronization import synchronize
+
+        t, block = channels_10x1m
+        series = {f"ch{k}": row for k, row in enumerate(block)}
+        result = benchmark.pedantic(synchronize, args=(series, dict.fromkeys(series, t), "kalman_align", {}),
+                                    rounds=3, iterations=1)
+
+        assert len(result.synced_series) == 10
+
+
+@pytest.mark.benchmark(group="correlation")
+class TestCorrelationBenchmarks:
+    """Benchmarks de correlação cruzada e matriz de atrasos"""
+
+    def test_cross_correlation_1m_full(self, benchmark, large_data):
+        """Benchmark correlação 1M x 1M, todos os lags (FFT)"""
+        from platform_base.processing.analysis import compute_correlation
+
+        _, y = large_data
+        result = benchmark(compute_correlation, y, np.roll(y, 100), "cross")
+
+        assert len(result.lags) == 2 * len(y) - 1
+
+    def test_cross_correlation_1m_lag_50(self, benchmark, large_data):
+        """Benchmark correlação 1M x 1M, |lag| <= 50 (direto)"""
+        from platform_base.processing.analysis import compute_correlation
+
+        _, y = large_data
+        result = benchmark(compute_correlation, y, np.roll(y, 10), "cross", 50)
+
+        assert len(result.lags) == 101
+
+    def test_lag_matrix_40x100k(self, benchmark, channels_40x100k):
+        """Benchmark matriz de atrasos 40 canais x 100K (|lag| <= 1000)"""
+        from platform_base.processing.analysis import compute_lag_matrix
+
+        _, block = channels_40x100k
+        series = {f"ch{k}": row for k, row in enumerate(block)}
+        result = benchmark.pedantic(compute_lag_matrix, args=(series, 1000), rounds=3, iterations=1)
+
+        assert result.lags.shape == (40, 40)
+
+
+@pytest.mark.benchmark(group="spectral")
+class TestSpectralBenchmarks:
+    """Benchmarks de Welch/STFT por lotes de segmentos"""
+
+    def test_welch_10m(self, benchmark, decimation_10m):
+        """Benchmark Welch 10M pontos (nperseg 1024)"""
+        from platform_base.processing.spectral import welch_psd
+
+        result = benchmark.pedantic(welch_psd, args=(decimation_10m, 1000.0, 1024),
+                                    rounds=3, iterations=1)
+
+        assert result.n_segments > 19_000
+
+    def test_spectrogram_1m(self, benchmark, large_data):
+        """Benchmark espectrograma 1M pontos (nperseg 256)"""
+        from platform_base.processing.spectral import stft_spectrogram
+
+        _, y = large_data
+        result = benchmark(stft_spectrogram, y, 10_000.0, 256)
+
+        assert result.power.shape[0] == 129
+
+
+@pytest.mark.benchmark(group="window_stats")
+class TestWindowStatsBenchmarks:
+    """Benchmarks das estatísticas por janela (40 canais)"""
+
+    def test_tumbling_stats_40x100k(self, benchmark, channels_40x100k):
+        """Benchmark janelas fixas 40 x 100K (janela 100, com mediana)"""
+        from platform_base.processing.window_stats import tumbling_stats
+
+        _, block = channels_40x100k
+        result = benchmark(tumbling_stats, block, 100, ["mean", "std", "min", "max", "median"])
+
+        assert result["mean"].shape == (40, 1000)
+
+    def test_rolling_stats_40x100k(self, benchmark, channels_40x100k):
+        """Benchmark janelas móveis 40 x 100K (janela 256, com mediana)"""
+        from platform_base.processing.window_stats import rolling_stats
+
+        _, block = channels_40x100k
+        result = benchmark.pedantic(rolling_stats, args=(block, 256, ["mean", "std", "min", "max", "median"]),
+                                    rounds=3, iterations=1)
+
+        assert result["median"].shape == block.shape
+
+
+@pytest.fixture(scope="module")
+def runs_2x100k():
+    """Duas execuções de 100k amostras com deriva de fase"""
+    t = np.linspace(0, 200, 100_000)
+    return np.sin(t), np.sin(t * 1.001 + 0.2)
+
+
+@pytest.mark.benchmark(group="dtw")
+class TestDTWBenchmarks:
+    """Benchmarks do motor DTW"""
+
+    def test_dtw_distance_100k_band_500(self, benchmark, runs_2x100k):
+        """Benchmark DTW 100k x 100k (banda ±500, linhas rolantes)"""
+        from platform_base.processing.dtw import dtw_distance
+
+        x, y = runs_2x100k
+        result = benchmark.pedantic(dtw_distance, args=(x, y, 500), rounds=3, iterations=1)
+
+        assert np.isfinite(result)
+
+    def test_dtw_multiscale_1m(self, benchmark):
+        """Benchmark FastDTW com caminho, 1M x 1M (raio 10)"""
+        from platform_base.processing.dtw import dtw_path_multiscale
+
+        t = np.linspace(0, 2000, 1_000_000)
+        x, y = np.sin(t), np.sin(t * 1.001 + 0.2)
+        result = benchmark.pedantic(dtw_path_multiscale, args=(x, y, 10), rounds=3, iterations=1)
+
+        assert len(result.path) >= len(x)
+
+    def test_dtw_matrix_pruned_20x1k(self, benchmark):
+        """Benchmark matriz 20 x 1k com poda LB_Keogh"""
+        from platform_base.processing.dtw import dtw_distance_matrix
+
+        rng = np.random.default_rng(21)
+        series = [rng.normal(size=1000).cumsum() for _ in range(20)]
+        result = benchmark(dtw_distance_matrix, series, window=50, max_distance=500.0)
+
+        assert result.shape == (20, 20)
+
+
 @pytest.mark.benchmark(group="downsampling")
 class TestDownsamplingBenchmarks:
     """Benchmarks para downsampling"""
@@ -161,6 +377,92 @@ class TestDownsamplingBenchmarks:
         
         assert result is not None
 
+    def test_downsample_adaptive_1m_to_5k(self, benchmark, large_data):
+        """Benchmark adaptive 1M → 5K pontos (variância móvel por somas acumuladas)"""
+        from platform_base.processing.downsampling import downsample
+
+        t, y = large_data
+        result = benchmark(downsample, y, t, n_points=5000, method="adaptive")
+
+        assert len(result.values) <= 5000
+
+    def test_downsample_adaptive_10m_to_10k(self, benchmark, decimation_10m):
+        """Benchmark adaptive 10M → 10K pontos"""
+        from platform_base.processing.downsampling import downsample
+
+        t = np.arange(len(decimation_10m), dtype=np.float64)
+        result = benchmark.pedantic(
+            downsample, args=(decimation_10m, t),
+            kwargs={"n_points": 10_000, "method": "adaptive"}, rounds=3,
+        )
+
+        assert len(result.values) <= 10_000
+
+
+@pytest.fixture(scope="module")
+def decimation_10m():
+    """Série de 10M pontos para o engine de decimação"""
+    rng = np.random.default_rng(0)
+    return np.sin(np.linspace(0, 1000, 10_000_000)) + rng.normal(0, 0.1, 10_000_000)
+
+
+@pytest.fixture(scope="module")
+def decimation_100m():
+    """Série de 100M pontos (800 MB) para o engine de decimação"""
+    y = np.sin(np.linspace(0, 1000, 100_000_000))
+    y[::997] += 0.5
+    return y
+
+
+@pytest.mark.benchmark(group="decimation")
+class TestDecimationBenchmarks:
+    """Benchmarks do engine de decimação compartilhado (processing.decimation)"""
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("method", ["minmax", "m4", "lttb"])
+    def test_decimate_100m_to_4k(self, benchmark, decimation_100m, method):
+        """100M → 4K pontos (uma passada sobre o array inteiro)"""
+        from platform_base.processing.decimation import decimate_indices
+
+        decimate_indices(None, decimation_100m[:10_000], 4000, method)  # compila
+        out = np.empty(4000, dtype=np.int64)
+        idx = benchmark(decimate_indices, None, decimation_100m, 4000, method, out=out)
+
+        assert len(idx) <= 4000
+
+    def test_decimate_multi_series_10m(self, benchmark, decimation_10m):
+        """4 séries de 2.5M pontos decimadas numa única chamada"""
+        from platform_base.processing.decimation import decimate_indices
+
+        y = decimation_10m.reshape(4, -1)
+        idx = benchmark(decimate_indices, None, y, 4000, "minmax")
+
+        assert len(idx) <= 4000
+
+
+@pytest.mark.benchmark(group="pyramid")
+class TestPyramidBenchmarks:
+    """Benchmarks da pirâmide min/max (processing.pyramid)"""
+
+    def test_build_10m(self, benchmark, decimation_10m):
+        """Construção única da pirâmide de 10M pontos"""
+        from platform_base.processing.pyramid import MinMaxPyramid
+
+        MinMaxPyramid(decimation_10m[:10_000])  # compila
+        pyramid = benchmark(MinMaxPyramid, decimation_10m)
+
+        assert pyramid.n_points == 10_000_000
+
+    @pytest.mark.slow
+    def test_query_100m_2k_pixels(self, benchmark, decimation_100m):
+        """Janela de ~90M pontos em 2000 pixels (independe do tamanho)"""
+        from platform_base.processing.pyramid import MinMaxPyramid
+
+        pyramid = MinMaxPyramid(decimation_100m)
+        idx = benchmark(pyramid.indices, 1_234_567, 91_234_567, 2000)
+
+        assert len(idx) <= 4000
+
 
 @pytest.mark.benchmark(group="interpolation")
 class TestInterpolationBenchmarks:
@@ -188,6 +490,19 @@ class TestInterpolationBenchmarks:
         
         assert result is not None
 
+    def test_interpolate_mls_1m_5pct_gaps(self, benchmark, large_data):
+        """Benchmark MLS 1M pontos com 5% de lacunas"""
+        from platform_base.processing.interpolation import interpolate
+
+        t, y = large_data
+        y = y.copy()
+        y[np.random.default_rng(0).random(len(y)) < 0.05] = np.nan
+
+        result = benchmark.pedantic(interpolate, args=(y, t, "mls", {"degree": 2}),
+                                    rounds=3, iterations=1)
+
+        assert np.all(np.isfinite(result.values))
+
 
 # =============================================================================
 # FILE LOADING BENCHMARKS
@@ -205,6 +520,108 @@ class TestFileLoadingBenchmarks:
         
         assert result is not None
 
+    def test_load_csv_chunked_100k(self, benchmark, temp_csv_100k):
+        """Benchmark load CSV 100K linhas com ingestão por chunks"""
+        from platform_base.io.loader import LoadConfig, load
+        
+        config = LoadConfig(chunk_size=20_000)
+        result = benchmark(load, temp_csv_100k, config)
+        
+        assert len(result.t_seconds) == 100_000
+
+    def test_load_csv_arrow_100k(self, benchmark, temp_csv_100k):
+        """Benchmark load CSV 100K linhas com engine PyArrow"""
+        from platform_base.io.loader import LoadConfig, load
+        
+        config = LoadConfig(engine="arrow", timestamp_column="time")
+        result = benchmark(load, temp_csv_100k, config)
+        
+        assert len(result.t_seconds) == 100_000
+
+    def test_load_xlsx_openpyxl_10k(self, benchmark, temp_xlsx_10k):
+        """Benchmark load XLSX 10K linhas via pd.read_excel (openpyxl)"""
+        from platform_base.io.loader import LoadConfig, load
+        
+        config = LoadConfig(excel_engine="openpyxl", timestamp_column="time")
+        result = benchmark(load, temp_xlsx_10k, config)
+        
+        assert len(result.t_seconds) == 10_000
+
+    def test_load_xlsx_streaming_10k(self, benchmark, temp_xlsx_10k):
+        """Benchmark load XLSX 10K linhas com leitor streaming"""
+        from platform_base.io.loader import LoadConfig, load
+        
+        config = LoadConfig(excel_engine="streaming", timestamp_column="time")
+        result = benchmark(load, temp_xlsx_10k, config)
+        
+        assert len(result.t_seconds) == 10_000
+
+
+@pytest.fixture(scope="module")
+def store_10m():
+    """DatasetStore com dataset monotônico de 10M pontos"""
+    from datetime import datetime
+
+    from platform_base.core.dataset_store import DatasetStore
+    from platform_base.core.models import (
+        Dataset,
+        DatasetMetadata,
+        Series,
+        SeriesMetadata,
+        SourceInfo,
+    )
+    from platform_base.processing.units import parse_unit
+
+    n = 10_000_000
+    t = np.arange(n, dtype=np.float64) * 1e-3
+    dataset = Dataset(
+        dataset_id="ds_10m",
+        version=1,
+        parent_id=None,
+        source=SourceInfo(filepath="/bench.csv", filename="bench.csv", format="csv",
+                          size_bytes=1, checksum="bench"),
+        t_seconds=t,
+        t_datetime=np.datetime64("2024-01-01", "ns") + (t * 1e9).astype("timedelta64[ns]"),
+        series={"y": Series(series_id="y", name="y", unit=parse_unit("bar"),
+                            values=np.sin(t),
+                            metadata=SeriesMetadata(original_name="y", source_column="y"))},
+        metadata=DatasetMetadata(),
+        created_at=datetime(2024, 1, 1),
+    )
+    store = DatasetStore()
+    store.add_dataset(dataset)
+    return store
+
+
+@pytest.mark.benchmark(group="view")
+class TestViewBenchmarks:
+    """Benchmarks de DatasetStore.create_view (zoom/pan interativo)"""
+
+    def test_create_view_10m(self, benchmark, store_10m):
+        """Janela de 1% em 10M pontos (busca binária, sem cópia)"""
+        from platform_base.core.models import TimeWindow
+
+        window = TimeWindow(start=5000.0, end=5100.0)
+        view = benchmark(store_10m.create_view, "ds_10m", ["y"], window)
+
+        assert len(view.t_seconds) == 100_001
+
+    def test_create_view_10m_under_1ms(self, store_10m):
+        """create_view em 10M pontos deve ser < 1ms"""
+        import time
+
+        from platform_base.core.models import TimeWindow
+
+        elapsed = []
+        for i in range(20):
+            window = TimeWindow(start=100.0 * i, end=100.0 * i + 500.0)
+            start = time.perf_counter()
+            store_10m.create_view("ds_10m", ["y"], window)
+            elapsed.append(time.perf_counter() - start)
+
+        median = float(np.median(elapsed))
+        assert median < 1e-3, f"create_view 10M levou {median*1000:.3f}ms (max 1ms)"
+
 
 # =============================================================================
 # BASELINE ASSERTIONS
@@ -256,6 +673,72 @@ class TestPerformanceBaselines:
         
         assert elapsed < 0.5, f"Downsample 100K→1K levou {elapsed*1000:.1f}ms (max 500ms)"
     
+    def test_decimation_baseline_10m_under_100ms(self, decimation_10m):
+        """Decimação 10M → 4K (minmax e LTTB) deve ser < 100ms"""
+        import time
+
+        from platform_base.processing.decimation import NUMBA_AVAILABLE, decimate_indices
+
+        if not NUMBA_AVAILABLE:
+            pytest.skip("Numba não disponível")
+
+        for method in ("minmax", "lttb"):
+            decimate_indices(None, decimation_10m[:10_000], 4000, method)  # compila
+            start = time.perf_counter()
+            decimate_indices(None, decimation_10m, 4000, method)
+            elapsed = time.perf_counter() - start
+
+            assert elapsed < 0.1, f"Decimação {method} 10M→4K levou {elapsed*1000:.1f}ms (max 100ms)"
+
+    def test_kalman_baseline_10x1m_under_1s(self, channels_10x1m):
+        """Kalman/RTS 10 x 1M deve ser < 1s"""
+        import time
+
+        from platform_base.processing.synchronization import NUMBA_AVAILABLE, _kalman_smooth_rows
+
+        if not NUMBA_AVAILABLE:
+            pytest.skip("Numba não disponível")
+
+        t, block = channels_10x1m
+        _kalman_smooth_rows(block[:, :1000], t[:1000])  # compila
+        start = time.perf_counter()
+        _kalman_smooth_rows(block, t)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0, f"Kalman 10x1M levou {elapsed*1000:.1f}ms (max 1000ms)"
+
+    def test_dtw_baseline_100k_under_10s(self, runs_2x100k):
+        """DTW com caminho de duas execuções de 100k (banda ±500) deve ser < 10s"""
+        import time
+
+        from platform_base.processing.dtw import NUMBA_AVAILABLE, dtw_path
+
+        if not NUMBA_AVAILABLE:
+            pytest.skip("Numba não disponível")
+
+        x, y = runs_2x100k
+        dtw_path(x[:100], y[:100], 10)  # compila
+        start = time.perf_counter()
+        alignment = dtw_path(x, y, 500)
+        elapsed = time.perf_counter() - start
+
+        assert len(alignment.path) >= len(x)
+        assert elapsed < 10.0, f"DTW 100k levou {elapsed:.2f}s (max 10s)"
+
+    def test_pyramid_query_baseline_under_5ms(self, decimation_10m):
+        """Consulta de view na pirâmide (10M pontos, 2000 pixels) deve ser < 5ms"""
+        import time
+
+        from platform_base.processing.pyramid import MinMaxPyramid
+
+        pyramid = MinMaxPyramid(decimation_10m)
+        start = time.perf_counter()
+        for offset in range(0, 1_000_000, 100_000):
+            pyramid.indices(offset, 9_000_000 + offset, 2000)
+        elapsed = (time.perf_counter() - start) / 10
+
+        assert elapsed < 0.005, f"Consulta na pirâmide levou {elapsed*1000:.2f}ms (max 5ms)"
+
     def test_smooth_baseline_10k_under_100ms(self, small_data):
         """Smooth SavGol 10K deve ser < 100ms"""
         import time
@@ -1,11 +1,19 @@
 import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from platform_base.processing.calculus import derivative
 
 
+SRC_PATH = Path(__file__).resolve().parents[2] / "src"
+
+
 def test_large_dataset_derivative():
     if os.getenv("RUN_STRESS") != "1":
         pytest.skip("Stress tests disabled")
@@ -14,3 +22,55 @@ def test_large_dataset_derivative():
     values = np.sin(t)
     result = derivative(values, t, 1, "finite_diff", {})
     assert len(result.values) == n
+
+
+_PEAK_RSS_SCRIPT = textwrap.dedent("""
+    import json, resource, sys
+    import psutil
+    from platform_base.io.loader import LoadConfig, load
+
+    baseline = psutil.Process().memory_info().rss
+    dataset = load(sys.argv[1], LoadConfig(chunk_size=int(sys.argv[2]), encoding="utf-8"))
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    numeric = [dataset.t_seconds, dataset.t_datetime]
+    metadata = []
+    for s in dataset.series.values():
+        numeric.append(s.values)
+        metadata += [s.interpolation_info.is_interpolated, s.interpolation_info.method_used]
+    print(json.dumps({"baseline": baseline, "peak": peak,
+                      "numeric": sum(a.nbytes for a in numeric),
+                      "metadata": sum(a.nbytes for a in metadata)}))
+""")
+
+
+def test_chunked_csv_load_peak_rss_10m_rows(tmp_path):
+    """Ingestão por chunks de 10M linhas mantém pico de RSS perto do tamanho final"""
+    if os.getenv("RUN_STRESS") != "1":
+        pytest.skip("Stress tests disabled")
+    if sys.platform == "win32":
+        pytest.skip("resource.getrusage not available")
+
+    n = 10_000_000
+    path = tmp_path / "large.csv"
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=n, freq="100ms"),
+        "value": np.random.default_rng(0).standard_normal(n).round(4),
+    })
+    df.to_csv(path, index=False, chunksize=1_000_000)
+    del df
+
+    import json
+    env = {**os.environ, "PYTHONPATH": str(SRC_PATH)}
+    out = subprocess.run(
+        [sys.executable, "-c", _PEAK_RSS_SCRIPT, str(path), "500000"],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    stats = json.loads(out.stdout.strip().splitlines()[-1])
+
+    # Razão sobre as colunas numéricas; os arrays de interpolação (bool +
+    # "<U32" por linha) ficam residentes de qualquer forma e são descontados
+    # em vez de inflar o denominador. Acima de 1.0x sobra o working set de um
+    # chunk de parsing (~0.25x com chunks de 500k linhas), retido pelos
+    # alocadores: proporcional a chunk_size, não ao tamanho do dataset.
+    ratio = (stats["peak"] - stats["baseline"] - stats["metadata"]) / stats["numeric"]
+    assert ratio < 1.3, f"Pico de RSS {ratio:.2f}x o tamanho das colunas numéricas (max 1.3x)"
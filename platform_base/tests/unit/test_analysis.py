@@ -0,0 +1,106 @@
+"""
+Testes unitários para correlação e estimativa de atrasos (processing/analysis.py)
+"""
+import numpy as np
+import pytest
+
+from platform_base.processing.analysis import compute_correlation, compute_lag_matrix
+from platform_base.utils.errors import ValidationError
+
+
+@pytest.fixture
+def noise():
+    return np.random.default_rng(3).normal(size=2000)
+
+
+class TestCorrelation:
+    """Métodos direct/fft contra np.correlate"""
+
+    @pytest.mark.parametrize("method", ["direct", "fft", "auto"])
+    @pytest.mark.parametrize("n1,n2", [(50, 50), (40, 65), (65, 40)])
+    @pytest.mark.parametrize("max_lag", [None, 0, 7])
+    def test_matches_numpy(self, method, n1, n2, max_lag):
+        rng = np.random.default_rng(n1 + n2)
+        a, v = rng.normal(size=n1), rng.normal(size=n2)
+        expected = np.correlate(a, v, mode="full")
+        lags = np.arange(-(n2 - 1), n1)
+        if max_lag is not None:
+            keep = np.abs(lags) <= max_lag
+            expected, lags = expected[keep], lags[keep]
+
+        result = compute_correlation(a, v, mode="cross", max_lag=max_lag,
+                                     normalize=False, method=method)
+
+        np.testing.assert_array_equal(result.lags, lags)
+        np.testing.assert_allclose(result.correlation, expected, atol=1e-10)
+
+    def test_autocorrelation_normalized_peak(self, noise):
+        result = compute_correlation(noise, max_lag=20)
+
+        assert result.peak_lag == 0
+        assert result.correlation.shape == (41,)
+        assert result.peak_correlation == pytest.approx(np.sum(noise ** 2) / (np.std(noise) * len(noise)))
+
+    @pytest.mark.parametrize("method", ["direct", "fft"])
+    def test_finds_delay(self, noise, method):
+        delayed = np.roll(noise, 37)
+
+        result = compute_correlation(delayed, noise, mode="cross", max_lag=100, method=method)
+
+        assert result.peak_lag == 37
+        assert result.peak_correlation == pytest.approx(1.0, abs=0.05)
+
+    def test_large_signal_uses_fft(self):
+        rng = np.random.default_rng(5)
+        x = rng.normal(size=200_000)
+        result = compute_correlation(np.roll(x, -1234), x, mode="cross")
+
+        assert result.peak_lag == -1234
+        assert len(result.lags) == 2 * len(x) - 1
+
+    def test_invalid_arguments(self, noise):
+        with pytest.raises(ValidationError):
+            compute_correlation(noise, method="winograd")
+        with pytest.raises(ValidationError):
+            compute_correlation(noise, max_lag=-1)
+
+
+class TestLagMatrix:
+    """Matriz de atrasos entre todos os pares"""
+
+    def test_recovers_channel_delays(self, noise):
+        rng = np.random.default_rng(9)
+        delays = [0, 5, -12, 30]
+        series = {f"ch{k}": np.roll(noise, d) + 0.05 * rng.normal(size=noise.size)
+                  for k, d in enumerate(delays)}
+
+        result = compute_lag_matrix(series, max_lag=50)
+
+        assert result.names == list(series)
+        expected = np.subtract.outer(delays, delays)
+        np.testing.assert_array_equal(result.lags, expected)
+        np.testing.assert_allclose(np.diag(result.peak_correlation), 1.0)
+        assert np.all(result.peak_correlation > 0.9)
+        np.testing.assert_array_equal(result.peak_correlation, result.peak_correlation.T)
+
+    def test_matches_compute_correlation(self, noise):
+        other = np.roll(noise, 8) + np.linspace(0, 1, noise.size)
+        result = compute_lag_matrix({"a": noise, "b": other}, max_lag=20)
+
+        reference = compute_correlation(noise - noise.mean(), other - other.mean(),
+                                        mode="cross", max_lag=20)
+        assert result.lags[0, 1] == reference.peak_lag
+        assert result.peak_correlation[0, 1] == pytest.approx(reference.peak_correlation)
+
+    def test_nan_and_constant_series(self, noise):
+        gappy = noise.copy()
+        gappy[100:150] = np.nan
+
+        result = compute_lag_matrix({"a": noise, "b": gappy, "flat": np.ones(noise.size)}, max_lag=10)
+
+        assert result.lags[0, 1] == 0
+        assert result.peak_correlation[0, 2] == 0.0
+
+    def test_length_mismatch(self, noise):
+        with pytest.raises(ValidationError):
+            compute_lag_matrix({"a": noise, "b": noise[:-1]})
@@ -0,0 +1,152 @@
+"""
+Testes unitários para o processamento em lote (n_series x n_points)
+"""
+import numpy as np
+import pytest
+
+from platform_base.processing import parallel
+from platform_base.processing.calculus import (
+    derivative,
+    derivative_batch,
+    integral,
+    integral_batch,
+)
+from platform_base.processing.filters import apply_filter, apply_filter_batch
+from platform_base.processing.smoothing import SmoothingConfig, smooth, smooth_batch
+from platform_base.utils.errors import CalculusError, ValidationError
+
+
+@pytest.fixture
+def channels():
+    rng = np.random.default_rng(3)
+    t = np.sort(rng.uniform(0, 20, 12_001))
+    block = np.vstack([np.sin(k * t) + rng.normal(0, 0.05, t.size) for k in range(1, 7)])
+    return t, block
+
+
+@pytest.fixture
+def parallel_chunks(monkeypatch):
+    """Força a divisão em chunks mesmo para blocos pequenos"""
+    monkeypatch.setattr(parallel, "MIN_PARALLEL_SAMPLES", 0)
+
+
+class TestRowChunks:
+    """Helpers de parallel.py"""
+
+    def test_chunked_result_keeps_row_order(self, parallel_chunks):
+        block = np.arange(30, dtype=float).reshape(10, 3)
+        out = parallel.map_row_chunks(lambda rows: rows.sum(axis=1), block, max_workers=4)
+
+        np.testing.assert_array_equal(out, block.sum(axis=1))
+
+    def test_invalid_shapes(self):
+        with pytest.raises(ValidationError):
+            parallel.as_row_block(np.zeros(10))
+        with pytest.raises(CalculusError):
+            parallel.as_row_block(np.zeros((2, 10)), n_points=9, error=CalculusError)
+
+
+class TestDerivativeBatch:
+    """Cada linha igual a ``derivative`` da série isolada"""
+
+    @pytest.mark.parametrize(("method", "order"), [
+        ("finite_diff", 1),
+        ("finite_diff", 2),
+        ("savitzky_golay", 1),
+        ("savitzky_golay", 3),
+    ])
+    def test_matches_single_series(self, channels, parallel_chunks, method, order):
+        t, block = channels
+        result = derivative_batch(block, t, order, method, max_workers=3)
+
+        assert result.values.shape == block.shape
+        for row, out in zip(block, result.values, strict=True):
+            expected = derivative(row, t, order, method).values
+            np.testing.assert_allclose(out, expected, rtol=1e-12, atol=1e-12)
+
+    def test_spline_matches_single_series(self, channels, parallel_chunks):
+        t, block = channels
+        t, block = t[:400], block[:, :400]
+        params = {"s": 400 * 0.05**2}
+        result = derivative_batch(block, t, 1, "spline_derivative", params, max_workers=2)
+
+        for row, out in zip(block, result.values, strict=True):
+            expected = derivative(row, t, 1, "spline_derivative", params).values
+            np.testing.assert_allclose(out, expected, rtol=1e-12, atol=1e-12)
+
+    def test_with_smoothing(self, channels):
+        t, block = channels
+        smoothing = SmoothingConfig(method="gaussian", params={"sigma": 3})
+        result = derivative_batch(block, t, 1, smoothing=smoothing)
+
+        expected = derivative(block[2], t, 1, smoothing=smoothing).values
+        np.testing.assert_allclose(result.values[2], expected, rtol=1e-12, atol=1e-12)
+
+    def test_invalid_arguments(self, channels):
+        t, block = channels
+        with pytest.raises(CalculusError):
+            derivative_batch(block, t, 4)
+        with pytest.raises(CalculusError):
+            derivative_batch(block[:, :-1], t, 1)
+        with pytest.raises(CalculusError):
+            derivative_batch(block, t, 1, method="unknown")
+
+
+class TestIntegralBatch:
+    """Áreas por linha e integral cumulativa"""
+
+    @pytest.mark.parametrize("method", ["trapezoid", "simpson", "cumulative"])
+    def test_matches_single_series(self, channels, method):
+        t, block = channels
+        result = integral_batch(block[:, :-1], t[:-1], method)
+
+        expected = np.vstack([integral(row, t[:-1], method).values for row in block[:, :-1]])
+        np.testing.assert_allclose(np.atleast_2d(result.values.T).T, expected,
+                                   rtol=1e-10, atol=1e-12)
+
+
+class TestSmoothAndFilterBatch:
+    """smooth_batch / apply_filter_batch"""
+
+    @pytest.mark.parametrize(("method", "params"), [
+        ("savitzky_golay", {"window_length": 11, "polyorder": 3}),
+        ("gaussian", {"sigma": 2.0}),
+        ("median", {"kernel_size": 5}),
+        ("lowpass", {"cutoff": 0.1, "order": 3}),
+    ])
+    def test_smooth_matches_single_series(self, channels, parallel_chunks, method, params):
+        _, block = channels
+        out = smooth_batch(block, method, params, max_workers=2)
+
+        for row, row_out in zip(block, out, strict=True):
+            np.testing.assert_allclose(row_out, smooth(row, method, params), atol=1e-12)
+
+    @pytest.mark.parametrize("zero_phase", [True, False])
+    def test_filter_matches_single_series(self, channels, parallel_chunks, zero_phase):
+        _, block = channels
+        out = apply_filter_batch(block, 500.0, "lowpass", 20.0, zero_phase=zero_phase,
+                                 max_workers=2)
+
+        for row, row_out in zip(block, out, strict=True):
+            expected = apply_filter(row, 500.0, "lowpass", 20.0, zero_phase=zero_phase)
+            np.testing.assert_allclose(row_out, expected.filtered_values, atol=1e-12)
+
+    def test_filter_keeps_nan_positions(self, channels):
+        _, block = channels
+        block = block.copy()
+        block[1, 500:700] = np.nan
+        out = apply_filter_batch(block, 500.0, "bandpass", (5.0, 50.0))
+        expected = apply_filter(block[1], 500.0, "bandpass", (5.0, 50.0)).filtered_values
+
+        assert out.shape == block.shape
+        assert np.isnan(out[1, 500:700]).all()
+        np.testing.assert_allclose(out[1][~np.isnan(block[1])], expected, atol=1e-12)
+
+    def test_filter_invalid_arguments(self, channels):
+        _, block = channels
+        with pytest.raises(ValidationError):
+            apply_filter_batch(block, 500.0, "lowpass", 300.0)
+        with pytest.raises(ValidationError):
+            apply_filter_batch(block, -1.0, "lowpass", 20.0)
+        with pytest.raises(ValidationError):
+            apply_filter_batch(block[0], 500.0, "lowpass", 20.0)
@@ -3,6 +3,7 @@
 import tempfile
 import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -207,4 +208,153 @@ class TestDiskCache:
             
             # Test setting None value
             cache.set("null_key", None)
-            assert cache.get("null_key") is None
\ No newline at end of file
+            assert cache.get("null_key") is None
+
+class TestArrayAwareDiskCache:
+    """Test numpy-aware storage (npy blobs + SQLite index)."""
+
+    def test_large_arrays_return_memmap(self, tmp_path):
+        """Large arrays are stored as .npy blobs and mapped on hit."""
+        import numpy as np
+
+        cache = DiskCache(location=tmp_path)
+        values = np.random.rand(100_000)
+        cache.set("view", {"values": values, "small": np.arange(3), "label": "x"})
+
+        result = cache.get("view")
+
+        assert isinstance(result["values"], np.memmap)
+        np.testing.assert_array_equal(result["values"], values)
+        assert not isinstance(result["small"], np.memmap)
+        assert result["label"] == "x"
+
+    def test_cached_arrays_are_copy_on_write(self, tmp_path):
+        """Writing to a returned array does not change the cache."""
+        import numpy as np
+
+        cache = DiskCache(location=tmp_path)
+        cache.set("arr", np.zeros(50_000))
+
+        first = cache.get("arr")
+        first[0] = 1.0
+
+        assert cache.get("arr")[0] == 0.0
+
+    def test_pydantic_model_roundtrip(self, tmp_path):
+        """ViewData round-trips with memory-mapped series."""
+        import numpy as np
+
+        from platform_base.core.models import TimeWindow, ViewData
+
+        n = 20_000
+        t = np.arange(n, dtype=float)
+        view = ViewData(
+            dataset_id="ds",
+            series={"s": np.sin(t)},
+            t_seconds=t,
+            t_datetime=np.datetime64("2024-01-01", "ns") + t.astype("timedelta64[s]"),
+            window=TimeWindow(start=0.0, end=float(n)),
+        )
+        cache = DiskCache(location=tmp_path)
+        cache.set("view:ds", view)
+
+        result = cache.get("view:ds")
+
+        assert isinstance(result.series["s"], np.memmap)
+        np.testing.assert_array_equal(result.t_datetime, view.t_datetime)
+
+    def test_lru_updates_are_batched(self, tmp_path):
+        """Hits are buffered and written to the index in batches."""
+        from platform_base.caching import disk
+
+        cache = DiskCache(location=tmp_path)
+        cache.set("key", "value")
+
+        for _ in range(3):
+            cache.get("key")
+        assert cache.get_stats()["pending_lru_updates"] == 1
+
+        with patch.object(disk, "LRU_FLUSH_INTERVAL", 1):
+            cache.get("key")
+        assert cache.get_stats()["pending_lru_updates"] == 0
+
+    def test_recent_hit_protects_from_eviction(self, tmp_path):
+        """Batched hits still count for LRU eviction."""
+        cache = DiskCache(location=tmp_path, max_size_bytes=500)
+        cache.set("key1", "x" * 200)
+        time.sleep(0.01)
+        cache.set("key2", "x" * 200)
+        time.sleep(0.01)
+        cache.get("key1")
+
+        cache.set("key3", "x" * 200)
+
+        assert cache.get("key1") is not None
+        assert cache.get("key2") is None
+
+    def test_size_tracked_without_scanning(self, tmp_path):
+        """Inserting does not walk the cache directory."""
+        cache = DiskCache(location=tmp_path, max_size_bytes=10_000_000)
+        cache.set("a", "x" * 1000)
+
+        with patch.object(Path, "glob", side_effect=AssertionError("scan")):
+            cache.set("b", "x" * 1000)
+
+        assert cache.get_stats()["current_size_bytes"] > 2000
+
+    def test_index_persists_size(self, tmp_path):
+        """A new instance reads the total size from the index."""
+        cache1 = DiskCache(location=tmp_path)
+        cache1.set("a", "x" * 1000)
+        size = cache1.get_stats()["current_size_bytes"]
+        cache1.close()
+
+        cache2 = DiskCache(location=tmp_path)
+        assert cache2.get_stats()["current_size_bytes"] == size
+        assert cache2.get_stats()["entry_count"] == 1
+
+    def test_cleanup_removes_orphans(self, tmp_path):
+        """Entries missing from the index are removed by cleanup."""
+        cache = DiskCache(location=tmp_path)
+        cache.set("a", "value")
+        orphan = tmp_path / "entries" / "orphan"
+        orphan.mkdir()
+        (tmp_path / "legacy.cache").write_bytes(b"old")
+
+        cache.cleanup()
+
+        assert not orphan.exists()
+        assert not (tmp_path / "legacy.cache").exists()
+        assert cache.get("a") == "value"
+
+    def test_overwrite_keeps_mapped_readers_valid(self, tmp_path):
+        """set() on an existing key writes a new version; old maps stay intact."""
+        import numpy as np
+
+        cache = DiskCache(location=tmp_path)
+        cache.set("arr", np.zeros(50_000))
+        reader = cache.get("arr")
+
+        cache.set("arr", np.ones(50_000))
+
+        assert reader.sum() == 0.0
+        assert cache.get("arr").sum() == 50_000
+        assert cache.get_stats()["entry_count"] == 1
+        assert len([p for p in (tmp_path / "entries").iterdir() if p.is_dir()]) == 1
+
+    def test_cleanup_keeps_in_flight_staging(self, tmp_path):
+        """Fresh .tmp staging dirs (another thread's set) survive cleanup; stale ones go."""
+        import os
+
+        cache = DiskCache(location=tmp_path)
+        fresh = tmp_path / "entries" / ".abc.123.tmp"
+        stale = tmp_path / "entries" / ".def.456.tmp"
+        fresh.mkdir()
+        stale.mkdir()
+        old = time.time() - 2 * 3600
+        os.utime(stale, (old, old))
+
+        cache.cleanup()
+
+        assert fresh.exists()
+        assert not stale.exists()
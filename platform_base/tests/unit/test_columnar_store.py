@@ -0,0 +1,312 @@
+"""
+Testes unitários para o formato colunar (io/columnar.py) e sua integração
+com o DatasetStore.
+"""
+import json
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from platform_base.core.dataset_store import DatasetStore
+from platform_base.core.models import (
+    Dataset,
+    DatasetMetadata,
+    InterpolationInfo,
+    Lineage,
+    Series,
+    SeriesMetadata,
+    SourceInfo,
+)
+from platform_base.io.columnar import (
+    is_columnar_dataset,
+    read_columnar,
+    read_manifest,
+    write_columnar,
+)
+from platform_base.processing.units import parse_unit
+from platform_base.utils.errors import DataLoadError, ValidationError
+
+
+@pytest.fixture
+def dataset():
+    """Dataset com duas séries, uma com informação de interpolação"""
+    n_points = 500
+    t_seconds = np.arange(n_points, dtype=np.float64) * 0.5
+    t_datetime = np.datetime64("2024-01-01T00:00:00", "ns") + (t_seconds * 1e9).astype("timedelta64[ns]")
+
+    pressure = np.sin(t_seconds)
+    pressure[10:15] = np.nan
+    info = InterpolationInfo(
+        is_interpolated=np.zeros(n_points, dtype=bool),
+        method_used=np.where(np.isnan(pressure), "missing", "original").astype("<U32"),
+    )
+
+    series = {
+        "BAR_DT (bar)": Series(
+            series_id="BAR_DT (bar)",
+            name="BAR_DT (bar)",
+            unit=parse_unit("bar"),
+            values=pressure,
+            interpolation_info=info,
+            metadata=SeriesMetadata(original_name="BAR_DT (bar)", source_column="BAR_DT (bar)"),
+            lineage=Lineage(
+                origin_series=[],
+                operation="load",
+                parameters={"path": "/data/bar.csv"},
+                timestamp=datetime(2024, 1, 1),
+                version="2.0.0",
+            ),
+        ),
+        "temp": Series(
+            series_id="temp",
+            name="temp",
+            unit=parse_unit("degC"),
+            values=np.cos(t_seconds),
+            metadata=SeriesMetadata(original_name="temp", source_column="temp"),
+        ),
+    }
+
+    return Dataset(
+        dataset_id="ds_columnar",
+        version=1,
+        parent_id=None,
+        source=SourceInfo(
+            filepath="/data/bar.csv", filename="bar.csv", format="csv",
+            size_bytes=1024, checksum="abc",
+        ),
+        t_seconds=t_seconds,
+        t_datetime=t_datetime,
+        series=series,
+        metadata=DatasetMetadata(description="columnar", tags=["a"]),
+        created_at=datetime(2024, 1, 2, 3, 4, 5),
+    )
+
+
+class TestColumnarFormat:
+    """Testa escrita/leitura do formato colunar"""
+
+    def test_roundtrip_preserves_data(self, dataset, tmp_path):
+        path = write_columnar(dataset, tmp_path)
+        assert is_columnar_dataset(path)
+
+        loaded = read_columnar(path)
+
+        assert loaded.dataset_id == dataset.dataset_id
+        assert loaded.created_at == dataset.created_at
+        assert loaded.metadata.tags == ["a"]
+        np.testing.assert_array_equal(loaded.t_seconds, dataset.t_seconds)
+        np.testing.assert_array_equal(loaded.t_datetime, dataset.t_datetime)
+        assert list(loaded.series) == list(dataset.series)
+        for sid, series in dataset.series.items():
+            np.testing.assert_array_equal(loaded.series[sid].values, series.values)
+            assert str(loaded.series[sid].unit) == str(series.unit)
+
+    def test_arrays_are_memory_mapped(self, dataset, tmp_path):
+        loaded = read_columnar(write_columnar(dataset, tmp_path))
+
+        assert isinstance(loaded.t_seconds, np.memmap)
+        assert isinstance(loaded.series["temp"].values, np.memmap)
+        with pytest.raises(ValueError):
+            loaded.series["temp"].values[0] = 1.0
+
+    def test_mmap_disabled_loads_in_memory(self, dataset, tmp_path):
+        loaded = read_columnar(write_columnar(dataset, tmp_path), mmap_mode=None)
+
+        assert not isinstance(loaded.series["temp"].values, np.memmap)
+
+    def test_interpolation_info_and_lineage_roundtrip(self, dataset, tmp_path):
+        loaded = read_columnar(write_columnar(dataset, tmp_path))
+        original = dataset.series["BAR_DT (bar)"]
+        restored = loaded.series["BAR_DT (bar)"]
+
+        np.testing.assert_array_equal(
+            restored.interpolation_info.method_used, original.interpolation_info.method_used,
+        )
+        assert restored.lineage.operation == "load"
+        assert loaded.series["temp"].interpolation_info is None
+
+    def test_rewrite_replaces_existing(self, dataset, tmp_path):
+        write_columnar(dataset, tmp_path)
+        dataset.series.pop("temp")
+        path = write_columnar(dataset, tmp_path)
+
+        assert list(read_columnar(path).series) == ["BAR_DT (bar)"]
+
+    def test_pyramid_persisted_next_to_series(self, dataset, tmp_path):
+        path = write_columnar(dataset, tmp_path)
+        manifest = read_manifest(path)
+        loaded = read_columnar(path)
+
+        pyramid = loaded.series["temp"].pyramid
+        assert "pyramid_lo" in manifest["series"][1]["files"]
+        assert isinstance(pyramid.to_arrays()["lo"], np.memmap)
+        assert pyramid.values is loaded.series["temp"].values
+        idx = pyramid.indices(0, 500, 20)
+        assert loaded.series["temp"].values[idx].max() == dataset.series["temp"].values.max()
+
+    def test_manifest_without_pyramid_builds_on_demand(self, dataset, tmp_path):
+        path = write_columnar(dataset, tmp_path)
+        manifest = read_manifest(path)
+        for entry in manifest["series"]:
+            entry.pop("pyramid")
+            entry["files"].pop("pyramid_lo")
+            entry["files"].pop("pyramid_hi")
+        (path / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+        store = DatasetStore()
+        store.open_columnar(path)
+
+        assert store.get_series("ds_columnar", "temp").pyramid is None
+        pyramid = store.get_pyramid("ds_columnar", "temp")
+        assert pyramid.n_points == 500
+        assert store.get_pyramid("ds_columnar", "temp") is pyramid
+
+    def test_missing_manifest_raises(self, tmp_path):
+        with pytest.raises(DataLoadError):
+            read_columnar(tmp_path)
+
+    def test_unsupported_version_raises(self, dataset, tmp_path):
+        path = write_columnar(dataset, tmp_path)
+        manifest = (path / "manifest.json").read_text().replace(
+            '"format_version": 1', '"format_version": 99',
+        )
+        (path / "manifest.json").write_text(manifest)
+
+        with pytest.raises(DataLoadError):
+            read_manifest(path)
+
+
+class TestDatasetStoreColumnar:
+    """Testa DatasetStore com store colunar habilitado"""
+
+    def test_add_dataset_serves_memmap(self, dataset, tmp_path):
+        store = DatasetStore(columnar_path=tmp_path)
+        store.add_dataset(dataset)
+
+        series = store.get_series("ds_columnar", "temp")
+        assert isinstance(series.values, np.memmap)
+        np.testing.assert_array_equal(series.values, dataset.series["temp"].values)
+
+    def test_columnar_path_from_cache_config(self, dataset, tmp_path):
+        store = DatasetStore(cache_config={"path": str(tmp_path / "cache"),
+                                           "columnar_path": str(tmp_path / "cols")})
+        store.add_dataset(dataset)
+
+        assert is_columnar_dataset(tmp_path / "cols" / "ds_columnar")
+
+    def test_reopen_from_new_store(self, dataset, tmp_path):
+        DatasetStore(columnar_path=tmp_path).add_dataset(dataset)
+
+        reopened = DatasetStore(columnar_path=tmp_path)
+        loaded = reopened.get_dataset("ds_columnar")
+
+        assert isinstance(loaded.t_seconds, np.memmap)
+        assert len(loaded.series) == 2
+
+    def test_persist_and_open_columnar(self, dataset, tmp_path):
+        store = DatasetStore()
+        store.add_dataset(dataset)
+        path = store.persist_dataset("ds_columnar", root=tmp_path)
+
+        assert isinstance(store.get_dataset("ds_columnar").t_seconds, np.memmap)
+
+        other = DatasetStore()
+        assert other.open_columnar(path) == "ds_columnar"
+
+    def test_persist_without_root_raises(self, dataset):
+        store = DatasetStore()
+        store.add_dataset(dataset)
+
+        with pytest.raises(ValidationError):
+            store.persist_dataset("ds_columnar")
+
+    def test_remove_dataset_deletes_files(self, dataset, tmp_path):
+        store = DatasetStore(columnar_path=tmp_path)
+        store.add_dataset(dataset)
+
+        assert store.remove_dataset("ds_columnar")
+        assert not is_columnar_dataset(tmp_path / "ds_columnar")
+        with pytest.raises(ValidationError):
+            store.get_dataset("ds_columnar")
+
+
+class TestDatasetStoreViews:
+    """Testa create_view por busca binária e o fallback não-monotônico"""
+
+    def test_monotonic_flag_detected_and_persisted(self, dataset, tmp_path):
+        assert dataset.is_monotonic is True
+
+        path = write_columnar(dataset, tmp_path)
+        assert read_manifest(path)["is_monotonic"] is True
+        assert read_columnar(path).is_monotonic is True
+
+    def test_monotonic_view_is_zero_copy(self, dataset, tmp_path):
+        from platform_base.core.models import TimeWindow
+
+        store = DatasetStore(columnar_path=tmp_path)
+        store.add_dataset(dataset)
+        view = store.create_view("ds_columnar", ["temp"], TimeWindow(start=10.0, end=20.0))
+
+        t = store.get_dataset("ds_columnar").t_seconds
+        assert view.t_seconds[0] == 10.0 and view.t_seconds[-1] == 20.0
+        assert len(view.t_seconds) == 21
+        assert isinstance(view.series["temp"], np.memmap)
+        assert np.shares_memory(view.t_seconds, t)
+
+    def test_monotonic_view_is_read_only(self, dataset):
+        from platform_base.core.models import TimeWindow
+
+        store = DatasetStore()
+        store.add_dataset(dataset)
+        view = store.create_view("ds_columnar", ["temp"], TimeWindow(start=10.0, end=20.0))
+
+        with pytest.raises(ValueError):
+            view.series["temp"][0] = 0.0
+        with pytest.raises(ValueError):
+            view.t_seconds[0] = 0.0
+        assert dataset.t_seconds.flags.writeable  # o dataset continua editável
+
+    def test_replacing_time_axis_recomputes_flag(self, dataset):
+        shuffled_t = dataset.t_seconds[::-1].copy()
+
+        copy = dataset.model_copy(update={"t_seconds": shuffled_t})
+        assert copy.is_monotonic is False
+        assert dataset.model_copy(update={"version": 2}).is_monotonic is True
+
+        dataset.t_seconds = shuffled_t
+        assert dataset.is_monotonic is False
+
+    def test_non_monotonic_matches_mask(self, dataset):
+        from platform_base.core.models import TimeWindow
+
+        rng = np.random.default_rng(0)
+        order = rng.permutation(len(dataset.t_seconds))
+        shuffled = Dataset(**{
+            **dataset.__dict__,
+            "t_seconds": dataset.t_seconds[order],
+            "t_datetime": dataset.t_datetime[order],
+            "is_monotonic": None,
+        })
+        assert shuffled.is_monotonic is False
+
+        store = DatasetStore()
+        store.add_dataset(shuffled)
+        window = TimeWindow(start=30.0, end=60.5)
+        view = store.create_view("ds_columnar", ["temp"], window)
+
+        mask = (shuffled.t_seconds >= 30.0) & (shuffled.t_seconds <= 60.5)
+        np.testing.assert_array_equal(view.t_seconds, shuffled.t_seconds[mask])
+        np.testing.assert_array_equal(view.series["temp"],
+                                      shuffled.series["temp"].values[mask])
+        assert store.create_view("ds_columnar", ["temp"], window) is view
+
+    def test_view_cache_key_is_stable(self):
+        from platform_base.core.models import TimeWindow
+
+        window = TimeWindow(start=1.0, end=2.5)
+        key = DatasetStore._view_cache_key("ds", ["a", "b"], window)
+
+        assert key == DatasetStore._view_cache_key("ds", ["a", "b"], window)
+        assert key != DatasetStore._view_cache_key("ds", ["ab"], window)
+        assert key.startswith("view:ds:")
@@ -159,6 +159,33 @@ class TestMemoryManager:
         
         assert hasattr(memory_manager, 'PSUTIL_AVAILABLE')
 
+    def test_reservations_reduce_available_memory(self, tmp_path):
+        """Test that reserved loads count against can_load_file."""
+        from platform_base.core import memory_manager
+
+        manager = MemoryManager()
+        status = MemoryStatus(
+            process_mb=100.0, total_mb=1000.0, available_mb=500.0,
+            percent=50.0, level=MemoryLevel.NORMAL, suggestions=[],
+        )
+        path = tmp_path / "data.csv"
+        path.write_text("x")
+
+        with patch.object(memory_manager, "PSUTIL_AVAILABLE", True), \
+             patch.object(manager, "get_status", return_value=status), \
+             patch.object(manager, "estimate_file_memory", return_value=300.0):
+            assert manager.can_load_file(path)[0]
+
+            assert manager.reserve("first", path) == 300.0
+            assert manager.reserved_mb == 300.0
+            can_load, message = manager.can_load_file(path)
+            assert not can_load
+            assert "200.0MB available" in message
+
+            manager.release("first")
+            assert manager.reserved_mb == 0.0
+            assert manager.can_load_file(path)[0]
+
 
 class TestMemoryLevelThresholds:
     """Tests for memory level threshold logic."""
@@ -0,0 +1,180 @@
+"""
+Testes unitários para o cache persistente de datasets (io/dataset_cache.py)
+"""
+import os
+import shutil
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from platform_base.io.dataset_cache import DatasetCache, config_fingerprint
+from platform_base.io.loader import DataLoaderService, LoadConfig, load
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "BAR_DT.csv"
+    pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=200, freq="s"),
+        "pressure": np.sin(np.arange(200) / 10.0),
+        "flow": np.arange(200, dtype=float),
+    }).to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DatasetCache(tmp_path / "cache")
+
+
+class TestDatasetCache:
+    """Testa get/put, chave por conteúdo e validação por size+mtime"""
+
+    def test_roundtrip(self, cache, csv_file):
+        config = LoadConfig()
+        dataset = load(str(csv_file), config)
+
+        assert cache.get(csv_file, config) is None
+        cache.put(csv_file, config, dataset)
+        cached = cache.get(csv_file, config)
+
+        assert cached is not None
+        assert cached.dataset_id != dataset.dataset_id
+        assert list(cached.series) == list(dataset.series)
+        np.testing.assert_array_equal(cached.t_seconds, dataset.t_seconds)
+        np.testing.assert_array_equal(cached.series["flow"].values, dataset.series["flow"].values)
+        assert isinstance(cached.series["flow"].values, np.memmap)
+        assert cached.source.checksum == dataset.source.checksum
+
+    def test_cached_arrays_are_copy_on_write(self, cache, csv_file):
+        config = LoadConfig()
+        cache.put(csv_file, config, load(str(csv_file), config))
+
+        first = cache.get(csv_file, config)
+        first.series["flow"].values[0] = -1.0
+
+        assert cache.get(csv_file, config).series["flow"].values[0] == 0.0
+
+    def test_config_is_part_of_key(self, cache, csv_file):
+        config = LoadConfig()
+        cache.put(csv_file, config, load(str(csv_file), config))
+
+        assert cache.get(csv_file, LoadConfig(columns=["flow"])) is None
+        assert config_fingerprint(config) == config_fingerprint(LoadConfig())
+
+    def test_content_addressed_across_paths(self, cache, csv_file, tmp_path):
+        config = LoadConfig()
+        cache.put(csv_file, config, load(str(csv_file), config))
+
+        copy = tmp_path / "copy.csv"
+        shutil.copy(csv_file, copy)
+        cached = cache.get(copy, config)
+
+        assert cached is not None
+        assert cached.source.filename == "copy.csv"
+
+    def test_unchanged_file_is_not_rehashed(self, cache, csv_file):
+        config = LoadConfig()
+        cache.put(csv_file, config, load(str(csv_file), config))
+
+        with patch("platform_base.io.dataset_cache.file_checksum") as checksum:
+            assert cache.get(csv_file, config) is not None
+        checksum.assert_not_called()
+
+    def test_modified_file_misses(self, cache, csv_file):
+        config = LoadConfig()
+        cache.put(csv_file, config, load(str(csv_file), config))
+
+        with open(csv_file, "a") as f:
+            f.write("2024-01-01 00:03:20,0.5,200.0\n")
+
+        assert cache.get(csv_file, config) is None
+
+    def test_touched_file_with_same_content_hits(self, cache, csv_file):
+        config = LoadConfig()
+        cache.put(csv_file, config, load(str(csv_file), config))
+
+        stat = csv_file.stat()
+        os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert cache.get(csv_file, config) is not None
+
+    def test_size_limit_evicts_oldest(self, tmp_path, csv_file):
+        config = LoadConfig()
+        dataset = load(str(csv_file), config)
+        probe = DatasetCache(tmp_path / "probe")
+        probe.put(csv_file, config, dataset)
+        entry_size = probe.size_bytes
+
+        cache = DatasetCache(tmp_path / "limited", max_size_bytes=int(entry_size * 1.5))
+        cache.put(csv_file, config, dataset)
+        other = LoadConfig(max_missing_ratio=0.5)
+        cache.put(csv_file, other, load(str(csv_file), other))
+
+        assert cache.get_stats()["entry_count"] == 1
+        assert cache.get(csv_file, config) is None
+        assert cache.get(csv_file, other) is not None
+
+    def test_clear(self, cache, csv_file):
+        config = LoadConfig()
+        cache.put(csv_file, config, load(str(csv_file), config))
+        cache.clear()
+
+        assert cache.get(csv_file, config) is None
+        assert cache.size_bytes == 0
+
+
+class TestDataLoaderServiceCache:
+    """Testa integração do cache com DataLoaderService"""
+
+    def test_second_load_skips_parser(self, cache, csv_file):
+        service = DataLoaderService(dataset_cache=cache)
+        first = service.load_dataset(csv_file)
+
+        with patch("platform_base.io.loader.load") as parser:
+            second = DataLoaderService(dataset_cache=cache).load_dataset(csv_file)
+        parser.assert_not_called()
+
+        np.testing.assert_array_equal(second.series["pressure"].values,
+                                      first.series["pressure"].values)
+
+    def test_cold_miss_hashes_file_once(self, cache, csv_file):
+        from platform_base.io import dataset_cache, loader
+
+        hashers = []
+        original_open = loader._hashed_open
+
+        def spy_open(path, hasher):
+            hashers.append(hasher)
+            return original_open(path, hasher)
+
+        with patch.object(dataset_cache, "file_checksum", wraps=dataset_cache.file_checksum) as lookup_hash, \
+                patch.object(loader, "_hashed_open", side_effect=spy_open), \
+                patch.object(loader, "file_checksum") as source_hash:
+            dataset = DataLoaderService(dataset_cache=cache).load_dataset(csv_file)
+
+        lookup_hash.assert_called_once()
+        source_hash.assert_not_called()
+        assert hashers and all(h is None for h in hashers)
+        assert dataset.source.checksum == dataset_cache.file_checksum(csv_file)
+        assert cache.get(csv_file, LoadConfig()) is not None
+
+    def test_use_cache_false_bypasses(self, cache, csv_file):
+        DataLoaderService(dataset_cache=cache).load_dataset(csv_file, use_cache=False)
+
+        assert cache.get_stats()["entry_count"] == 0
+
+    def test_load_many_serves_hits_without_pool(self, cache, csv_file):
+        from unittest.mock import MagicMock
+
+        service = DataLoaderService(dataset_cache=cache)
+        service.load_dataset(csv_file)
+        manager = MagicMock()
+        manager.can_load_file.return_value = (True, None)
+
+        results = list(service.load_many([csv_file], memory_manager=manager))
+
+        assert results[0].ok
+        manager.reserve.assert_not_called()
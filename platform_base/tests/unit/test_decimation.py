@@ -0,0 +1,156 @@
+"""
+Testes unitários para o engine de decimação (processing/decimation.py)
+"""
+import numpy as np
+import pytest
+
+from platform_base.processing import decimation
+from platform_base.processing.decimation import (
+    DECIMATION_METHODS,
+    decimate,
+    decimate_indices,
+)
+from platform_base.utils.errors import DownsampleError
+
+
+@pytest.fixture
+def noisy_sine():
+    rng = np.random.default_rng(42)
+    t = np.linspace(0, 100, 50_000)
+    y = np.sin(t) + rng.normal(0, 0.1, t.size)
+    return t, y
+
+
+class TestDecimateIndices:
+    """Contrato comum a todos os métodos"""
+
+    @pytest.mark.parametrize("method", DECIMATION_METHODS)
+    def test_indices_sorted_and_bounded(self, noisy_sine, method):
+        t, y = noisy_sine
+        idx = decimate_indices(t, y, 1000, method)
+
+        assert idx.dtype == np.int64
+        assert len(idx) <= 1000
+        assert np.all(np.diff(idx) > 0)
+        assert idx[0] >= 0
+        assert idx[-1] < len(y)
+
+    @pytest.mark.parametrize("method", DECIMATION_METHODS)
+    def test_small_input_returns_everything(self, method):
+        y = np.arange(10, dtype=float)
+        np.testing.assert_array_equal(decimate_indices(None, y, 20, method), np.arange(10))
+
+    def test_lttb_exact_count_and_endpoints(self, noisy_sine):
+        t, y = noisy_sine
+        idx = decimate_indices(t, y, 500, "lttb")
+
+        assert len(idx) == 500
+        assert idx[0] == 0
+        assert idx[-1] == len(y) - 1
+
+    def test_minmax_keeps_global_extrema(self, noisy_sine):
+        t, y = noisy_sine
+        idx = decimate_indices(t, y, 200, "minmax")
+
+        assert np.argmax(y) in idx
+        assert np.argmin(y) in idx
+
+    def test_m4_keeps_bucket_edges(self):
+        y = np.sin(np.linspace(0, 20, 4000))
+        idx = decimate_indices(None, y, 40, "m4")
+
+        # 10 buckets de 400: primeiro e último ponto de cada um
+        for b in range(10):
+            assert b * 400 in idx
+            assert b * 400 + 399 in idx
+
+    def test_peak_aware_keeps_spike(self):
+        y = np.sin(np.linspace(0, 20, 100_000))
+        y[31_337] = 50.0
+        idx = decimate_indices(None, y, 300, "peak_aware")
+
+        assert 31_337 in idx
+
+    def test_nan_buckets_are_kept_visible(self):
+        y = np.sin(np.linspace(0, 10, 1000))
+        y[100:300] = np.nan
+        idx = decimate_indices(None, y, 100, "minmax")
+
+        assert np.any(np.isnan(y[idx]))
+        assert np.nanmax(y[idx]) == np.nanmax(y)
+
+    def test_datetime_axis(self):
+        t = np.datetime64("2024-01-01", "ns") + np.arange(10_000).astype("timedelta64[s]")
+        y = np.cos(np.arange(10_000) / 100)
+        t_out, y_out = decimate(t, y, 100, "lttb")
+
+        assert t_out.dtype == t.dtype
+        assert len(y_out) == 100
+
+    def test_preallocated_output(self, noisy_sine):
+        t, y = noisy_sine
+        out = np.empty(600, dtype=np.int64)
+        idx = decimate_indices(t, y, 600, "lttb", out=out)
+
+        assert np.shares_memory(idx, out)
+        np.testing.assert_array_equal(idx, decimate_indices(t, y, 600, "lttb"))
+
+    def test_output_buffer_too_small(self, noisy_sine):
+        t, y = noisy_sine
+        with pytest.raises(DownsampleError):
+            decimate_indices(t, y, 600, "lttb", out=np.empty(10, dtype=np.int64))
+
+    def test_invalid_arguments(self):
+        y = np.arange(100, dtype=float)
+        with pytest.raises(DownsampleError):
+            decimate_indices(None, y, 10, "spline")
+        with pytest.raises(DownsampleError):
+            decimate_indices(None, y, 0)
+        with pytest.raises(DownsampleError):
+            decimate_indices(np.arange(5), y, 10)
+
+
+class TestMultiSeries:
+    """Várias séries decimadas numa única chamada"""
+
+    def test_shared_selection(self):
+        t = np.linspace(0, 10, 20_000)
+        y = np.vstack([np.sin(t), np.cos(3 * t), t])
+        t_out, y_out = decimate(t, y, 900, "minmax")
+
+        assert y_out.shape == (3, len(t_out))
+        assert len(t_out) <= 900
+        # Extremos de cada série preservados na seleção comum
+        for row, row_out in zip(y, y_out):
+            assert row_out.max() == row.max()
+            assert row_out.min() == row.min()
+
+
+class TestKernelEquivalence:
+    """Kernels compilados e fallbacks numpy devem escolher os mesmos pontos"""
+
+    @pytest.mark.parametrize("n_out", [3, 17, 256])
+    def test_lttb(self, noisy_sine, n_out):
+        t, y = noisy_sine
+        a = np.empty(n_out, dtype=np.int64)
+        b = np.empty(n_out, dtype=np.int64)
+        decimation._lttb_kernel(t, y, n_out, 0.0, 0.5, a)
+        decimation._lttb_numpy(t, y, n_out, 0.0, 0.5, b)
+
+        np.testing.assert_array_equal(a, b)
+
+    @pytest.mark.parametrize(("kernel", "fallback", "per_bucket"), [
+        ("_minmax_kernel", "_minmax_numpy", 2),
+        ("_m4_kernel", "_m4_numpy", 4),
+    ])
+    def test_bucket_kernels(self, noisy_sine, kernel, fallback, per_bucket):
+        _, y = noisy_sine
+        y = y.copy()
+        y[1000:1400] = np.nan
+        a = np.empty(per_bucket * 100, dtype=np.int64)
+        b = np.empty(per_bucket * 100, dtype=np.int64)
+        ka = getattr(decimation, kernel)(y, 100, a)
+        kb = getattr(decimation, fallback)(y, 100, b)
+
+        assert ka == kb
+        np.testing.assert_array_equal(a[:ka], b[:kb])
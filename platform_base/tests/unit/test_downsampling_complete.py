@@ -193,6 +193,41 @@ class TestAdaptiveDownsample:
         
         assert len(ds_t) == len(ds_v) == len(indices)
 
+    @pytest.mark.parametrize(("n_data", "n_points", "threshold"), [
+        (5_000, 300, 0.1),
+        (20_011, 1_000, 0.05),
+        (2_000, 150, 0.0),
+    ])
+    def test_matches_reference_loop(self, n_data, n_points, threshold):
+        """Testa equivalência com a implementação por janela (np.var + argmin)"""
+        rng = np.random.default_rng(n_data)
+        t = np.arange(n_data, dtype=float)
+        values = np.sin(t / 200) * np.linspace(0, 3, n_data) + rng.normal(0, 0.05, n_data)
+        values[n_data // 2: n_data // 2 + 300] = 1.5  # trecho constante
+
+        window_size = max(3, n_data // 100)
+        variances = np.array([
+            np.var(values[max(0, i - window_size // 2):min(n_data, i + window_size // 2 + 1)])
+            for i in range(n_data)
+        ])
+        variances = np.maximum(variances / variances.max(), threshold)
+        cumulative = np.cumsum(variances / variances.sum())
+        expected = sorted({0, n_data - 1} | {
+            int(np.argmin(np.abs(cumulative - i / n_points))) for i in range(1, n_points - 1)
+        })
+
+        _, _, indices = _adaptive_downsample(t, values, n_points, threshold)
+
+        np.testing.assert_array_equal(indices, expected)
+
+    def test_constant_signal_is_uniform(self):
+        """Testa que sinal constante distribui os pontos uniformemente"""
+        t = np.arange(10_000, dtype=float)
+        _, _, indices = _adaptive_downsample(t, np.full(10_000, 0.1), 100)
+
+        # Alvos i/n_points com i < n_points - 1: só o último intervalo é maior
+        np.testing.assert_allclose(np.diff(indices)[:-1], 100, atol=1)
+
 
 class TestUniformDownsample:
     """Testes para Uniform downsampling"""
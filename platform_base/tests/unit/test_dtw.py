@@ -0,0 +1,219 @@
+"""
+Testes unitários para o motor DTW (processing/dtw.py)
+"""
+import numpy as np
+import pytest
+
+from platform_base.processing.dtw import (
+    dtw_band,
+    dtw_distance,
+    dtw_distance_matrix,
+    dtw_path,
+    dtw_path_multiscale,
+    lb_keogh,
+    lb_kim,
+)
+from platform_base.utils.errors import ValidationError
+
+
+def _reference_dtw(x, y, lo, hi, asymmetric=False):
+    """DTW O(nm) direto (custo |x - y|) restrito às colunas lo..hi"""
+    n, m = len(x), len(y)
+    cost = np.full((n + 1, m + 1), np.inf)
+    cost[0, 0] = 0.0
+    for i in range(1, n + 1):
+        for j in range(lo[i - 1] + 1, hi[i - 1] + 2):
+            d = abs(x[i - 1] - y[j - 1])
+            up = cost[i - 1, j] + (d if asymmetric else 0.0)
+            cost[i, j] = d + min(up, cost[i, j - 1], cost[i - 1, j - 1])
+    return cost[n, m]
+
+
+@pytest.fixture
+def pair():
+    rng = np.random.default_rng(7)
+    return rng.normal(size=40).cumsum(), rng.normal(size=55).cumsum()
+
+
+class TestBands:
+    """Limites por linha da região de busca"""
+
+    @pytest.mark.parametrize("n,m,window,band", [
+        (50, 50, 3, "sakoe_chiba"),
+        (20, 90, 0, "sakoe_chiba"),
+        (90, 20, 2, "sakoe_chiba"),
+        (60, 45, None, "itakura"),
+        (1, 10, 2, "sakoe_chiba"),
+    ])
+    def test_band_is_monotone_and_connected(self, n, m, window, band):
+        lo, hi = dtw_band(n, m, window, band)
+
+        assert lo[0] == 0 and hi[-1] == m - 1
+        assert np.all(lo <= hi)
+        assert np.all(np.diff(lo) >= 0) and np.all(np.diff(hi) >= 0)
+        assert np.all(hi[:-1] >= lo[1:] - 1)
+
+    def test_sakoe_chiba_square(self):
+        lo, hi = dtw_band(10, 10, 2)
+
+        np.testing.assert_array_equal(lo, np.maximum(np.arange(10) - 2, 0))
+        np.testing.assert_array_equal(hi, np.minimum(np.arange(10) + 2, 9))
+
+    def test_invalid_band(self):
+        with pytest.raises(ValidationError):
+            dtw_band(10, 10, band="diamond")
+        with pytest.raises(ValidationError):
+            dtw_band(10, 10, window=-1)
+
+
+class TestDistance:
+    """Distância e caminho contra a implementação direta"""
+
+    @pytest.mark.parametrize("window,band", [
+        (None, "sakoe_chiba"), (5, "sakoe_chiba"), (0, "sakoe_chiba"), (None, "itakura"),
+    ])
+    @pytest.mark.parametrize("step_pattern", ["symmetric", "asymmetric"])
+    def test_matches_reference(self, pair, window, band, step_pattern):
+        x, y = pair
+        lo, hi = dtw_band(len(x), len(y), window, band)
+        expected = _reference_dtw(x, y, lo, hi, step_pattern == "asymmetric")
+
+        distance = dtw_distance(x, y, window, band, metric="manhattan", step_pattern=step_pattern)
+        alignment = dtw_path(x, y, window, band, metric="manhattan", step_pattern=step_pattern)
+
+        assert distance == pytest.approx(expected)
+        assert alignment.distance == pytest.approx(expected)
+
+    def test_path_is_valid_warping(self, pair):
+        x, y = pair
+        alignment = dtw_path(x, y, window=6, metric="manhattan", return_cost_matrix=True)
+        path = alignment.path
+
+        assert tuple(path[0]) == (0, 0)
+        assert tuple(path[-1]) == (len(x) - 1, len(y) - 1)
+        steps = np.diff(path, axis=0)
+        assert np.all((steps >= 0) & (steps <= 1)) and np.all(steps.sum(axis=1) >= 1)
+        # Soma dos custos locais ao longo do caminho = distância
+        assert np.abs(x[path[:, 0]] - y[path[:, 1]]).sum() == pytest.approx(alignment.distance)
+        assert alignment.cost_matrix.shape == (len(x), len(y))
+        assert alignment.cost_matrix[-1, -1] == pytest.approx(alignment.distance)
+
+    def test_metrics_on_multivariate(self):
+        x = np.array([[0.0, 1.0], [1.0, 1.0], [2.0, 0.0]])
+        y = np.array([[0.0, 1.0], [2.0, 0.0]])
+
+        assert dtw_distance(x, x) == 0.0
+        assert dtw_distance(x, y, metric="euclidean") == pytest.approx(1.0)
+        assert dtw_distance(x, y, metric="sqeuclidean") == pytest.approx(1.0)
+        assert dtw_distance(x, y, metric="manhattan") == pytest.approx(1.0)
+        assert dtw_distance(x, y, metric="cosine") == pytest.approx(1.0 - 1.0 / np.sqrt(2.0))
+
+    def test_early_abandon(self, pair):
+        x, y = pair
+        distance = dtw_distance(x, y, metric="manhattan")
+
+        assert dtw_distance(x, y, metric="manhattan", max_distance=distance * 1.01) == pytest.approx(distance)
+        assert dtw_distance(x, y, metric="manhattan", max_distance=distance * 0.5) == np.inf
+
+    def test_invalid_inputs(self):
+        with pytest.raises(ValidationError):
+            dtw_distance(np.array([]), np.ones(3))
+        with pytest.raises(ValidationError):
+            dtw_distance(np.ones(3), np.ones(3), metric="chebyshev")
+        with pytest.raises(ValidationError):
+            dtw_distance(np.ones(3), np.ones(3), step_pattern="p2")
+
+    def test_long_series_with_band(self):
+        t = np.linspace(0, 40, 20_000)
+        distance = dtw_distance(np.sin(t), np.sin(t + 0.2), window=200)
+
+        assert np.isfinite(distance)
+        assert distance < dtw_distance(np.sin(t), np.sin(t + 0.2), window=0)
+
+
+class TestMultiscale:
+    """FastDTW: projeção e refinamento dentro do raio"""
+
+    @staticmethod
+    def _assert_valid_path(path, n, m):
+        assert tuple(path[0]) == (0, 0)
+        assert tuple(path[-1]) == (n - 1, m - 1)
+        steps = np.diff(path, axis=0)
+        assert np.all((steps >= 0) & (steps <= 1)) and np.all(steps.sum(axis=1) >= 1)
+
+    @pytest.mark.parametrize("n,m", [(3, 3), (50, 37), (301, 200)])
+    def test_upper_bound_of_exact(self, n, m):
+        rng = np.random.default_rng(n)
+        x, y = rng.normal(size=n).cumsum(), rng.normal(size=m).cumsum()
+        exact = dtw_path(x, y, metric="manhattan").distance
+
+        for radius in (0, 2, 8):
+            alignment = dtw_path_multiscale(x, y, radius=radius, metric="manhattan")
+            path = alignment.path
+
+            self._assert_valid_path(path, n, m)
+            assert alignment.distance >= exact - 1e-9
+            assert np.abs(x[path[:, 0]] - y[path[:, 1]]).sum() == pytest.approx(alignment.distance)
+
+    def test_large_radius_is_exact(self, pair):
+        x, y = pair
+        assert dtw_path_multiscale(x, y, radius=60).distance == pytest.approx(dtw_path(x, y).distance)
+
+    def test_long_series_close_to_exact(self):
+        t = np.linspace(0, 60, 6000)
+        x, y = np.sin(t), np.sin(1.02 * t + 0.3)
+
+        exact = dtw_path(x, y, window=400).distance
+        alignment = dtw_path_multiscale(x, y, radius=10)
+
+        self._assert_valid_path(alignment.path, len(x), len(y))
+        assert alignment.distance <= exact * 1.01
+        assert alignment.cost_matrix is None
+
+    def test_invalid_radius(self, pair):
+        with pytest.raises(ValidationError):
+            dtw_path_multiscale(*pair, radius=-1)
+
+
+class TestLowerBounds:
+    """LB_Kim/LB_Keogh nunca excedem a distância DTW"""
+
+    @pytest.mark.parametrize("metric", ["euclidean", "sqeuclidean", "manhattan"])
+    @pytest.mark.parametrize("window", [0, 3, 10])
+    def test_bounds_below_distance(self, metric, window):
+        rng = np.random.default_rng(window)
+        for _ in range(10):
+            x, y = rng.normal(size=30), rng.normal(size=30)
+            distance = dtw_distance(x, y, window, metric=metric)
+
+            assert lb_kim(x, y, metric) <= distance + 1e-9
+            assert lb_keogh(x, y, window, metric=metric) <= distance + 1e-9
+
+    def test_keogh_not_applicable(self):
+        x = np.ones((5, 2))
+        assert lb_keogh(x, x + 10.0) == 0.0
+        assert lb_keogh(np.ones(5), -np.ones(5), metric="cosine") == 0.0
+
+
+class TestDistanceMatrix:
+    """Matriz de distâncias com poda"""
+
+    def test_matches_pairwise(self, pair):
+        x, y = pair
+        series = [x, y, x[::-1].copy()]
+        matrix = dtw_distance_matrix(series, window=8, normalize=True, max_workers=2)
+
+        assert matrix.shape == (3, 3)
+        np.testing.assert_array_equal(np.diag(matrix), 0.0)
+        np.testing.assert_array_equal(matrix, matrix.T)
+        assert matrix[0, 1] == pytest.approx(dtw_distance(x, y, 8) / (len(x) + len(y)))
+
+    def test_pruned_pairs_are_inf(self):
+        base = np.sin(np.linspace(0, 6, 200))
+        series = [base, base + 0.01, base + 50.0]
+        full = dtw_distance_matrix(series, window=10)
+
+        pruned = dtw_distance_matrix(series, window=10, max_distance=full[0, 1] * 2)
+
+        assert pruned[0, 1] == pytest.approx(full[0, 1])
+        assert pruned[0, 2] == np.inf and pruned[1, 2] == np.inf
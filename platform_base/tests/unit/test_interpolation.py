@@ -214,6 +214,92 @@ class TestResampleGrid:
         assert "dt or n_points" in str(exc_info.value)
 
 
+# =============================================================================
+# Testes de avaliação local nas lacunas
+# =============================================================================
+
+class TestGapLocalEvaluation:
+    """Só os trechos ausentes são avaliados."""
+
+    @pytest.fixture
+    def long_series_with_runs(self):
+        rng = np.random.default_rng(7)
+        t = np.cumsum(rng.uniform(0.5, 1.5, 20_000)) * 1e-2
+        y = np.sin(t) + 0.1 * np.sin(17 * t)
+        for start in (1_000, 7_500, 15_000):
+            y[start:start + 40] = np.nan
+        return t, y
+
+    def test_no_gaps_returns_copy_without_fitting(self, monkeypatch):
+        """Série sem lacunas não ajusta nenhum interpolador."""
+        import platform_base.processing.interpolation as interp_module
+
+        def fail(*args, **kwargs):
+            raise AssertionError("interpolant should not be fitted")
+
+        monkeypatch.setattr(interp_module, "CubicSpline", fail)
+        t = np.linspace(0, 10, 101)
+        y = np.sin(t)
+
+        result = interpolate(y, t, method="spline_cubic", params={})
+
+        np.testing.assert_array_equal(result.values, y)
+        assert not result.interpolation_info.is_interpolated_mask.any()
+        assert np.all(result.interpolation_info.method_used == "original")
+
+    def test_local_cubic_spline_matches_global_fit(self, long_series_with_runs):
+        """Spline cúbica local por lacuna coincide com o ajuste global."""
+        from scipy.interpolate import CubicSpline
+
+        t, y = long_series_with_runs
+        missing = np.isnan(y)
+
+        local = interpolate(y, t, method="spline_cubic", params={})
+        global_fit = interpolate(y, t, method="spline_cubic", params={"gap_context": None})
+
+        expected = CubicSpline(t[~missing], y[~missing])(t[missing])
+        np.testing.assert_allclose(local.values[missing], expected, atol=1e-12)
+        np.testing.assert_allclose(global_fit.values[missing], expected, atol=1e-12)
+
+    def test_local_smoothing_spline_fills_runs(self, long_series_with_runs):
+        """Spline de suavização com gap_context ajusta janelas locais."""
+        t, y = long_series_with_runs
+        missing = np.isnan(y)
+        y = np.where(missing, np.nan, np.sin(t))
+
+        result = interpolate(y, t, method="smoothing_spline",
+                             params={"s": 0.0, "gap_context": 32})
+
+        np.testing.assert_allclose(result.values[missing], np.sin(t[missing]), atol=1e-4)
+
+    def test_gap_segments_merge_overlapping_windows(self):
+        """Lacunas próximas compartilham a mesma janela de ajuste."""
+        from platform_base.processing.interpolation import _gap_segments
+
+        t_valid = np.arange(1_000, dtype=float)
+        t_target = np.array([100.5, 101.5, 110.5, 800.5])
+
+        segments = _gap_segments(t_valid, t_target, context=8)
+
+        assert [(lo, hi) for lo, hi, _ in segments] == [(93, 119), (793, 809)]
+        assert [sorted(targets.tolist()) for _, _, targets in segments] == [[0, 1, 2], [3]]
+
+    def test_gap_segments_fall_back_to_global_fit(self):
+        """Lacunas densas usam um único ajuste global."""
+        from platform_base.processing.interpolation import _gap_segments
+
+        t_valid = np.arange(1_000, dtype=float)
+        t_target = np.arange(0.5, 1_000, 10.0)
+
+        assert _gap_segments(t_valid, t_target, context=8) is None
+
+    def test_invalid_gap_context_raises(self, long_series_with_runs):
+        """gap_context menor que 4 é rejeitado."""
+        t, y = long_series_with_runs
+        with pytest.raises(InterpolationError):
+            interpolate(y, t, method="spline_cubic", params={"gap_context": 2})
+
+
 # =============================================================================
 # Testes de MLS (Moving Least Squares)
 # =============================================================================
@@ -248,6 +334,37 @@ class TestMLSInterpolation:
         # MLS deve aproximar bem uma quadrática com degree=2
         np.testing.assert_array_almost_equal(result.values, expected, decimal=0)
 
+    def test_mls_local_fit_matches_dense_solution(self):
+        """Ajuste local em lote coincide com o WLS denso da vizinhança."""
+        t = np.sort(np.random.default_rng(3).uniform(0, 10, 200))
+        y = np.cos(t)
+        y[90:100] = np.nan
+        t_valid, v_valid = t[~np.isnan(y)], y[~np.isnan(y)]
+        radius = 0.2
+
+        result = interpolate(y, t, method="mls",
+                             params={"degree": 2, "weight_radius": radius, "n_neighbors": 8})
+
+        for i in range(90, 100):
+            first = np.clip(np.searchsorted(t_valid, t[i]) - 4, 0, len(t_valid) - 8)
+            tw, vw = t_valid[first:first + 8], v_valid[first:first + 8]
+            w = np.maximum(np.exp(-((tw - t[i]) / radius) ** 2), 1e-10)
+            A = np.vander(tw - t[i], 3, increasing=True)
+            coeffs = np.linalg.solve(A.T @ (w[:, None] * A), A.T @ (w * vw))
+            assert result.values[i] == pytest.approx(coeffs[0], abs=1e-9)
+
+    def test_mls_large_series_with_scattered_gaps(self):
+        """MLS escala para séries longas (só os pontos ausentes são avaliados)."""
+        t = np.linspace(0, 1000, 200_000)
+        y = np.sin(t)
+        missing = np.random.default_rng(0).random(len(t)) < 0.05
+        y[missing] = np.nan
+
+        result = interpolate(y, t, method="mls", params={"degree": 2})
+
+        np.testing.assert_allclose(result.values[missing], np.sin(t[missing]), atol=1e-6)
+        np.testing.assert_array_equal(result.values[~missing], y[~missing])
+
 
 # =============================================================================
 # Testes de GPR (Gaussian Process Regression)
@@ -294,6 +411,79 @@ class TestGPRInterpolation:
         
         assert not np.any(np.isnan(result.values))
 
+    def test_gpr_reports_per_point_uncertainty(self, small_data_with_gap):
+        """GPR devolve desvio padrão e confiança por ponto."""
+        pytest.importorskip("sklearn")
+        t, y = small_data_with_gap
+        result = interpolate(y, t, method="gpr", params={"n_restarts": 1})
+
+        info = result.interpolation_info
+        gap = np.isnan(y)
+        assert result.metadata.params["mode"] == "global"
+        assert np.all(info.uncertainty_std[~gap] == 0.0)
+        assert np.all(info.uncertainty_std[gap] > 0.0)
+        assert np.all(info.confidence[~gap] == 1.0)
+        assert np.all((info.confidence[gap] >= 0.0) & (info.confidence[gap] < 1.0))
+
+    @pytest.mark.parametrize("optimize", ["shared", "per_window"])
+    def test_gpr_windowed_matches_signal(self, optimize):
+        """Modo janelado ajusta GPs locais ao redor das lacunas."""
+        pytest.importorskip("sklearn")
+        rng = np.random.default_rng(1)
+        t = np.linspace(0, 50, 5_000)
+        y = np.sin(t)
+        missing = rng.random(len(t)) < 0.05
+        missing[2_000:2_010] = True
+        y[missing] = np.nan
+
+        result = interpolate(y, t, method="gpr", params={
+            "mode": "windowed", "n_restarts": 0, "window_points": 64,
+            "optimize": optimize, "max_workers": 2,
+        })
+
+        np.testing.assert_allclose(result.values[missing], np.sin(t[missing]), atol=1e-3)
+        assert np.all(result.interpolation_info.uncertainty_std[missing] > 0.0)
+        assert result.metadata.params["mode"] == "windowed"
+
+    def test_gpr_auto_mode_uses_windows_for_large_series(self):
+        """Acima de max_train_points o modo auto usa janelas."""
+        pytest.importorskip("sklearn")
+        t = np.linspace(0, 20, 2_000)
+        y = np.sin(t)
+        y[500:520] = np.nan
+
+        result = interpolate(y, t, method="gpr",
+                             params={"n_restarts": 0, "max_train_points": 500})
+
+        assert result.metadata.params["mode"] == "windowed"
+        np.testing.assert_allclose(result.values[500:520], np.sin(t[500:520]), atol=1e-3)
+
+    def test_gpr_window_kernel_cache(self, monkeypatch):
+        """Kernels otimizados são reutilizados para a mesma janela."""
+        pytest.importorskip("sklearn")
+        import platform_base.processing.interpolation as interp_module
+
+        monkeypatch.setattr(interp_module, "_gpr_kernel_cache", interp_module.OrderedDict())
+        t = np.linspace(0, 10, 400)
+        y = np.sin(t)
+        y[100:105] = np.nan
+        y[300:305] = np.nan
+        params = {"mode": "windowed", "n_restarts": 0, "window_points": 64,
+                  "optimize": "per_window"}
+
+        first = interpolate(y, t, method="gpr", params=params)
+        assert len(interp_module._gpr_kernel_cache) == 2
+        second = interpolate(y, t, method="gpr", params=params)
+
+        assert len(interp_module._gpr_kernel_cache) == 2
+        np.testing.assert_allclose(second.values, first.values)
+
+    def test_gpr_invalid_mode_raises(self, small_data_with_gap):
+        """Modo GPR desconhecido é rejeitado."""
+        t, y = small_data_with_gap
+        with pytest.raises(InterpolationError):
+            interpolate(y, t, method="gpr", params={"mode": "sparse"})
+
     def test_gpr_raises_without_sklearn(self, small_data_with_gap, monkeypatch):
         """GPR levanta erro se sklearn não disponível."""
         import platform_base.processing.interpolation as interp_module
@@ -0,0 +1,160 @@
+"""
+Testes unitários para o scheduler de jobs (core/job_scheduler.py)
+"""
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from platform_base.core.job_scheduler import JobPriority, JobScheduler
+from platform_base.core.shared_arrays import attach_array, release_block, share_array
+
+
+def _worker_pid(values):
+    return os.getpid()
+
+
+@pytest.fixture
+def scheduler():
+    sched = JobScheduler(max_workers=1)
+    yield sched
+    sched.shutdown()
+
+
+def _blocker(scheduler):
+    """Ocupa o único slot até ``release.set()``"""
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    future = scheduler.submit(block, priority=JobPriority.INTERACTIVE)
+    assert started.wait(5)
+    return release, future
+
+
+class TestScheduling:
+    """Ordem de execução e limite de concorrência"""
+
+    def test_interactive_jobs_run_before_queued_bulk(self, scheduler):
+        release, _ = _blocker(scheduler)
+        order = []
+        futures = [
+            scheduler.submit(order.append, "bulk", priority=JobPriority.BULK),
+            scheduler.submit(order.append, "normal", priority=JobPriority.NORMAL),
+            scheduler.submit(order.append, "preview", priority=JobPriority.INTERACTIVE),
+        ]
+        assert scheduler.stats().queue_depth == 3
+
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+
+        assert order == ["preview", "normal", "bulk"]
+
+    def test_reserved_slot_for_interactive_jobs(self):
+        sched = JobScheduler(max_workers=2, interactive_reserve=1)
+        release = threading.Event()
+        try:
+            bulk = [sched.submit(release.wait, 5, priority=JobPriority.BULK) for _ in range(2)]
+            assert sched.stats().running == 1
+            assert sched.stats().queue_depth == 1
+
+            # O slot reservado atende o preview imediatamente
+            preview = sched.submit(lambda: "ok", priority=JobPriority.INTERACTIVE)
+            assert preview.result(timeout=5) == "ok"
+        finally:
+            release.set()
+            for future in bulk:
+                future.result(timeout=5)
+            sched.shutdown()
+
+    def test_cancel_pending(self, scheduler):
+        release, _ = _blocker(scheduler)
+        bulk = scheduler.submit(lambda: None, priority=JobPriority.BULK)
+        normal = scheduler.submit(lambda: 1, priority=JobPriority.NORMAL)
+
+        assert scheduler.cancel_pending(JobPriority.BULK) == 1
+        release.set()
+
+        assert bulk.cancelled()
+        assert normal.result(timeout=5) == 1
+
+
+class TestResultsAndStats:
+    """Resultados, erros e métricas"""
+
+    def test_errors_propagate(self, scheduler):
+        future = scheduler.submit(lambda: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            future.result(timeout=5)
+
+        assert scheduler.stats().failed == 1
+
+    def test_latency_stats(self, scheduler):
+        for value in range(3):
+            assert scheduler.submit(abs, -value).result(timeout=5) == value
+
+        stats = scheduler.stats()
+        assert stats.completed == 3
+        assert stats.queue_depth == 0
+        assert stats.running == 0
+        assert stats.last_latency_ms >= 0
+        assert set(stats.to_dict()) >= {"queue_depth", "mean_latency_ms"}
+
+    def test_submit_after_shutdown(self):
+        sched = JobScheduler(max_workers=1)
+        sched.shutdown()
+        with pytest.raises(RuntimeError):
+            sched.submit(abs, 1)
+
+    def test_large_job_runs_in_process_with_shared_inputs(self):
+        sched = JobScheduler(max_workers=1, process_min_bytes=1024)
+        values = np.arange(500_000, dtype=np.float64)
+        try:
+            result = sched.submit(np.cumsum, values).result(timeout=120)
+        finally:
+            sched.shutdown()
+
+        np.testing.assert_array_equal(result, np.cumsum(values))
+
+    def test_interactive_jobs_use_processes_only_when_warm(self):
+        sched = JobScheduler(max_workers=1, process_min_bytes=1024)
+        values = np.zeros(10_000)
+        try:
+            cold = sched.submit(_worker_pid, values, priority=JobPriority.INTERACTIVE)
+            assert cold.result(timeout=30) == os.getpid()  # thread: sem pagar spawn
+
+            sched.warm_up()
+            deadline = time.monotonic() + 120
+            while not sched.process_pool_warm and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert sched.process_pool_warm
+
+            warm = sched.submit(_worker_pid, values, priority=JobPriority.INTERACTIVE)
+            assert warm.result(timeout=30) != os.getpid()
+        finally:
+            sched.shutdown()
+        assert not sched.process_pool_warm
+
+
+class TestSharedArrays:
+    """Handoff por memória compartilhada"""
+
+    def test_round_trip_is_read_only(self):
+        values = np.linspace(0, 1, 1000)
+        block, handle = share_array(values)
+        try:
+            attached, view = attach_array(handle)
+            np.testing.assert_array_equal(view, values)
+            assert handle.nbytes == values.nbytes
+            with pytest.raises(ValueError):
+                view[0] = 5.0
+            del view
+            release_block(attached)
+        finally:
+            release_block(block, unlink=True)
@@ -336,6 +336,131 @@ class TestDataLoaderService:
             os.unlink(temp_file)
 
 
+class TestBatchLoad:
+    """Testes para DataLoaderService.load_many (pool de processos)"""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        paths = []
+        for name in ("BAR_DT", "BAR_FT", "PLN_PT"):
+            path = tmp_path / f"{name}.csv"
+            pd.DataFrame({
+                "timestamp": pd.date_range("2024-01-01", periods=50, freq="s"),
+                name: np.arange(50, dtype=float),
+            }).to_csv(path, index=False)
+            paths.append(path)
+        return paths
+
+    @staticmethod
+    def _manager(can_load=True):
+        manager = MagicMock()
+        manager.can_load_file.return_value = (can_load, None if can_load else "Not enough memory")
+        return manager
+
+    def test_loads_all_files(self, files):
+        from platform_base.io.loader import DataLoaderService
+
+        service = DataLoaderService()
+        results = list(service.load_many(files, max_workers=2, memory_manager=self._manager()))
+
+        assert sorted(r.path for r in results) == sorted(str(p) for p in files)
+        assert all(r.ok for r in results)
+        for result in results:
+            assert Path(result.path).stem in result.dataset.series
+        assert len(service.get_loaded_files()) == 3
+
+    def test_failure_does_not_stop_batch(self, files, tmp_path):
+        from platform_base.io.loader import DataLoaderService
+
+        broken = tmp_path / "broken.csv"
+        broken.write_text("only,header\n")
+        results = list(DataLoaderService().load_many(
+            [*files, broken], max_workers=2, memory_manager=self._manager(),
+        ))
+
+        failed = [r for r in results if not r.ok]
+        assert [r.path for r in failed] == [str(broken)]
+        assert "Failed to load file" in failed[0].error
+        assert sum(r.ok for r in results) == 3
+
+    def test_memory_budget_rejects_file(self, files):
+        from platform_base.io.loader import DataLoaderService
+
+        manager = self._manager(can_load=False)
+        results = list(DataLoaderService().load_many(files, memory_manager=manager))
+
+        assert [r.error for r in results] == ["Not enough memory"] * 3
+        manager.reserve.assert_not_called()
+
+    def test_reservations_released(self, files):
+        from platform_base.io.loader import DataLoaderService
+
+        manager = self._manager()
+        list(DataLoaderService().load_many(files, max_workers=2, memory_manager=manager))
+
+        reserved = {c.args[0] for c in manager.reserve.call_args_list}
+        released = {c.args[0] for c in manager.release.call_args_list}
+        assert reserved == released
+        assert sorted(c.args[1] for c in manager.reserve.call_args_list) == sorted(map(str, files))
+
+    def test_same_file_twice_gets_separate_reservations(self, files):
+        """Com o mesmo arquivo duas vezes no lote, cada carga reserva a própria memória"""
+        from platform_base.core.memory_manager import MemoryManager
+        from platform_base.io.loader import DataLoaderService
+
+        manager = MemoryManager()
+        manager.can_load_file = MagicMock(return_value=(True, None))
+        single_mb = manager.estimate_file_memory(files[0])
+        reserved_mb = []
+        original_reserve = manager.reserve
+
+        def reserve(key, path):
+            result = original_reserve(key, path)
+            reserved_mb.append(manager.reserved_mb)
+            return result
+
+        manager.reserve = reserve
+        results = list(DataLoaderService().load_many([files[0], files[0]], max_workers=2,
+                                                     memory_manager=manager))
+
+        assert all(r.ok for r in results) and len(results) == 2
+        assert reserved_mb[-1] == pytest.approx(2 * single_mb)
+        assert manager.reserved_mb == 0
+
+    def test_cancel_stops_iteration(self, files):
+        import threading
+
+        from platform_base.io.loader import DataLoaderService
+
+        cancel = threading.Event()
+        results = []
+        for result in DataLoaderService().load_many(
+            files, max_workers=1, cancel_event=cancel, memory_manager=self._manager(),
+        ):
+            results.append(result)
+            cancel.set()
+
+        assert len(results) == 1
+
+    def test_close_does_not_wait_for_running_loads(self, files):
+        from concurrent.futures import Future
+
+        from platform_base.io.loader import DataLoaderService
+
+        failed = Future()
+        failed.set_exception(RuntimeError("boom"))
+        pool = MagicMock()
+        pool.submit.side_effect = [failed, Future(), Future()]  # dois nunca terminam
+
+        with patch("platform_base.io.loader.ProcessPoolExecutor", return_value=pool) as pool_cls:
+            batch = DataLoaderService().load_many(files, max_workers=3, memory_manager=self._manager())
+            assert next(batch).error == "boom"
+            batch.close()
+
+        assert pool_cls.call_args.kwargs["mp_context"].get_start_method() == "spawn"
+        pool.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+
+
 class TestLoadExcel:
     """Testes para carregamento de Excel"""
     
@@ -453,3 +578,296 @@ class TestLoadEdgeCases:
             assert len(dataset.t_seconds) <= 100
         finally:
             os.unlink(temp_file)
+
+
+class TestChunkedCsvIngest:
+    """Testes da ingestão por chunks (LoadConfig.chunk_size)"""
+
+    @pytest.fixture
+    def csv_file(self, tmp_path):
+        n = 2_500
+        df = pd.DataFrame({
+            "timestamp": pd.date_range("2024-01-01", periods=n, freq="s"),
+            "pressure": np.sin(np.arange(n) / 50.0),
+            "flow": np.arange(n, dtype=float),
+        })
+        df.loc[[10, 20, 30], "pressure"] = np.nan
+        path = tmp_path / "chunked.csv"
+        df.to_csv(path, index=False)
+        return path
+
+    def test_chunked_matches_full_load(self, csv_file):
+        """Ingestão por chunks produz o mesmo dataset da leitura completa"""
+        from platform_base.io.loader import LoadConfig, load
+
+        full = load(str(csv_file))
+        chunked = load(str(csv_file), LoadConfig(chunk_size=300))
+
+        np.testing.assert_array_equal(chunked.t_datetime, full.t_datetime)
+        np.testing.assert_array_equal(chunked.t_seconds, full.t_seconds)
+        assert list(chunked.series) == list(full.series)
+        for sid, series in full.series.items():
+            np.testing.assert_array_equal(chunked.series[sid].values, series.values)
+            np.testing.assert_array_equal(
+                chunked.series[sid].interpolation_info.method_used,
+                series.interpolation_info.method_used,
+            )
+
+    def test_chunked_arrays_are_contiguous(self, csv_file):
+        """Arrays finais são contíguos e não têm capacidade sobrando"""
+        from platform_base.io.loader import LoadConfig, load
+
+        dataset = load(str(csv_file), LoadConfig(chunk_size=256))
+        values = dataset.series["flow"].values
+
+        assert values.flags["C_CONTIGUOUS"]
+        assert values.dtype == np.float64
+        assert len(values) == 2_500
+
+    def test_chunked_respects_max_rows(self, csv_file):
+        from platform_base.io.loader import LoadConfig, load
+
+        dataset = load(str(csv_file), LoadConfig(chunk_size=100, max_rows=450))
+
+        assert len(dataset.t_seconds) == 450
+
+    def test_chunked_too_few_points(self, csv_file):
+        from platform_base.io.loader import LoadConfig, load
+        from platform_base.utils.errors import DataLoadError
+
+        with pytest.raises(DataLoadError):
+            load(str(csv_file), LoadConfig(chunk_size=5, max_rows=8, min_valid_points=10))
+
+    def test_progress_reported_per_chunk(self, csv_file):
+        """load_async recebe progresso crescente durante a leitura"""
+        from platform_base.io.loader import LoadConfig, load_async
+
+        calls = []
+        load_async(str(csv_file), LoadConfig(chunk_size=500),
+                   progress_callback=lambda pct, msg: calls.append((pct, msg)))
+
+        reading = [pct for pct, msg in calls if msg.startswith("Reading file... (")]
+        assert len(reading) == 5
+        assert reading == sorted(reading)
+        assert calls[-1] == (100.0, "Load complete")
+
+    def test_chunked_column_projection(self, csv_file):
+        """columns restringe as séries e a leitura do parser, como nos demais caminhos"""
+        from unittest.mock import patch
+
+        from platform_base.io.loader import LoadConfig, LoadStrategy, load
+
+        seen = []
+        original = LoadStrategy.iter_chunks
+
+        def spy(self, *args, **kwargs):
+            for chunk in original(self, *args, **kwargs):
+                seen.append(list(chunk.columns))
+                yield chunk
+
+        with patch.object(LoadStrategy, "iter_chunks", spy):
+            dataset = load(str(csv_file), LoadConfig(chunk_size=300, columns=["flow", "missing"]))
+
+        assert list(dataset.series) == ["flow"]
+        np.testing.assert_array_equal(dataset.series["flow"].values, np.arange(2_500, dtype=float))
+        assert seen[-1] == ["timestamp", "flow"]
+
+        configured = load(str(csv_file), LoadConfig(chunk_size=300, columns=["pressure"],
+                                                    timestamp_column="timestamp"))
+        assert list(configured.series) == ["pressure"]
+
+    def test_column_buffer_growth_and_finalize(self):
+        from platform_base.io.loader import _ColumnBuffer
+
+        buffer = _ColumnBuffer(np.float64, capacity=4)
+        for start in range(0, 30, 3):
+            buffer.append(np.arange(start, start + 3, dtype=float))
+
+        result = buffer.finalize()
+        np.testing.assert_array_equal(result, np.arange(30, dtype=float))
+
+    def test_iter_chunks_requires_csv(self, tmp_path):
+        from platform_base.io.loader import FileFormat, LoadConfig, LoadStrategy
+        from platform_base.utils.errors import DataLoadError
+
+        strategy = LoadStrategy(format=FileFormat.EXCEL)
+        with pytest.raises(DataLoadError):
+            list(strategy.iter_chunks(tmp_path / "x.xlsx", LoadConfig(chunk_size=10)))
+
+
+class TestArrowEngine:
+    """Testes do engine PyArrow (LoadConfig.engine == "arrow")"""
+
+    @pytest.fixture
+    def frame(self):
+        n = 1_000
+        df = pd.DataFrame({
+            "timestamp": pd.date_range("2024-01-01", periods=n, freq="min"),
+            "pressure": np.sin(np.arange(n) / 30.0),
+            "flow": np.arange(n, dtype=np.int64),
+            "label": ["x"] * n,
+        })
+        df.loc[[5, 6], "pressure"] = np.nan
+        return df
+
+    @pytest.fixture
+    def parquet_file(self, tmp_path, frame):
+        path = tmp_path / "data.parquet"
+        frame.to_parquet(path, row_group_size=100)
+        return path
+
+    @pytest.fixture
+    def csv_file(self, tmp_path, frame):
+        path = tmp_path / "data.csv"
+        frame.to_csv(path, index=False)
+        return path
+
+    def test_arrow_csv_matches_pandas(self, csv_file):
+        from platform_base.io.loader import LoadConfig, load
+
+        reference = load(str(csv_file))
+        dataset = load(str(csv_file), LoadConfig(engine="arrow"))
+
+        np.testing.assert_array_equal(dataset.t_datetime, reference.t_datetime)
+        assert list(dataset.series) == list(reference.series) == ["pressure", "flow"]
+        for sid in reference.series:
+            # Parsers de float diferem no último ULP
+            np.testing.assert_allclose(dataset.series[sid].values, reference.series[sid].values,
+                                       rtol=1e-12)
+
+    def test_arrow_parquet_matches_pandas(self, parquet_file):
+        from platform_base.io.loader import LoadConfig, load
+
+        reference = load(str(parquet_file))
+        dataset = load(str(parquet_file), LoadConfig(engine="arrow"))
+
+        np.testing.assert_array_equal(dataset.t_seconds, reference.t_seconds)
+        np.testing.assert_array_equal(
+            dataset.series["pressure"].values, reference.series["pressure"].values,
+        )
+        assert dataset.series["flow"].values.dtype == np.float64
+
+    def test_column_projection(self, parquet_file):
+        from platform_base.io.loader import LoadConfig, load
+
+        dataset = load(str(parquet_file), LoadConfig(engine="arrow", columns=["flow"]))
+
+        assert list(dataset.series) == ["flow"]
+
+    def test_column_projection_pandas_engine(self, csv_file):
+        from platform_base.io.loader import LoadConfig, load
+
+        dataset = load(str(csv_file), LoadConfig(columns=["pressure"]))
+
+        assert list(dataset.series) == ["pressure"]
+
+    def test_parquet_time_range_pushdown(self, parquet_file):
+        from platform_base.io.loader import LoadConfig, load
+
+        config = LoadConfig(
+            engine="arrow",
+            time_range=(datetime(2024, 1, 1, 1, 0), datetime(2024, 1, 1, 2, 59)),
+        )
+        dataset = load(str(parquet_file), config)
+
+        assert len(dataset.t_seconds) == 120
+        assert dataset.t_datetime[0] == np.datetime64("2024-01-01T01:00:00")
+
+    def test_csv_time_range_filter(self, csv_file):
+        from platform_base.io.loader import LoadConfig, load
+
+        config = LoadConfig(
+            engine="arrow",
+            time_range=(datetime(2024, 1, 1, 0, 10), datetime(2024, 1, 1, 0, 29)),
+        )
+        dataset = load(str(csv_file), config)
+
+        assert len(dataset.series["flow"].values) == 20
+        assert dataset.series["flow"].values[0] == 10.0
+
+    def test_arrow_max_rows(self, csv_file):
+        from platform_base.io.loader import LoadConfig, load
+
+        dataset = load(str(csv_file), LoadConfig(engine="arrow", max_rows=50))
+
+        assert len(dataset.t_seconds) == 50
+
+    def test_invalid_engine(self):
+        from platform_base.io.loader import LoadConfig
+
+        with pytest.raises(ValueError):
+            LoadConfig(engine="polars")
+
+    def test_detect_arrow_schema(self, parquet_file):
+        import pyarrow.parquet as pq
+
+        from platform_base.io.schema_detector import SchemaRules, detect_arrow_schema
+
+        schema = detect_arrow_schema(pq.read_schema(parquet_file), SchemaRules())
+
+        assert schema.timestamp_column == "timestamp"
+        assert [c.name for c in schema.candidate_series] == ["pressure", "flow"]
+        assert schema.confidence == 0.95
+
+
+class TestSinglePassLoad:
+    """Testes do checksum em passada única, timestamps parseados uma vez e timings"""
+
+    @pytest.fixture
+    def csv_file(self, tmp_path):
+        n = 500
+        df = pd.DataFrame({
+            "timestamp": pd.date_range("2024-01-01", periods=n, freq="s").strftime("%d/%m/%Y %H:%M:%S"),
+            "pressure": np.linspace(0.0, 1.0, n),
+        })
+        path = tmp_path / "data.csv"
+        df.to_csv(path, index=False)
+        return path
+
+    @staticmethod
+    def _sha256(path):
+        import hashlib
+
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+
+    @pytest.mark.parametrize("config", [
+        {},
+        {"max_rows": 50},
+        {"chunk_size": 64},
+        {"engine": "arrow"},
+    ])
+    def test_checksum_matches_file_hash(self, csv_file, config):
+        from platform_base.io.loader import load
+
+        dataset = load(str(csv_file), config)
+
+        assert dataset.source.checksum == self._sha256(csv_file)
+
+    def test_checksum_non_csv_formats(self, tmp_path):
+        from platform_base.io.loader import load
+
+        path = tmp_path / "data.parquet"
+        pd.DataFrame({
+            "timestamp": pd.date_range("2024-01-01", periods=50, freq="s"),
+            "value": np.arange(50, dtype=float),
+        }).to_parquet(path)
+
+        assert load(str(path)).source.checksum == self._sha256(path)
+
+    def test_day_first_timestamps_parsed(self, csv_file):
+        from platform_base.io.loader import load
+
+        for config in ({}, {"chunk_size": 64}):
+            dataset = load(str(csv_file), config)
+            assert dataset.t_datetime[0] == np.datetime64("2024-01-01T00:00:00")
+            assert dataset.t_seconds[-1] == 499.0
+            assert not dataset.metadata.validation_errors
+
+    def test_load_timings_recorded(self, csv_file):
+        from platform_base.io.loader import load
+
+        timings = load(str(csv_file)).metadata.load_timings_ms
+
+        assert {"read", "schema", "timestamps", "validate", "series", "checksum", "total"} <= set(timings)
+        assert all(v >= 0 for v in timings.values())
+        assert timings["total"] >= timings["read"]
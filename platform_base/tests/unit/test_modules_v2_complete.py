@@ -175,6 +175,22 @@ class TestPerformanceModule:
         assert len(x_out) > 0
         assert len(x_in) > 0
 
+    def test_lod_view_uses_pyramid_resolution(self):
+        """Testa que a view tem até 2 pontos por pixel e mantém os extremos"""
+        from platform_base.ui.panels.performance import LODManager, PerformanceConfig
+
+        x = np.arange(1_000_000, dtype=float)
+        y = np.sin(x / 5_000)
+        y[654_321] = 25.0
+
+        lod = LODManager(x, y, PerformanceConfig(target_display_points=1_000, lod_levels=2))
+        x_view, y_view = lod.get_data_for_view(500_000, 800_000, 300)
+
+        assert len(x_view) <= 600
+        assert x_view[0] == 500_000
+        assert x_view[-1] == 800_000
+        assert y_view.max() == 25.0
+
 
 # ============================================================================
 # TEST: ENCODING DETECTOR
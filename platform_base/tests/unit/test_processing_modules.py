@@ -5,6 +5,7 @@ Cobertura para downsampling, interpolation, synchronization, smoothing, units, t
 from datetime import datetime, timedelta
 
 import numpy as np
+import pandas as pd
 import pytest
 
 
@@ -300,6 +301,47 @@ class TestTimebase:
         assert isinstance(dt_array, np.ndarray)
         assert len(dt_array) == 3
 
+    def test_detect_timestamp_format(self):
+        """Testa detecção do formato de timestamp numa amostra."""
+        from platform_base.processing.timebase import detect_timestamp_format
+
+        data = pd.Series(["31/01/2024 10:00:00", "01/02/2024 10:00:01"])
+        assert detect_timestamp_format(data) == "%d/%m/%Y %H:%M:%S"
+        assert detect_timestamp_format(pd.Series(["abc"])) is None
+
+    def test_parse_timestamps_single_format(self):
+        """Testa parse com formato único e fallback por coerção."""
+        from platform_base.processing.timebase import parse_timestamps
+
+        parsed = parse_timestamps(pd.Series(["2024-01-01 00:00:00", "2024-01-01 00:00:05"]))
+        assert parsed[1] == pd.Timestamp("2024-01-01 00:00:05")
+
+        mixed = parse_timestamps(pd.Series(["2024-01-01", "not a date"]))
+        assert pd.isna(mixed[1])
+
+    def test_parse_timestamps_bad_cell_single_coerce_pass(self):
+        """Célula inválida vira NaT sem testar os demais formatos."""
+        from unittest.mock import patch
+
+        from platform_base.processing import timebase
+
+        data = pd.Series(["2024-01-01 00:00:00", "n/a", "2024-01-01 00:00:10"] * 100)
+        with patch.object(timebase.pd, "to_datetime", wraps=pd.to_datetime) as spy:
+            parsed = timebase.parse_timestamps(data, fmt="%Y-%m-%d %H:%M:%S")
+
+        assert pd.isna(parsed[1])
+        assert parsed[2] == pd.Timestamp("2024-01-01 00:00:10")
+        assert [c.kwargs["format"] for c in spy.call_args_list] == ["%Y-%m-%d %H:%M:%S"] * 2
+
+    def test_parse_timestamps_wrong_format_tries_others(self):
+        """Formato que não casa com a maior parte da coluna cai nos demais."""
+        from platform_base.processing.timebase import parse_timestamps
+
+        parsed = parse_timestamps(
+            pd.Series(["31/01/2024 10:00:00", "01/02/2024 10:00:01"]), fmt="%Y-%m-%d",
+        )
+        assert parsed[0] == pd.Timestamp("2024-01-31 10:00:00")
+
 
 class TestDownsampleResult:
     """Testes para DownsampleResult dataclass."""
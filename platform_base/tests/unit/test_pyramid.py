@@ -0,0 +1,134 @@
+"""
+Testes unitários para a pirâmide min/max (processing/pyramid.py)
+"""
+import numpy as np
+import pytest
+
+from platform_base.processing import pyramid as pyramid_module
+from platform_base.processing.pyramid import MinMaxPyramid, series_pyramid
+from platform_base.utils.errors import DownsampleError
+
+
+@pytest.fixture
+def noisy_series():
+    rng = np.random.default_rng(7)
+    y = np.cumsum(rng.normal(size=200_003))
+    y[50_000:50_300] = np.nan
+    return y
+
+
+class TestQueries:
+    """Contrato de ``indices``/``window``"""
+
+    @pytest.mark.parametrize(("start", "stop", "n_pixels"), [
+        (0, 200_003, 800),
+        (12_345, 190_000, 300),
+        (49_990, 50_400, 50),
+        (100, 1_000, 1_000),
+        (199_000, 200_003, 4),
+    ])
+    def test_envelope_matches_raw_data(self, noisy_series, start, stop, n_pixels):
+        pyr = MinMaxPyramid(noisy_series)
+        idx = pyr.indices(start, stop, n_pixels)
+        segment = noisy_series[start:stop]
+
+        assert idx.dtype == np.int64
+        assert len(idx) <= 2 * max(n_pixels, 4)
+        assert np.all(np.diff(idx) > 0)
+        assert idx[0] == start
+        assert idx[-1] == stop - 1
+        assert np.nanmax(noisy_series[idx]) == np.nanmax(segment)
+        assert np.nanmin(noisy_series[idx]) == np.nanmin(segment)
+
+    def test_cost_does_not_depend_on_range(self, noisy_series):
+        pyr = MinMaxPyramid(noisy_series)
+        small = pyr.indices(0, 20_000, 200)
+        large = pyr.indices(0, 200_003, 200)
+
+        assert len(small) <= 400
+        assert len(large) <= 400
+
+    def test_small_range_returns_raw_samples(self, noisy_series):
+        pyr = MinMaxPyramid(noisy_series)
+        np.testing.assert_array_equal(pyr.indices(10, 90, 100), np.arange(10, 90))
+
+    def test_nan_gap_stays_visible(self):
+        y = np.sin(np.linspace(0, 50, 100_000))
+        y[40_000:60_000] = np.nan
+        pyr = MinMaxPyramid(y)
+        idx = pyr.indices(0, len(y), 100)
+
+        assert np.any(np.isnan(y[idx]))
+
+    def test_window_on_time_axis(self, noisy_series):
+        t = np.linspace(0.0, 2_000.0, len(noisy_series))
+        pyr = MinMaxPyramid(noisy_series)
+        idx = pyr.window(t, 500.0, 600.0, 200)
+
+        # Inclui uma amostra além de cada borda
+        assert t[idx[0]] < 500.0 <= t[idx[1]]
+        assert t[idx[-2]] <= 600.0 < t[idx[-1]]
+
+    def test_empty_and_invalid(self):
+        pyr = MinMaxPyramid(np.arange(10, dtype=float))
+        assert len(pyr.indices(5, 5, 100)) == 0
+        with pytest.raises(DownsampleError):
+            MinMaxPyramid(np.zeros((2, 10)))
+        with pytest.raises(DownsampleError):
+            pyr.window(np.arange(5.0), 0.0, 1.0, 10)
+
+
+class TestPersistence:
+    """Arrays concatenados e reabertura"""
+
+    def test_round_trip(self, noisy_series, tmp_path):
+        pyr = MinMaxPyramid(noisy_series)
+        arrays = pyr.to_arrays()
+        np.save(tmp_path / "lo.npy", arrays["lo"])
+        np.save(tmp_path / "hi.npy", arrays["hi"])
+
+        reopened = MinMaxPyramid.from_arrays(
+            noisy_series,
+            np.load(tmp_path / "lo.npy", mmap_mode="r"),
+            np.load(tmp_path / "hi.npy", mmap_mode="r"),
+            arrays["offsets"].tolist(),
+            arrays["bucket_size"],
+        )
+
+        assert reopened.n_levels == pyr.n_levels
+        np.testing.assert_array_equal(
+            reopened.indices(1_000, 150_000, 321), pyr.indices(1_000, 150_000, 321),
+        )
+
+    def test_mismatched_arrays_rejected(self, noisy_series):
+        arrays = MinMaxPyramid(noisy_series).to_arrays()
+        with pytest.raises(DownsampleError):
+            MinMaxPyramid.from_arrays(noisy_series[:1000], arrays["lo"], arrays["hi"],
+                                      arrays["offsets"])
+
+    def test_series_pyramid_is_cached_and_invalidated(self):
+        class _Series:
+            values = np.arange(1_000, dtype=float)
+            pyramid = None
+
+        series = _Series()
+        first = series_pyramid(series)
+        assert series_pyramid(series) is first
+
+        series.values = np.arange(2_000, dtype=float)
+        assert series_pyramid(series) is not first
+        assert series.pyramid.n_points == 2_000
+
+
+class TestKernelEquivalence:
+    """Nível 0 compilado e fallback numpy escolhem os mesmos índices"""
+
+    def test_level0(self, noisy_series):
+        n_buckets = -(-len(noisy_series) // 64)
+        a = [np.empty(n_buckets, dtype=np.int64) for _ in range(2)]
+        b = [np.empty(n_buckets, dtype=np.int64) for _ in range(2)]
+        pyramid_module._level0_kernel(noisy_series, 64, *a)
+        pyramid_module._level0_numpy(noisy_series, 64, *b)
+
+        np.testing.assert_array_equal(a[0], b[0])
+        np.testing.assert_array_equal(a[1], b[1])
@@ -0,0 +1,180 @@
+"""
+Testes unitários para o registry de memória compartilhada (core/shared_arrays.py)
+e sua integração com DatasetStore e JobScheduler
+"""
+import gc
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from platform_base.core.dataset_store import DatasetStore
+from platform_base.core.job_scheduler import JobScheduler
+from platform_base.core.models import (
+    Dataset,
+    DatasetMetadata,
+    Series,
+    SeriesMetadata,
+    SourceInfo,
+)
+from platform_base.core.shared_arrays import (
+    SHARED_MEMORY_MIN_BYTES,
+    SharedArrayRegistry,
+    attach_array,
+    get_shared_registry,
+    mapped_handle,
+    release_block,
+)
+from platform_base.processing.calculus import derivative
+from platform_base.processing.units import parse_unit
+
+
+N_LARGE = SHARED_MEMORY_MIN_BYTES // 8 + 1_000
+
+
+def _dataset(n_points):
+    t_seconds = np.linspace(0.0, 100.0, n_points)
+    series = {
+        name: Series(
+            series_id=name,
+            name=name,
+            unit=parse_unit("bar"),
+            values=np.sin(t_seconds * k),
+            metadata=SeriesMetadata(original_name=name, source_column=name),
+        )
+        for k, name in enumerate(["a", "b"], start=1)
+    }
+    return Dataset(
+        dataset_id="shared_ds",
+        version=1,
+        parent_id=None,
+        source=SourceInfo(filepath="/data/x.csv", filename="x.csv", format="csv",
+                          size_bytes=1, checksum="0"),
+        t_seconds=t_seconds,
+        t_datetime=np.datetime64("2024-01-01", "ns") + (t_seconds * 1e9).astype("timedelta64[ns]"),
+        series=series,
+        metadata=DatasetMetadata(),
+        created_at=datetime(2024, 1, 1),
+    )
+
+
+class TestRegistry:
+    """Posse dos blocos e mapeamento array -> handle"""
+
+    def test_put_and_handle_lookup(self):
+        registry = SharedArrayRegistry()
+        values = np.arange(1000, dtype=np.float64)
+        shared = registry.put(values)
+
+        np.testing.assert_array_equal(shared, values)
+        handle = registry.handle_for(shared)
+        assert handle is not None
+        assert registry.handle_for(shared[:]) == handle
+        assert registry.handle_for(shared[10:]) is None
+        assert registry.handle_for(values) is None
+        assert registry.put(shared) is shared
+        assert registry.nbytes == values.nbytes
+
+        block, view = attach_array(handle)
+        np.testing.assert_array_equal(view, values)
+        del view
+        release_block(block)
+        registry.release_all()
+
+    def test_block_unlinked_when_array_collected(self):
+        registry = SharedArrayRegistry()
+        shared = registry.allocate(100)
+        handle = registry.handle_for(shared)
+
+        del shared
+        gc.collect()
+
+        assert len(registry) == 0
+        with pytest.raises(FileNotFoundError):
+            attach_array(handle)
+
+    def test_release_unlinks_block(self):
+        registry = SharedArrayRegistry()
+        shared = registry.put(np.ones(100))
+        handle = registry.handle_for(shared)
+
+        registry.release(shared)
+
+        assert registry.handle_for(shared) is None
+        with pytest.raises(FileNotFoundError):
+            attach_array(handle)
+
+    def test_mapped_handle(self, tmp_path):
+        path = tmp_path / "values.npy"
+        np.save(path, np.arange(5_000, dtype=np.float64))
+        mapped = np.load(path, mmap_mode="r")
+
+        handle = mapped_handle(mapped)
+        assert handle is not None
+        np.testing.assert_array_equal(handle.open(), mapped)
+        assert mapped_handle(mapped[100:]) is None
+        assert mapped_handle(np.arange(10.0)) is None
+
+
+class TestDatasetStoreSharing:
+    """Séries alocadas no registry pelo DatasetStore"""
+
+    def test_share_dataset_replaces_large_arrays(self):
+        store = DatasetStore()
+        dataset = _dataset(N_LARGE)
+        original = dataset.series["a"].values.copy()
+        store.add_dataset(dataset)
+
+        shared = store.share_dataset("shared_ds", ["a"])
+        registry = get_shared_registry()
+
+        assert registry.handle_for(shared.series["a"].values) is not None
+        assert registry.handle_for(shared.t_seconds) is not None
+        assert registry.handle_for(shared.series["b"].values) is None
+        np.testing.assert_array_equal(shared.series["a"].values, original)
+
+        # Segunda chamada não realoca
+        values = shared.series["a"].values
+        assert store.share_dataset("shared_ds", ["a"]).series["a"].values is values
+
+    def test_shared_store_allocates_on_add(self):
+        store = DatasetStore(shared_memory=True)
+        store.add_dataset(_dataset(N_LARGE))
+        registry = get_shared_registry()
+
+        assert registry.handle_for(store.get_series("shared_ds", "b").values) is not None
+
+    def test_small_arrays_stay_private(self):
+        store = DatasetStore(shared_memory=True)
+        store.add_dataset(_dataset(100))
+
+        assert get_shared_registry().handle_for(store.get_series("shared_ds", "a").values) is None
+
+
+class TestProcessJobs:
+    """Jobs em processo recebem handles e devolvem resultados compartilhados"""
+
+    @pytest.fixture(scope="class")
+    def scheduler(self):
+        sched = JobScheduler(max_workers=1)
+        yield sched
+        sched.shutdown()
+
+    def test_registry_inputs_and_shared_result(self, scheduler):
+        registry = get_shared_registry()
+        t = registry.put(np.linspace(0.0, 10.0, N_LARGE))
+        y = registry.put(np.sin(t))
+
+        result = scheduler.submit(derivative, y, t, 1).result(timeout=120)
+
+        np.testing.assert_allclose(result.values, derivative(y, t, 1).values)
+        assert registry.handle_for(result.values) is not None
+
+    def test_list_of_arrays_and_array_result(self, scheduler):
+        arrays = [np.full(N_LARGE, float(k)) for k in range(3)]
+
+        result = scheduler.submit(np.vstack, arrays).result(timeout=120)
+
+        assert result.shape == (3, N_LARGE)
+        np.testing.assert_array_equal(result[:, 0], [0.0, 1.0, 2.0])
+        assert get_shared_registry().handle_for(result) is not None
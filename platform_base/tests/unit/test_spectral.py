@@ -0,0 +1,145 @@
+"""
+Testes unitários para Welch/STFT por segmentos (processing/spectral.py)
+"""
+import numpy as np
+import pytest
+from scipy import signal
+
+from platform_base.processing.spectral import (
+    SEGMENT_BATCH,
+    compute_fft,
+    get_window,
+    stft_spectrogram,
+    welch_psd,
+)
+from platform_base.utils.errors import ValidationError
+
+
+FS = 200.0
+
+
+@pytest.fixture
+def noise():
+    # Mais de um lote de segmentos para exercitar as fronteiras
+    return np.random.default_rng(11).normal(size=SEGMENT_BATCH * 64 + 37)
+
+
+def _chunks(values, size):
+    return (values[i:i + size] for i in range(0, len(values), size))
+
+
+class TestWelch:
+    """PSD de Welch contra scipy.signal.welch"""
+
+    @pytest.mark.parametrize("nperseg,noverlap,detrend,scaling,window", [
+        (128, None, "constant", "density", "hann"),
+        (127, 30, "linear", "spectrum", "hamming"),
+        (64, 0, False, "density", ("tukey", 0.25)),
+    ])
+    def test_matches_scipy(self, noise, nperseg, noverlap, detrend, scaling, window):
+        freqs, expected = signal.welch(noise, fs=FS, nperseg=nperseg, noverlap=noverlap,
+                                       detrend=detrend, scaling=scaling, window=window)
+
+        result = welch_psd(noise, FS, nperseg, noverlap, window, detrend, scaling)
+
+        np.testing.assert_allclose(result.frequencies, freqs)
+        np.testing.assert_allclose(result.psd, expected, rtol=1e-10)
+
+    def test_chunked_and_memmap_sources(self, noise, tmp_path):
+        expected = welch_psd(noise, FS, 100)
+
+        chunked = welch_psd(_chunks(noise, 333), FS, 100)
+        path = tmp_path / "noise.npy"
+        np.save(path, noise)
+        mapped = welch_psd(np.load(path, mmap_mode="r"), FS, 100)
+
+        np.testing.assert_allclose(chunked.psd, expected.psd)
+        np.testing.assert_allclose(mapped.psd, expected.psd)
+        assert chunked.n_segments == expected.n_segments == mapped.n_segments
+
+    def test_list_of_chunks(self, noise):
+        expected = welch_psd(noise, FS, 100)
+
+        result = welch_psd(list(_chunks(noise, 333)), FS, 100)
+
+        np.testing.assert_allclose(result.psd, expected.psd)
+        assert result.n_segments == expected.n_segments
+
+    def test_nan_segments_skipped(self, noise):
+        gappy = noise.copy()
+        gappy[1000:1010] = np.nan
+        clean = welch_psd(noise, FS, 256)
+
+        result = welch_psd(gappy, FS, 256)
+
+        assert result.n_segments == clean.n_segments - 2
+        assert np.all(np.isfinite(result.psd))
+
+    def test_white_noise_level(self, noise):
+        # PSD unilateral de ruído branco de variância 1 = 2 / fs
+        result = welch_psd(noise, FS, 256)
+        assert np.median(result.psd[1:-1]) == pytest.approx(2.0 / FS, rel=0.1)
+
+    def test_invalid_parameters(self, noise):
+        with pytest.raises(ValidationError):
+            welch_psd(noise, 0.0)
+        with pytest.raises(ValidationError):
+            welch_psd(noise, FS, 64, noverlap=64)
+        with pytest.raises(ValidationError):
+            welch_psd(noise, FS, window="nonexistent")
+        with pytest.raises(ValidationError):
+            welch_psd(noise[:10], FS, 64)
+
+
+class TestSpectrogram:
+    """STFT contra scipy.signal.spectrogram"""
+
+    @pytest.mark.parametrize("nperseg,noverlap", [(256, None), (100, 50), (33, 0)])
+    def test_matches_scipy(self, noise, nperseg, noverlap):
+        freqs, times, expected = signal.spectrogram(noise, fs=FS, nperseg=nperseg,
+                                                    noverlap=noverlap, window="hann")
+
+        result = stft_spectrogram(noise, FS, nperseg, noverlap)
+
+        np.testing.assert_allclose(result.frequencies, freqs)
+        np.testing.assert_allclose(result.times, times)
+        np.testing.assert_allclose(result.power, expected, rtol=1e-10)
+
+    def test_chunked_source(self, noise):
+        expected = stft_spectrogram(noise, FS, 128, 64)
+        result = stft_spectrogram(_chunks(noise, 1000), FS, 128, 64)
+
+        np.testing.assert_allclose(result.power, expected.power)
+
+    def test_tone_tracked(self):
+        t = np.arange(40_000) / FS
+        chirp = np.sin(2 * np.pi * np.where(t < t[-1] / 2, 10.0, 40.0) * t)
+
+        result = stft_spectrogram(chirp, FS, 200, 100)
+        peak = result.frequencies[np.argmax(result.power, axis=0)]
+
+        assert peak[0] == pytest.approx(10.0, abs=1.0)
+        assert peak[-1] == pytest.approx(40.0, abs=1.0)
+
+
+class TestHelpers:
+    """Janela em cache e FFT do sinal inteiro"""
+
+    def test_window_cached_read_only(self):
+        window = get_window("hann", 128)
+
+        assert get_window("hann", 128) is window
+        assert not window.flags.writeable
+
+    def test_list_window_spec(self):
+        window = get_window(["tukey", 0.25], 64)
+
+        assert get_window(("tukey", 0.25), 64) is window
+        np.testing.assert_allclose(window, signal.get_window(("tukey", 0.25), 64))
+
+    def test_compute_fft_peak(self):
+        t = np.arange(1000) / 1000.0
+        freqs, power = compute_fft(np.sin(2 * np.pi * 10 * t), fs=1000)
+
+        assert freqs[np.argmax(power)] == pytest.approx(10.0)
+        assert len(freqs) == 501
@@ -359,6 +359,46 @@ class TestWindowData:
         assert "temp" in data
         assert "pressure" not in data
 
+    @pytest.mark.parametrize("method", ["minmax", "lttb"])
+    def test_large_window_served_by_pyramids(self, method):
+        """Contiguous windows are decimated from the per-series pyramids"""
+        filters = StreamFilters(max_points_per_window=500, downsample_method=method)
+        state = StreamingState(window_size=timedelta(seconds=50), filters=filters)
+        engine = StreamingEngine(state, session_id="test")
+
+        t = np.linspace(0, 100, 200_000)
+        temp = np.sin(t)
+        temp[120_000] = 9.0
+        engine.setup_data(t, {"temp": temp, "pressure": np.cos(3 * t)})
+        state.current_time_index = 100_000
+
+        data, time = engine._get_window_data()
+
+        assert len(time) <= 500
+        assert np.all(np.diff(time) > 0)
+        assert data["temp"].max() == 9.0
+        assert set(engine._pyramids) == {"temp", "pressure"}
+
+    def test_filtered_window_falls_back_to_engine(self):
+        """Windows with filtered-out samples are decimated from the raw window"""
+        filters = StreamFilters(
+            max_points_per_window=500,
+            downsample_method="minmax",
+            time_exclude=[TimeInterval(start=40.0, end=45.0)],
+        )
+        state = StreamingState(window_size=timedelta(seconds=50), filters=filters)
+        engine = StreamingEngine(state, session_id="test")
+
+        t = np.linspace(0, 100, 200_000)
+        engine.setup_data(t, {"temp": np.sin(t)})
+        state.current_time_index = 90_000
+
+        _, time = engine._get_window_data()
+
+        assert len(time) <= 500
+        assert not np.any((time >= 40.0) & (time <= 45.0))
+        assert engine._pyramids == {}
+
 
 class TestLTTBDownsampling:
     """Tests for LTTB downsampling"""
@@ -11,3 +11,56 @@ def test_common_grid_sync():
     result = synchronize({"s1": s1, "s2": s2}, {"s1": t1, "s2": t2}, "common_grid_interpolate", {})
     assert len(result.t_common) > 0
     assert set(result.synced_series.keys()) == {"s1", "s2"}
+
+
+def _noisy_series(n, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.cumsum(rng.uniform(0.5, 1.5, n)) * 0.01
+    return t, np.sin(t) + 0.1 * rng.standard_normal(n)
+
+
+def test_compiled_kalman_smoother_matches_python_loop(monkeypatch):
+    import platform_base.processing.synchronization as sync_module
+
+    t, values = _noisy_series(2_000)
+    compiled = sync_module._kalman_smooth_series(values, t, 0.01, 0.1)
+
+    monkeypatch.setattr(sync_module, "NUMBA_AVAILABLE", False)
+    reference = sync_module._kalman_smooth_series(values, t, 0.01, 0.1)
+
+    np.testing.assert_allclose(compiled, reference, atol=1e-12)
+
+
+def test_compiled_kalman_filter_matches_python_loop(monkeypatch):
+    import platform_base.processing.synchronization as sync_module
+
+    t, values = _noisy_series(2_000, seed=1)
+    kf = sync_module.KalmanFilter1D(process_noise=0.05, measurement_noise=0.2)
+    filtered, velocities = kf.filter_series(t, values)
+
+    monkeypatch.setattr(sync_module, "NUMBA_AVAILABLE", False)
+    reference_kf = sync_module.KalmanFilter1D(process_noise=0.05, measurement_noise=0.2)
+    ref_filtered, ref_velocities = reference_kf.filter_series(t, values)
+
+    np.testing.assert_allclose(filtered, ref_filtered, atol=1e-12)
+    np.testing.assert_allclose(velocities, ref_velocities, atol=1e-12)
+    np.testing.assert_allclose(kf.x, reference_kf.x, atol=1e-12)
+    np.testing.assert_allclose(kf.P, reference_kf.P, atol=1e-12)
+
+
+def test_kalman_align_smooths_all_series_together():
+    from platform_base.processing.synchronization import _kalman_smooth_series
+
+    t = np.linspace(0.0, 10.0, 500)
+    rng = np.random.default_rng(2)
+    series = {f"s{k}": np.sin(t * (k + 1)) + 0.1 * rng.standard_normal(len(t)) for k in range(4)}
+    params = {"process_noise": 0.05, "measurement_noise": 0.2, "max_workers": 2}
+
+    result = synchronize(series, dict.fromkeys(series, t), "kalman_align", params)
+
+    assert list(result.synced_series) == list(series)
+    for key, values in series.items():
+        expected = _kalman_smooth_series(
+            np.interp(result.t_common, t, values), result.t_common, 0.05, 0.2,
+        )
+        np.testing.assert_allclose(result.synced_series[key], expected, atol=1e-12)
@@ -0,0 +1,311 @@
+"""
+Testes unitários para o cache em dois níveis (caching/tiered.py)
+"""
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from platform_base.caching import DiskCache, TieredCache
+from platform_base.caching.tiered import array_fingerprint, sizeof
+from platform_base.core.memory_manager import MemoryLevel, MemoryManager
+
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def memory_manager():
+    manager = MemoryManager()
+    yield manager
+    for level in MemoryLevel:
+        manager._level_change_callbacks[level].clear()
+
+
+class TestSizeof:
+    """Testa a estimativa de tamanho em bytes"""
+
+    def test_array_uses_nbytes(self):
+        assert sizeof(np.zeros(1000)) == 8000
+
+    def test_nested_containers(self):
+        arr = np.zeros(1000)
+        assert sizeof({"a": arr, "b": (arr, np.ones(10))}) >= 8080
+        # O mesmo array referenciado duas vezes conta uma vez
+        assert sizeof([arr, arr]) < 2 * 8000
+
+
+class TestTieredCacheMemory:
+    """Testa o L1 limitado por bytes"""
+
+    def test_get_set_and_counters(self):
+        cache = TieredCache(max_memory_bytes=MB)
+        cache.set("a", np.arange(10))
+
+        np.testing.assert_array_equal(cache.get("a"), np.arange(10))
+        assert cache.get("missing") is None
+        stats = cache.get_stats()
+        assert stats["l1_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_evicts_lru_by_bytes(self):
+        cache = TieredCache(max_memory_bytes=int(2.5 * 80_000))
+        for key in ("a", "b"):
+            cache.set(key, np.zeros(10_000))
+        cache.get("a")  # "b" passa a ser o menos recente
+        cache.set("c", np.zeros(10_000))
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.memory_bytes <= cache.max_memory_bytes
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_value_larger_than_limit_is_not_kept(self):
+        cache = TieredCache(max_memory_bytes=1000)
+        cache.set("big", np.zeros(1000))
+
+        assert len(cache) == 0
+        assert cache.memory_bytes == 0
+
+    def test_replace_updates_size(self):
+        cache = TieredCache(max_memory_bytes=MB)
+        cache.set("a", np.zeros(1000))
+        cache.set("a", np.zeros(10))
+
+        assert cache.memory_bytes == sizeof(np.zeros(10))
+
+    def test_discard_prefix(self):
+        cache = TieredCache(max_memory_bytes=MB)
+        cache.set("view:ds1:a", 1)
+        cache.set("view:ds1:b", 2)
+        cache.set("view:ds2:a", 3)
+
+        assert cache.discard_prefix("view:ds1:") == 2
+        assert len(cache) == 1
+
+    def test_concurrent_access(self):
+        cache = TieredCache(max_memory_bytes=50 * 8_000)
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(200):
+                    key = f"k{(offset + i) % 80}"
+                    if cache.get(key) is None:
+                        cache.set(key, np.zeros(1000))
+            except Exception as e:  # pragma: no cover - falha reportada abaixo
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n * 7,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert not errors
+        assert cache.memory_bytes == sum(size for _, size in cache._entries.values())
+        assert cache.memory_bytes <= cache.max_memory_bytes
+
+
+class TestTieredCacheDisk:
+    """Testa o L2 em disco"""
+
+    def test_l2_hit_is_promoted(self, tmp_path):
+        disk = DiskCache(location=tmp_path)
+        TieredCache(max_memory_bytes=MB, disk_cache=disk).set("a", np.arange(100))
+
+        cache = TieredCache(max_memory_bytes=MB, disk_cache=disk)
+        np.testing.assert_array_equal(cache.get("a"), np.arange(100))
+        cache.get("a")
+
+        stats = cache.get_stats()
+        assert stats["l2_hits"] == 1
+        assert stats["l1_hits"] == 1
+        assert "disk" in stats
+
+    def test_clear_memory_only(self, tmp_path):
+        cache = TieredCache(max_memory_bytes=MB, disk_cache=DiskCache(location=tmp_path))
+        cache.set("a", 1)
+        cache.clear(disk=False)
+
+        assert len(cache) == 0
+        assert cache.get("a") == 1
+
+
+class TestMemoryPressure:
+    """Testa a reação aos níveis do MemoryManager"""
+
+    def test_high_shrinks_and_critical_clears(self, memory_manager):
+        cache = TieredCache(max_memory_bytes=MB, memory_manager=memory_manager)
+        for i in range(10):
+            cache.set(f"k{i}", np.zeros(1000))
+
+        memory_manager._on_level_changed(MemoryLevel.HIGH)
+        assert len(cache) == 5
+        assert "k9" in cache and "k0" not in cache
+
+        memory_manager._on_level_changed(MemoryLevel.CRITICAL)
+        assert len(cache) == 0
+        assert cache.get_stats()["pressure_events"] == 2
+
+    def test_detach_removes_hooks(self, memory_manager):
+        cache = TieredCache(max_memory_bytes=MB, memory_manager=memory_manager)
+        cache.set("a", 1)
+        cache.detach_memory_manager()
+
+        memory_manager._on_level_changed(MemoryLevel.CRITICAL)
+        assert "a" in cache
+
+    def test_hooks_do_not_keep_cache_alive(self, memory_manager):
+        import gc
+        import weakref
+
+        cache = TieredCache(max_memory_bytes=MB, memory_manager=memory_manager)
+        ref = weakref.ref(cache)
+        del cache
+        gc.collect()
+
+        assert ref() is None
+        # Coleta do cache remove os hooks do MemoryManager
+        assert all(not memory_manager._level_change_callbacks[level] for level in MemoryLevel)
+
+    def test_cycle_collected_cache_removes_hooks(self, memory_manager):
+        import gc
+
+        cache = TieredCache(max_memory_bytes=MB, memory_manager=memory_manager)
+        cache._cycle = cache  # só o coletor de ciclos libera o cache
+        del cache
+        gc.collect()
+
+        assert not memory_manager._level_change_callbacks[MemoryLevel.HIGH]
+
+
+class TestArrayFingerprint:
+    """Testa a chave de conteúdo para arrays"""
+
+    def test_same_array_same_key(self):
+        x = np.arange(100_000, dtype=float)
+        assert array_fingerprint(x) == array_fingerprint(x)
+
+    def test_different_content_or_shape(self):
+        x = np.arange(100, dtype=float)
+        y = x.copy()
+        y[50] = -1.0
+
+        assert array_fingerprint(x) != array_fingerprint(y)
+        assert array_fingerprint(x) != array_fingerprint(x[:50])
+
+    def test_in_place_edit_anywhere_changes_key(self):
+        x = np.random.default_rng(0).normal(size=100_003)
+        key = array_fingerprint(x)
+
+        x[12_347] += 1.0  # índice fora de qualquer amostragem espaçada
+
+        assert array_fingerprint(x) != key
+
+    def test_read_only_view_of_writable_buffer_not_memoized(self):
+        x = np.zeros(10_000)
+        view = x.view()
+        view.flags.writeable = False
+        key = array_fingerprint(view)
+
+        x[7] = 1.0
+
+        assert array_fingerprint(view) != key
+
+    def test_immutable_array_keyed_by_identity(self):
+        from platform_base.caching import tiered
+
+        x = np.arange(10_000_000, dtype=float)
+        x.flags.writeable = False
+        same = x.copy()
+        same.flags.writeable = False
+
+        with patch.object(tiered, "_content_digest", side_effect=AssertionError("hash")):
+            key = array_fingerprint(x)
+            assert array_fingerprint(x) == key
+            assert array_fingerprint(same) != key
+
+    def test_large_writable_array_has_no_key(self):
+        from platform_base.caching import tiered
+
+        small = np.zeros(1000)
+        large = np.zeros(tiered.FINGERPRINT_MAX_HASH_BYTES // 8 + 1)
+
+        with patch.object(tiered, "_content_digest", side_effect=AssertionError("hash")):
+            assert array_fingerprint(large) is None
+            assert array_fingerprint(small, large) is None
+
+
+class TestAdoption:
+    """Testa uso do TieredCache em DatasetStore e decimação"""
+
+    def test_dataset_store_views_served_from_memory(self):
+        from datetime import datetime
+
+        from platform_base.core.dataset_store import DatasetStore
+        from platform_base.core.models import (
+            Dataset,
+            DatasetMetadata,
+            Series,
+            SeriesMetadata,
+            SourceInfo,
+            TimeWindow,
+        )
+        from platform_base.processing.units import parse_unit
+
+        t = np.arange(1000, dtype=float)[::-1].copy()  # não-monotônico: views em cache
+        dataset = Dataset(
+            dataset_id="ds_tiered",
+            version=1,
+            parent_id=None,
+            source=SourceInfo(filepath="/x.csv", filename="x.csv", format="csv",
+                              size_bytes=1, checksum="c"),
+            t_seconds=t,
+            t_datetime=np.datetime64("2024-01-01", "ns") + t.astype("timedelta64[s]"),
+            series={"s": Series(series_id="s", name="s", unit=parse_unit("bar"), values=np.sin(t),
+                                metadata=SeriesMetadata(original_name="s", source_column="s"))},
+            metadata=DatasetMetadata(),
+            created_at=datetime(2024, 1, 1),
+        )
+        store = DatasetStore()
+        store.add_dataset(dataset)
+        window = TimeWindow(start=10.0, end=20.0)
+
+        first = store.create_view("ds_tiered", ["s"], window)
+        second = store.create_view("ds_tiered", ["s"], window)
+
+        assert second is first
+        assert store.get_cache_stats()["view_cache"]["l1_hits"] == 1
+
+        store.remove_dataset("ds_tiered")
+        assert store.get_cache_stats()["view_cache"]["memory_entries"] == 0
+
+    def test_decimator_cache(self):
+        from platform_base.ui.panels.performance import DataDecimator, PerformanceConfig
+
+        decimator = DataDecimator(PerformanceConfig(target_display_points=100))
+        x = np.arange(10_000, dtype=float)
+        y = np.sin(x / 50.0)
+
+        first = decimator.decimate(x, y)
+        second = decimator.decimate(x, y)
+
+        assert second is first
+        assert decimator._cache.get_stats()["l1_hits"] == 1
+
+    def test_decimator_skips_cache_for_large_writable_arrays(self):
+        from platform_base.ui.panels.performance import DataDecimator, PerformanceConfig
+
+        decimator = DataDecimator(PerformanceConfig(target_display_points=100))
+        x = np.arange(200_000, dtype=float)
+        y = np.sin(x / 50.0)
+
+        decimator.decimate(x, y)
+        y[0] = 10.0
+        _, y_decimated = decimator.decimate(x, y)
+
+        assert y_decimated.max() == 10.0
+        assert len(decimator._cache) == 0
@@ -75,6 +75,23 @@ class TestFileLoadWorker:
         assert worker.config["delimiter"] == ";"
         assert worker.config["timestamp_column"] == "Time"
 
+    def test_dataset_cache_is_opt_in_and_bounded(self, tmp_path):
+        """Persistent dataset cache is off by default and size-limited when on."""
+        from platform_base.desktop.dialogs.upload_dialog import (
+            DEFAULT_DATASET_CACHE_MAX_SIZE_GB,
+            _build_dataset_cache,
+        )
+
+        assert _build_dataset_cache({}) is None
+
+        cache = _build_dataset_cache({"use_dataset_cache": True, "dataset_cache_path": tmp_path})
+        assert cache.location == tmp_path
+        assert cache.get_stats()["max_size_bytes"] == int(DEFAULT_DATASET_CACHE_MAX_SIZE_GB * 1024 ** 3)
+
+        small = _build_dataset_cache({"use_dataset_cache": True, "dataset_cache_path": tmp_path,
+                                      "dataset_cache_max_size_gb": 0.5})
+        assert small.get_stats()["max_size_bytes"] == 512 * 1024 ** 2
+
 
 # =============================================================================
 # PreviewWorker Tests
@@ -594,7 +611,7 @@ class TestUploadDialogMultiFileLoading:
     def test_multi_file_initial_state(self, upload_dialog):
         """Test initial state for multi-file loading."""
         assert upload_dialog.pending_files == []
-        assert upload_dialog.loading_files == {}
+        assert upload_dialog.batch_worker is None
         assert upload_dialog.loaded_datasets == []
         assert upload_dialog.load_errors == []
     
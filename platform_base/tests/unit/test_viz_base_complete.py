@@ -10,31 +10,26 @@ import numpy as np
 import pytest
 
 
-class TestLTTBNumba:
-    """Testes para LTTB com Numba"""
+class TestLTTBEngine:
+    """Testes para o LTTB do engine de decimação usado por viz.base"""
     
-    def test_create_lttb_numba_available(self):
-        """Testa criação de LTTB com numba disponível"""
-        from platform_base.viz.base import NUMBA_AVAILABLE, _create_lttb_numba
+    def test_numba_kernel_selected(self):
+        """Testa que o kernel compilado é usado quando numba existe"""
+        from platform_base.processing import decimation
         
-        func = _create_lttb_numba()
-        
-        if NUMBA_AVAILABLE:
-            assert func is not None
+        if decimation.NUMBA_AVAILABLE:
+            assert decimation._lttb_impl is decimation._lttb_kernel
         else:
-            assert func is None
+            assert decimation._lttb_impl is decimation._lttb_numpy
     
-    def test_lttb_numba_basic(self):
-        """Testa LTTB numba básico"""
-        from platform_base.viz.base import NUMBA_AVAILABLE, _lttb_numba
-        
-        if not NUMBA_AVAILABLE or _lttb_numba is None:
-            pytest.skip("Numba não disponível")
+    def test_lttb_engine_basic(self):
+        """Testa LTTB do engine via _downsample_lttb"""
+        from platform_base.viz.base import _downsample_lttb
         
         x = np.linspace(0, 100, 1000)
         y = np.sin(x) * 10
         
-        x_down, y_down = _lttb_numba(x, y, 100)
+        x_down, y_down = _downsample_lttb(x, y, 100, preserve_features=[])
         
         assert len(x_down) == 100
         assert len(y_down) == 100
@@ -147,42 +142,42 @@ class TestDownsampleLTTB:
         assert len(x_down) <= 200
 
 
-class TestLTTBNumpy:
-    """Testes para implementação numpy de LTTB"""
+class TestLTTBDecimate:
+    """Testes para LTTB via processing.decimation.decimate"""
     
-    def test_lttb_numpy_basic(self):
-        """Testa LTTB numpy básico"""
-        from platform_base.viz.base import _lttb_numpy
+    def test_lttb_basic(self):
+        """Testa LTTB básico"""
+        from platform_base.processing.decimation import decimate
         
         x = np.linspace(0, 100, 10000)
         y = np.sin(x / 10) * 50
         
-        x_down, y_down = _lttb_numpy(x, y, max_points=500)
+        x_down, y_down = decimate(x, y, 500, "lttb")
         
         assert len(x_down) == 500
         assert len(y_down) == 500
         assert x_down[0] == x[0]
         assert x_down[-1] == x[-1]
     
-    def test_lttb_numpy_few_points(self):
+    def test_lttb_few_points(self):
         """Testa com poucos pontos de saída"""
-        from platform_base.viz.base import _lttb_numpy
+        from platform_base.processing.decimation import decimate
         
         x = np.linspace(0, 10, 1000)
         y = np.sin(x)
         
-        x_down, y_down = _lttb_numpy(x, y, max_points=2)
+        x_down, y_down = decimate(x, y, 2, "lttb")
         
         assert len(x_down) == 2
     
-    def test_lttb_numpy_preserves_range(self):
+    def test_lttb_preserves_range(self):
         """Testa que mantém range de valores"""
-        from platform_base.viz.base import _lttb_numpy
+        from platform_base.processing.decimation import decimate
         
         x = np.linspace(0, 100, 10000)
         y = np.sin(x) * 100  # Range: -100 a 100
         
-        x_down, y_down = _lttb_numpy(x, y, max_points=200)
+        x_down, y_down = decimate(x, y, 200, "lttb")
         
         # Range aproximado deve ser preservado
         assert np.min(y_down) < -80
@@ -360,35 +355,36 @@ class TestDownsamplingEdgeCases:
     
     def test_empty_array(self):
         """Testa com arrays vazios"""
-        from platform_base.viz.base import _lttb_numpy
+        from platform_base.processing.decimation import decimate
         
         x = np.array([])
         y = np.array([])
         
-        # Não deve crashar
-        # A função pode ter comportamento undefined para arrays vazios
-        # mas não deve levantar exceção não tratada
+        x_down, y_down = decimate(x, y, 10, "lttb")
+        
+        assert len(x_down) == 0
+        assert len(y_down) == 0
     
     def test_single_point(self):
         """Testa com único ponto"""
-        from platform_base.viz.base import _lttb_numpy
+        from platform_base.processing.decimation import decimate
         
         x = np.array([5.0])
         y = np.array([10.0])
         
-        x_down, y_down = _lttb_numpy(x, y, max_points=10)
+        x_down, y_down = decimate(x, y, 10, "lttb")
         
         assert len(x_down) == 1
         assert x_down[0] == 5.0
     
     def test_two_points(self):
         """Testa com dois pontos"""
-        from platform_base.viz.base import _lttb_numpy
+        from platform_base.processing.decimation import decimate
         
         x = np.array([0.0, 10.0])
         y = np.array([0.0, 100.0])
         
-        x_down, y_down = _lttb_numpy(x, y, max_points=10)
+        x_down, y_down = decimate(x, y, 10, "lttb")
         
         assert len(x_down) == 2
     
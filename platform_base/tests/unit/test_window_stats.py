@@ -0,0 +1,156 @@
+"""
+Testes unitários para estatísticas por janela (processing/window_stats.py)
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from platform_base.processing.window_stats import (
+    _rolling_quantiles_python,
+    describe,
+    rolling_stats,
+    tumbling_stats,
+)
+from platform_base.utils.errors import ValidationError
+
+
+ALL_STATS = ["count", "sum", "mean", "var", "std", "min", "max", "range", "median", "q10", "q90"]
+
+
+@pytest.fixture
+def block():
+    rng = np.random.default_rng(4)
+    values = rng.normal(size=(3, 600)).cumsum(axis=1)
+    values[0, 100:140] = np.nan   # lacuna maior que algumas janelas
+    values[1, ::7] = np.nan
+    return values
+
+
+class TestTumbling:
+    """Janelas fixas contra as funções nan* do numpy"""
+
+    @pytest.mark.parametrize("window", [1, 10, 37, 600])
+    def test_matches_numpy(self, block, window):
+        n_windows = block.shape[1] // window
+        windows = block[:, :n_windows * window].reshape(3, n_windows, window)
+
+        result = tumbling_stats(block, window, ALL_STATS, ddof=1)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # janelas só com NaN
+            expected = {
+                "count": np.sum(~np.isnan(windows), axis=-1),
+                "sum": np.nansum(windows, axis=-1),
+                "mean": np.nanmean(windows, axis=-1),
+                "var": np.nanvar(windows, axis=-1, ddof=1),
+                "min": np.nanmin(windows, axis=-1),
+                "median": np.nanmedian(windows, axis=-1),
+                "q90": np.nanquantile(windows, 0.9, axis=-1),
+            }
+        for name, values in expected.items():
+            if name == "sum":
+                values = np.where(expected["count"] > 0, values, np.nan)
+            np.testing.assert_allclose(result[name], values, equal_nan=True, err_msg=name)
+        np.testing.assert_allclose(result["std"], np.sqrt(result["var"]), equal_nan=True)
+
+    def test_series_input_and_partial_window(self):
+        result = tumbling_stats(np.arange(25.0), 10, ["mean", "max"])
+
+        np.testing.assert_array_equal(result["mean"], [4.5, 14.5])
+        np.testing.assert_array_equal(result["max"], [9.0, 19.0])
+
+    def test_invalid_arguments(self, block):
+        with pytest.raises(ValidationError):
+            tumbling_stats(block, 0)
+        with pytest.raises(ValidationError):
+            tumbling_stats(block, 10, ["mean", "kurtosis"])
+        with pytest.raises(ValidationError):
+            tumbling_stats(block, 10, ["q101"])
+
+
+class TestRolling:
+    """Janelas móveis contra pandas.rolling"""
+
+    @pytest.mark.parametrize("window,min_periods", [(1, None), (8, None), (50, 5), (1000, 1)])
+    def test_matches_pandas(self, block, window, min_periods):
+        result = rolling_stats(block, window, ALL_STATS, min_periods=min_periods, ddof=1)
+
+        for row in range(3):
+            rolling = pd.Series(block[row]).rolling(window, min_periods=min_periods or window)
+            expected = {
+                "sum": rolling.sum(), "mean": rolling.mean(), "var": rolling.var(),
+                "std": rolling.std(), "min": rolling.min(), "max": rolling.max(),
+                "median": rolling.median(), "q10": rolling.quantile(0.1),
+                "q90": rolling.quantile(0.9),
+            }
+            for name, values in expected.items():
+                np.testing.assert_allclose(result[name][row], values.to_numpy(), atol=1e-8,
+                                           equal_nan=True, err_msg=f"{name} row {row}")
+
+    def test_large_offset_keeps_precision(self):
+        values = 1e9 + np.random.default_rng(1).normal(size=5000)
+
+        result = rolling_stats(values, 100, ["var"])
+
+        # Referência em duas passadas por janela
+        expected = np.lib.stride_tricks.sliding_window_view(values, 100).var(axis=1)
+        assert np.all(np.isnan(result["var"][:99]))
+        np.testing.assert_allclose(result["var"][99:], expected, rtol=1e-9)
+
+    def test_drifting_series_keeps_precision(self):
+        n, window = 200_000, 50
+        values = np.linspace(0.0, 1e7, n) + np.random.default_rng(2).normal(scale=14.0, size=n)
+        values[1000:1120] = np.nan  # lacuna maior que a janela (blocos vazios)
+
+        result = rolling_stats(values, window, ["mean", "std"], min_periods=1, ddof=1)
+
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        full = ~np.isnan(windows).any(axis=1)
+        expected_std = windows[full].std(axis=1, ddof=1)
+        expected_mean = windows[full].mean(axis=1)
+        np.testing.assert_allclose(result["std"][window - 1:][full], expected_std, rtol=1e-9)
+        np.testing.assert_allclose(result["mean"][window - 1:][full], expected_mean, rtol=1e-12)
+
+    def test_python_quantile_fallback(self, block):
+        quantiles = np.array([0.25, 0.5])
+        compiled = rolling_stats(block, 20, ["q25", "median"], min_periods=3)
+
+        fallback = _rolling_quantiles_python(block, 20, quantiles, 3)
+
+        np.testing.assert_allclose(fallback[:, 0, :], compiled["q25"], equal_nan=True)
+        np.testing.assert_allclose(fallback[:, 1, :], compiled["median"], equal_nan=True)
+
+
+class TestDescribe:
+    """Resumo de uma série inteira"""
+
+    def test_ignores_nan(self):
+        summary = describe(np.array([1.0, np.nan, 3.0, 2.0]), ("min", "max", "mean", "median", "count"))
+
+        assert summary == {"min": 1.0, "max": 3.0, "mean": 2.0, "median": 2.0, "count": 3.0}
+
+    @pytest.mark.parametrize("with_nan", [False, True])
+    def test_matches_single_tumbling_window(self, with_nan):
+        values = np.random.default_rng(3).normal(size=1001)
+        if with_nan:
+            values[::13] = np.nan
+
+        summary = describe(values, ALL_STATS, ddof=1)
+
+        reference = tumbling_stats(values, len(values), ALL_STATS, ddof=1)
+        for name in ALL_STATS:
+            assert summary[name] == pytest.approx(reference[name][0], rel=1e-12), name
+
+    def test_single_value_with_ddof(self):
+        summary = describe(np.array([np.nan, 2.0]), ("count", "mean", "var"), ddof=1)
+
+        assert summary["count"] == 1.0 and summary["mean"] == 2.0
+        assert np.isnan(summary["var"])
+
+    def test_empty_is_nan(self):
+        summary = describe(np.array([np.nan]))
+
+        assert all(np.isnan(value) for value in summary.values())
+
@@ -133,6 +133,20 @@ class TestXlsxToCsvConverter:
         for csv_path in result:
             assert Path(csv_path).exists()
     
+    def test_convert_with_cache_matches_openpyxl(self, temp_xlsx_file, tmp_path):
+        """Test streaming engine with conversion cache produces the same CSV"""
+        cached = XlsxToCsvConverter(cache_dir=tmp_path / "cache")
+        baseline = XlsxToCsvConverter(engine="openpyxl")
+        
+        assert cached.convert(temp_xlsx_file, tmp_path / "cached.csv")
+        assert cached.convert(temp_xlsx_file, tmp_path / "cached_again.csv")
+        assert baseline.convert(temp_xlsx_file, tmp_path / "baseline.csv")
+        
+        expected = (tmp_path / "baseline.csv").read_text()
+        assert (tmp_path / "cached.csv").read_text() == expected
+        assert (tmp_path / "cached_again.csv").read_text() == expected
+        assert len(list((tmp_path / "cache").glob("*.arrow"))) == 1
+    
     def test_get_sheet_names(self, temp_xlsx_multi_sheet):
         """Test getting sheet names from XLSX"""
         sheet_names = XlsxToCsvConverter.get_sheet_names(temp_xlsx_multi_sheet)
@@ -0,0 +1,166 @@
+"""
+Testes unitários para o leitor XLSX streaming (io/xlsx_reader.py)
+"""
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from platform_base.io.xlsx_reader import (
+    XlsxSheetCache,
+    read_xlsx,
+    read_xlsx_sheets,
+    xlsx_sheet_names,
+)
+from platform_base.utils.errors import DataLoadError
+
+
+@pytest.fixture
+def frame():
+    n = 300
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=n, freq="s"),
+        "BAR_DT (bar)": np.sin(np.arange(n) / 10.0),
+        "count": np.arange(n),
+        "label": ["a", "b", "c"] * (n // 3),
+    })
+    df.loc[[4, 5], "BAR_DT (bar)"] = np.nan
+    return df
+
+
+@pytest.fixture
+def xlsx_file(tmp_path, frame):
+    path = tmp_path / "BAR-OP10.xlsx"
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        frame.to_excel(writer, sheet_name="Dados", index=False)
+        frame.head(20).to_excel(writer, sheet_name="Resumo", index=False)
+    return path
+
+
+class TestReadXlsx:
+    """Testa leitura streaming comparada ao pd.read_excel (openpyxl)"""
+
+    def test_matches_read_excel(self, xlsx_file):
+        expected = pd.read_excel(xlsx_file, engine="openpyxl")
+        result = read_xlsx(xlsx_file)
+
+        assert list(result.columns) == list(expected.columns)
+        assert list(result.dtypes) == list(expected.dtypes)
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_sheet_by_name_and_index(self, xlsx_file):
+        assert len(read_xlsx(xlsx_file, "Resumo")) == 20
+        assert len(read_xlsx(xlsx_file, 1)) == 20
+
+    def test_max_rows(self, xlsx_file):
+        result = read_xlsx(xlsx_file, max_rows=7)
+
+        assert len(result) == 7
+        assert result["count"].tolist() == list(range(7))
+
+    def test_missing_sheet_raises(self, xlsx_file):
+        with pytest.raises(DataLoadError):
+            read_xlsx(xlsx_file, "Nope")
+        with pytest.raises(DataLoadError):
+            read_xlsx(xlsx_file, 5)
+
+    def test_invalid_file_raises(self, tmp_path):
+        path = tmp_path / "broken.xlsx"
+        path.write_text("not a zip")
+
+        with pytest.raises(DataLoadError):
+            read_xlsx(path)
+
+    def test_sparse_cells_and_mixed_column(self, tmp_path):
+        path = tmp_path / "sparse.xlsx"
+        pd.DataFrame({
+            "a": [1.5, None, 3.5],
+            "b": [None, "x", 2.0],
+        }).to_excel(path, index=False)
+
+        result = read_xlsx(path)
+
+        assert np.isnan(result["a"][1])
+        assert result["b"].tolist() == [None, "x", 2.0]
+
+    def test_omitted_rows_and_booleans(self, tmp_path):
+        import openpyxl
+
+        # openpyxl não grava <row> para linhas vazias: posição vem do atributo r
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["a", "flag", "mixed", "text"])
+        sheet.append([1.0, True, True, True])
+        sheet["A5"], sheet["B5"], sheet["C5"], sheet["D5"] = 4.0, False, 2.5, "x"
+        sheet["B3"], sheet["B4"] = True, False
+        path = tmp_path / "gaps.xlsx"
+        workbook.save(path)
+
+        expected = pd.read_excel(path, engine="openpyxl")
+        result = read_xlsx(path)
+
+        assert result["flag"].dtype == bool
+        assert result["text"].tolist() == [True, None, None, "x"]
+        pd.testing.assert_frame_equal(result.drop(columns="text"), expected.drop(columns="text"))
+        assert np.isnan(result["a"][1]) and result["a"][3] == 4.0
+
+    def test_sheet_names(self, xlsx_file):
+        assert xlsx_sheet_names(xlsx_file) == ["Dados", "Resumo"]
+
+
+class TestReadXlsxSheets:
+    """Testa decodificação de várias sheets"""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_all_sheets(self, xlsx_file, max_workers):
+        sheets = read_xlsx_sheets(xlsx_file, max_workers=max_workers)
+
+        assert list(sheets) == ["Dados", "Resumo"]
+        assert len(sheets["Dados"]) == 300
+        assert len(sheets["Resumo"]) == 20
+
+
+class TestXlsxSheetCache:
+    """Testa o cache de conversão em Arrow IPC"""
+
+    def test_second_read_skips_xml(self, xlsx_file, tmp_path):
+        cache = XlsxSheetCache(tmp_path / "cache")
+        first = cache.read(xlsx_file, "Dados")
+
+        with patch("platform_base.io.xlsx_reader.read_xlsx") as reader:
+            second = cache.read(xlsx_file, "Dados")
+        reader.assert_not_called()
+
+        pd.testing.assert_frame_equal(second, first)
+
+    def test_modified_workbook_is_decoded_again(self, xlsx_file, tmp_path, frame):
+        cache = XlsxSheetCache(tmp_path / "cache")
+        cache.read(xlsx_file)
+
+        frame.head(10).to_excel(xlsx_file, sheet_name="Dados", index=False)
+
+        assert len(cache.read(xlsx_file)) == 10
+
+
+class TestLoadStreamingEngine:
+    """Testa LoadConfig.excel_engine == "streaming" no loader"""
+
+    def test_load_matches_openpyxl(self, xlsx_file):
+        from platform_base.io.loader import LoadConfig, load
+
+        expected = load(str(xlsx_file), LoadConfig())
+        with patch("pandas.read_excel") as read_excel:
+            result = load(str(xlsx_file), LoadConfig(excel_engine="streaming"))
+        read_excel.assert_not_called()
+
+        assert list(result.series) == list(expected.series)
+        np.testing.assert_array_equal(result.t_datetime, expected.t_datetime)
+        for name in expected.series:
+            np.testing.assert_array_equal(result.series[name].values, expected.series[name].values)
+
+    def test_invalid_excel_engine(self):
+        from platform_base.io.loader import LoadConfig
+
+        with pytest.raises(ValueError):
+            LoadConfig(excel_engine="calamine")